@@ -0,0 +1,143 @@
+import argparse
+import hashlib
+import json
+import os
+import wave
+
+# Le transcodage ne joue aucun son : un pilote audio factice suffit si aucun n'est imposé.
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from classes.AudioManager import AudioManager
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Dossier des sons d'origine
+SOURCE_DIR: str = "assets/audio"
+
+# Extensions des sons à transcoder
+SOURCE_EXTENSIONS: tuple[str, ...] = (".mp3", ".wav", ".ogg", ".flac")
+
+
+def compute_hash(source_path: str, mixer_format: dict[str, int]) -> str:
+    """
+    Calcule l'empreinte d'un son d'origine et du format cible.
+
+    Args:
+        source_path (str): Le chemin du son d'origine.
+        mixer_format (dict[str, int]): Le format du mixeur (fréquence, taille, canaux).
+
+    Returns:
+        str: L'empreinte hexadécimale (SHA-256).
+    """
+    digest = hashlib.sha256(json.dumps(mixer_format, sort_keys=True).encode("utf-8"))
+    with open(source_path, "rb") as source_file:
+        for chunk in iter(lambda: source_file.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def transcode(source_path: str, output_path: str, mixer_format: dict[str, int]) -> None:
+    """
+    Décode un son avec le mixeur et l'écrit en WAV PCM au format du mixeur.
+
+    Args:
+        source_path (str): Le chemin du son d'origine.
+        output_path (str): Le chemin du fichier WAV à produire.
+        mixer_format (dict[str, int]): Le format du mixeur (fréquence, taille, canaux).
+    """
+    # Le mixeur convertit le son à son propre format lors du décodage.
+    samples = pygame.mixer.Sound(source_path).get_raw()
+
+    temporary_path = f"{output_path}.tmp"
+    with wave.open(temporary_path, "wb") as output_file:
+        output_file.setnchannels(mixer_format["channels"])
+        output_file.setsampwidth(abs(mixer_format["size"]) // 8)
+        output_file.setframerate(mixer_format["frequency"])
+        output_file.writeframes(samples)
+    os.replace(temporary_path, output_path)
+
+
+def build(source_dir: str = SOURCE_DIR, manifest_path: str = AudioManager.AUDIO_MANIFEST_PATH,
+          force: bool = False) -> dict[str, int]:
+    """
+    Transcode les sons modifiés depuis la dernière exécution et met à jour le manifeste.
+
+    Args:
+        source_dir (str): Le dossier des sons d'origine. Par défaut, `assets/audio`.
+        manifest_path (str): Le chemin du manifeste. Les sons transcodés sont écrits dans le même dossier.
+        force (bool): Si vrai, tous les sons sont transcodés à nouveau. Par défaut, False.
+
+    Returns:
+        dict[str, int]: Le nombre de sons transcodés, inchangés et supprimés du manifeste.
+
+    Raises:
+        FileNotFoundError: Si le dossier des sons d'origine n'existe pas.
+    """
+    if not os.path.isdir(source_dir):
+        raise FileNotFoundError(f"Le dossier des sons n'existe pas : {source_dir}")
+
+    pygame.mixer.init(AudioManager.MIXER_FREQUENCY, AudioManager.MIXER_SIZE, AudioManager.MIXER_CHANNELS)
+    frequency, size, channels = pygame.mixer.get_init()
+    mixer_format = {"frequency": frequency, "size": size, "channels": channels}
+
+    output_dir = os.path.dirname(manifest_path)
+    os.makedirs(output_dir, exist_ok=True)
+
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+            previous_sounds = json.load(manifest_file).get("sounds", {})
+    except (OSError, json.JSONDecodeError):
+        previous_sounds = {}
+
+    sounds = {}
+    stats = {"transcoded": 0, "unchanged": 0, "removed": 0}
+    for file_name in sorted(os.listdir(source_dir)):
+        source_path = f"{source_dir}/{file_name}"
+        if not file_name.lower().endswith(SOURCE_EXTENSIONS) or not os.path.isfile(source_path):
+            continue
+
+        content_hash = compute_hash(source_path, mixer_format)
+        output_path = f"{output_dir}/{os.path.splitext(file_name)[0]}.wav"
+        previous = previous_sounds.get(source_path, {})
+
+        # Seuls les sons dont le contenu (ou le format cible) a changé sont transcodés.
+        if force or previous.get("hash") != content_hash or not os.path.exists(output_path):
+            transcode(source_path, output_path, mixer_format)
+            stats["transcoded"] += 1
+        else:
+            stats["unchanged"] += 1
+
+        sounds[source_path] = {"hash": content_hash, "output": output_path}
+
+    # Les sons transcodés dont l'original a disparu sont supprimés.
+    for source_path, entry in previous_sounds.items():
+        if source_path not in sounds and os.path.exists(entry.get("output", "")):
+            os.remove(entry["output"])
+            stats["removed"] += 1
+
+    with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+        json.dump({"mixer": mixer_format, "sounds": sounds}, manifest_file, indent=4)
+
+    return stats
+
+
+def main() -> None:
+    """
+    Point d'entrée en ligne de commande du transcodage des sons.
+
+    Exemple (depuis le dossier `front_end`) : `python -m asset_builders.transcode_audio`
+    """
+    parser = argparse.ArgumentParser(description="Transcode les sons du client Pente au format du mixeur.")
+    parser.add_argument("--force", action="store_true", help="Transcode tous les sons, même inchangés.")
+    args = parser.parse_args()
+
+    stats = build(force=args.force)
+    print(f"Sons transcodés : {stats['transcoded']}, inchangés : {stats['unchanged']}, "
+          f"supprimés : {stats['removed']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import argparse
+import contextlib
+import io
+import json
+import time
+
+from classes.GUIElementsManager import GUIElementsManager
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Nombre d'images rendues par défaut pour chaque page
+DEFAULT_FRAMES: int = 600
+
+# Durée simulée d'une image (60 FPS), identique à la boucle principale
+FRAME_TIME_DELTA: float = 1 / 60
+
+# Parties factices affichées dans le lobby
+SAMPLE_GAMES: list[dict] = [
+    {"id": index, "name": f"Partie {index}", "players": ["Frodon", "Sam"], "status": index % 2}
+    for index in range(10)
+]
+
+
+def build_sample_boards() -> dict[str, str]:
+    """
+    Construit des plateaux représentatifs (vide, milieu de partie, plateau rempli).
+
+    Returns:
+        dict[str, str]: Les plateaux indexés par nom, au format `board_state` (361 caractères).
+    """
+    size = GUIElementsManager.GRID_SIZE
+    middle_game = [GUIElementsManager.EMPTY_CHAR] * size
+    for index in range(0, size, 7):
+        middle_game[index] = GUIElementsManager.HOST_CHAR if index % 2 else GUIElementsManager.OPPONENT_CHAR
+
+    full = [
+        GUIElementsManager.HOST_CHAR if index % 2 else GUIElementsManager.OPPONENT_CHAR
+        for index in range(size)
+    ]
+
+    return {
+        "empty": GUIElementsManager.EMPTY_CHAR * size,
+        "middle_game": "".join(middle_game),
+        "full": "".join(full),
+    }
+
+
+def measure_page_builds(gui: GUIElementsManager) -> dict[str, float]:
+    """
+    Mesure le temps de construction (puis de destruction) de chaque page de l'interface.
+
+    Args:
+        gui (GUIElementsManager): Le gestionnaire GUI en mode sans affichage.
+
+    Returns:
+        dict[str, float]: Le temps de construction de chaque page en millisecondes.
+    """
+    builders = {
+        "login": gui.create_gui_elements_login_page,
+        "new_account": gui.create_gui_elements_new_account_page,
+        "create_game": gui.create_gui_elements_create_game_page,
+        "lobby": gui.create_gui_elements_lobby_page,
+        "game": gui.create_gui_elements_game_page,
+    }
+
+    results = {}
+    for page_name, builder in builders.items():
+        start = time.perf_counter()
+        elements = builder()
+        results[page_name] = (time.perf_counter() - start) * 1000
+        gui.clear_page(elements)
+
+    return results
+
+
+def measure_frames(gui: GUIElementsManager, frames: int, is_grid_visible: bool, is_board_visible: bool) -> dict:
+    """
+    Rend `frames` images consécutives et mesure le débit obtenu.
+
+    Args:
+        gui (GUIElementsManager): Le gestionnaire GUI en mode sans affichage.
+        frames (int): Le nombre d'images à rendre.
+        is_grid_visible (bool): Si vrai, la grille est dessinée.
+        is_board_visible (bool): Si vrai, les pions sont dessinés.
+
+    Returns:
+        dict: Le nombre d'images, la durée totale (s), le débit (images/s) et le temps moyen par image (ms).
+    """
+    start = time.perf_counter()
+    for _ in range(frames):
+        gui.render_frame(FRAME_TIME_DELTA, is_grid_visible, is_board_visible)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "frames": frames,
+        "seconds": elapsed,
+        "fps": frames / elapsed if elapsed else float("inf"),
+        "ms_per_frame": elapsed * 1000 / frames if frames else 0.0,
+    }
+
+
+def measure_animated_frames(gui: GUIElementsManager, frames: int, boards: list[str]) -> dict:
+    """
+    Rend `frames` images en alternant entre plusieurs plateaux pour déclencher en continu les animations
+    d'apparition et de capture.
+
+    Args:
+        gui (GUIElementsManager): Le gestionnaire GUI en mode sans affichage.
+        frames (int): Le nombre d'images à rendre.
+        boards (list[str]): Les plateaux à alterner.
+
+    Returns:
+        dict: Le nombre d'images, la durée totale (s), le débit (images/s) et le temps moyen par image (ms).
+    """
+    # Nombre d'images nécessaires pour terminer l'animation la plus longue.
+    frames_per_board = max(1, round(GUIElementsManager.CAPTURE_DISSOLVE_DURATION / FRAME_TIME_DELTA))
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        if frame % frames_per_board == 0:
+            with contextlib.redirect_stdout(io.StringIO()):
+                gui.board = boards[(frame // frames_per_board) % len(boards)]
+        gui.render_frame(FRAME_TIME_DELTA, True, True)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "frames": frames,
+        "seconds": elapsed,
+        "fps": frames / elapsed if elapsed else float("inf"),
+        "ms_per_frame": elapsed * 1000 / frames if frames else 0.0,
+    }
+
+
+def run_benchmark(frames: int = DEFAULT_FRAMES, window_size: tuple[int, int] | None = None) -> dict:
+    """
+    Exécute le benchmark complet : construction des pages, chargement des plateaux et rendu du lobby et du jeu.
+
+    Args:
+        frames (int): Le nombre d'images à rendre par scénario. Par défaut, 600.
+        window_size (tuple[int, int] | None): Taille de fenêtre simulée. Par défaut, la taille logique 1280x900.
+
+    Returns:
+        dict: Les résultats du benchmark.
+
+    Raises:
+        ValueError: Si `frames` n'est pas un entier strictement positif.
+    """
+    if not isinstance(frames, int) or frames <= 0:
+        raise ValueError("Le nombre d'images doit être un entier strictement positif.")
+
+    gui = GUIElementsManager(headless=True)
+    if window_size is not None:
+        gui.resize(window_size)
+
+    results = {
+        "window_size": list(gui.surface.get_size()),
+        "page_builds_ms": measure_page_builds(gui),
+        "lobby": {},
+        "game": {}
+    }
+
+    # Rendu du lobby avec une liste de parties.
+    lobby_elements = gui.create_gui_elements_lobby_page()
+    lobby_elements["game_buttons"] = [
+        gui.create_gui_join_game_button_element(game_json, index) for index, game_json in enumerate(SAMPLE_GAMES)
+    ]
+    results["lobby"] = measure_frames(gui, frames, False, False)
+    gui.clear_page(lobby_elements)
+
+    # Rendu de la page de jeu pour chaque plateau représentatif.
+    game_elements = gui.create_gui_elements_game_page()
+    sample_boards = build_sample_boards()
+    for board_name, board in sample_boards.items():
+        # L'affectation du plateau l'imprime dans la console : on masque cette sortie.
+        with contextlib.redirect_stdout(io.StringIO()):
+            gui.set_board(board, animate=False)
+        results["game"][board_name] = measure_frames(gui, frames, True, True)
+
+    # Rendu pendant les animations : alternance entre le milieu de partie et un plateau avec un pion
+    # posé et deux pions capturés.
+    animated_board = list(sample_boards["middle_game"])
+    animated_board[GUIElementsManager.GRID_SIZE // 2] = GUIElementsManager.HOST_CHAR
+    animated_board[0] = animated_board[7] = GUIElementsManager.EMPTY_CHAR
+    results["game"]["animated"] = measure_animated_frames(
+        gui, frames, [sample_boards["middle_game"], "".join(animated_board)]
+    )
+    gui.clear_page(game_elements)
+
+    return results
+
+
+def main() -> None:
+    """
+    Point d'entrée en ligne de commande du benchmark de rendu.
+
+    Exemple (depuis le dossier `front_end`) : `python -m benchmarks.render_benchmark --frames 1000`
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de rendu sans affichage du client Pente.")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="Nombre d'images par scénario.")
+    parser.add_argument("--output", type=str, default=None, help="Fichier JSON où écrire les résultats.")
+    parser.add_argument("--window-size", type=int, nargs=2, default=None, metavar=("WIDTH", "HEIGHT"),
+                        help="Taille de fenêtre simulée (ex : 3840 2160).")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.frames, tuple(args.window_size) if args.window_size else None)
+
+    print(json.dumps(results, indent=4))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(results, output_file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
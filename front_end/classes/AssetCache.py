@@ -0,0 +1,290 @@
+import hashlib
+import json
+import os
+import threading
+from importlib import metadata
+
+import pygame
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+
+class AssetCache:
+    """
+    Cache mémoire et disque des images pré-redimensionnées, indexé par une empreinte du thème et des assets.
+
+    Le fichier de cache contient un index JSON sur sa première ligne (nom, largeur, hauteur et position de chaque
+    image), suivi des pixels bruts des images mis bout à bout. Rien n'y est exécuté au chargement : un fichier
+    invalide ou modifié est simplement ignoré.
+    """
+
+    # Dossier par défaut du cache disque
+    CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pente-game")
+
+    # Version du format du fichier de cache (à incrémenter si le format change)
+    CACHE_FORMAT_VERSION = 2
+
+    # Format des pixels stockés sur disque
+    PIXEL_FORMAT = "RGBA"
+
+    # Nombre d'octets par pixel du format stocké
+    BYTES_PER_PIXEL = 4
+
+    # Taille maximale de l'index JSON en tête du fichier de cache (en octets)
+    MAX_INDEX_SIZE = 1 << 20
+
+    def __init__(self, theme_path: str, image_paths: dict[str, str], cache_dir: str = CACHE_DIR) -> None:
+        """
+        Initialise le cache et calcule l'empreinte du thème et des images sources.
+
+        Args:
+            theme_path (str): Le chemin du fichier de thème pygame_gui.
+            image_paths (dict[str, str]): Les chemins des images sources, indexés par nom.
+            cache_dir (str): Le dossier du cache disque. Par défaut, `~/.cache/pente-game`.
+
+        Raises:
+            ValueError: Si le chemin du thème ou le dictionnaire des images est invalide.
+            FileNotFoundError: Si le thème ou une image source n'existe pas.
+        """
+        if not isinstance(theme_path, str) or not theme_path:
+            raise ValueError("Le chemin du thème doit être une chaîne non vide.")
+        if not isinstance(image_paths, dict) or not image_paths:
+            raise ValueError("Le dictionnaire des images doit être non vide.")
+
+        self.theme_path = theme_path
+        self.image_paths = image_paths
+        self.cache_dir = cache_dir
+        self.theme_hash = self.__compute_theme_hash()
+
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._entries: dict[tuple[str, int, int], bytes | memoryview] = {}
+        self._surfaces: dict[tuple[str, int, int], pygame.Surface] = {}
+        self._originals: dict[str, pygame.Surface] = {}
+        self._is_dirty = False
+        self._warm_up_thread: threading.Thread | None = None
+
+    @property
+    def cache_path(self) -> str:
+        """
+        Récupère le chemin du fichier de cache correspondant à l'empreinte actuelle.
+
+        Returns:
+            str: Le chemin du fichier de cache.
+        """
+        return os.path.join(self.cache_dir, f"{self.theme_hash}.cache")
+
+    def __compute_theme_hash(self) -> str:
+        """
+        Calcule l'empreinte du thème, de la version de pygame_gui et des images sources.
+
+        Returns:
+            str: L'empreinte hexadécimale (SHA-256).
+
+        Raises:
+            FileNotFoundError: Si le thème ou une image source n'existe pas.
+        """
+        try:
+            pygame_gui_version = metadata.version("pygame_gui")
+        except metadata.PackageNotFoundError:
+            pygame_gui_version = "inconnue"
+
+        digest = hashlib.sha256()
+        digest.update(f"{AssetCache.CACHE_FORMAT_VERSION}:{pygame_gui_version}".encode("utf-8"))
+
+        with open(self.theme_path, "rb") as theme_file:
+            digest.update(theme_file.read())
+
+        # Les images sources sont identifiées par leur chemin, leur taille et leur date de modification.
+        for name, path in sorted(self.image_paths.items()):
+            stat = os.stat(path)
+            digest.update(f"{name}:{path}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def load(self) -> bool:
+        """
+        Charge le cache disque correspondant à l'empreinte actuelle.
+
+        Returns:
+            bool: True si un cache valide a été chargé, False sinon.
+        """
+        try:
+            with open(self.cache_path, "rb") as cache_file:
+                index = json.loads(cache_file.readline(AssetCache.MAX_INDEX_SIZE))
+                pixels = cache_file.read()
+        except (OSError, ValueError):
+            return False
+
+        entries = AssetCache.__read_entries(index, pixels)
+        if entries is None:
+            return False
+
+        with self._lock:
+            self._entries.update(entries)
+        return True
+
+    @staticmethod
+    def __read_entries(index: object, pixels: bytes) -> dict[tuple[str, int, int], memoryview] | None:
+        """
+        Vérifie l'index du fichier de cache et découpe les pixels de chaque image (sans copie).
+
+        Args:
+            index (object): L'index JSON décodé.
+            pixels (bytes): Les pixels bruts qui suivent l'index.
+
+        Returns:
+            dict[tuple[str, int, int], memoryview] | None: Les pixels de chaque image, ou None si l'index est
+                invalide (autre version, entrée mal formée ou hors du fichier).
+        """
+        if (not isinstance(index, dict) or index.get("version") != AssetCache.CACHE_FORMAT_VERSION
+                or index.get("format") != AssetCache.PIXEL_FORMAT or not isinstance(index.get("entries"), list)):
+            return None
+
+        view = memoryview(pixels)
+        entries = {}
+        for entry in index["entries"]:
+            if not isinstance(entry, list) or len(entry) != 4:
+                return None
+            name, width, height, offset = entry
+            if (not isinstance(name, str)
+                    or any(type(value) is not int for value in (width, height, offset))
+                    or width <= 0 or height <= 0 or offset < 0):
+                return None
+
+            end = offset + width * height * AssetCache.BYTES_PER_PIXEL
+            if end > len(pixels):
+                return None
+            entries[(name, width, height)] = view[offset:end]
+        return entries
+
+    def save(self) -> None:
+        """
+        Écrit le cache sur disque s'il contient de nouvelles images (écriture atomique). Appelée à la fin de la
+        préparation en arrière-plan, puis à la fermeture du client pour les images redimensionnées entre-temps (ex :
+        après un redimensionnement de la fenêtre).
+        """
+        # Une seule écriture à la fois (préparation en arrière-plan et fermeture peuvent se chevaucher).
+        with self._save_lock:
+            with self._lock:
+                if not self._is_dirty:
+                    return
+                entries = dict(self._entries)
+                self._is_dirty = False
+
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                temporary_path = f"{self.cache_path}.{os.getpid()}.tmp"
+                index = {"version": AssetCache.CACHE_FORMAT_VERSION, "format": AssetCache.PIXEL_FORMAT, "entries": []}
+                offset = 0
+                for (name, width, height), pixels in entries.items():
+                    index["entries"].append([name, width, height, offset])
+                    offset += len(pixels)
+
+                with open(temporary_path, "wb") as cache_file:
+                    cache_file.write(json.dumps(index).encode("utf-8") + b"\n")
+                    for pixels in entries.values():
+                        cache_file.write(pixels)
+                os.replace(temporary_path, self.cache_path)
+            except OSError as ose:
+                print(f"Impossible d'écrire le cache des images : {ose}")
+
+    def get_image(self, name: str, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Récupère une image redimensionnée, depuis la mémoire, le disque ou en la calculant.
+
+        Args:
+            name (str): Le nom de l'image (clé de `image_paths`).
+            size (tuple[int, int]): La taille souhaitée (largeur, hauteur).
+
+        Returns:
+            pygame.Surface: L'image à la taille demandée.
+
+        Raises:
+            KeyError: Si le nom de l'image est inconnu.
+        """
+        key = (name, int(size[0]), int(size[1]))
+
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            return surface
+
+        with self._lock:
+            pixels = self._entries.get(key)
+
+        if pixels is None:
+            pixels = self.__rasterize(key)
+
+        # Copie : la surface ne dépend pas des pixels du cache (partagés avec le fichier chargé).
+        surface = pygame.image.frombuffer(pixels, (key[1], key[2]), AssetCache.PIXEL_FORMAT).copy()
+        self._surfaces[key] = surface
+        return surface
+
+    def __rasterize(self, key: tuple[str, int, int]) -> bytes:
+        """
+        Charge l'image source et la redimensionne, puis stocke le résultat dans le cache.
+
+        Args:
+            key (tuple[str, int, int]): Le nom de l'image et la taille souhaitée.
+
+        Returns:
+            bytes: Les pixels de l'image redimensionnée.
+        """
+        name, width, height = key
+
+        # Les images sources sont partagées avec la préparation en arrière-plan, qui les libère à la fin.
+        with self._lock:
+            original = self._originals.get(name)
+        if original is None:
+            loaded = pygame.image.load(self.image_paths[name])
+            with self._lock:
+                original = self._originals.setdefault(name, loaded)
+
+        scaled = original if original.get_size() == (width, height) else pygame.transform.smoothscale(
+            original, (width, height)
+        )
+        pixels = pygame.image.tobytes(scaled, AssetCache.PIXEL_FORMAT)
+
+        with self._lock:
+            self._entries[key] = pixels
+            self._is_dirty = True
+
+        return pixels
+
+    def warm_up_async(self, requests: list[tuple[str, tuple[int, int]]]) -> threading.Thread:
+        """
+        Prépare en arrière-plan les images demandées qui ne sont pas encore en cache, puis enregistre le cache.
+
+        Args:
+            requests (list[tuple[str, tuple[int, int]]]): Les images à préparer (nom, taille), par ordre de priorité.
+
+        Returns:
+            threading.Thread: Le thread de préparation.
+        """
+        def warm_up() -> None:
+            for name, size in requests:
+                key = (name, int(size[0]), int(size[1]))
+                with self._lock:
+                    is_cached = key in self._entries
+                if not is_cached:
+                    self.__rasterize(key)
+
+            # Les images sources ne sont plus nécessaires une fois le cache rempli.
+            with self._lock:
+                self._originals.clear()
+            self.save()
+
+        self._warm_up_thread = threading.Thread(target=warm_up, name="asset-cache-warm-up", daemon=True)
+        self._warm_up_thread.start()
+        return self._warm_up_thread
+
+    def wait(self, timeout: float | None = None) -> None:
+        """
+        Attend la fin de la préparation en arrière-plan, si elle est en cours.
+
+        Args:
+            timeout (float | None): Durée maximale d'attente en secondes. Par défaut, illimitée.
+        """
+        if self._warm_up_thread is not None:
+            self._warm_up_thread.join(timeout)
@@ -1,4 +1,6 @@
+import json
 import os
+import threading
 
 import pygame
 from pygame_gui.elements import UIButton
@@ -10,14 +12,175 @@ __docformat__ = "google"
 class AudioManager:
     """Gestionnaire audio pour la lecture de musique et de sons."""
 
-    def __init__(self, sound_enabled: bool = True) -> None:
-        """Initialise le gestionnaire audio avec un état du son activé par défaut."""
+    # Format du mixeur (les sons transcodés sont produits dans ce format pour éviter toute conversion)
+    MIXER_FREQUENCY = 44100
+    MIXER_SIZE = -16
+    MIXER_CHANNELS = 2
+
+    # Manifeste des sons transcodés (voir `asset_builders/transcode_audio.py`)
+    AUDIO_MANIFEST_PATH = "assets/audio/transcoded/manifest.json"
+
+    # Catégories de sons : canaux réservés, priorité (plus elle est haute, plus le son est important) et volume
+    CATEGORY_RESULT = "result"
+    CATEGORY_GAME = "game"
+    CATEGORY_INTERFACE = "interface"
+    SOUND_CATEGORIES = {
+        CATEGORY_RESULT: {"channels": 1, "priority": 3, "volume": 1.0},
+        CATEGORY_GAME: {"channels": 3, "priority": 2, "volume": 1.0},
+        CATEGORY_INTERFACE: {"channels": 2, "priority": 1, "volume": 1.0}
+    }
+
+    # Canaux partagés entre toutes les catégories, utilisés quand les canaux réservés sont occupés
+    SHARED_CHANNELS = 2
+
+    # Durée du fondu (en millisecondes) lors de la coupure du son
+    MUTE_FADEOUT_MS = 200
+
+    def __init__(self, sound_enabled: bool = True, manifest_path: str | None = AUDIO_MANIFEST_PATH) -> None:
+        """
+        Initialise le gestionnaire audio avec un état du son activé par défaut.
+
+        Args:
+            sound_enabled (bool): Si vrai, le son est activé. Par défaut, True.
+            manifest_path (str | None): Le manifeste des sons transcodés. Si None ou absent, les fichiers
+                d'origine sont utilisés.
+
+        Raises:
+            TypeError: Si les paramètres sont de types incorrects.
+        """
         if not isinstance(sound_enabled, bool):
             raise TypeError("Le paramètre 'sound_enabled' doit être un booléen.")
 
-        pygame.mixer.init()
+        if manifest_path is not None and not isinstance(manifest_path, str):
+            raise TypeError("Le paramètre 'manifest_path' doit être une chaîne ou None.")
+
+        pygame.mixer.init(AudioManager.MIXER_FREQUENCY, AudioManager.MIXER_SIZE, AudioManager.MIXER_CHANNELS)
         self.sound_enabled = sound_enabled
 
+        # Correspondance entre les fichiers d'origine et leur version transcodée
+        self._transcoded_paths = self.__load_manifest(manifest_path) if manifest_path else {}
+
+        # Répartition des canaux : les canaux réservés de chaque catégorie, puis les canaux partagés
+        reserved_count = sum(category["channels"] for category in AudioManager.SOUND_CATEGORIES.values())
+        pygame.mixer.set_num_channels(reserved_count + AudioManager.SHARED_CHANNELS)
+        pygame.mixer.set_reserved(reserved_count)
+
+        self._category_channels: dict[str, list[pygame.mixer.Channel]] = {}
+        self._category_volumes: dict[str, float] = {}
+        next_channel = 0
+        for name, category in AudioManager.SOUND_CATEGORIES.items():
+            self._category_channels[name] = [
+                pygame.mixer.Channel(index) for index in range(next_channel, next_channel + category["channels"])
+            ]
+            self._category_volumes[name] = category["volume"]
+            next_channel += category["channels"]
+        self._shared_channels = [
+            pygame.mixer.Channel(index) for index in range(next_channel, next_channel + AudioManager.SHARED_CHANNELS)
+        ]
+
+        # Dernier son joué sur chaque canal : (priorité, numéro de lecture, catégorie, volume du son)
+        self._channel_states: dict[pygame.mixer.Channel, tuple[int, int, str, float]] = {}
+        self._play_count = 0
+
+        # Cache des sons décodés, indexés par leur chemin
+        self._sounds: dict[str, pygame.mixer.Sound] = {}
+        self._sounds_lock = threading.Lock()
+        self._preload_thread: threading.Thread | None = None
+
+    @staticmethod
+    def __load_manifest(manifest_path: str) -> dict[str, str]:
+        """
+        Charge le manifeste des sons transcodés, s'il existe et correspond au format actuel du mixeur.
+
+        Args:
+            manifest_path (str): Le chemin du manifeste.
+
+        Returns:
+            dict[str, str]: Les chemins des fichiers transcodés, indexés par le chemin du fichier d'origine.
+        """
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        # Un son produit pour un autre format serait converti à chaque chargement : on l'ignore.
+        frequency, size, channels = pygame.mixer.get_init()
+        if manifest.get("mixer") != {"frequency": frequency, "size": size, "channels": channels}:
+            print("Le manifeste audio ne correspond pas au format du mixeur : les fichiers d'origine seront utilisés.")
+            return {}
+
+        return {
+            source_path: entry["output"]
+            for source_path, entry in manifest.get("sounds", {}).items()
+            if os.path.exists(entry.get("output", ""))
+        }
+
+    def preload_sounds(self, sound_paths: dict[str, str]) -> threading.Thread:
+        """
+        Décode en arrière-plan les sons donnés, pour que leur lecture ne fasse plus aucun accès disque.
+
+        Args:
+            sound_paths (dict[str, str]): Les chemins des sons à précharger, indexés par nom (ex : `AUDIO_PATHS`).
+
+        Returns:
+            threading.Thread: Le thread de préchargement.
+
+        Raises:
+            TypeError: Si le paramètre n'est pas un dictionnaire.
+        """
+        if not isinstance(sound_paths, dict):
+            raise TypeError("Le paramètre 'sound_paths' doit être un dictionnaire.")
+
+        def preload() -> None:
+            for name, sound_path in sound_paths.items():
+                try:
+                    self.__load_sound(sound_path)
+                except (FileNotFoundError, pygame.error) as e:
+                    print(f"Impossible de précharger le son '{name}' : {e}")
+
+        self._preload_thread = threading.Thread(target=preload, name="audio-preload", daemon=True)
+        self._preload_thread.start()
+        return self._preload_thread
+
+    def wait_preload(self, timeout: float | None = None) -> None:
+        """
+        Attend la fin du préchargement des sons, s'il est en cours.
+
+        Args:
+            timeout (float | None): Durée maximale d'attente en secondes. Par défaut, illimitée.
+        """
+        if self._preload_thread is not None:
+            self._preload_thread.join(timeout)
+
+    def __load_sound(self, sound_path: str) -> pygame.mixer.Sound:
+        """
+        Récupère un son décodé depuis le cache, ou le décode et l'ajoute au cache.
+
+        Args:
+            sound_path (str): Chemin du fichier audio.
+
+        Returns:
+            pygame.mixer.Sound: Le son décodé.
+
+        Raises:
+            FileNotFoundError: Si le fichier audio spécifié n'existe pas.
+            pygame.error: Si le fichier ne peut pas être décodé.
+        """
+        sound = self._sounds.get(sound_path)
+        if sound is not None:
+            return sound
+
+        # Version transcodée au format du mixeur si elle existe, sinon le fichier d'origine.
+        load_path = self._transcoded_paths.get(sound_path, sound_path)
+        if not os.path.exists(load_path):
+            raise FileNotFoundError(f"Le fichier audio spécifié n'existe pas : {load_path}")
+
+        # Le décodage se fait hors du verrou : seul l'ajout au cache est protégé.
+        sound = pygame.mixer.Sound(load_path)
+        with self._sounds_lock:
+            return self._sounds.setdefault(sound_path, sound)
+
     def toggle_sound(self) -> bool:
         """
         Active ou désactive le son. Audio et musique seront coupés si le son est désactivé.
@@ -34,18 +197,98 @@ class AudioManager:
                 "pygame.mixer n'est pas initialisé. Assurez-vous que pygame.mixer.init() est appelé avant de basculer le son."
             )
 
-        # Arrête tout audio en cours de lecture si nécessaire
-        if pygame.mixer.get_busy():
-            pygame.mixer.stop()
-
         # Inverse l'état actuel du son
         self.sound_enabled = not self.sound_enabled
 
+        # Coupe en fondu les sons en cours si le son est désactivé (rien n'est interrompu à la réactivation)
+        if not self.sound_enabled:
+            for channel in self.__all_channels():
+                if channel.get_busy():
+                    channel.fadeout(AudioManager.MUTE_FADEOUT_MS)
+
         # Ajuste le volume en fonction du nouvel état
         pygame.mixer.music.set_volume(1 if self.sound_enabled else 0)
 
         return self.sound_enabled
 
+    def set_category_volume(self, category: str, volume: float) -> None:
+        """
+        Modifie le volume d'une catégorie de sons, y compris pour les sons en cours de lecture.
+
+        Args:
+            category (str): La catégorie (clé de `SOUND_CATEGORIES`).
+            volume (float): Niveau du volume (valeurs entre 0.0 et 1.0).
+
+        Raises:
+            ValueError: Si la catégorie est inconnue ou si le volume est hors de l'intervalle [0.0, 1.0].
+        """
+        if category not in AudioManager.SOUND_CATEGORIES:
+            raise ValueError(f"La catégorie de son '{category}' est inconnue.")
+
+        if not (0.0 <= volume <= 1.0):
+            raise ValueError("Le volume doit être compris entre 0.0 et 1.0.")
+
+        self._category_volumes[category] = volume
+
+        # Les sons de la catégorie peuvent aussi occuper des canaux partagés.
+        for channel, (_, _, channel_category, sound_volume) in self._channel_states.items():
+            if channel_category == category and channel.get_busy():
+                channel.set_volume(sound_volume * volume)
+
+    def get_category_volume(self, category: str) -> float:
+        """
+        Récupère le volume d'une catégorie de sons.
+
+        Args:
+            category (str): La catégorie (clé de `SOUND_CATEGORIES`).
+
+        Returns:
+            float: Le volume de la catégorie.
+
+        Raises:
+            ValueError: Si la catégorie est inconnue.
+        """
+        if category not in AudioManager.SOUND_CATEGORIES:
+            raise ValueError(f"La catégorie de son '{category}' est inconnue.")
+
+        return self._category_volumes[category]
+
+    def __all_channels(self) -> list[pygame.mixer.Channel]:
+        """
+        Récupère tous les canaux gérés (réservés puis partagés).
+
+        Returns:
+            list[pygame.mixer.Channel]: Les canaux.
+        """
+        channels = [channel for channels in self._category_channels.values() for channel in channels]
+        return channels + self._shared_channels
+
+    def __find_channel(self, category: str) -> pygame.mixer.Channel | None:
+        """
+        Choisit le canal sur lequel jouer un son de la catégorie donnée.
+
+        Un canal réservé libre est préféré, puis un canal partagé libre. Sinon, le son le moins prioritaire
+        (le plus ancien en cas d'égalité) est volé, à condition que sa priorité ne dépasse pas celle du nouveau son.
+
+        Args:
+            category (str): La catégorie du son à jouer.
+
+        Returns:
+            pygame.mixer.Channel | None: Le canal à utiliser, ou None si tous les sons en cours sont plus prioritaires.
+        """
+        candidates = self._category_channels[category] + self._shared_channels
+        for channel in candidates:
+            if not channel.get_busy():
+                return channel
+
+        priority = AudioManager.SOUND_CATEGORIES[category]["priority"]
+        victim = min(candidates, key=lambda candidate: self._channel_states.get(candidate, (0, 0))[:2])
+        if self._channel_states.get(victim, (0, 0))[0] > priority:
+            return None
+
+        victim.stop()
+        return victim
+
     def update_sound_button(self, sound_button: UIButton) -> None:
         """
         Met à jour le texte du bouton en fonction de l'état du son.
@@ -102,16 +345,17 @@ class AudioManager:
             except pygame.error as pe:
                 raise pygame.error(f"Erreur Pygame lors de la lecture de la musique : {pe}") from pe
 
-    def play_audio(self, sound_path: str, volume: float = 0.1) -> None:
+    def play_audio(self, sound_path: str, volume: float = 0.1, category: str = CATEGORY_INTERFACE) -> None:
         """
-        Joue un fichier audio.
+        Joue un fichier audio sur un canal de sa catégorie, en volant le canal d'un son moins prioritaire si besoin.
 
         Args:
-            sound_path (str): Chemin vers le fichier audio à jouer.
+            sound_path (str): Chemin vers le fichier audio à jouer (décodé une seule fois, puis gardé en cache).
             volume (float): Niveau du volume (valeurs entre 0.0 et 1.0). Par défaut, 0.1.
+            category (str): La catégorie du son (clé de `SOUND_CATEGORIES`). Par défaut, `CATEGORY_INTERFACE`.
 
         Raises:
-            ValueError: Si le volume est hors des limites acceptables.
+            ValueError: Si le volume est hors des limites acceptables ou si la catégorie est inconnue.
             TypeError: Si les paramètres sont de types incorrects.
             FileNotFoundError: Si le fichier audio spécifié n'existe pas.
             pygame.error: Si une erreur se produit lors de la lecture audio.
@@ -120,17 +364,27 @@ class AudioManager:
         if not isinstance(sound_path, str) or not sound_path.strip():
             raise ValueError("Le paramètre 'sound_path' doit être une chaîne non vide.")
 
-        if not os.path.exists(sound_path):
-            raise FileNotFoundError(f"Le fichier audio spécifié n'existe pas : {sound_path}")
-
         if not (0.0 <= volume <= 1.0):
             raise ValueError("Le volume doit être compris entre 0.0 et 1.0.")
 
-        # Si le son est activé et aucun autre son n'est en cours de lecture
-        if self.sound_enabled and not pygame.mixer.get_busy():
+        if category not in AudioManager.SOUND_CATEGORIES:
+            raise ValueError(f"La catégorie de son '{category}' est inconnue.")
+
+        # Si le son est activé, le joue sur un canal libre ou volé à un son moins prioritaire
+        if self.sound_enabled:
             try:
-                sound = pygame.mixer.Sound(sound_path)
-                sound.set_volume(volume)
-                sound.play()
+                # Son préchargé : aucun accès disque ; sinon il est décodé une seule fois puis gardé en cache.
+                sound = self.__load_sound(sound_path)
+
+                channel = self.__find_channel(category)
+                if channel is None:
+                    return
+
+                self._play_count += 1
+                self._channel_states[channel] = (
+                    AudioManager.SOUND_CATEGORIES[category]["priority"], self._play_count, category, volume
+                )
+                channel.play(sound)
+                channel.set_volume(volume * self._category_volumes[category])
             except pygame.error as pe:
                 raise pygame.error(f"Erreur Pygame lors de la lecture de l'audio : {pe}") from pe
@@ -1,3 +1,7 @@
+import json
+import math
+import os
+
 import pygame
 import pygame_gui
 
@@ -6,6 +10,41 @@ __docformat__ = "google"
 
 from pygame_gui.elements import UIButton
 
+from classes.AssetCache import AssetCache
+
+
+class _ScaledUIManager(pygame_gui.UIManager):
+    """Gestionnaire pygame_gui dont les positions de la souris sont converties de la fenêtre vers la surface logique."""
+
+    def __init__(self, window_resolution: tuple[int, int], theme_path: str) -> None:
+        """
+        Initialise le gestionnaire avec une mise à l'échelle neutre.
+
+        Args:
+            window_resolution (tuple[int, int]): La résolution logique de l'interface.
+            theme_path (str): Le chemin du fichier de thème.
+        """
+        self.output_scale = 1.0
+        self.output_offset = (0, 0)
+
+        # Le thème est figé : inutile de surveiller le fichier à chaque mise à jour.
+        super().__init__(window_resolution, theme_path, enable_live_theme_updates=False)
+
+    def calculate_scaled_mouse_position(self, position: tuple[int, int]) -> tuple[int, int]:
+        """
+        Convertit une position de la fenêtre en position sur la surface logique.
+
+        Args:
+            position (tuple[int, int]): La position dans la fenêtre.
+
+        Returns:
+            tuple[int, int]: La position correspondante sur la surface logique.
+        """
+        return (
+            int((position[0] - self.output_offset[0]) / self.output_scale),
+            int((position[1] - self.output_offset[1]) / self.output_scale)
+        )
+
 
 class GUIElementsManager:
     """Classe pour créer le gestionnaire GUI et les éléments"""
@@ -102,21 +141,46 @@ class GUIElementsManager:
     # Chemin du fichier style
     THEME_PATH = "assets/styles/theme.json"
 
-    # Charger les images
-    GANDALF_IMAGE = pygame.image.load("assets/images/gandalf.png")
-    SAURON_IMAGE = pygame.image.load("assets/images/sauron.png")
-    GOLLUM_IMAGE = pygame.image.load("assets/images/gollum.png")
-    NAZGUL_IMAGE = pygame.image.load("assets/images/nazgul.png")
-    KING_WITCH_OF_ANGMAR_IMAGE = pygame.image.load("assets/images/king_witch_of_angmar.png")
-    YOUNG_BILBO_IMAGE = pygame.image.load("assets/images/young_bilbo.png")
-    OLD_BILBO_IMAGE = pygame.image.load("assets/images/old_bilbo.png")
-    HOST_PION_IMAGE = pygame.image.load("assets/images/one_ring_pion.png")
-    OPPONENT_PION_IMAGE = pygame.image.load("assets/images/eye_of_sauron_pion.png")
-    PENTE_LOGO = pygame.image.load("assets/images/pente-game-LOTR-LOGO.webp")
-
-    # Redimensionner les images
-    OPPONENT_PION_IMAGE_SCALED = pygame.transform.scale(OPPONENT_PION_IMAGE, (PIECE_SIZE, PIECE_SIZE))
-    HOST_PION_IMAGE_SCALED = pygame.transform.scale(HOST_PION_IMAGE, (PIECE_SIZE, PIECE_SIZE))
+    # Pilote SDL utilisé en mode sans affichage (CI, benchmarks)
+    HEADLESS_SDL_DRIVER = "dummy"
+
+    # Chemins des images (chargées et redimensionnées via le cache des assets)
+    IMAGE_PATHS = {
+        "gandalf": "assets/images/gandalf.png",
+        "sauron": "assets/images/sauron.png",
+        "gollum": "assets/images/gollum.png",
+        "nazgul": "assets/images/nazgul.png",
+        "king_witch_of_angmar": "assets/images/king_witch_of_angmar.png",
+        "young_bilbo": "assets/images/young_bilbo.png",
+        "old_bilbo": "assets/images/old_bilbo.png",
+        "host_pion": "assets/images/one_ring_pion.png",
+        "opponent_pion": "assets/images/eye_of_sauron_pion.png",
+        "pente_logo": "assets/images/pente-game-LOTR-LOGO.webp"
+    }
+
+    # Taille de l'icône de la fenêtre
+    ICON_SIZE = (64, 64)
+
+    # Images préparées en arrière-plan au démarrage, par ordre d'apparition des pages
+    PRELOAD_IMAGES = [
+        ("gandalf", (GANDALF_IMAGE_WIDTH, GANDALF_IMAGE_HEIGHT)),
+        ("sauron", (SAURON_IMAGE_WIDTH, SAURON_IMAGE_HEIGHT)),
+        ("young_bilbo", (YOUNG_BILBO_IMAGE_WIDTH, YOUNG_BILBO_IMAGE_HEIGHT)),
+        ("old_bilbo", (OLD_BILBO_IMAGE_WIDTH, OLD_BILBO_IMAGE_HEIGHT)),
+        ("host_pion", (HOST_PION_LOGO_WIDTH, HOST_PION_LOGO_HEIGHT)),
+        ("opponent_pion", (OPPONENT_PION_LOGO_WIDTH, OPPONENT_PION_LOGO_HEIGHT)),
+        ("host_pion", (PIECE_SIZE, PIECE_SIZE)),
+        ("opponent_pion", (PIECE_SIZE, PIECE_SIZE)),
+        ("nazgul", (NAZGUL_IMAGE_WIDTH, NAZGUL_IMAGE_HEIGHT)),
+        ("king_witch_of_angmar", (KING_WITCH_OF_ANGMAR_IMAGE_WIDTH, KING_WITCH_OF_ANGMAR_IMAGE_HEIGHT)),
+        ("gollum", (GOLLUM_IMAGE_WIDTH, GOLLUM_IMAGE_HEIGHT))
+    ]
+
+    # Police par défaut de pygame_gui (le thème ne précise pas de nom de police)
+    DEFAULT_FONT_NAME = "noto_sans"
+
+    # Nombre maximal de tailles de fenêtre dont les calques redimensionnés sont conservés
+    LAYER_CACHE_MAX_SIZES = 2
 
     # Couleurs
     BACKGROUND_COLOR = (193, 176, 150)
@@ -135,23 +199,78 @@ class GUIElementsManager:
     OPPONENT_CHAR = 'o'
     EMPTY_CHAR = '-'
 
-    def __init__(self) -> None:
+    # Durée des animations (en secondes)
+    PLACEMENT_FADE_DURATION = 0.25
+    CAPTURE_DISSOLVE_DURATION = 0.4
+
+    # Types d'animation
+    ANIMATION_FADE_IN = "fade_in"
+    ANIMATION_DISSOLVE = "dissolve"
+
+    # Opacité des pions provisoires (joués localement, en attente de confirmation du serveur)
+    PROVISIONAL_ALPHA = 140
+
+    def __init__(self, headless: bool = False) -> None:
         """
         Initialise le gestionnaire d'éléments GUI.
 
+        Args:
+            headless (bool): Si vrai, utilise les pilotes SDL "dummy" (vidéo et audio) au lieu d'ouvrir une
+                vraie fenêtre. Par défaut, False.
+
         Raises:
+            TypeError: Si le paramètre `headless` n'est pas un booléen.
             ValueError: Si le chemin du thème n'est pas une chaîne non vide.
         """
+        if not isinstance(headless, bool):
+            raise TypeError("Le paramètre 'headless' doit être un booléen.")
+
+        self.headless = headless
+
+        # Cache des images : chargé depuis le disque s'il correspond au thème et aux assets actuels,
+        # sinon les images sont préparées en arrière-plan pendant l'affichage de la page de connexion.
+        self.asset_cache = AssetCache(GUIElementsManager.THEME_PATH, GUIElementsManager.IMAGE_PATHS)
+        self.asset_cache.load()
+        self.asset_cache.warm_up_async(GUIElementsManager.PRELOAD_IMAGES)
+        self._ui_images: dict[tuple[str, int, int], pygame.Surface] = {}
 
         self.surface = self.__init_pygame()
-        self.manager = pygame_gui.UIManager(
+        self.manager = _ScaledUIManager(
             (GUIElementsManager.SCREEN_WIDTH, GUIElementsManager.SCREEN_HEIGHT),
             GUIElementsManager.THEME_PATH
         )
-        self.background = self.__create_background()
-        self.screen = pygame.display.set_mode((GUIElementsManager.SCREEN_WIDTH, GUIElementsManager.SCREEN_HEIGHT))
+        self.__preload_theme_fonts()
         self._board = ""
 
+        # Calques (fond, grille, pions) rastérisés pour chaque taille de fenêtre
+        self._layers_cache: dict[tuple[int, int], dict] = {}
+        self._layers: dict = {}
+        self._logical_surface = pygame.Surface(
+            (GUIElementsManager.SCREEN_WIDTH, GUIElementsManager.SCREEN_HEIGHT), pygame.SRCALPHA
+        )
+        self.screen = self._logical_surface
+        self.background = None
+
+        # État des éléments de l'interface à l'image précédente (None : interface à redessiner entièrement)
+        self._ui_state: list[tuple] | None = None
+
+        # Rendu partiel : fenêtre entière à mettre à jour, cases modifiées et visibilité de la grille et des pions
+        self._needs_full_redraw = True
+        self._dirty_cells: set[int] = set()
+        self._frame_visibility: tuple[bool, bool] | None = None
+
+        # Image mise en cache sans les animations (fond, interface, grille et pions immobiles), recomposée uniquement
+        # dans les régions modifiées (None : image entière à composer)
+        self._scene: pygame.Surface | None = None
+
+        # Animations en cours, indexées par case du plateau
+        self._animations: dict[int, dict] = {}
+
+        # Cases des pions provisoires, dessinés en transparence jusqu'à la réponse du serveur
+        self._provisional_cells: frozenset[int] = frozenset()
+
+        self.resize(self.surface.get_size())
+
     @property
     def board(self) -> str:
         """
@@ -164,18 +283,135 @@ class GUIElementsManager:
 
     @board.setter
     def board(self, board: str) -> None:
+        """
+        Définit le plateau de jeu en animant les pions posés et capturés.
+
+        Args:
+            board (str): Le plateau de jeu.
+        """
+        self.set_board(board)
+
+    def set_board(self, board: str, animate: bool = True) -> None:
         """
         Définit le plateau de jeu.
 
+        Les pions apparus depuis le plateau précédent apparaissent en fondu et les pions disparus (captures)
+        se dissolvent. Seules les cases concernées sont redessinées pendant l'animation.
+
         Args:
             board (str): Le plateau de jeu.
+            animate (bool): Si faux, le plateau est affiché sans animation (ex : début de partie). Par défaut, True.
+
+        Raises:
+            ValueError: Si le plateau n'est pas une chaîne non vide.
         """
         if not isinstance(board, str) or not board:
             raise ValueError("Le plateau de jeu doit être une chaîne non vide.")
 
+        previous_board = self._board
         self._board = board
+
+        # Un plateau remplacé sans animation est recomposé entièrement au prochain rendu.
+        if not animate or len(previous_board) != len(board):
+            self._animations.clear()
+            self._scene = None
+        else:
+            # Planifie une animation pour chaque case modifiée.
+            for index, (old_cell, new_cell) in enumerate(zip(previous_board, board)):
+                if old_cell == new_cell:
+                    continue
+                self._dirty_cells.add(index)
+                if new_cell == GUIElementsManager.EMPTY_CHAR:
+                    self.__schedule_animation(index, old_cell, GUIElementsManager.ANIMATION_DISSOLVE)
+                else:
+                    self.__schedule_animation(index, new_cell, GUIElementsManager.ANIMATION_FADE_IN)
+
         self.print_board()
 
+    def __schedule_animation(self, index: int, char: str, kind: str) -> None:
+        """
+        Planifie une animation sur une case (remplace l'animation en cours sur cette case, le cas échéant).
+
+        Args:
+            index (int): L'indice de la case sur le plateau.
+            char (str): Le caractère du pion animé.
+            kind (str): Le type d'animation (`ANIMATION_FADE_IN` ou `ANIMATION_DISSOLVE`).
+        """
+        self._animations[index] = {
+            "char": char,
+            "kind": kind,
+            "elapsed": 0.0,
+            "duration": (
+                GUIElementsManager.PLACEMENT_FADE_DURATION
+                if kind == GUIElementsManager.ANIMATION_FADE_IN
+                else GUIElementsManager.CAPTURE_DISSOLVE_DURATION
+            )
+        }
+
+    def __preload_theme_fonts(self) -> None:
+        """
+        Précharge toutes les polices déclarées dans le thème, pour éviter leur chargement à la construction des pages.
+        """
+        with open(GUIElementsManager.THEME_PATH, "r", encoding="utf-8") as theme_file:
+            theme = json.load(theme_file)
+
+        default_font = theme.get("defaults", {}).get("font", {})
+        fonts = set()
+        for block in theme.values():
+            font = {**default_font, **block.get("font", {})}
+            style = ("bold" if font.get("bold") else "") + ("_italic" if font.get("italic") else "")
+            fonts.add((font.get("name", GUIElementsManager.DEFAULT_FONT_NAME), int(font.get("size", 14)),
+                       style.lstrip("_") or "regular"))
+
+        self.manager.preload_fonts([
+            {"name": name, "point_size": size, "style": style} for name, size, style in sorted(fonts)
+        ])
+
+    def __ui_image(self, name: str, width: int, height: int) -> pygame.Surface:
+        """
+        Récupère une image déjà redimensionnée et prémultipliée, prête pour un élément `UIImage`.
+
+        Args:
+            name (str): Le nom de l'image (clé de `IMAGE_PATHS`).
+            width (int): La largeur de l'élément.
+            height (int): La hauteur de l'élément.
+
+        Returns:
+            pygame.Surface: L'image à passer avec `image_is_alpha_premultiplied=True`.
+        """
+        key = (name, width, height)
+        image = self._ui_images.get(key)
+        if image is None:
+            image = self.asset_cache.get_image(name, (width, height)).convert_alpha().premul_alpha()
+            self._ui_images[key] = image
+        return image
+
+    def set_provisional_cells(self, cells: set[int] | frozenset[int] = frozenset()) -> None:
+        """
+        Définit les cases dont le pion est provisoire (coup joué localement, pas encore confirmé par le serveur).
+
+        Args:
+            cells (set[int] | frozenset[int]): Les indices des cases. Par défaut, aucune.
+
+        Raises:
+            ValueError: Si une case est hors du plateau.
+        """
+        if any(not isinstance(index, int) or not 0 <= index < GUIElementsManager.GRID_SIZE for index in cells):
+            raise ValueError("Les cases provisoires doivent être des indices du plateau.")
+
+        if frozenset(cells) != self._provisional_cells:
+            self._dirty_cells |= self._provisional_cells ^ frozenset(cells)
+            self._provisional_cells = frozenset(cells)
+
+    def has_animations(self) -> bool:
+        """
+        Indique si des animations sont en cours.
+
+        Returns:
+            bool: True si au moins une animation est en cours, False sinon.
+        """
+        return bool(self._animations)
+
     def print_board(self) -> None:
         """
         Affiche le plateau de jeu de manière lisible avec les numéros de colonnes et de lignes.
@@ -198,13 +434,183 @@ class GUIElementsManager:
         Args:
             event (pygame.event.Event): L'événement à traiter.
         """
+        # Redimensionnement de la fenêtre : les calques sont reconstruits une seule fois.
+        if event.type == pygame.VIDEORESIZE:
+            self.resize(event.size)
+
+        # Fenêtre de nouveau visible : son contenu est à redessiner entièrement.
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self._needs_full_redraw = True
+
         self.manager.process_events(event)
 
-    def draw_ui(self) -> None:
+    def resize(self, size: tuple[int, int]) -> None:
+        """
+        Adapte le rendu à une nouvelle taille de fenêtre.
+
+        Le fond et les pions sont rastérisés une seule fois par taille de fenêtre puis conservés en cache ; aucune
+        mise à l'échelle n'est faite image par image pour ces calques.
+
+        Args:
+            size (tuple[int, int]): La nouvelle taille de la fenêtre (largeur, hauteur).
+
+        Raises:
+            ValueError: Si la taille n'est pas composée de deux entiers strictement positifs.
         """
-        Dessine les éléments de l'interface utilisateur.
+        width, height = size
+        if not isinstance(width, int) or not isinstance(height, int) or width <= 0 or height <= 0:
+            raise ValueError("La taille de la fenêtre doit être composée de deux entiers strictement positifs.")
+
+        # Redimensionne la fenêtre si nécessaire (redimensionnement demandé par le programme).
+        if pygame.display.get_surface().get_size() != (width, height):
+            pygame.display.set_mode((width, height), pygame.RESIZABLE)
+        self.surface = pygame.display.get_surface()
+
+        # Récupère les calques depuis le cache ou les construit pour cette taille.
+        layers = self._layers_cache.pop((width, height), None)
+        if layers is None:
+            layers = self.__build_layers((width, height))
+        self._layers_cache[(width, height)] = layers
+
+        # Limite le nombre de tailles conservées (les plus anciennes sont retirées en premier).
+        while len(self._layers_cache) > GUIElementsManager.LAYER_CACHE_MAX_SIZES:
+            del self._layers_cache[next(iter(self._layers_cache))]
+
+        self._layers = layers
+        self.background = layers["background"]
+        self._scene = None
+        self._ui_state = None
+        self._needs_full_redraw = True
+
+        self.manager.output_scale = layers["scale"]
+        self.manager.output_offset = layers["offset"]
+
+    def to_logical_position(self, position: tuple[int, int]) -> tuple[int, int]:
         """
+        Convertit une position de la fenêtre (ex : `event.pos`) en position sur la surface logique 1280x900.
+
+        Args:
+            position (tuple[int, int]): La position dans la fenêtre.
+
+        Returns:
+            tuple[int, int]: La position correspondante sur la surface logique.
+        """
+        return self.manager.calculate_scaled_mouse_position(position)
+
+    def __build_layers(self, size: tuple[int, int]) -> dict:
+        """
+        Construit les calques de rendu pour une taille de fenêtre donnée.
+
+        Args:
+            size (tuple[int, int]): La taille de la fenêtre (largeur, hauteur).
+
+        Returns:
+            dict: L'échelle, le décalage, le fond, les pions rastérisés, la position des cases et le calque de
+                  l'interface.
+        """
+        width, height = size
+        scale = min(width / GUIElementsManager.SCREEN_WIDTH, height / GUIElementsManager.SCREEN_HEIGHT)
+        scaled_size = (round(GUIElementsManager.SCREEN_WIDTH * scale), round(GUIElementsManager.SCREEN_HEIGHT * scale))
+        offset = ((width - scaled_size[0]) // 2, (height - scaled_size[1]) // 2)
+        is_identity = scaled_size == (GUIElementsManager.SCREEN_WIDTH, GUIElementsManager.SCREEN_HEIGHT)
+
+        # Pions rastérisés à la taille finale depuis les images d'origine.
+        piece_size = max(1, round(GUIElementsManager.PIECE_SIZE * scale))
+        pieces = {
+            GUIElementsManager.HOST_CHAR: self.asset_cache.get_image("host_pion", (piece_size, piece_size)),
+            GUIElementsManager.OPPONENT_CHAR: self.asset_cache.get_image("opponent_pion", (piece_size, piece_size))
+        }
+
+        # Coin supérieur gauche des pions pour chaque colonne et chaque ligne.
+        cell_x = [
+            offset[0] + round((GUIElementsManager.MARGIN_X + x * GUIElementsManager.CELL_SIZE) * scale) - piece_size // 2
+            for x in range(GUIElementsManager.GRID_COLS)
+        ]
+        cell_y = [
+            offset[1] + round((GUIElementsManager.MARGIN_Y + y * GUIElementsManager.CELL_SIZE) * scale) - piece_size // 2
+            for y in range(GUIElementsManager.GRID_ROWS)
+        ]
+
+        return {
+            "scale": scale,
+            "offset": offset,
+            "background": self.__create_background(size).convert(),
+            "pieces": {char: piece.convert_alpha() for char, piece in pieces.items()},
+            "animated_pieces": {char: piece.convert_alpha() for char, piece in pieces.items()},
+            "cell_x": cell_x,
+            "cell_y": cell_y,
+            "piece_size": (piece_size, piece_size),
+            "ui": None if is_identity else pygame.Surface(scaled_size, pygame.SRCALPHA).convert_alpha()
+        }
+
+    def draw_ui(self) -> list[pygame.Rect] | None:
+        """
+        Dessine les éléments de l'interface utilisateur sur leur calque (la surface logique, remise à l'échelle de la
+        fenêtre si besoin).
+
+        Le calque n'est dessiné et mis à l'échelle que si l'interface a changé depuis l'image précédente (voir
+        `__ui_state`) : une image sans changement ne coûte qu'une comparaison de quelques dizaines d'éléments.
+
+        Returns:
+            list[pygame.Rect] | None: Les régions de la fenêtre où l'interface a changé (vide si rien n'a changé), ou
+                                      None si toute l'interface est à recomposer (nouvelle taille, ordre modifié).
+        """
+        state = self.__ui_state()
+        previous_state = self._ui_state
+        if state == previous_state:
+            return []
+
+        self._ui_state = state
+        self.screen.fill((0, 0, 0, 0))
         self.manager.draw_ui(self.screen)
+        ui_layer = self._layers["ui"]
+        if ui_layer is not None:
+            pygame.transform.scale(self.screen, ui_layer.get_size(), ui_layer)
+
+        changed = set(state).symmetric_difference(previous_state or [])
+        if previous_state is None or not changed:
+            return None
+        return [
+            self.__to_window_rect(pygame.Rect(rect).union(pygame.Rect(rect[:2], image.get_size())))
+            for image, rect, _, _ in changed
+        ]
+
+    def __to_window_rect(self, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Convertit une région de la surface logique en région de la fenêtre, élargie d'un pixel pour couvrir les
+        arrondis de la mise à l'échelle.
+
+        Args:
+            rect (pygame.Rect): La région sur la surface logique.
+
+        Returns:
+            pygame.Rect: La région correspondante dans la fenêtre (limitée à la fenêtre).
+        """
+        scale = self._layers["scale"]
+        offset_x, offset_y = self._layers["offset"]
+        left = offset_x + math.floor(rect.left * scale) - 1
+        top = offset_y + math.floor(rect.top * scale) - 1
+        right = offset_x + math.ceil(rect.right * scale) + 1
+        bottom = offset_y + math.ceil(rect.bottom * scale) + 1
+        return pygame.Rect(left, top, right - left, bottom - top).clip(self.surface.get_rect())
+
+    def __ui_state(self) -> list[tuple]:
+        """
+        Relève l'état affiché de l'interface : image, position, région visible et mode de fusion de chaque élément
+        visible, dans l'ordre de dessin.
+
+        Les éléments de pygame_gui remplacent leur image par une copie à chaque changement d'apparence (survol,
+        focus, texte, curseur clignotant) : comparer les images par identité suffit à savoir si l'interface a
+        changé, sans la dessiner. Les images sont conservées dans l'état, leur identité ne peut donc pas être
+        réutilisée par une nouvelle image.
+
+        Returns:
+            list[tuple]: L'état de chaque élément visible.
+        """
+        return [
+            (image, tuple(rect), None if area is None else tuple(area), blendmode)
+            for image, rect, area, blendmode in self.manager.ui_group.visible
+        ]
 
     def update_manager(self, time_delta: float) -> None:
         """
@@ -215,11 +621,23 @@ class GUIElementsManager:
         """
         self.manager.update(time_delta)
 
-    def blit_background(self) -> None:
+    def blit_background(self, with_grid: bool = False) -> None:
         """
         Affiche l'arrière-plan sur l'écran.
+
+        Args:
+            with_grid (bool): Si vrai, affiche l'arrière-plan comprenant la grille du plateau. Par défaut, False.
+
+        Raises:
+            ValueError: Si la surface n'est pas valide.
         """
-        self.screen.blit(self.background, (0, 0))
+        # Vérifie que la surface est valide
+        if not isinstance(self.surface, pygame.Surface):
+            raise ValueError("La surface fournie n'est pas valide.")
+
+        self.surface.blit(self._layers["background"], (0, 0))
+        if with_grid:
+            self.__rasterize_grid(self.surface, self._layers["scale"], self._layers["offset"])
 
     def __init_pygame(self) -> pygame.Surface:
         """
@@ -232,6 +650,11 @@ class GUIElementsManager:
             RuntimeError: Si Pygame ne peut pas être initialisé correctement.
         """
         try:
+            # En mode sans affichage, force les pilotes SDL factices avant l'initialisation
+            if self.headless:
+                os.environ["SDL_VIDEODRIVER"] = GUIElementsManager.HEADLESS_SDL_DRIVER
+                os.environ["SDL_AUDIODRIVER"] = GUIElementsManager.HEADLESS_SDL_DRIVER
+
             # Initialise Pygame
             pygame.init()
 
@@ -239,31 +662,139 @@ class GUIElementsManager:
             if not pygame.get_init():
                 raise RuntimeError("Échec de l'initialisation de Pygame.")
 
-            # Crée une fenêtre de jeu
-            screen = pygame.display.set_mode((GUIElementsManager.SCREEN_WIDTH, GUIElementsManager.SCREEN_HEIGHT))
+            # Crée une fenêtre de jeu redimensionnable
+            screen = pygame.display.set_mode(
+                (GUIElementsManager.SCREEN_WIDTH, GUIElementsManager.SCREEN_HEIGHT),
+                pygame.RESIZABLE
+            )
             pygame.display.set_caption("Pente Game / LOTR Edition")
-            pygame.display.set_icon(GUIElementsManager.PENTE_LOGO)
+            pygame.display.set_icon(self.asset_cache.get_image("pente_logo", GUIElementsManager.ICON_SIZE))
 
             return screen
         except Exception as e:
             raise RuntimeError(f"Erreur lors de l'initialisation de Pygame : {e}") from e
 
+    def render_frame(self, time_delta: float, is_grid_visible: bool, is_board_visible: bool) -> None:
+        """
+        Effectue le rendu d'une image : interface, grille et plateau, puis met à jour l'affichage.
+
+        L'image sans les animations est mise en cache et recomposée uniquement dans les régions modifiées : éléments
+        de l'interface changés et cases dont le pion a changé (entièrement si la taille de la fenêtre, l'ordre des
+        éléments ou la visibilité de la grille et des pions a changé). Seules ces régions et les cases animées sont
+        copiées dans la fenêtre et envoyées à l'écran ; si rien n'a changé, l'affichage n'est pas mis à jour.
+
+        Args:
+            time_delta (float): Le temps écoulé depuis la dernière image (en secondes).
+            is_grid_visible (bool): Si vrai, dessine la grille du plateau.
+            is_board_visible (bool): Si vrai, dessine les pions du plateau.
+        """
+        self.update_manager(time_delta)
+        ui_rects = self.draw_ui()
+
+        visibility = (is_grid_visible, is_board_visible)
+        if ui_rects is None or visibility != self._frame_visibility:
+            self._scene = None
+        self._frame_visibility = visibility
+
+        dirty_cells = self._dirty_cells if is_board_visible else set()
+        self._dirty_cells = set()
+
+        # Image en cache : composée entièrement, ou seulement dans les régions modifiées.
+        if self._scene is None:
+            self.__compose()
+            rects = None
+        else:
+            rects = ui_rects + [self.__cell_rect(index) for index in dirty_cells]
+            for rect in rects:
+                self.__compose(rect)
+
+        if rects is None or self._needs_full_redraw:
+            self.surface.blit(self._scene, (0, 0))
+            rects = redrawn_cells = None
+        else:
+            # Les pions animés sont redessinés à chaque image, les pions provisoires seulement si leur case a été
+            # recomposée (ailleurs, leur transparence s'accumulerait) : leur case est alors copiée en entier.
+            redrawn_cells = set(self._animations) if is_board_visible else set()
+            if is_board_visible:
+                redrawn_cells |= {
+                    index for index in self._provisional_cells if self.__cell_rect(index).collidelist(rects) != -1
+                }
+            rects += [self.__cell_rect(index) for index in redrawn_cells - dirty_cells]
+            for rect in rects:
+                self.surface.blit(self._scene, rect, rect)
+        self._needs_full_redraw = False
+
+        # Animations des pions (uniquement les cases concernées).
+        if is_board_visible:
+            self.draw_animations(time_delta, redrawn_cells)
+
+        # Mise à jour de l'affichage (rien à envoyer si aucune région n'a changé).
+        if rects is None or rects:
+            self.update_display(rects)
+
+    def __compose(self, area: pygame.Rect | None = None) -> None:
+        """
+        Compose l'image mise en cache dans l'ordre de rendu : fond, interface, grille puis pions immobiles (hors pions
+        en cours d'apparition et pions provisoires, dessinés à chaque image par `draw_animations`).
+
+        Args:
+            area (pygame.Rect | None): La région de la fenêtre à recomposer. Par défaut, toute l'image (recréée si
+                la taille de la fenêtre a changé).
+        """
+        if self._scene is None:
+            self._scene = pygame.Surface(self.surface.get_size()).convert()
+            area = None
+
+        scene = self._scene
+        is_grid_visible, is_board_visible = self._frame_visibility
+        scene.set_clip(area)
+
+        scene.blit(self._layers["background"], (0, 0))
+        scene.blit(self._layers["ui"] or self.screen, self._layers["offset"], special_flags=pygame.BLEND_PREMULTIPLIED)
+        if is_grid_visible:
+            self.__rasterize_grid(scene, self._layers["scale"], self._layers["offset"])
+
+        if is_board_visible:
+            pieces = self._layers["pieces"]
+            for index, cell in enumerate(self.board):
+                # Dessine le pion s'il est défini, n'est pas en cours d'apparition, n'est pas provisoire et se
+                # trouve dans la région
+                pion_image = pieces.get(cell)
+                animation = self._animations.get(index)
+                if (
+                        pion_image and index not in self._provisional_cells
+                        and not (animation and animation["kind"] == GUIElementsManager.ANIMATION_FADE_IN)
+                        and (area is None or area.colliderect(self.__cell_rect(index)))
+                ):
+                    scene.blit(pion_image, self.__cell_position(index))
+
+        scene.set_clip(None)
+
     @staticmethod
-    def update_display() -> None:
+    def update_display(rects: list[pygame.Rect] | None = None) -> None:
         """
         Met à jour l'affichage de la fenêtre de jeu.
+
+        Args:
+            rects (list[pygame.Rect] | None): Les régions à mettre à jour. Par défaut, toute la fenêtre.
         """
-        pygame.display.update()
+        if rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
 
     @staticmethod
-    def __create_background() -> pygame.Surface:
+    def __create_background(size: tuple[int, int]) -> pygame.Surface:
         """
         Crée une surface d'arrière-plan pour la fenêtre de jeu.
 
+        Args:
+            size (tuple[int, int]): La taille de la fenêtre.
+
         Returns:
             pygame.Surface: La surface d'arrière-plan remplie avec la couleur de fond.
         """
-        background = pygame.Surface((GUIElementsManager.SCREEN_WIDTH, GUIElementsManager.SCREEN_HEIGHT))
+        background = pygame.Surface(size)
         background.fill(GUIElementsManager.BACKGROUND_COLOR)
         return background
 
@@ -280,7 +811,10 @@ class GUIElementsManager:
                 (GUIElementsManager.HOST_PION_LOGO_X, GUIElementsManager.HOST_PION_LOGO_Y),  # Position du logo.
                 (GUIElementsManager.HOST_PION_LOGO_WIDTH, GUIElementsManager.HOST_PION_LOGO_HEIGHT)  # Taille du logo.
             ),
-            image_surface=GUIElementsManager.HOST_PION_IMAGE,  # Image utilisée pour le logo.
+            image_surface=self.__ui_image(
+                "host_pion", GUIElementsManager.HOST_PION_LOGO_WIDTH, GUIElementsManager.HOST_PION_LOGO_HEIGHT
+            ),  # Image utilisée pour le logo.
+            image_is_alpha_premultiplied=True,
             manager=self.manager  # Gestionnaire d'interface utilisateur.
         )
 
@@ -298,7 +832,10 @@ class GUIElementsManager:
                 (GUIElementsManager.OPPONENT_PION_LOGO_WIDTH, GUIElementsManager.OPPONENT_PION_LOGO_HEIGHT)
                 # Taille du logo.
             ),
-            image_surface=GUIElementsManager.OPPONENT_PION_IMAGE,  # Image utilisée pour le logo.
+            image_surface=self.__ui_image(
+                "opponent_pion", GUIElementsManager.OPPONENT_PION_LOGO_WIDTH, GUIElementsManager.OPPONENT_PION_LOGO_HEIGHT
+            ),  # Image utilisée pour le logo.
+            image_is_alpha_premultiplied=True,
             manager=self.manager  # Gestionnaire d'interface utilisateur.
         )
 
@@ -572,7 +1109,10 @@ class GUIElementsManager:
                     (GUIElementsManager.YOUNG_BILBO_IMAGE_X, GUIElementsManager.YOUNG_BILBO_IMAGE_Y),
                     (GUIElementsManager.YOUNG_BILBO_IMAGE_WIDTH, GUIElementsManager.YOUNG_BILBO_IMAGE_HEIGHT)
                 ),
-                image_surface=GUIElementsManager.YOUNG_BILBO_IMAGE,
+                image_surface=self.__ui_image(
+                    "young_bilbo", GUIElementsManager.YOUNG_BILBO_IMAGE_WIDTH, GUIElementsManager.YOUNG_BILBO_IMAGE_HEIGHT
+                ),
+                image_is_alpha_premultiplied=True,
                 manager=self.manager
             ),
             "old_bilbo_image": pygame_gui.elements.UIImage(
@@ -580,7 +1120,10 @@ class GUIElementsManager:
                     (GUIElementsManager.OLD_BILBO_IMAGE_X, GUIElementsManager.OLD_BILBO_IMAGE_Y),
                     (GUIElementsManager.OLD_BILBO_IMAGE_WIDTH, GUIElementsManager.OLD_BILBO_IMAGE_HEIGHT)
                 ),
-                image_surface=GUIElementsManager.OLD_BILBO_IMAGE,
+                image_surface=self.__ui_image(
+                    "old_bilbo", GUIElementsManager.OLD_BILBO_IMAGE_WIDTH, GUIElementsManager.OLD_BILBO_IMAGE_HEIGHT
+                ),
+                image_is_alpha_premultiplied=True,
                 manager=self.manager
             ),
 
@@ -688,7 +1231,10 @@ class GUIElementsManager:
                     (GUIElementsManager.NAZGUL_IMAGE_X, GUIElementsManager.NAZGUL_IMAGE_Y),
                     (GUIElementsManager.NAZGUL_IMAGE_WIDTH, GUIElementsManager.NAZGUL_IMAGE_HEIGHT)
                 ),
-                image_surface=GUIElementsManager.NAZGUL_IMAGE,
+                image_surface=self.__ui_image(
+                    "nazgul", GUIElementsManager.NAZGUL_IMAGE_WIDTH, GUIElementsManager.NAZGUL_IMAGE_HEIGHT
+                ),
+                image_is_alpha_premultiplied=True,
                 manager=self.manager
             ),
             "king_witch_of_angmar_image": pygame_gui.elements.UIImage(
@@ -697,7 +1243,10 @@ class GUIElementsManager:
                     (GUIElementsManager.KING_WITCH_OF_ANGMAR_IMAGE_WIDTH,
                      GUIElementsManager.KING_WITCH_OF_ANGMAR_IMAGE_HEIGHT)
                 ),
-                image_surface=GUIElementsManager.KING_WITCH_OF_ANGMAR_IMAGE,
+                image_surface=self.__ui_image(
+                    "king_witch_of_angmar", GUIElementsManager.KING_WITCH_OF_ANGMAR_IMAGE_WIDTH, GUIElementsManager.KING_WITCH_OF_ANGMAR_IMAGE_HEIGHT
+                ),
+                image_is_alpha_premultiplied=True,
                 manager=self.manager
             ),
 
@@ -790,7 +1339,10 @@ class GUIElementsManager:
                     (GUIElementsManager.GANDALF_IMAGE_X, GUIElementsManager.GANDALF_IMAGE_Y),
                     (GUIElementsManager.GANDALF_IMAGE_WIDTH, GUIElementsManager.GANDALF_IMAGE_HEIGHT)
                 ),
-                image_surface=GUIElementsManager.GANDALF_IMAGE,
+                image_surface=self.__ui_image(
+                    "gandalf", GUIElementsManager.GANDALF_IMAGE_WIDTH, GUIElementsManager.GANDALF_IMAGE_HEIGHT
+                ),
+                image_is_alpha_premultiplied=True,
                 manager=self.manager
             ),
             "sauron_image": pygame_gui.elements.UIImage(
@@ -798,7 +1350,10 @@ class GUIElementsManager:
                     (GUIElementsManager.SAURON_IMAGE_X, GUIElementsManager.SAURON_IMAGE_Y),
                     (GUIElementsManager.SAURON_IMAGE_WIDTH, GUIElementsManager.SAURON_IMAGE_HEIGHT)
                 ),
-                image_surface=GUIElementsManager.SAURON_IMAGE,
+                image_surface=self.__ui_image(
+                    "sauron", GUIElementsManager.SAURON_IMAGE_WIDTH, GUIElementsManager.SAURON_IMAGE_HEIGHT
+                ),
+                image_is_alpha_premultiplied=True,
                 manager=self.manager
             ),
 
@@ -856,6 +1411,16 @@ class GUIElementsManager:
                 manager=self.manager
             ),
 
+            # Bouton pour jouer hors ligne contre l'ordinateur (sans serveur).
+            "offline_button": pygame_gui.elements.UIButton(
+                relative_rect=pygame.Rect(
+                    (GUIElementsManager.SCREEN_WIDTH // 2 - 100, GUIElementsManager.SCREEN_HEIGHT // 2 + 205),
+                    (GUIElementsManager.BUTTON_WIDTH, GUIElementsManager.BUTTON_HEIGHT)
+                ),
+                text="Jouer hors ligne",
+                manager=self.manager
+            ),
+
             # Label pour afficher les erreurs éventuelles.
             "error_label": pygame_gui.elements.UILabel(
                 relative_rect=pygame.Rect(
@@ -949,7 +1514,10 @@ class GUIElementsManager:
                     (GUIElementsManager.GOLLUM_IMAGE_X, GUIElementsManager.GOLLUM_IMAGE_Y),
                     (GUIElementsManager.GOLLUM_IMAGE_WIDTH, GUIElementsManager.GOLLUM_IMAGE_HEIGHT)
                 ),
-                image_surface=GUIElementsManager.GOLLUM_IMAGE,
+                image_surface=self.__ui_image(
+                    "gollum", GUIElementsManager.GOLLUM_IMAGE_WIDTH, GUIElementsManager.GOLLUM_IMAGE_HEIGHT
+                ),
+                image_is_alpha_premultiplied=True,
                 manager=self.manager
             ),
 
@@ -1211,81 +1779,191 @@ class GUIElementsManager:
                 manager=self.manager,
                 object_id="#captures_label_on_game_page"
             ),
+
+            # Bouton pour demander un indice (meilleur coup calculé en arrière-plan).
+            "hint_button": pygame_gui.elements.UIButton(
+                relative_rect=pygame.Rect(
+                    (
+                        GUIElementsManager.SCREEN_WIDTH - GUIElementsManager.BUTTON_WIDTH - GUIElementsManager.BUTTON_LEFT_RIGHT_MARGIN,
+                        GUIElementsManager.SCREEN_HEIGHT - 2 * GUIElementsManager.BUTTON_BOTTOM_MARGIN
+                    ),
+                    (GUIElementsManager.BUTTON_WIDTH, GUIElementsManager.BUTTON_HEIGHT)
+                ),
+                text="Indice",
+                manager=self.manager,
+                object_id="#hint_button"
+            ),
+
+            # Bouton pour afficher ou masquer la barre d'évaluation.
+            "evaluation_button": pygame_gui.elements.UIButton(
+                relative_rect=pygame.Rect(
+                    (
+                        GUIElementsManager.SCREEN_WIDTH - GUIElementsManager.BUTTON_WIDTH - GUIElementsManager.BUTTON_LEFT_RIGHT_MARGIN,
+                        GUIElementsManager.SCREEN_HEIGHT - 3 * GUIElementsManager.BUTTON_BOTTOM_MARGIN
+                    ),
+                    (GUIElementsManager.BUTTON_WIDTH, GUIElementsManager.BUTTON_HEIGHT)
+                ),
+                text="Évaluation",
+                manager=self.manager,
+                object_id="#evaluation_button"
+            ),
+
+            # Indice et évaluation de l'analyse en cours.
+            "hint_label": pygame_gui.elements.UILabel(
+                relative_rect=pygame.Rect(
+                    (
+                        GUIElementsManager.SCREEN_WIDTH - GUIElementsManager.BUTTON_WIDTH - GUIElementsManager.BUTTON_LEFT_RIGHT_MARGIN,
+                        GUIElementsManager.SCREEN_HEIGHT - 4 * GUIElementsManager.BUTTON_BOTTOM_MARGIN
+                    ),
+                    (GUIElementsManager.BUTTON_WIDTH, GUIElementsManager.LABEL_HEIGHT)
+                ),
+                text="",
+                manager=self.manager,
+                object_id="#hint_label"
+            ),
+
+            # Barre d'évaluation (part de l'avantage du joueur local), masquée par défaut.
+            "evaluation_bar": pygame_gui.elements.UIStatusBar(
+                relative_rect=pygame.Rect(
+                    (
+                        GUIElementsManager.SCREEN_WIDTH - GUIElementsManager.BUTTON_WIDTH - GUIElementsManager.BUTTON_LEFT_RIGHT_MARGIN,
+                        GUIElementsManager.SCREEN_HEIGHT - 4 * GUIElementsManager.BUTTON_BOTTOM_MARGIN +
+                        GUIElementsManager.LABEL_HEIGHT + GUIElementsManager.LABEL_MARGIN_BOTTOM // 2
+                    ),
+                    (GUIElementsManager.BUTTON_WIDTH, GUIElementsManager.LABEL_HEIGHT // 2)
+                ),
+                manager=self.manager,
+                object_id="#evaluation_bar",
+                visible=0
+            ),
         }
 
-    def draw_board(self) -> None:
+    def __cell_position(self, index: int) -> tuple[int, int]:
         """
-        Dessine le plateau de jeu en affichant les pièces à leurs positions respectives.
+        Calcule la position (coin supérieur gauche) d'un pion dans la fenêtre.
 
-        Raises:
-            NameError: Si des constantes ou variables utilisées ne sont pas définies.
-            TypeError: Si le tableau `board` ou ses éléments sont mal définis.
+        Args:
+            index (int): L'indice de la case sur le plateau.
+
+        Returns:
+            tuple[int, int]: La position du pion dans la fenêtre.
         """
-        # Parcourt chaque rangée de la grille
-        for y in range(GUIElementsManager.GRID_ROWS):
-            # Parcourt chaque colonne de la grille
-            for x in range(GUIElementsManager.GRID_COLS):
-                # Récupère l'état de la case actuelle
-                cell = self.board[y * GUIElementsManager.GRID_COLS + x]
+        return (
+            self._layers["cell_x"][index % GUIElementsManager.GRID_COLS],
+            self._layers["cell_y"][index // GUIElementsManager.GRID_COLS]
+        )
 
-                # Calcul de la position en pixels de l'image
-                img_x = GUIElementsManager.MARGIN_X + (x * GUIElementsManager.CELL_SIZE) - (
-                        GUIElementsManager.PIECE_SIZE // 2)
-                img_y = GUIElementsManager.MARGIN_Y + (y * GUIElementsManager.CELL_SIZE) - (
-                        GUIElementsManager.PIECE_SIZE // 2)
+    def __cell_rect(self, index: int) -> pygame.Rect:
+        """
+        Calcule la région d'un pion dans la fenêtre.
 
-                # Détermine l'image à utiliser en fonction du caractère dans la case
-                pion_image = {
-                    GUIElementsManager.HOST_CHAR: GUIElementsManager.HOST_PION_IMAGE_SCALED,
-                    GUIElementsManager.OPPONENT_CHAR: GUIElementsManager.OPPONENT_PION_IMAGE_SCALED
-                }.get(cell)
+        Args:
+            index (int): L'indice de la case sur le plateau.
 
-                # Dessine l'image si elle est définie
-                if pion_image:
-                    self.screen.blit(pion_image, (img_x, img_y))
+        Returns:
+            pygame.Rect: La région du pion dans la fenêtre.
+        """
+        return pygame.Rect(self.__cell_position(index), self._layers["piece_size"])
 
-    def draw_grid(self) -> None:
+    def draw_animations(self, time_delta: float, redrawn_cells: set[int] | None = None) -> None:
         """
-        Dessine la grille du plateau et les points "hoshi" sur la surface donnée.
+        Fait avancer et dessine les animations en cours (apparition et capture des pions), puis les pions provisoires.
 
-        Raises:
-            ValueError: Si la surface n'est pas valide.
+        Seules les cases animées ou provisoires sont dessinées ; sinon, rien n'est fait.
+        À la fin d'une apparition, le pion est intégré à l'image mise en cache sans la recomposer.
+
+        Args:
+            time_delta (float): Le temps écoulé depuis la dernière image (en secondes).
+            redrawn_cells (set[int] | None): Les cases restaurées pour cette image : seuls leurs pions provisoires
+                sont redessinés (ailleurs, leur transparence s'accumulerait). Par défaut, toutes les cases.
         """
-        # Vérifie que la surface est valide
-        if not isinstance(self.surface, pygame.Surface):
-            raise ValueError("La surface fournie n'est pas valide.")
+        if not self._animations and not self._provisional_cells:
+            return
+
+        animated_pieces = self._layers["animated_pieces"]
+        finished = []
+
+        for index, animation in self._animations.items():
+            animation["elapsed"] += time_delta
+            progress = min(1.0, animation["elapsed"] / animation["duration"])
+            position = self.__cell_position(index)
+
+            if progress >= 1.0:
+                finished.append(index)
+                # Le pion apparu rejoint l'image mise en cache (région de la case uniquement).
+                if (
+                        animation["kind"] == GUIElementsManager.ANIMATION_FADE_IN and self._scene is not None
+                        and index not in self._provisional_cells
+                ):
+                    self._scene.blit(self._layers["pieces"][animation["char"]], position)
+                    self.surface.blit(self._layers["pieces"][animation["char"]], position)
+                continue
+
+            # Opacité croissante pour une apparition, décroissante pour une capture.
+            alpha = progress if animation["kind"] == GUIElementsManager.ANIMATION_FADE_IN else 1.0 - progress
+            max_alpha = GUIElementsManager.PROVISIONAL_ALPHA if index in self._provisional_cells else 255
+            pion_image = animated_pieces.get(animation["char"])
+            if pion_image:
+                pion_image.set_alpha(round(alpha * max_alpha))
+                self.surface.blit(pion_image, position)
+
+        for index in finished:
+            del self._animations[index]
+
+        # Les pions provisoires restent transparents tant que le serveur n'a pas confirmé le coup.
+        for index in self._provisional_cells:
+            pion_image = animated_pieces.get(self.board[index])
+            if pion_image and index not in self._animations and (redrawn_cells is None or index in redrawn_cells):
+                pion_image.set_alpha(GUIElementsManager.PROVISIONAL_ALPHA)
+                self.surface.blit(pion_image, self.__cell_position(index))
+
+    @staticmethod
+    def __rasterize_grid(grid: pygame.Surface, scale: float, offset: tuple[int, int]) -> None:
+        """
+        Rastérise la grille du plateau et les points "hoshi" à la taille de la fenêtre.
+
+        Args:
+            grid (pygame.Surface): La surface (à la taille de la fenêtre) sur laquelle dessiner la grille.
+            scale (float): Le facteur d'échelle entre la surface logique et la fenêtre.
+            offset (tuple[int, int]): Le décalage de la surface logique dans la fenêtre.
+        """
+        def to_window(x: float, y: float) -> tuple[int, int]:
+            return offset[0] + round(x * scale), offset[1] + round(y * scale)
+
+        def line_width(width: int) -> int:
+            return max(1, round(width * scale))
 
         # Dessiner les lignes verticales
         for x in range(GUIElementsManager.GRID_COLS):
             pygame.draw.line(
-                self.surface,
+                grid,
                 GUIElementsManager.LINE_COLOR,
-                (GUIElementsManager.MARGIN_X + x * GUIElementsManager.CELL_SIZE, GUIElementsManager.MARGIN_Y),
-                (GUIElementsManager.MARGIN_X + x * GUIElementsManager.CELL_SIZE,
-                 GUIElementsManager.MARGIN_Y + GUIElementsManager.GRID_DIMENSIONS),
-                GUIElementsManager.LINE_WIDTH_CENTER if x == GUIElementsManager.GRID_COLS // 2 else GUIElementsManager.LINE_WIDTH_DEFAULT
+                to_window(GUIElementsManager.MARGIN_X + x * GUIElementsManager.CELL_SIZE, GUIElementsManager.MARGIN_Y),
+                to_window(GUIElementsManager.MARGIN_X + x * GUIElementsManager.CELL_SIZE,
+                          GUIElementsManager.MARGIN_Y + GUIElementsManager.GRID_DIMENSIONS),
+                line_width(GUIElementsManager.LINE_WIDTH_CENTER if x == GUIElementsManager.GRID_COLS // 2 else GUIElementsManager.LINE_WIDTH_DEFAULT)
             )
 
         # Dessiner les lignes horizontales
         for y in range(GUIElementsManager.GRID_ROWS):
             pygame.draw.line(
-                self.surface,
+                grid,
                 GUIElementsManager.LINE_COLOR,
-                (GUIElementsManager.MARGIN_X, GUIElementsManager.MARGIN_Y + y * GUIElementsManager.CELL_SIZE),
-                (GUIElementsManager.MARGIN_X + GUIElementsManager.GRID_DIMENSIONS,
-                 GUIElementsManager.MARGIN_Y + y * GUIElementsManager.CELL_SIZE),
-                GUIElementsManager.LINE_WIDTH_CENTER if y == GUIElementsManager.GRID_ROWS // 2 else GUIElementsManager.LINE_WIDTH_DEFAULT
+                to_window(GUIElementsManager.MARGIN_X, GUIElementsManager.MARGIN_Y + y * GUIElementsManager.CELL_SIZE),
+                to_window(GUIElementsManager.MARGIN_X + GUIElementsManager.GRID_DIMENSIONS,
+                          GUIElementsManager.MARGIN_Y + y * GUIElementsManager.CELL_SIZE),
+                line_width(GUIElementsManager.LINE_WIDTH_CENTER if y == GUIElementsManager.GRID_ROWS // 2 else GUIElementsManager.LINE_WIDTH_DEFAULT)
             )
 
         # Ajouter les points "hoshi" sur le plateau
+        hoshi_size = line_width(GUIElementsManager.HOSHI_POINTS_SIZE)
         for px, py in GUIElementsManager.HOSHI_POINTS:
+            center_x, center_y = to_window(
+                GUIElementsManager.MARGIN_X + px * GUIElementsManager.CELL_SIZE,
+                GUIElementsManager.MARGIN_Y + py * GUIElementsManager.CELL_SIZE
+            )
             pygame.draw.rect(
-                self.surface,
+                grid,
                 GUIElementsManager.LINE_COLOR,
-                pygame.Rect(
-                    GUIElementsManager.MARGIN_X + px * GUIElementsManager.CELL_SIZE - GUIElementsManager.HOSHI_POINTS_SIZE // 2,
-                    GUIElementsManager.MARGIN_Y + py * GUIElementsManager.CELL_SIZE - GUIElementsManager.HOSHI_POINTS_SIZE // 2,
-                    GUIElementsManager.HOSHI_POINTS_SIZE,
-                    GUIElementsManager.HOSHI_POINTS_SIZE
-                )
+                pygame.Rect(center_x - hoshi_size // 2, center_y - hoshi_size // 2, hoshi_size, hoshi_size)
             )
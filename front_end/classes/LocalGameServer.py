@@ -0,0 +1,226 @@
+from collections import deque
+
+from pente_engine import BOARD_COLS, BOARD_ROWS, PLAYER2, Board, ComputerOpponent, calculate_delta, to_index
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+
+class LocalGameServer:
+    """
+    Serveur de jeu local pour une partie hors ligne contre l'ordinateur.
+
+    Remplace `RequestManager` pendant la partie : mêmes méthodes d'envoi et de réception, et mêmes messages JSON que
+    le serveur C (`alert_start_game`, `move_response`, `new_board_state`, `game_over`, `quit_game_response`), produits
+    par le moteur de règles au lieu du socket. Les gestionnaires de réponses du client sont ainsi réutilisés tels
+    quels, sans serveur ni latence réseau. Le coup de l'ordinateur est calculé dans un processus séparé
+    (`ComputerOpponent`) et récupéré sans attente.
+    """
+
+    # Nom de l'adversaire et de la partie
+    COMPUTER_NAME = "Ordinateur"
+    GAME_NAME = "Partie hors ligne"
+
+    # Score de l'ordinateur (score initial du serveur, jamais mis à jour)
+    COMPUTER_SCORE = 0
+
+    # Status des réponses et de fin de partie (mêmes valeurs que le serveur)
+    STATUS_FAILURE = 0
+    STATUS_SUCCESS = 1
+    STATUS_VICTORY = 0
+    STATUS_DEFEAT = 1
+
+    def __init__(self, player_stats: dict | None = None,
+                 time_budget: float = ComputerOpponent.DEFAULT_TIME_BUDGET) -> None:
+        """
+        Initialise le serveur local (la partie commence à l'appel de `send_ready_to_play_message`).
+
+        Le joueur rejoint la partie de l'ordinateur : il joue les 'o' et commence, sur un plateau vide.
+
+        Args:
+            player_stats (dict | None): Les statistiques du joueur (score, victoires, défaites, abandons, parties
+                jouées), mises à jour à chaque fin de partie. Par défaut, des statistiques nulles.
+            time_budget (float): Le temps de réflexion de l'ordinateur par coup (en secondes). Par défaut,
+                1 seconde.
+
+        Raises:
+            ValueError: Si le budget de temps n'est pas strictement positif.
+        """
+        self.player_stats = {"score": 0, "wins": 0, "losses": 0, "forfeits": 0, "games_played": 0}
+        self.player_stats.update(player_stats or {})
+        self.player = PLAYER2
+        self.computer = ComputerOpponent(time_budget)
+        self.board: Board | None = None
+        self._messages: deque[dict] = deque()
+
+    @property
+    def is_game_running(self) -> bool:
+        """
+        Indique si une partie est en cours.
+
+        Returns:
+            bool: True si la partie a commencé et n'est pas terminée, False sinon.
+        """
+        return self.board is not None and not self.board.is_game_over
+
+    def is_socket_ready(self, timeout: float = 0.001) -> bool:
+        """
+        Récupère le coup de l'ordinateur s'il est prêt (sans attendre) et indique si un message est disponible.
+
+        Args:
+            timeout (float): Ignoré (aucune attente : compatibilité avec `RequestManager`).
+
+        Returns:
+            bool: True si un message attend d'être reçu, False sinon.
+        """
+        result = self.computer.poll()
+        if result is not None and self.is_game_running:
+            self.__play_computer_move(result.best_move)
+        return bool(self._messages)
+
+    def receive_json(self) -> dict:
+        """
+        Reçoit le prochain message du serveur local.
+
+        Returns:
+            dict: Le message JSON décodé sous forme de dictionnaire.
+
+        Raises:
+            ConnectionError: Si aucun message n'est disponible.
+        """
+        if not self._messages:
+            raise ConnectionError("Aucun message du serveur local.")
+        return self._messages.popleft()
+
+    def send_ready_to_play_message(self) -> None:
+        """
+        Démarre la partie : plateau vide, comme sur le serveur, puis alerte de début de partie.
+        """
+        self.computer.shutdown()
+        self.board = Board()
+
+        computer_info = {"score": LocalGameServer.COMPUTER_SCORE, "wins": 0, "losses": 0, "forfeits": 0,
+                         "games_played": 0, "name": LocalGameServer.COMPUTER_NAME}
+        self._messages.append({
+            "type": "alert_start_game",
+            "status": LocalGameServer.STATUS_SUCCESS,
+            "board": self.board.to_board_state(),
+            "opponent_info": computer_info,
+            "game_name": LocalGameServer.GAME_NAME
+        })
+
+    def send_play_move_json(self, x: int, y: int) -> None:
+        """
+        Joue le coup du joueur, répond comme le serveur, puis lance la réflexion de l'ordinateur.
+
+        Args:
+            x (int): Coordonnée x du coup.
+            y (int): Coordonnée y du coup.
+
+        Raises:
+            TypeError: Si les coordonnées x et y ne sont pas des entiers.
+        """
+        if not isinstance(x, int) or not isinstance(y, int):
+            raise TypeError("Les coordonnées x et y doivent être des entiers.")
+
+        index = to_index(x, y) if 0 <= x < BOARD_COLS and 0 <= y < BOARD_ROWS else -1
+        if not self.is_game_running or self.board.to_move != self.player or not self.board.is_legal(index):
+            self._messages.append({"type": "move_response", "status": LocalGameServer.STATUS_FAILURE})
+            return
+
+        result = self.board.play(index)
+        if result.is_win:
+            self.__end_game(LocalGameServer.STATUS_VICTORY)
+            return
+
+        self._messages.append({
+            "type": "move_response",
+            "status": LocalGameServer.STATUS_SUCCESS,
+            "board_state": self.board.to_board_state(),
+            "captures": self.board.captures[self.player]
+        })
+        self.computer.start_thinking(self.board)
+
+    def __play_computer_move(self, index: int) -> None:
+        """
+        Joue le coup de l'ordinateur et annonce le nouveau plateau au joueur (ou sa défaite).
+
+        Args:
+            index (int): L'indice de la case jouée par l'ordinateur.
+        """
+        result = self.board.play(index)
+        if result.is_win:
+            self.__end_game(LocalGameServer.STATUS_DEFEAT)
+            return
+
+        self._messages.append({
+            "type": "new_board_state",
+            "status": LocalGameServer.STATUS_SUCCESS,
+            "board_state": self.board.to_board_state()
+        })
+
+    def __end_game(self, status: int) -> None:
+        """
+        Termine la partie, met à jour les statistiques du joueur et envoie le message de fin de partie.
+
+        Args:
+            status (int): `STATUS_VICTORY` ou `STATUS_DEFEAT`.
+        """
+        # Mêmes arguments que le serveur (`handle_win`) : le score du perdant en `sg`, celui du gagnant en `sp`.
+        if status == LocalGameServer.STATUS_VICTORY:
+            self.player_stats["score"] += self.__score_delta(sg=LocalGameServer.COMPUTER_SCORE,
+                                                             sp=self.player_stats["score"])
+            self.player_stats["wins"] += 1
+        else:
+            self.player_stats["score"] -= self.__score_delta(sg=self.player_stats["score"],
+                                                             sp=LocalGameServer.COMPUTER_SCORE)
+            self.player_stats["losses"] += 1
+        self.player_stats["games_played"] += 1
+        self._messages.append({"type": "game_over", "status": status, "player_stats": dict(self.player_stats)})
+
+    @staticmethod
+    def __score_delta(*, sg: int, sp: int) -> int:
+        """
+        Calcule la variation de score avec la formule du serveur (`calculate_delta`), avec ses arguments.
+
+        Un score négatif (possible après des défaites à partir de 0) compte comme nul : le serveur refuse alors le
+        calcul et laisse les statistiques inchangées.
+
+        Args:
+            sg (int): Le score passé en premier à la formule.
+            sp (int): Le score passé en second à la formule.
+
+        Returns:
+            int: La variation de score.
+        """
+        return calculate_delta(sg=max(0, sg), sp=max(0, sp))
+
+    def send_quit_game_json(self) -> None:
+        """
+        Abandonne la partie en cours (comptée comme une défaite par abandon).
+        """
+        if not self.is_game_running:
+            self._messages.append({"type": "quit_game_response", "status": LocalGameServer.STATUS_FAILURE})
+            return
+
+        self.computer.shutdown()
+        self.board.winner = 1 - self.player
+
+        # Mêmes arguments que le serveur (`forfeit_game`) : le score du gagnant en `sg`, celui de l'abandon en `sp`.
+        self.player_stats["score"] -= self.__score_delta(sg=LocalGameServer.COMPUTER_SCORE,
+                                                         sp=self.player_stats["score"])
+        self.player_stats["games_played"] += 1
+        self.player_stats["losses"] += 1
+        self.player_stats["forfeits"] += 1
+        self._messages.append({
+            "type": "quit_game_response",
+            "status": LocalGameServer.STATUS_SUCCESS,
+            "player_stats": dict(self.player_stats)
+        })
+
+    def close_socket(self) -> None:
+        """
+        Arrête le processus de calcul de l'ordinateur (compatibilité avec `RequestManager`).
+        """
+        self.computer.shutdown()
+        self._messages.clear()
@@ -1,4 +1,5 @@
 import json
+import os
 import re
 from typing import Callable, Dict, Tuple
 
@@ -7,7 +8,10 @@ import pygame_gui
 
 from classes.AudioManager import AudioManager
 from classes.GUIElementsManager import GUIElementsManager
+from classes.LocalGameServer import LocalGameServer
 from classes.RequestManager import RequestManager
+from pente_engine import PLAYER1, PLAYER2, PLAYER_CHARS, BackgroundAnalyzer, Board, to_coordinates, to_index
+from pente_engine.analysis import evaluation_fraction
 
 # Prêt pour release 2.0.0
 # pdoc: format de la documentation
@@ -76,6 +80,12 @@ TICK_DURATION_FACTOR: float = 1000.0
 # Images par secondes (FPS)
 FPS: int = 60
 
+# Mode sans affichage (pilotes SDL factices), activé via la variable d'environnement PENTE_HEADLESS=1
+HEADLESS: bool = os.environ.get("PENTE_HEADLESS", "0") == "1"
+
+# Réflexion anticipée pendant le tour de l'adversaire, désactivable via la variable d'environnement PENTE_PONDER=0
+PONDER: bool = os.environ.get("PENTE_PONDER", "1") == "1"
+
 # Statistiques du joueur connecté
 score: int = 0
 wins: int = 0
@@ -92,17 +102,41 @@ game_name: str = ""
 player_name: str = ""
 opponent_name: str = ""
 captures: int = 0
+opponent_captures: int = 0
 is_host: bool = False
 is_my_turn: bool = False
 
+# Coup joué localement (affiché de façon provisoire) en attente de la réponse du serveur
+pending_move: int | None = None
+board_before_pending_move: str = ""
+predicted_board: str = ""
+
+# Aide au jeu : indice demandé, barre d'évaluation affichée et joueur au trait de la position analysée
+is_hint_requested: bool = False
+is_evaluation_visible: bool = False
+analysed_player: int = PLAYER1
+
 # Initialisation de l'interface graphique
-gui_elements_manager: GUIElementsManager = GUIElementsManager()
+gui_elements_manager: GUIElementsManager = GUIElementsManager(headless=HEADLESS)
 
-# Gestion des requêtes JSON
-request_manager: RequestManager = RequestManager(SERVER_INFO.get("host"), SERVER_INFO.get("port"))
+# Gestion des requêtes JSON (sans serveur joignable, seul le jeu hors ligne est disponible)
+try:
+    request_manager: RequestManager | LocalGameServer | None = RequestManager(
+        SERVER_INFO.get("host"), SERVER_INFO.get("port")
+    )
+except (ConnectionError, ValueError) as connection_error:
+    print(f"Serveur indisponible, jeu hors ligne uniquement : {connection_error}")
+    request_manager = None
 
-# Gestion du son
+# Connexion au serveur mise de côté pendant une partie hors ligne (le serveur local la remplace)
+network_request_manager: RequestManager | None = None
+
+# Gestion du son (les effets sonores sont décodés en arrière-plan ; la musique de fond est lue en flux)
 audio_manager: AudioManager = AudioManager()
+audio_manager.preload_sounds({name: path for name, path in AUDIO_PATHS.items() if name != "background_music"})
+
+# Analyse de la position en arrière-plan (indice et barre d'évaluation), dans un processus démarré à la demande
+analyzer: BackgroundAnalyzer = BackgroundAnalyzer()
 
 
 def handle_server_response(
@@ -130,7 +164,7 @@ def handle_server_response(
         tuple: (bool, current_page_elements, current_event_handler)
     """
     try:
-        if not request_manager.is_socket_ready():
+        if request_manager is None or not request_manager.is_socket_ready():
             # Si le socket n'est pas prête, on retourne l'état actuel.
             return True, current_page_elements, current_event_handler
 
@@ -206,6 +240,10 @@ def return_to_lobby(
             - Un dictionnaire contenant les éléments GUI de la page du lobby.
             - Une fonction à appeler pour gérer les événements sur la page du lobby.
     """
+    # Une partie hors ligne se termine sur la page de connexion (le lobby nécessite le serveur).
+    if isinstance(request_manager, LocalGameServer):
+        return end_offline_game(current_page_elements)
+
     # Supprime les éléments GUI de la page actuelle.
     gui_elements_manager.clear_page(current_page_elements)
 
@@ -219,12 +257,75 @@ def return_to_lobby(
     return True, lobby_page_elements, handle_events_on_lobby_page
 
 
+def start_offline_game(
+        current_page_elements: Dict[str, "pygame_gui.elements"]
+) -> Tuple[bool, Dict[str, "pygame_gui.elements"], Callable]:
+    """
+    Démarre une partie hors ligne contre l'ordinateur : le serveur local remplace la connexion au serveur le temps
+    de la partie, et ses messages sont traités par les gestionnaires de réponses habituels.
+
+    Args:
+        current_page_elements (Dict[str, pygame_gui.elements]): Les éléments GUI de la page de connexion.
+
+    Returns:
+        Tuple[bool, Dict[str, pygame_gui.elements], Callable]:
+            - Un booléen indiquant si l'opération a réussi.
+            - Un dictionnaire contenant les éléments GUI de la page de jeu.
+            - Une fonction à appeler pour gérer les événements sur la page de jeu.
+    """
+    global request_manager, network_request_manager, player_name, is_host
+
+    # Le nom saisi est utilisé s'il y en a un.
+    player_name = current_page_elements["username_entry"].get_text() or "Joueur"
+
+    # Le serveur local remplace la connexion au serveur (conservée pour la suite).
+    network_request_manager = request_manager
+    request_manager = LocalGameServer({
+        "score": score, "wins": wins, "losses": losses, "forfeits": forfeits, "games_played": games_played
+    })
+
+    # Le joueur rejoint la partie de l'ordinateur, comme après une réponse « join_game » du serveur.
+    is_host = False
+    gui_elements_manager.clear_page(current_page_elements)
+    game_page_elements = gui_elements_manager.create_gui_elements_game_page()
+    request_manager.send_ready_to_play_message()
+
+    return True, game_page_elements, handle_events_on_game_page
+
+
+def end_offline_game(
+        current_page_elements: Dict[str, "pygame_gui.elements"]
+) -> Tuple[bool, Dict[str, "pygame_gui.elements"], Callable]:
+    """
+    Termine la partie hors ligne : arrête le serveur local, rétablit la connexion au serveur et affiche la page de
+    connexion.
+
+    Args:
+        current_page_elements (Dict[str, pygame_gui.elements]): Les éléments GUI de la page actuelle.
+
+    Returns:
+        Tuple[bool, Dict[str, pygame_gui.elements], Callable]:
+            - Un booléen indiquant si l'opération a réussi.
+            - Un dictionnaire contenant les éléments GUI de la page de connexion.
+            - Une fonction à appeler pour gérer les événements sur la page de connexion.
+    """
+    global request_manager, network_request_manager
+
+    request_manager.close_socket()
+    request_manager, network_request_manager = network_request_manager, None
+
+    gui_elements_manager.clear_page(current_page_elements)
+    login_page_elements = gui_elements_manager.create_gui_elements_login_page()
+    return True, login_page_elements, handle_events_on_login_page
+
+
 def reset_game_info() -> None:
     """
     Réinitialise toutes les informations de jeu globales à leurs valeurs par défaut.
     """
     global is_grid_visible, is_board_visible, is_host, is_my_turn
-    global game_name, player_name, opponent_name, captures
+    global game_name, player_name, opponent_name, captures, opponent_captures
+    global is_hint_requested, is_evaluation_visible
 
     # Rend la grille et le plateau invisibles.
     is_grid_visible = False
@@ -239,8 +340,176 @@ def reset_game_info() -> None:
     player_name = ""
     opponent_name = ""
 
-    # Réinitialise le compteur de captures à zéro.
+    # Réinitialise les compteurs de captures à zéro.
     captures = 0
+    opponent_captures = 0
+
+    # Oublie le coup éventuellement en attente de confirmation.
+    clear_pending_move()
+
+    # Arrête l'aide au jeu de la partie terminée.
+    is_hint_requested = False
+    is_evaluation_visible = False
+    analyzer.cancel()
+
+
+def clear_pending_move() -> None:
+    """
+    Oublie le coup local en attente de confirmation et retire son affichage provisoire.
+    """
+    global pending_move, board_before_pending_move, predicted_board
+
+    pending_move = None
+    board_before_pending_move = ""
+    predicted_board = ""
+    gui_elements_manager.set_provisional_cells()
+
+
+def play_move_optimistically(col: int, row: int, page_game_elements: dict[str, pygame_gui.elements]) -> None:
+    """
+    Valide un coup localement avec le moteur de règles, l'affiche aussitôt de façon provisoire, puis l'envoie au
+    serveur. Les coups manifestement invalides (pas votre tour, case occupée) sont refusés sans aller-retour réseau.
+
+    Args:
+        col (int): La colonne de la case jouée.
+        row (int): La ligne de la case jouée.
+        page_game_elements (dict[str, pygame_gui.elements]): Les éléments de l'interface de la page de jeu.
+    """
+    global pending_move, board_before_pending_move, predicted_board
+
+    error_label = page_game_elements["error_label"]
+
+    if not is_my_turn:
+        error_label.set_text("Ce n'est pas votre tour.")
+        return
+
+    if pending_move is not None:
+        error_label.set_text("Coup précédent en attente de confirmation.")
+        return
+
+    board = build_current_board()
+
+    index = to_index(col, row)
+    if not board.is_legal(index):
+        error_label.set_text("Cette case est déjà occupée.")
+        return
+
+    # Le coup (et ses captures) est prédit avec les règles du serveur et affiché en attendant sa confirmation.
+    board.play(index)
+    board_before_pending_move = gui_elements_manager.board
+    predicted_board = board.to_board_state()
+    pending_move = index
+
+    error_label.set_text("")
+    gui_elements_manager.set_board(predicted_board)
+    gui_elements_manager.set_provisional_cells({index})
+
+    request_manager.send_play_move_json(col, row)
+
+
+def build_current_board() -> Board:
+    """
+    Construit le plateau affiché avec le moteur de règles (joueur au trait selon le tour, captures des deux joueurs).
+
+    Returns:
+        Board: Le plateau.
+    """
+    # L'hôte joue les 'x' (joueur 1), celui qui a rejoint la partie joue les 'o' (joueur 2).
+    player = PLAYER1 if is_host else PLAYER2
+    return Board.from_board_state(
+        gui_elements_manager.board,
+        to_move=player if is_my_turn else 1 - player,
+        captures=(captures, opponent_captures) if player == PLAYER1 else (opponent_captures, captures)
+    )
+
+
+def request_analysis() -> None:
+    """
+    Envoie la position affichée au processus d'analyse si un indice ou l'évaluation est demandé (l'analyse de la
+    position précédente est abandonnée), sinon arrête l'analyse. Ne bloque jamais la boucle de rendu.
+
+    Pendant le tour de l'adversaire, la position est envoyée pour une réflexion anticipée (si `PONDER`) : l'indice
+    et l'évaluation sont alors quasi immédiats si l'adversaire joue le coup prédit.
+    """
+    global analysed_player
+
+    if len(gui_elements_manager.board) != GUIElementsManager.GRID_SIZE:
+        analyzer.cancel()
+        return
+
+    # Une position sans analyse est tout de même transmise : elle juge la réflexion anticipée (coup adverse prédit).
+    board = build_current_board()
+    is_pondering = PONDER and not is_my_turn
+    if not (is_hint_requested or is_evaluation_visible or is_pondering) or board.is_game_over:
+        analyzer.cancel(board)
+        return
+
+    analysed_player = board.to_move
+    if is_pondering:
+        analyzer.ponder(board)
+    else:
+        analyzer.analyse(board)
+
+
+def display_analysis(page_game_elements: dict[str, pygame_gui.elements]) -> None:
+    """
+    Affiche le dernier résultat de l'analyse, s'il y en a un nouveau (indice et barre d'évaluation), sans attendre.
+
+    Args:
+        page_game_elements (dict[str, pygame_gui.elements]): Les éléments de l'interface de la page de jeu.
+    """
+    update = analyzer.poll()
+    if update is None:
+        return
+
+    # La valeur est donnée du point de vue du joueur au trait : elle est ramenée à celui du joueur local.
+    player = PLAYER1 if is_host else PLAYER2
+    value = update.value if analysed_player == player else -update.value
+
+    if is_evaluation_visible:
+        page_game_elements["evaluation_bar"].percent_full = evaluation_fraction(value)
+
+    if is_hint_requested and analysed_player == player:
+        col, row = to_coordinates(update.best_move)
+        page_game_elements["hint_label"].set_text(f"Indice : {col + 1}-{row + 1} (prof. {update.depth})")
+
+
+def toggle_evaluation_bar(page_game_elements: dict[str, pygame_gui.elements]) -> None:
+    """
+    Affiche ou masque la barre d'évaluation et lance ou arrête l'analyse en conséquence.
+
+    Args:
+        page_game_elements (dict[str, pygame_gui.elements]): Les éléments de l'interface de la page de jeu.
+    """
+    global is_evaluation_visible
+
+    is_evaluation_visible = not is_evaluation_visible
+    evaluation_bar = page_game_elements["evaluation_bar"]
+    if is_evaluation_visible:
+        evaluation_bar.percent_full = 0.5
+        evaluation_bar.show()
+    else:
+        evaluation_bar.hide()
+    request_analysis()
+
+
+def request_hint(page_game_elements: dict[str, pygame_gui.elements]) -> None:
+    """
+    Demande un indice pour la position affichée (le meilleur coup s'affiche puis s'affine avec la profondeur).
+
+    Args:
+        page_game_elements (dict[str, pygame_gui.elements]): Les éléments de l'interface de la page de jeu.
+    """
+    global is_hint_requested
+
+    if not is_my_turn:
+        page_game_elements["error_label"].set_text("Ce n'est pas votre tour.")
+        return
+
+    if not is_hint_requested:
+        is_hint_requested = True
+        page_game_elements["hint_label"].set_text("Analyse en cours...")
+        request_analysis()
 
 
 def handle_quit_game_response(
@@ -276,7 +545,7 @@ def handle_quit_game_response(
     reset_game_info()
 
     # Joue un son spécifique pour indiquer l'abandon.
-    audio_manager.play_audio(AUDIO_PATHS.get("forfeit_sound"))
+    audio_manager.play_audio(AUDIO_PATHS.get("forfeit_sound"), category=AudioManager.CATEGORY_RESULT)
 
     # Met à jour les statistiques du joueur avec les données fournies.
     update_player_stats(response_json.get("player_stats", {}))
@@ -300,18 +569,33 @@ def handle_move_response(
         tuple: (bool, éléments GUI mis à jour, gestionnaire d'événements suivant).
     """
     # Variables globales (à réviser si possible)
-    global is_my_turn, captures
+    global is_my_turn, captures, opponent_captures, is_hint_requested
 
     # Récupération des données de la réponse
     response_status = response_json.get("status")
     response_board = response_json.get("board_state")
 
+    # "move_response" répond à notre coup, "new_board_state" annonce le coup de l'adversaire.
+    is_own_move = response_json.get("type") == SERVER_RESPONSES.get("move")
+
+    # Réconciliation du coup provisoire avec la réponse du serveur, qui fait autorité.
+    expected_board = None
+    rollback_board = None
+    if is_own_move and pending_move is not None:
+        expected_board = predicted_board
+        rollback_board = board_before_pending_move
+        clear_pending_move()
+
     # Vérification de l'état de la réponse
     if response_status != RESPONSE_STATUS.get("success") or response_board is None:
+        # Le coup provisoire est annulé.
+        if rollback_board:
+            gui_elements_manager.set_board(rollback_board, animate=False)
+
         current_page_elements.get("error_label").set_text(
             "Placement invalide ou pas votre tour."
         )
-        audio_manager.play_audio(AUDIO_PATHS.get("move_failed"))
+        audio_manager.play_audio(AUDIO_PATHS.get("move_failed"), category=AudioManager.CATEGORY_GAME)
         return True, current_page_elements, handle_events_on_game_page
 
     # Réinitialisation du message d'erreur si succès
@@ -323,21 +607,37 @@ def handle_move_response(
         current_page_elements.get("captures_label").set_text(
             f"Captures: {response_captures}"
         )
-        audio_manager.play_audio(AUDIO_PATHS.get("capture_sound"))
+        audio_manager.play_audio(AUDIO_PATHS.get("capture_sound"), category=AudioManager.CATEGORY_GAME)
         captures = response_captures
 
     # Mise à jour de l'instruction
     instruction_text = (
         f"Attendez que {opponent_name} joue."
-        if response_json.get("status", "") == SERVER_RESPONSES.get("move_response")
+        if is_own_move
         else f"À vous de jouer, {player_name} !"
     )
     current_page_elements.get("instruction_label").set_text(instruction_text)
 
-    # Mise à jour du tour et de l'état du plateau
-    is_my_turn = not is_my_turn
+    # Captures de l'adversaire : le serveur ne les envoie pas, elles sont déduites des pions du joueur retirés.
+    if not is_own_move:
+        player_char = PLAYER_CHARS[PLAYER1 if is_host else PLAYER2]
+        removed = gui_elements_manager.board.count(player_char) - response_board.count(player_char)
+        opponent_captures += max(removed, 0) // 2
+
+    # Mise à jour du tour et de l'état du plateau (inchangé si la prédiction locale était exacte)
+    is_my_turn = not is_own_move
     gui_elements_manager.board = response_board
 
+    # Signale une prédiction locale différente du plateau du serveur (le plateau du serveur est affiché).
+    if expected_board is not None and response_board != expected_board:
+        print("Le plateau prédit localement diffère de celui du serveur : resynchronisation.")
+        current_page_elements.get("error_label").set_text("Plateau resynchronisé avec le serveur.")
+
+    # L'indice portait sur la position précédente ; l'évaluation suit la nouvelle position.
+    is_hint_requested = False
+    current_page_elements.get("hint_label").set_text("")
+    request_analysis()
+
     # Retour des valeurs mises à jour
     return True, current_page_elements, handle_events_on_game_page
 
@@ -387,10 +687,10 @@ def handle_game_over_response(
     # Mise à jour des éléments de l'interface utilisateur en fonction du statut de la partie.
     if response_status == GAME_OVER_STATUS.get("victory"):
         current_page_elements["instruction_label"].set_text("Vous avez gagné la partie!")
-        audio_manager.play_audio(AUDIO_PATHS.get("victory_sound"))
+        audio_manager.play_audio(AUDIO_PATHS.get("victory_sound"), category=AudioManager.CATEGORY_RESULT)
     elif response_status == GAME_OVER_STATUS.get("defeat"):
         current_page_elements["instruction_label"].set_text("Vous avez perdu la partie!")
-        audio_manager.play_audio(AUDIO_PATHS.get("defeat_sound"))
+        audio_manager.play_audio(AUDIO_PATHS.get("defeat_sound"), category=AudioManager.CATEGORY_RESULT)
     elif response_status == GAME_OVER_STATUS.get("withdraw"):
         current_page_elements["instruction_label"].set_text("Vous avez abandonné la partie!")
 
@@ -440,8 +740,8 @@ def handle_alert_start_game(
     if response_board is None:
         return return_to_lobby(current_page_elements)
 
-    # Mise à jour du plateau et visibilité.
-    gui_elements_manager.board = response_board
+    # Mise à jour du plateau (sans animation en début de partie) et visibilité.
+    gui_elements_manager.set_board(response_board, animate=False)
     is_board_visible = True
     is_grid_visible = True
 
@@ -463,11 +763,11 @@ def handle_alert_start_game(
         current_page_elements["oppenent_pion_logo"] = gui_elements_manager.draw_opponent_pion_logo()
         current_page_elements["instruction_label"].set_text(f"À vous de jouer, {player_name} !")
         is_my_turn = not is_my_turn
-        audio_manager.play_audio(AUDIO_PATHS.get("start_game_opponent_sound"))
+        audio_manager.play_audio(AUDIO_PATHS.get("start_game_opponent_sound"), category=AudioManager.CATEGORY_GAME)
     else:
         current_page_elements["oppenent_pion_logo"] = gui_elements_manager.draw_opponent_pion_logo()
         current_page_elements["instruction_label"].set_text(f"Attendez que {opponent_name} joue.")
-        audio_manager.play_audio(AUDIO_PATHS.get("start_game_host_sound"))
+        audio_manager.play_audio(AUDIO_PATHS.get("start_game_host_sound"), category=AudioManager.CATEGORY_GAME)
 
     # Affichage des statistiques du joueur et de l'adversaire.
     display_player_stats(current_page_elements)
@@ -824,6 +1124,12 @@ def handle_login_event(login_page_elements: dict[str, pygame_gui.elements]) -> N
         audio_manager.play_audio(AUDIO_PATHS.get("error_sound"))
         return
 
+    # Sans serveur joignable, seul le jeu hors ligne est disponible.
+    if request_manager is None:
+        login_page_elements["error_label"].set_text("Serveur indisponible : jouez hors ligne.")
+        audio_manager.play_audio(AUDIO_PATHS.get("error_sound"))
+        return
+
     # Mise à jour du nom du joueur et affichage d'une tentative de connexion.
     player_name = username
     print(f"Tentative de connexion : {username}, {password}")
@@ -869,6 +1175,12 @@ def handle_create_new_account_event(new_account_page_elements: dict[str, pygame_
         audio_manager.play_audio(AUDIO_PATHS.get("error_sound"))
         return
 
+    # Sans serveur joignable, aucun compte ne peut être créé.
+    if request_manager is None:
+        new_account_page_elements["error_label"].set_text("Serveur indisponible.")
+        audio_manager.play_audio(AUDIO_PATHS.get("error_sound"))
+        return
+
     # Affichage de la tentative dans la console (pour le débogage).
     print(f"Tentative de création de compte : {username}")
 
@@ -984,19 +1296,30 @@ def handle_events_on_game_page(
 
         # Gère les clics de la souris.
         elif event.type == pygame.MOUSEBUTTONDOWN:
+            # Convertit la position du clic (fenêtre) en position sur la surface logique.
+            logical_pos = gui_elements_manager.to_logical_position(event.pos)
+
             # Obtient les coordonnées de la grille à partir de la position du clic.
-            col, row = gui_elements_manager.get_grid_coordinates(*event.pos)
+            col, row = gui_elements_manager.get_grid_coordinates(*logical_pos)
 
-            # Si c'est au tour du joueur et que le clic est dans la grille.
-            if is_my_turn and (col, row) != (-1, -1):
+            # Si le clic est dans la grille, le coup est validé localement puis affiché et envoyé.
+            if (col, row) != (-1, -1):
                 print("Placement du pion")
-                request_manager.send_play_move_json(col, row)
+                play_move_optimistically(col, row, page_game_elements)
 
             # Si le bouton "Quitter" est cliqué.
-            elif page_game_elements["quit_button"].get_relative_rect().collidepoint(event.pos):
+            elif page_game_elements["quit_button"].get_relative_rect().collidepoint(logical_pos):
                 print("Abandon de la partie")
                 request_manager.send_quit_game_json()
 
+            # Si le bouton "Indice" est cliqué.
+            elif page_game_elements["hint_button"].get_relative_rect().collidepoint(logical_pos):
+                request_hint(page_game_elements)
+
+            # Si le bouton "Évaluation" est cliqué.
+            elif page_game_elements["evaluation_button"].get_relative_rect().collidepoint(logical_pos):
+                toggle_evaluation_bar(page_game_elements)
+
             # Si le clic est en dehors de la grille.
             else:
                 print("Clic en dehors de la grille.")
@@ -1005,6 +1328,9 @@ def handle_events_on_game_page(
         # Passe l'événement au gestionnaire d'événements GUI.
         gui_elements_manager.process_events_manager(event)
 
+    # Affiche les résultats de l'analyse en arrière-plan (sans attente).
+    display_analysis(page_game_elements)
+
     # Retourne les éléments actuels de la page de jeu et la fonction de gestion des événements.
     return True, page_game_elements, handle_events_on_game_page
 
@@ -1168,6 +1494,10 @@ def handle_events_on_login_page(
                 create_account_elements = gui_elements_manager.create_gui_elements_new_account_page()
                 return True, create_account_elements, handle_events_on_new_account_page
 
+            # Bouton pour jouer hors ligne contre l'ordinateur.
+            elif event.ui_element == login_page_elements["offline_button"]:
+                return start_offline_game(login_page_elements)
+
         # Gère les modifications dans les champs de texte.
         elif event.type == pygame_gui.UI_TEXT_ENTRY_CHANGED:
             # Efface les messages d'erreur si un champ de texte est modifié.
@@ -1191,8 +1521,11 @@ def main() -> None:
     """
     global request_manager
 
-    # Initialisation de la musique de fond.
-    audio_manager.play_music(AUDIO_PATHS.get("background_music"), 1, 5000, True)
+    # Initialisation de la musique de fond (facultative : le client démarre sans elle si elle est absente).
+    try:
+        audio_manager.play_music(AUDIO_PATHS.get("background_music"), 1, 5000, True)
+    except (FileNotFoundError, pygame.error) as music_error:
+        print(f"Musique de fond indisponible : {music_error}")
 
     # Initialisation de l'horloge.
     clock = pygame.time.Clock()
@@ -1230,21 +1563,8 @@ def main() -> None:
             # Mise à jour de la condition de fonctionnement.
             is_running = is_current_handler_running and is_server_running
 
-            # Mise à jour de l'interface graphique.
-            gui_elements_manager.update_manager(frame_per_second)
-            gui_elements_manager.blit_background()
-            gui_elements_manager.draw_ui()
-
-            # Dessin de la grille si elle est visible.
-            if is_grid_visible:
-                gui_elements_manager.draw_grid()
-
-            # Dessin du plateau si visible.
-            if is_board_visible:
-                gui_elements_manager.draw_board()
-
-            # Mise à jour de l'affichage.
-            gui_elements_manager.update_display()
+            # Mise à jour de l'interface graphique, de la grille et du plateau.
+            gui_elements_manager.render_frame(frame_per_second, is_grid_visible, is_board_visible)
 
     except Exception as e:
         # Gestion des erreurs non interceptées.
@@ -1253,6 +1573,14 @@ def main() -> None:
     finally:
         # Fermeture de l'application et nettoyage des ressources.
         print("Fermeture de la connexion.")
+        ponder_stats = analyzer.ponder_stats()
+        if ponder_stats["hits"] + ponder_stats["misses"]:
+            print(f"Réflexion anticipée : {ponder_stats['hits']} coup(s) prédit(s), {ponder_stats['misses']} manqué(s)"
+                  f" ({ponder_stats['hit_rate']:.0%}).")
+        analyzer.shutdown()
+        gui_elements_manager.asset_cache.save()
+        if isinstance(request_manager, LocalGameServer):
+            request_manager.close_socket()
         del request_manager
         pygame.quit()
 
@@ -0,0 +1,37 @@
+"""
+Moteur de règles du Pente en Python pur, fidèle aux règles du serveur (`back_end/main.c`).
+
+Sert de base à la validation des coups côté client, à l'analyse de positions et au jeu hors ligne.
+"""
+
+from pente_engine.analysis import AnalysisUpdate, BackgroundAnalyzer
+from pente_engine.anytime import AnytimeSearch
+from pente_engine.board import Board, MoveResult
+from pente_engine.book import OpeningBook
+from pente_engine.candidates import CandidateSet
+from pente_engine.incremental import IncrementalEvaluator
+from pente_engine.mcts import MCTSResult, ParallelMCTS
+from pente_engine.opponent import ComputerOpponent
+from pente_engine.rules import (
+    BOARD_COLS, BOARD_ROWS, BOARD_SIZE, CAPTURES_TO_WIN, EMPTY_CHAR, FIRST_PLAYER, PLAYER1, PLAYER1_CHAR, PLAYER2,
+    PLAYER2_CHAR, PLAYER_CHARS, WIN_LENGTH, to_coordinates, to_index
+)
+from pente_engine.scoring import calculate_delta
+from pente_engine.search import AlphaBetaSearch, SearchResult
+from pente_engine.symmetry import canonical_form, transform_board
+from pente_engine.threats import ThreatSearchResult, ThreatSpaceSearch
+from pente_engine.transposition import EXACT, LOWER_BOUND, NO_MOVE, UPPER_BOUND, TranspositionEntry, TranspositionTable
+from pente_engine.zobrist import compute_hash
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+__all__ = [
+    "AlphaBetaSearch", "AnalysisUpdate", "AnytimeSearch", "BackgroundAnalyzer", "Board", "CandidateSet",
+    "ComputerOpponent", "IncrementalEvaluator", "MCTSResult", "MoveResult", "OpeningBook", "ParallelMCTS",
+    "SearchResult", "ThreatSearchResult", "ThreatSpaceSearch", "TranspositionEntry", "TranspositionTable",
+    "calculate_delta", "canonical_form", "compute_hash", "transform_board",
+    "EXACT", "LOWER_BOUND", "NO_MOVE", "UPPER_BOUND",
+    "BOARD_COLS", "BOARD_ROWS", "BOARD_SIZE", "CAPTURES_TO_WIN", "EMPTY_CHAR", "FIRST_PLAYER", "PLAYER1",
+    "PLAYER1_CHAR", "PLAYER2", "PLAYER2_CHAR", "PLAYER_CHARS", "WIN_LENGTH", "to_coordinates", "to_index"
+]
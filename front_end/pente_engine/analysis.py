@@ -0,0 +1,357 @@
+import multiprocessing
+import queue
+import time
+from multiprocessing.sharedctypes import Synchronized
+from typing import Iterator, NamedTuple
+
+from pente_engine.board import Board
+from pente_engine.search import WIN_SCORE, AlphaBetaSearch, SearchResult
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Profondeur d'analyse de la position adverse avant la réflexion anticipée (prédiction de la réponse adverse)
+PREDICTION_DEPTH: int = 2
+
+# Valeur donnant 3/4 de la barre d'évaluation au joueur avantagé (valeur d'une fenêtre de 4 pions)
+EVALUATION_SCALE: int = 1024
+
+
+def evaluation_fraction(value: int) -> float:
+    """
+    Convertit une valeur de la recherche en part de la barre d'évaluation.
+
+    Args:
+        value (int): La valeur, du point de vue du joueur affiché.
+
+    Returns:
+        float: La part de la barre (0,5 pour une position équilibrée, proche de 1 pour une victoire).
+    """
+    return 0.5 + 0.5 * value / (abs(value) + EVALUATION_SCALE)
+
+
+class AnalysisUpdate(NamedTuple):
+    """Résultat intermédiaire d'une analyse (envoyé à chaque profondeur terminée)."""
+
+    # Numéro de la demande d'analyse (les résultats des demandes périmées sont ignorés)
+    generation: int
+
+    # Meilleur coup trouvé (indice de case)
+    best_move: int
+
+    # Valeur de la position, du point de vue du joueur au trait
+    value: int
+
+    # Profondeur terminée
+    depth: int
+
+    # Nombre de positions visitées depuis le début de l'analyse
+    nodes: int
+
+    # Durée de l'analyse depuis la demande (en secondes)
+    seconds: float
+
+
+def _deepen(search: AlphaBetaSearch, board: Board, requests: multiprocessing.Queue, deadline: float, max_depth: int,
+            slice_seconds: float, depth_reached: int = 0) -> Iterator[tuple[SearchResult, int]]:
+    """
+    Approfondit l'analyse d'une position par tranches de temps courtes, jusqu'à la profondeur maximale, l'échéance
+    ou l'arrivée d'une nouvelle demande (vérifiée entre deux tranches).
+
+    Chaque tranche reprend l'approfondissement itératif depuis la profondeur 1, mais la table de transposition,
+    conservée d'une tranche à l'autre, rend les profondeurs déjà terminées presque gratuites.
+
+    Args:
+        search (AlphaBetaSearch): La recherche (et sa table de transposition).
+        board (Board): Le plateau.
+        requests (multiprocessing.Queue): Les demandes d'analyse.
+        deadline (float): L'échéance (horloge `time.perf_counter`).
+        max_depth (int): La profondeur maximale.
+        slice_seconds (float): La durée d'une tranche (en secondes).
+        depth_reached (int): La profondeur déjà connue (seuls les résultats plus profonds sont produits).
+
+    Yields:
+        tuple[SearchResult, int]: Chaque résultat plus profond que les précédents et le nombre total de positions
+                                  visitées.
+    """
+    nodes = 0
+    while time.perf_counter() < deadline and requests.empty():
+        result = search.search(board, slice_seconds, max_depth)
+        nodes += result.nodes
+        if result.depth > depth_reached:
+            depth_reached = result.depth
+            yield result, nodes
+        if depth_reached >= max_depth or abs(result.value) >= WIN_SCORE - max_depth:
+            return
+
+
+def _analysis_worker(requests: multiprocessing.Queue, updates: multiprocessing.Queue, ponder_hits: Synchronized,
+                     ponder_misses: Synchronized, max_depth: int, analysis_seconds: float,
+                     slice_seconds: float) -> None:
+    """
+    Boucle du processus d'analyse : attend une position, l'analyse par tranches de temps et envoie un résultat à
+    chaque profondeur terminée. Une nouvelle demande remplace la position en cours.
+
+    Pour une demande de réflexion anticipée (adversaire au trait), la position n'est analysée que le temps de
+    prédire la réponse adverse, puis la position qui suivrait cette réponse est analysée sans rien envoyer. La
+    prédiction est jugée sur la première position reçue ensuite, avec ou sans demande d'analyse (une interruption
+    peut transmettre la position atteinte) : si c'est la position prédite, son dernier résultat est conservé, puis
+    renvoyé aussitôt à la demande d'analyse de cette position, dont l'analyse reprend à partir de sa profondeur.
+
+    Args:
+        requests (multiprocessing.Queue): Les demandes `(génération, plateau ou None, réflexion anticipée ou None
+            pour une interruption)` ; None seul arrête le processus.
+        updates (multiprocessing.Queue): Les résultats intermédiaires (`AnalysisUpdate`).
+        ponder_hits (Synchronized): Le nombre de positions correctement prédites.
+        ponder_misses (Synchronized): Le nombre de positions mal prédites.
+        max_depth (int): La profondeur maximale.
+        analysis_seconds (float): La durée maximale d'analyse d'une position (en secondes).
+        slice_seconds (float): La durée d'une tranche (en secondes).
+    """
+    search = AlphaBetaSearch()
+
+    # Position prédite par la dernière réflexion anticipée, son résultat le plus profond et si la prédiction a déjà
+    # été jugée (sur une position reçue avec une interruption)
+    pondered_key: int | None = None
+    pondered_update: AnalysisUpdate | None = None
+    is_prediction_scored = False
+
+    batch = [requests.get()]
+    while None not in batch:
+        # Chaque position reçue juge la prédiction, y compris celles des demandes remplacées entre-temps.
+        for _, board, _ in batch:
+            # Une interruption sans position (ex : fin de partie) oublie la prédiction sans la juger.
+            if board is None:
+                pondered_key, pondered_update = None, None
+
+            elif pondered_key is not None:
+                is_hit = board.hash == pondered_key
+                if not is_prediction_scored:
+                    counter = ponder_hits if is_hit else ponder_misses
+                    with counter.get_lock():
+                        counter.value += 1
+                    is_prediction_scored = True
+                if not is_hit:
+                    pondered_key, pondered_update = None, None
+
+        generation, board, ponder = batch[-1]
+        if ponder is not None and board is not None and not board.is_game_over:
+            start = time.perf_counter()
+            depth_reached = 0
+
+            # La position est celle prédite (sinon la prédiction vient d'être oubliée).
+            if pondered_key is not None:
+                if pondered_update is not None:
+                    updates.put(pondered_update._replace(generation=generation, seconds=0.0))
+                    depth_reached = pondered_update.depth
+                pondered_key, pondered_update = None, None
+
+            prediction = None
+            analysed_depth = min(PREDICTION_DEPTH, max_depth) if ponder else max_depth
+            for result, nodes in _deepen(search, board, requests, start + analysis_seconds, analysed_depth,
+                                         slice_seconds, depth_reached):
+                prediction = result.best_move
+                updates.put(AnalysisUpdate(
+                    generation, result.best_move, result.value, result.depth, nodes, time.perf_counter() - start
+                ))
+
+            if ponder and prediction is not None and requests.empty():
+                ponder_start = time.perf_counter()
+                ponder_board = board.copy()
+                ponder_board.play(prediction)
+                if not ponder_board.is_game_over:
+                    pondered_key = ponder_board.hash
+                    is_prediction_scored = False
+                    for result, nodes in _deepen(search, ponder_board, requests, ponder_start + analysis_seconds,
+                                                 max_depth, slice_seconds):
+                        pondered_update = AnalysisUpdate(
+                            generation, result.best_move, result.value, result.depth, nodes,
+                            time.perf_counter() - ponder_start
+                        )
+
+        # Attend la demande suivante (seule la plus récente est analysée si plusieurs sont arrivées entre-temps).
+        batch = [requests.get()]
+        while True:
+            try:
+                batch.append(requests.get_nowait())
+            except queue.Empty:
+                break
+
+
+class BackgroundAnalyzer:
+    """
+    Analyse en continu la position affichée dans un processus séparé, sans jamais bloquer la boucle de rendu :
+    `analyse` envoie la position et rend la main aussitôt, `poll` récupère sans attente le dernier résultat.
+
+    Chaque nouvelle position périme l'analyse précédente : le processus l'abandonne à la fin de sa tranche de temps
+    en cours et ses résultats sont ignorés.
+
+    Pendant le tour de l'adversaire, `ponder` prédit sa réponse et analyse d'avance la position qui en découle :
+    si l'adversaire joue le coup prédit, l'analyse suivante repart de ce résultat (voir `ponder_stats`). Une position
+    atteinte mais pas analysée est transmise à `cancel`, pour juger la prédiction et en conserver le résultat.
+    """
+
+    # Profondeur maximale par défaut
+    DEFAULT_MAX_DEPTH = 6
+
+    # Durée maximale d'analyse d'une position par défaut (en secondes)
+    DEFAULT_ANALYSIS_SECONDS = 10.0
+
+    # Durée d'une tranche d'analyse par défaut (délai maximal avant l'abandon d'une analyse périmée)
+    DEFAULT_SLICE_SECONDS = 0.2
+
+    def __init__(self, max_depth: int = DEFAULT_MAX_DEPTH, analysis_seconds: float = DEFAULT_ANALYSIS_SECONDS,
+                 slice_seconds: float = DEFAULT_SLICE_SECONDS) -> None:
+        """
+        Initialise l'analyseur (le processus d'analyse est démarré à la première demande).
+
+        Args:
+            max_depth (int): La profondeur maximale. Par défaut, 6.
+            analysis_seconds (float): La durée maximale d'analyse d'une position. Par défaut, 10 secondes.
+            slice_seconds (float): La durée d'une tranche d'analyse. Par défaut, 0,2 seconde.
+
+        Raises:
+            ValueError: Si un paramètre n'est pas strictement positif.
+        """
+        if not isinstance(max_depth, int) or max_depth < 1:
+            raise ValueError("La profondeur maximale doit être un entier strictement positif.")
+
+        if analysis_seconds <= 0 or slice_seconds <= 0:
+            raise ValueError("Les durées d'analyse doivent être strictement positives.")
+
+        self.max_depth = max_depth
+        self.analysis_seconds = float(analysis_seconds)
+        self.slice_seconds = float(slice_seconds)
+        self.generation = 0
+        self.latest: AnalysisUpdate | None = None
+        self._process: multiprocessing.Process | None = None
+        self._requests: multiprocessing.Queue | None = None
+        self._updates: multiprocessing.Queue | None = None
+        self._ponder_hits: Synchronized | None = None
+        self._ponder_misses: Synchronized | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Indique si le processus d'analyse est démarré.
+
+        Returns:
+            bool: True si le processus d'analyse est en vie, False sinon.
+        """
+        return self._process is not None and self._process.is_alive()
+
+    def __start(self) -> None:
+        """
+        Démarre le processus d'analyse et ses files de communication.
+        """
+        self._requests = multiprocessing.Queue()
+        self._updates = multiprocessing.Queue()
+        if self._ponder_hits is None:
+            self._ponder_hits = multiprocessing.Value("i", 0)
+            self._ponder_misses = multiprocessing.Value("i", 0)
+        self._process = multiprocessing.Process(
+            target=_analysis_worker,
+            args=(self._requests, self._updates, self._ponder_hits, self._ponder_misses, self.max_depth,
+                  self.analysis_seconds, self.slice_seconds),
+            daemon=True
+        )
+        self._process.start()
+
+    def analyse(self, board: Board) -> None:
+        """
+        Demande l'analyse d'une position, sans attendre : l'analyse précédente est périmée.
+
+        Args:
+            board (Board): Le plateau (copié lors de l'envoi au processus d'analyse).
+        """
+        self.__request(board, False)
+
+    def ponder(self, board: Board) -> None:
+        """
+        Demande une réflexion anticipée sur une position où l'adversaire est au trait, sans attendre : la position
+        est analysée brièvement (résultats envoyés comme pour `analyse`), puis la réponse adverse prédite est jouée
+        et la position obtenue est analysée d'avance.
+
+        Args:
+            board (Board): Le plateau, adversaire au trait (copié lors de l'envoi au processus d'analyse).
+        """
+        self.__request(board, True)
+
+    def __request(self, board: Board, ponder: bool) -> None:
+        """
+        Envoie une demande d'analyse au processus d'analyse (démarré au besoin).
+
+        Args:
+            board (Board): Le plateau.
+            ponder (bool): Si vrai, la demande est une réflexion anticipée.
+        """
+        if not self.is_running:
+            self.__start()
+
+        self.generation += 1
+        self.latest = None
+        self._requests.put((self.generation, board.copy(), ponder))
+
+    def cancel(self, board: Board | None = None) -> None:
+        """
+        Abandonne l'analyse en cours (le processus reste démarré, en attente de la prochaine position).
+
+        Args:
+            board (Board | None): La position atteinte, sans demande d'analyse (copiée lors de l'envoi au processus
+                d'analyse) : elle juge la dernière réflexion anticipée, dont le résultat est conservé pour une
+                prochaine analyse de cette position s'il s'agit de la position prédite. Par défaut, aucune : la
+                prédiction est oubliée sans être jugée.
+        """
+        self.generation += 1
+        self.latest = None
+        if self.is_running:
+            self._requests.put((self.generation, board.copy() if board is not None else None, None))
+
+    def poll(self) -> AnalysisUpdate | None:
+        """
+        Récupère, sans bloquer, le résultat le plus récent de l'analyse en cours.
+
+        Returns:
+            AnalysisUpdate | None: Le nouveau résultat s'il y en a un depuis le dernier appel, None sinon
+                                   (le dernier résultat reste disponible dans `latest`).
+        """
+        if self._updates is None:
+            return None
+
+        update = None
+        while True:
+            try:
+                received = self._updates.get_nowait()
+            except queue.Empty:
+                break
+            if received.generation == self.generation:
+                update = received
+
+        if update is not None:
+            self.latest = update
+        return update
+
+    def ponder_stats(self) -> dict[str, int | float]:
+        """
+        Récupère les statistiques de la réflexion anticipée.
+
+        Returns:
+            dict[str, int | float]: Le nombre de positions correctement et mal prédites et le taux de réussite.
+        """
+        hits = self._ponder_hits.value if self._ponder_hits is not None else 0
+        misses = self._ponder_misses.value if self._ponder_misses is not None else 0
+        return {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses) if hits + misses else 0.0}
+
+    def shutdown(self) -> None:
+        """
+        Arrête le processus d'analyse (l'analyse en cours est abandonnée).
+        """
+        if self._process is not None:
+            if self._process.is_alive():
+                self._requests.put(None)
+                self._process.join(timeout=2 * self.slice_seconds)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+            self._requests = self._updates = None
+        self.latest = None
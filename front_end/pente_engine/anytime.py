@@ -0,0 +1,196 @@
+import queue
+import threading
+import time
+from typing import Callable
+
+from pente_engine.board import Board
+from pente_engine.search import AlphaBetaSearch, SearchResult
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+
+class AnytimeSearch:
+    """
+    Recherche alpha-bêta « à tout moment » : la recherche tourne dans un fil d'exécution séparé, publie un résultat
+    de plus en plus profond à chaque itération terminée (meilleur coup, valeur, profondeur, variante principale) et
+    peut être interrompue ou recevoir une nouvelle échéance à tout instant.
+
+    L'appelant n'attend jamais : `start`, `cancel` et `set_deadline` rendent la main aussitôt, et `poll` lit les
+    résultats sans bloquer. La recherche s'arrête dès la position suivante après `cancel` (le délai mesuré par
+    `python -m pente_engine.benchmark --anytime` comprend en plus la construction du résultat final).
+
+    Le fil d'exécution partage le GIL avec l'appelant : pour une recherche longue sans ralentir l'affichage,
+    préférer `BackgroundAnalyzer`, qui analyse dans un processus séparé.
+    """
+
+    def __init__(self, search: AlphaBetaSearch | None = None,
+                 on_progress: Callable[[SearchResult], None] | None = None) -> None:
+        """
+        Initialise la recherche (sans la démarrer).
+
+        Args:
+            search (AlphaBetaSearch | None): La recherche utilisée (et sa table de transposition, conservée d'une
+                recherche à l'autre). Par défaut, une nouvelle recherche.
+            on_progress (Callable[[SearchResult], None] | None): Fonction appelée avec chaque nouveau résultat, dans
+                le fil d'exécution de la recherche. Par défaut, aucune (les résultats restent lisibles avec `poll`).
+        """
+        self.search = search if search is not None else AlphaBetaSearch()
+        self.on_progress = on_progress
+        self.generation = 0
+        self.latest: SearchResult | None = None
+        self.result: SearchResult | None = None
+        self._results: queue.Queue = queue.Queue()
+        self._requests: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._is_cancelled = False
+
+        # Fin de la recherche de la génération courante (signalée aussi lorsqu'une recherche périmée est ignorée)
+        self._done = threading.Event()
+        self._done.set()
+
+        # Échéance de la génération courante (horloge `time.perf_counter`) et génération en cours de recherche
+        self._deadline = 0.0
+        self._running_generation = 0
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Indique si une recherche est en cours.
+
+        Returns:
+            bool: True si la recherche de la génération courante n'est pas terminée, False sinon.
+        """
+        return not self._done.is_set()
+
+    def start(self, board: Board, time_budget: float = AlphaBetaSearch.DEFAULT_TIME_BUDGET,
+              max_depth: int = AlphaBetaSearch.MAX_DEPTH) -> None:
+        """
+        Démarre la recherche d'une position, sans attendre : la recherche précédente est interrompue et ses
+        résultats sont ignorés (le fil d'exécution de la recherche passe à la nouvelle position dès qu'elle s'arrête).
+
+        Args:
+            board (Board): Le plateau (copié avant la recherche).
+            time_budget (float): Le temps maximal (en secondes). Par défaut, 1 seconde.
+            max_depth (int): La profondeur maximale. Par défaut, 10.
+
+        Raises:
+            ValueError: Si la partie est terminée ou si les paramètres sont invalides.
+        """
+        if board.is_game_over:
+            raise ValueError("La partie est terminée : aucun coup à chercher.")
+
+        if time_budget <= 0 or max_depth < 1:
+            raise ValueError("Le budget de temps et la profondeur maximale doivent être strictement positifs.")
+
+        self.cancel()
+
+        self.generation += 1
+        self.latest = None
+        self.result = None
+        self._is_cancelled = False
+        self._deadline = time.perf_counter() + time_budget
+        self._done = threading.Event()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.__worker, daemon=True)
+            self._thread.start()
+        self._requests.put((self.generation, board.copy(), max_depth, self._done))
+
+    def __worker(self) -> None:
+        """
+        Boucle du fil d'exécution de la recherche : traite les demandes une à une (la recherche et sa table de
+        transposition ne servent qu'à une position à la fois) et ignore les demandes déjà périmées.
+        """
+        while True:
+            generation, board, max_depth, done = self._requests.get()
+            try:
+                if generation == self.generation:
+                    self.__run(generation, board, max_depth)
+            finally:
+                done.set()
+
+    def __run(self, generation: int, board: Board, max_depth: int) -> None:
+        """
+        Cherche une position et publie chaque résultat.
+
+        Args:
+            generation (int): La génération de la recherche (les résultats d'une génération périmée sont ignorés).
+            board (Board): Le plateau.
+            max_depth (int): La profondeur maximale.
+        """
+        def publish(result: SearchResult) -> None:
+            # Une interruption ou une échéance demandée avant que la recherche ne fixe la sienne est appliquée ici.
+            if generation != self.generation:
+                self.search.cancel()
+                return
+            self.search.set_deadline(self._deadline - time.perf_counter())
+            self._results.put((generation, result))
+            if self.on_progress is not None:
+                self.on_progress(result)
+
+        self._running_generation = generation
+        time_budget = self._deadline - time.perf_counter()
+        if time_budget <= 0:
+            return
+
+        result = self.search.search(board, time_budget, max_depth, publish)
+        if generation == self.generation:
+            self.result = result
+
+    def cancel(self) -> None:
+        """
+        Interrompt la recherche en cours, sans attendre (elle s'arrête dès la position suivante). Peut être appelée
+        depuis n'importe quel fil d'exécution.
+        """
+        self._is_cancelled = True
+        self._deadline = 0.0
+        if self._running_generation == self.generation:
+            self.search.cancel()
+
+    def set_deadline(self, time_budget: float) -> None:
+        """
+        Remplace l'échéance de la recherche en cours (pour la prolonger ou l'avancer), sans attendre. Peut être
+        appelée depuis n'importe quel fil d'exécution.
+
+        Args:
+            time_budget (float): Le temps restant à partir de maintenant (en secondes).
+        """
+        if not self._is_cancelled:
+            self._deadline = time.perf_counter() + time_budget
+            if self._running_generation == self.generation:
+                self.search.set_deadline(time_budget)
+
+    def poll(self) -> SearchResult | None:
+        """
+        Récupère, sans bloquer, le résultat le plus récent de la recherche en cours.
+
+        Returns:
+            SearchResult | None: Le nouveau résultat s'il y en a un depuis le dernier appel, None sinon (le dernier
+                                 résultat reste disponible dans `latest`).
+        """
+        result = None
+        while True:
+            try:
+                generation, received = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if generation == self.generation:
+                result = received
+
+        if result is not None:
+            self.latest = result
+        return result
+
+    def wait(self, timeout: float | None = None) -> SearchResult | None:
+        """
+        Attend la fin de la recherche en cours.
+
+        Args:
+            timeout (float | None): Le temps d'attente maximal (en secondes). Par défaut, sans limite.
+
+        Returns:
+            SearchResult | None: Le résultat final, ou None si la recherche n'est pas terminée (ou n'a pas abouti).
+        """
+        if not self._done.wait(timeout):
+            return None
+        return self.result
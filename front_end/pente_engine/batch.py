@@ -0,0 +1,338 @@
+"""
+Évaluation vectorisée (NumPy) d'un grand nombre de plateaux à la fois, pour les statistiques et le réglage de
+l'évaluation.
+
+Les plateaux sont des tableaux `(N, 19, 19)` de type `int8` (0 : case vide, 1 : joueur 1, 2 : joueur 2). Chaque ligne
+est convertie en masque de 19 bits ; toutes les fenêtres de 5 cases et tous les segments de capture des quatre
+directions sont alors calculés par décalages et opérations bit à bit sur l'ensemble du lot, sans boucle Python par
+plateau. Les valeurs sont identiques à celles de `evaluation.evaluate`.
+
+NumPy n'est nécessaire que pour ce module : le reste du moteur n'en dépend pas.
+"""
+
+from typing import NamedTuple, Sequence
+
+import numpy as np
+
+from pente_engine.evaluation import CAPTURE_SCORES, CAPTURE_THREAT_SCORE, WINDOW_SCORES
+from pente_engine.rules import (
+    BOARD_COLS, BOARD_ROWS, BOARD_SIZE, CAPTURE_DIRECTIONS, EMPTY_CHAR, LINE_DIRECTIONS, PLAYER1, PLAYER1_CHAR,
+    PLAYER2, PLAYER2_CHAR, WIN_LENGTH
+)
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Contenu d'une case dans un plateau vectorisé
+EMPTY_CELL: int = 0
+PLAYER_CELLS: tuple[int, int] = (1, 2)  # Indexé par joueur (PLAYER1, PLAYER2)
+
+# Nombre de plateaux traités à la fois (les tableaux intermédiaires restent dans le cache du processeur)
+CHUNK_SIZE: int = 2048
+
+# Décodage des caractères d'un `board_state` (-1 : caractère invalide)
+_CHAR_CODES: np.ndarray = np.full(256, -1, dtype=np.int8)
+_CHAR_CODES[ord(EMPTY_CHAR)] = EMPTY_CELL
+_CHAR_CODES[ord(PLAYER1_CHAR)] = PLAYER_CELLS[PLAYER1]
+_CHAR_CODES[ord(PLAYER2_CHAR)] = PLAYER_CELLS[PLAYER2]
+
+# Chaque ligne du plateau est un masque de 19 bits (bit x : colonne x). Les lignes sont entourées de lignes vides pour
+# que les décalages verticaux ne sortent jamais du tableau.
+_ROW_MASK: int = (1 << BOARD_COLS) - 1
+_PADDING: int = WIN_LENGTH - 1
+
+# Valeur de chaque colonne dans un masque de ligne
+_COLUMN_BITS: np.ndarray = (2.0 ** np.arange(BOARD_COLS)).astype(np.float32)
+
+# Score d'une fenêtre selon le nombre de pions d'un seul joueur (1 à 5 ; 5 pions est une victoire, non évaluée)
+_PATTERN_SCORES: np.ndarray = np.array(WINDOW_SCORES[1:] + (0,), dtype=np.int64)
+_CAPTURE_SCORES: np.ndarray = np.array(CAPTURE_SCORES, dtype=np.int64)
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """
+    Compte les bits à 1 de chaque entier (repli pour les versions de NumPy sans `bitwise_count`).
+
+    Args:
+        values (np.ndarray): Les entiers (`uint32`).
+
+    Returns:
+        np.ndarray: Le nombre de bits à 1 de chaque entier.
+    """
+    return _POPCOUNT_16[values & 0xFFFF] + _POPCOUNT_16[values >> 16]
+
+
+if hasattr(np, "bitwise_count"):
+    _bit_count = np.bitwise_count
+else:
+    _POPCOUNT_16: np.ndarray = np.array([bin(value).count("1") for value in range(1 << 16)], dtype=np.uint8)
+    _bit_count = _popcount
+
+
+def _valid_starts(dx: int, dy: int, length: int) -> np.ndarray:
+    """
+    Calcule, pour chaque ligne, le masque des cases où peut commencer une fenêtre de `length` cases dans la direction
+    donnée sans sortir du plateau.
+
+    Args:
+        dx (int): Le déplacement horizontal.
+        dy (int): Le déplacement vertical.
+        length (int): Le nombre de cases.
+
+    Returns:
+        np.ndarray: Les masques des 19 lignes (`uint32`).
+    """
+    masks = np.zeros(BOARD_ROWS, dtype=np.uint32)
+    for y in range(BOARD_ROWS):
+        for x in range(BOARD_COLS):
+            if 0 <= x + (length - 1) * dx < BOARD_COLS and 0 <= y + (length - 1) * dy < BOARD_ROWS:
+                masks[y] |= np.uint32(1 << x)
+    return masks
+
+
+# Directions des fenêtres, avec les cases où une fenêtre peut commencer
+_WINDOW_DIRECTIONS: list[tuple[int, int, np.ndarray]] = [
+    (dx, dy, _valid_starts(dx, dy, WIN_LENGTH)[:, None]) for dx, dy in LINE_DIRECTIONS
+]
+
+
+def _to_row_masks(boards: np.ndarray, cell: int) -> np.ndarray:
+    """
+    Convertit les cases d'un contenu donné en masques de lignes, entourés de lignes vides.
+
+    Les masques sont rangés ligne par ligne (`(lignes, plateaux)`) pour que chaque opération porte sur des vecteurs
+    contigus de tout le lot.
+
+    Args:
+        boards (np.ndarray): Les plateaux `(n, 19, 19)`.
+        cell (int): Le contenu recherché (l'une des PLAYER_CELLS).
+
+    Returns:
+        np.ndarray: Les masques `(19 + 2 * 4, n)` en `uint32`.
+    """
+    # Produit matriciel en flottants simple précision : exact jusqu'à 2^24, donc pour 19 bits.
+    rows = (boards == cell).astype(np.float32) @ _COLUMN_BITS
+    masks = np.zeros((BOARD_ROWS + 2 * _PADDING, len(boards)), dtype=np.uint32)
+    masks[_PADDING:_PADDING + BOARD_ROWS] = rows.T
+    return masks
+
+
+def _shift(masks: np.ndarray, step: int, dx: int, dy: int) -> np.ndarray:
+    """
+    Aligne sur chaque case (x, y) le contenu de la case (x + step * dx, y + step * dy).
+
+    Args:
+        masks (np.ndarray): Les masques de lignes entourés de lignes vides.
+        step (int): Le nombre de pas.
+        dx (int): Le déplacement horizontal.
+        dy (int): Le déplacement vertical.
+
+    Returns:
+        np.ndarray: Les masques des 19 lignes `(19, n)`, hors du plateau à 0.
+    """
+    start = _PADDING + step * dy
+    rows = masks[start:start + BOARD_ROWS]
+    if dx > 0:
+        return rows >> np.uint32(step * dx)
+    if dx < 0:
+        return (rows << np.uint32(-step * dx)) & np.uint32(_ROW_MASK)
+    return rows
+
+
+def _count_bits(masks: np.ndarray) -> np.ndarray:
+    """
+    Compte les bits à 1 des 19 masques de lignes de chaque plateau.
+
+    Args:
+        masks (np.ndarray): Les masques `(19, n)`.
+
+    Returns:
+        np.ndarray: Le nombre de bits à 1 de chaque plateau `(n,)`.
+    """
+    return _bit_count(masks).sum(axis=0, dtype=np.uint16).astype(np.int64)
+
+
+class BatchAnalysis(NamedTuple):
+    """Caractéristiques d'un lot de plateaux."""
+
+    # Alignement de 5 pions ou plus, par plateau et par joueur : (N, 2) booléens
+    five_in_a_row: np.ndarray
+
+    # Nombre de fenêtres de 5 cases contenant 1 à 5 pions du joueur et aucun pion adverse : (N, 2, 5)
+    pattern_counts: np.ndarray
+
+    # Nombre de menaces de capture de chaque joueur : (N, 2)
+    capture_threats: np.ndarray
+
+    # Score des fenêtres (joueur 1 moins joueur 2, sans les captures) : (N,)
+    window_scores: np.ndarray
+
+
+def decode_board_states(board_states: Sequence[str]) -> np.ndarray:
+    """
+    Décode des chaînes `board_state` (format du serveur) en un tableau de plateaux.
+
+    Args:
+        board_states (Sequence[str]): Les plateaux, 361 caractères chacun.
+
+    Returns:
+        np.ndarray: Les plateaux, de forme `(N, 19, 19)` et de type `int8`.
+
+    Raises:
+        ValueError: Si un plateau n'a pas la bonne longueur ou contient un caractère invalide.
+    """
+    if any(len(board_state) != BOARD_SIZE for board_state in board_states):
+        raise ValueError(f"Chaque plateau doit contenir exactement {BOARD_SIZE} caractères.")
+
+    raw = np.frombuffer("".join(board_states).encode("latin-1", errors="replace"), dtype=np.uint8)
+    boards = _CHAR_CODES[raw]
+    if (boards < 0).any():
+        raise ValueError("Un plateau contient un caractère invalide.")
+    return boards.reshape(len(board_states), BOARD_ROWS, BOARD_COLS)
+
+
+def _check_boards(boards: np.ndarray) -> np.ndarray:
+    """
+    Vérifie la forme et le contenu d'un lot de plateaux.
+
+    Args:
+        boards (np.ndarray): Les plateaux.
+
+    Returns:
+        np.ndarray: Les plateaux, en `int8`.
+
+    Raises:
+        ValueError: Si la forme n'est pas `(N, 19, 19)` ou si une case ne vaut pas 0, 1 ou 2.
+    """
+    boards = np.asarray(boards)
+    if boards.ndim != 3 or boards.shape[1:] != (BOARD_ROWS, BOARD_COLS):
+        raise ValueError(f"Les plateaux doivent être de forme (N, {BOARD_ROWS}, {BOARD_COLS}).")
+    if boards.size and (boards.min() < EMPTY_CELL or boards.max() > PLAYER_CELLS[PLAYER2]):
+        raise ValueError("Les cases doivent valoir 0 (vide), 1 (joueur 1) ou 2 (joueur 2).")
+    return boards.astype(np.int8, copy=False)
+
+
+def _analyse_chunk(boards: np.ndarray) -> BatchAnalysis:
+    """
+    Calcule les caractéristiques d'un lot de taille raisonnable (voir `CHUNK_SIZE`), par opérations bit à bit sur les
+    masques de lignes : chaque opération traite les 19 cases d'une ligne de tous les plateaux à la fois.
+
+    Args:
+        boards (np.ndarray): Les plateaux `(n, 19, 19)` en `int8`.
+
+    Returns:
+        BatchAnalysis: Les caractéristiques du lot.
+    """
+    count = len(boards)
+    stones = [_to_row_masks(boards, PLAYER_CELLS[player]) for player in (PLAYER1, PLAYER2)]
+    empty = ~(stones[PLAYER1] | stones[PLAYER2]) & np.uint32(_ROW_MASK)
+    empty[:_PADDING] = empty[_PADDING + BOARD_ROWS:] = 0
+
+    pattern_counts = np.zeros((count, 2, WIN_LENGTH), dtype=np.int64)
+    for dx, dy, valid in _WINDOW_DIRECTIONS:
+        shifted = [[_shift(masks, step, dx, dy) for step in range(WIN_LENGTH)] for masks in stones]
+        for player in (PLAYER1, PLAYER2):
+            # Nombre de pions du joueur dans chaque fenêtre, sur 3 bits (additionneur bit à bit).
+            cells = shifted[player]
+            bit0, bit1, bit2 = cells[0].copy(), np.zeros_like(cells[0]), np.zeros_like(cells[0])
+            for cell in cells[1:]:
+                carry0 = bit0 & cell
+                bit0 ^= cell
+                carry1 = bit1 & carry0
+                bit1 ^= carry0
+                bit2 |= carry1
+
+            # Fenêtres sans pion adverse et entièrement sur le plateau.
+            opponent = shifted[1 - player]
+            open_windows = valid & ~(opponent[0] | opponent[1] | opponent[2] | opponent[3] | opponent[4])
+
+            # Nombre de fenêtres par nombre de pions (1 à 5) à partir des bits du compteur :
+            # bit 0 -> 1, 3 ou 5 pions ; bit 1 -> 2 ou 3 ; bit 2 -> 4 ou 5 ; bits 0 et 1 -> 3 ; bits 0 et 2 -> 5.
+            odd = open_windows & bit0
+            three = _count_bits(odd & bit1)
+            five = _count_bits(odd & bit2)
+            counts = pattern_counts[:, player]
+            counts[:, 0] += _count_bits(odd) - three - five
+            counts[:, 1] += _count_bits(open_windows & bit1) - three
+            counts[:, 2] += three
+            counts[:, 3] += _count_bits(open_windows & bit2) - five
+            counts[:, 4] += five
+
+    # Menaces de capture : pion du joueur, paire adverse, puis case vide, dans les 8 directions.
+    threats = np.zeros((count, 2), dtype=np.int64)
+    for dx, dy in CAPTURE_DIRECTIONS:
+        closing = _shift(empty, 3, dx, dy)
+        for player in (PLAYER1, PLAYER2):
+            opponent = stones[1 - player]
+            threat = (
+                stones[player][_PADDING:_PADDING + BOARD_ROWS]
+                & _shift(opponent, 1, dx, dy) & _shift(opponent, 2, dx, dy) & closing
+            )
+            threats[:, player] += _count_bits(threat)
+
+    return BatchAnalysis(
+        five_in_a_row=pattern_counts[:, :, WIN_LENGTH - 1] > 0,
+        pattern_counts=pattern_counts,
+        capture_threats=threats,
+        window_scores=pattern_counts[:, PLAYER1] @ _PATTERN_SCORES - pattern_counts[:, PLAYER2] @ _PATTERN_SCORES,
+    )
+
+
+def analyse_batch(boards: np.ndarray) -> BatchAnalysis:
+    """
+    Calcule les caractéristiques d'un lot de plateaux : alignements de 5, motifs par fenêtre et menaces de capture.
+
+    Args:
+        boards (np.ndarray): Les plateaux, de forme `(N, 19, 19)` (0 : vide, 1 : joueur 1, 2 : joueur 2).
+
+    Returns:
+        BatchAnalysis: Les caractéristiques de chaque plateau.
+
+    Raises:
+        ValueError: Si les plateaux sont invalides.
+    """
+    boards = _check_boards(boards)
+    chunks = [_analyse_chunk(boards[start:start + CHUNK_SIZE]) for start in range(0, len(boards), CHUNK_SIZE)]
+    if not chunks:
+        return _analyse_chunk(boards)
+    return BatchAnalysis(*(np.concatenate(field) for field in zip(*chunks)))
+
+
+def evaluate_batch(boards: np.ndarray, captures: np.ndarray | None = None,
+                   to_move: np.ndarray | None = None) -> np.ndarray:
+    """
+    Évalue un lot de plateaux avec la même formule que `evaluation.evaluate`.
+
+    Args:
+        boards (np.ndarray): Les plateaux, de forme `(N, 19, 19)`.
+        captures (np.ndarray | None): Les captures de chaque joueur, de forme `(N, 2)`. Par défaut, aucune.
+        to_move (np.ndarray | None): Le joueur au trait de chaque plateau, de forme `(N,)`. Par défaut, les scores
+                                     sont donnés du point de vue du joueur 1.
+
+    Returns:
+        np.ndarray: Les scores, de forme `(N,)` (positifs si le joueur au trait est avantagé).
+
+    Raises:
+        ValueError: Si les plateaux, les captures ou les joueurs au trait sont invalides.
+    """
+    analysis = analyse_batch(boards)
+    count = len(analysis.window_scores)
+
+    scores = analysis.window_scores + CAPTURE_THREAT_SCORE * (
+        analysis.capture_threats[:, PLAYER1] - analysis.capture_threats[:, PLAYER2]
+    )
+
+    if captures is not None:
+        captures = np.asarray(captures)
+        if captures.shape != (count, 2) or (captures < 0).any():
+            raise ValueError("Les captures doivent être de forme (N, 2) et positives.")
+        capture_scores = _CAPTURE_SCORES[np.minimum(captures, len(CAPTURE_SCORES) - 1)]
+        scores += capture_scores[:, PLAYER1] - capture_scores[:, PLAYER2]
+
+    if to_move is not None:
+        to_move = np.asarray(to_move)
+        if to_move.shape != (count,) or not np.isin(to_move, (PLAYER1, PLAYER2)).all():
+            raise ValueError("Le joueur au trait doit être PLAYER1 ou PLAYER2 pour chaque plateau.")
+        scores = np.where(to_move == PLAYER1, scores, -scores)
+
+    return scores
@@ -0,0 +1,749 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from pente_engine.analysis import BackgroundAnalyzer
+from pente_engine.anytime import AnytimeSearch
+from pente_engine.board import Board
+from pente_engine.book import OpeningBook, build_book
+from pente_engine.candidates import CENTER_INDEX, CandidateSet
+from pente_engine.evaluation import evaluate
+from pente_engine.incremental import IncrementalEvaluator
+from pente_engine.mcts import ParallelMCTS
+from pente_engine.rules import (
+    BOARD_COLS, BOARD_ROWS, BOARD_SIZE, CAPTURE_DIRECTIONS, CAPTURES_TO_WIN, EMPTY_CHAR, FIRST_PLAYER,
+    LINE_DIRECTIONS, PLAYER_CHARS, dilate, iterate_bits, to_coordinates
+)
+from pente_engine.search import AlphaBetaSearch
+from pente_engine.symmetry import canonical_form
+from pente_engine.threats import FORCED_WIN, UNKNOWN, ThreatSpaceSearch
+from pente_engine.transposition import EXACT, NO_MOVE, TranspositionTable
+from pente_engine.zobrist import compute_hash
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Nombre de parties aléatoires jouées par défaut
+DEFAULT_GAMES: int = 200
+
+# Graine par défaut (résultats reproductibles)
+DEFAULT_SEED: int = 1
+
+
+def reference_play(board: list[str], captures: list[int], index: int, player: int) -> tuple[bool, int]:
+    """
+    Joue un coup avec une traduction directe des fonctions du serveur, sur un plateau au format `board_state`.
+
+    Sert de référence pour vérifier que le moteur à bitboards respecte exactement les règles du serveur.
+
+    Args:
+        board (list[str]): Le plateau (modifié en place).
+        captures (list[int]): Les captures de chaque joueur (modifiées en place).
+        index (int): L'indice de la case jouée (supposée vide).
+        player (int): Le joueur.
+
+    Returns:
+        tuple[bool, int]: Vrai si le coup gagne, et le nombre de paires capturées.
+    """
+    player_char = PLAYER_CHARS[player]
+    opponent_char = PLAYER_CHARS[1 - player]
+    last_x, last_y = to_coordinates(index)
+    board[index] = player_char
+
+    def cell(x: int, y: int) -> str | None:
+        return board[y * BOARD_COLS + x] if 0 <= x < BOARD_COLS and 0 <= y < BOARD_ROWS else None
+
+    # check_alignements / count_in_direction
+    for dx, dy in LINE_DIRECTIONS:
+        total = 1
+        for sign in (1, -1):
+            for step in range(1, 5):
+                if cell(last_x + sign * step * dx, last_y + sign * step * dy) != player_char:
+                    break
+                total += 1
+        if total >= 5:
+            return True, 0
+
+    # check_captures
+    pairs = 0
+    for dx, dy in CAPTURE_DIRECTIONS:
+        if (
+            cell(last_x + dx, last_y + dy) == opponent_char
+            and cell(last_x + 2 * dx, last_y + 2 * dy) == opponent_char
+            and cell(last_x + 3 * dx, last_y + 3 * dy) == player_char
+        ):
+            board[(last_y + dy) * BOARD_COLS + last_x + dx] = EMPTY_CHAR
+            board[(last_y + 2 * dy) * BOARD_COLS + last_x + 2 * dx] = EMPTY_CHAR
+            pairs += 1
+
+    captures[player] += pairs
+    return captures[player] >= CAPTURES_TO_WIN, pairs
+
+
+def generate_games(games: int, seed: int) -> list[list[int]]:
+    """
+    Génère des parties aléatoires complètes (jusqu'à la victoire ou au plateau plein).
+
+    Les coups sont tirés près du centre pour provoquer alignements et captures, comme dans une vraie partie.
+
+    Args:
+        games (int): Le nombre de parties.
+        seed (int): La graine du générateur aléatoire.
+
+    Returns:
+        list[list[int]]: Les coups de chaque partie.
+    """
+    generator = random.Random(seed)
+    center = BOARD_COLS // 2
+    sequences = []
+    for _ in range(games):
+        board = Board()
+        moves = []
+        while not board.is_game_over and board.move_count < BOARD_SIZE:
+            x = min(BOARD_COLS - 1, max(0, round(generator.gauss(center, 3))))
+            y = min(BOARD_ROWS - 1, max(0, round(generator.gauss(center, 3))))
+            index = y * BOARD_COLS + x
+            if not board.is_legal(index):
+                legal_moves = board.legal_moves()
+                if not legal_moves:
+                    break
+                index = generator.choice(legal_moves)
+            board.play(index)
+            moves.append(index)
+        sequences.append(moves)
+    return sequences
+
+
+def verify(sequences: list[list[int]]) -> int:
+    """
+    Rejoue les parties avec le moteur et avec la référence, et compare plateaux, captures et victoires.
+    Vérifie aussi que l'empreinte de Zobrist incrémentale correspond à un calcul complet.
+
+    Args:
+        sequences (list[list[int]]): Les coups de chaque partie.
+
+    Returns:
+        int: Le nombre de coups vérifiés.
+
+    Raises:
+        AssertionError: Si le moteur diverge de la référence.
+    """
+    checked = 0
+    for moves in sequences:
+        board = Board()
+        reference_board = [EMPTY_CHAR] * BOARD_SIZE
+        reference_captures = [0, 0]
+        player = FIRST_PLAYER
+        for index in moves:
+            result = board.play(index)
+            is_win, pairs = reference_play(reference_board, reference_captures, index, player)
+
+            assert result.is_win == is_win, f"Victoire différente au coup {checked}."
+            assert len(result.captured) == 2 * pairs, f"Captures différentes au coup {checked}."
+            assert board.to_board_state() == "".join(reference_board), f"Plateau différent au coup {checked}."
+            assert board.captures == reference_captures, f"Compteurs de captures différents au coup {checked}."
+            assert Board.from_board_state(board.to_board_state()).bitboards == board.bitboards
+            assert board.hash == compute_hash(board.bitboards, board.captures, board.to_move), \
+                f"Empreinte de Zobrist incrémentale différente au coup {checked}."
+
+            player = 1 - player
+            checked += 1
+    return checked
+
+
+def measure_undo(sequences: list[list[int]]) -> dict:
+    """
+    Compare l'examen d'un coup par copie du plateau (copie puis coup) et par annulation (coup puis annulation).
+
+    Args:
+        sequences (list[list[int]]): Les coups de chaque partie.
+
+    Returns:
+        dict: Les débits des deux méthodes (coups examinés par seconde).
+    """
+    positions = []
+    for moves in sequences:
+        board = Board()
+        for index in moves:
+            positions.append((board.copy(), index))
+            board.play(index)
+
+    start = time.perf_counter()
+    for board, index in positions:
+        board.copy().play(index)
+    copy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for board, index in positions:
+        board.play(index)
+        board.undo()
+    undo_seconds = time.perf_counter() - start
+
+    return {
+        "copy_play_per_second": len(positions) / copy_seconds if copy_seconds else float("inf"),
+        "play_undo_per_second": len(positions) / undo_seconds if undo_seconds else float("inf"),
+    }
+
+
+def reference_candidates(board: Board, distance: int) -> list[int]:
+    """
+    Calcule les coups candidats en relisant tout le plateau (référence de `CandidateSet`).
+
+    Args:
+        board (Board): Le plateau.
+        distance (int): La distance maximale des candidats aux pions.
+
+    Returns:
+        list[int]: Les indices des cases candidates, par ordre croissant (le centre sur un plateau vide).
+    """
+    occupied = board.occupied
+    if not occupied:
+        return [CENTER_INDEX]
+    return list(iterate_bits(dilate(occupied, distance) & ~occupied))
+
+
+def measure_candidates(sequences: list[list[int]], distance: int = 2) -> dict:
+    """
+    Compare le coût de la liste des candidats recalculée sur tout le plateau à celui de l'ensemble incrémental
+    (coup appliqué, liste des candidats, puis annulation).
+
+    Args:
+        sequences (list[list[int]]): Les coups de chaque partie.
+        distance (int): La distance maximale des candidats aux pions. Par défaut, 2.
+
+    Returns:
+        dict: Les durées moyennes (en microsecondes), l'accélération et le nombre moyen de candidats.
+    """
+    samples = []
+    for moves in sequences:
+        board = Board()
+        for index in moves[:-1]:
+            parent = board.copy()
+            result = board.play(index)
+            samples.append((parent, board.copy(), result))
+
+    start = time.perf_counter()
+    for _, child, _ in samples:
+        reference_candidates(child, distance)
+    full_seconds = time.perf_counter() - start
+
+    candidate_sets = [CandidateSet(parent, distance) for parent, _, _ in samples]
+    count = 0
+    start = time.perf_counter()
+    for candidates, (_, _, result) in zip(candidate_sets, samples):
+        candidates.apply(result)
+        count += len(candidates.moves())
+        candidates.undo()
+    incremental_seconds = time.perf_counter() - start
+
+    return {
+        "positions": len(samples),
+        "average_candidates": count / len(samples),
+        "full_microseconds": 1e6 * full_seconds / len(samples),
+        "incremental_microseconds": 1e6 * incremental_seconds / len(samples),
+        "speedup": full_seconds / incremental_seconds if incremental_seconds else float("inf"),
+    }
+
+
+def measure_evaluation(sequences: list[list[int]]) -> dict:
+    """
+    Compare le coût d'une évaluation complète à celui d'un coup appliqué puis annulé avec l'évaluateur
+    incrémental (ce que fait la recherche à chaque position).
+
+    Args:
+        sequences (list[list[int]]): Les coups de chaque partie.
+
+    Returns:
+        dict: Les durées moyennes (en microsecondes) et l'accélération.
+    """
+    samples = []
+    for moves in sequences:
+        board = Board()
+        for index in moves[:-1]:
+            parent = board.copy()
+            result = board.play(index)
+            samples.append((parent, board.copy(), result))
+
+    start = time.perf_counter()
+    for _, child, _ in samples:
+        evaluate(child)
+    full_seconds = time.perf_counter() - start
+
+    evaluators = [IncrementalEvaluator(parent) for parent, _, _ in samples]
+    start = time.perf_counter()
+    for evaluator, (_, child, result) in zip(evaluators, samples):
+        evaluator.apply(result)
+        evaluator.evaluate(child)
+        evaluator.undo()
+    incremental_seconds = time.perf_counter() - start
+
+    return {
+        "positions": len(samples),
+        "full_microseconds": 1e6 * full_seconds / len(samples),
+        "incremental_microseconds": 1e6 * incremental_seconds / len(samples),
+        "speedup": full_seconds / incremental_seconds if incremental_seconds else float("inf"),
+    }
+
+
+def run_benchmark(games: int = DEFAULT_GAMES, seed: int = DEFAULT_SEED) -> dict:
+    """
+    Mesure le débit du moteur (coups joués par seconde) et le compare à la traduction directe du serveur.
+
+    Args:
+        games (int): Le nombre de parties aléatoires. Par défaut, 200.
+        seed (int): La graine du générateur aléatoire. Par défaut, 1.
+
+    Returns:
+        dict: Les résultats (nombre de coups, durées et coups par seconde).
+
+    Raises:
+        ValueError: Si le nombre de parties n'est pas un entier strictement positif.
+    """
+    if not isinstance(games, int) or games <= 0:
+        raise ValueError("Le nombre de parties doit être un entier strictement positif.")
+
+    sequences = generate_games(games, seed)
+    moves = sum(len(sequence) for sequence in sequences)
+    checked = verify(sequences)
+
+    start = time.perf_counter()
+    for sequence in sequences:
+        board = Board()
+        for index in sequence:
+            board.play(index)
+    engine_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for sequence in sequences:
+        reference_board = [EMPTY_CHAR] * BOARD_SIZE
+        reference_captures = [0, 0]
+        player = FIRST_PLAYER
+        for index in sequence:
+            reference_play(reference_board, reference_captures, index, player)
+            player = 1 - player
+    reference_seconds = time.perf_counter() - start
+
+    # Table de transposition : écriture puis lecture de chaque position rencontrée.
+    table = TranspositionTable()
+    positions = []
+    for sequence in sequences:
+        board = Board()
+        for index in sequence:
+            board.play(index)
+            positions.append((board.hash, board.move_count))
+
+    start = time.perf_counter()
+    for key, depth in positions:
+        table.store(key, depth % 8, 0, EXACT, NO_MOVE)
+    for key, _ in positions:
+        table.probe(key)
+    table_seconds = time.perf_counter() - start
+
+    return {
+        "games": games,
+        "moves": moves,
+        "verified_moves": checked,
+        "engine_seconds": engine_seconds,
+        "engine_moves_per_second": moves / engine_seconds if engine_seconds else float("inf"),
+        "reference_seconds": reference_seconds,
+        "reference_moves_per_second": moves / reference_seconds if reference_seconds else float("inf"),
+        "transposition_operations_per_second": 2 * len(positions) / table_seconds if table_seconds else float("inf"),
+        "transposition_stats": table.stats(),
+        "evaluation": measure_evaluation(sequences),
+        "candidates": measure_candidates(sequences),
+        "undo": measure_undo(sequences),
+    }
+
+
+def measure_threat_search(sequences: list[list[int]], positions: int = 30, opening_moves: int = 30) -> dict:
+    """
+    Mesure la recherche de menaces sur des positions de milieu de partie et rejoue chaque ligne gagnante trouvée
+    pour vérifier qu'elle se termine bien par la victoire de l'attaquant.
+
+    Args:
+        sequences (list[list[int]]): Les coups de chaque partie.
+        positions (int): Le nombre maximal de positions mesurées. Par défaut, 30.
+        opening_moves (int): Le nombre de coups joués avant la position mesurée. Par défaut, 30.
+
+    Returns:
+        dict: Pour la recherche limitée aux quatre et captures puis avec les trois : le nombre de victoires forcées
+              et de budgets épuisés, et les durées moyenne et maximale (en millisecondes).
+
+    Raises:
+        AssertionError: Si une ligne gagnante ne mène pas à la victoire de l'attaquant.
+    """
+    boards = []
+    for moves in sequences:
+        board = Board()
+        for index in moves[:opening_moves]:
+            board.play(index)
+            if board.is_game_over:
+                break
+        if not board.is_game_over:
+            boards.append(board)
+    boards = boards[:positions]
+
+    results = {}
+    for name, use_threes in (("fours_and_captures", False), ("with_threes", True)):
+        solver = ThreatSpaceSearch(use_threes=use_threes)
+        durations, forced_wins, unknown = [], 0, 0
+        for board in boards:
+            result = solver.search(board)
+            durations.append(result.seconds)
+            unknown += result.status == UNKNOWN
+            if result.status == FORCED_WIN:
+                forced_wins += 1
+                attacker, line_board = board.to_move, board.copy()
+                for index in result.winning_line:
+                    line_board.play(index)
+                assert line_board.winner == attacker, f"Ligne gagnante invalide : {result.winning_line}."
+
+        results[name] = {
+            "positions": len(boards),
+            "forced_wins": forced_wins,
+            "budget_exhausted": unknown,
+            "average_milliseconds": 1000 * sum(durations) / len(durations) if durations else 0.0,
+            "max_milliseconds": 1000 * max(durations, default=0.0),
+        }
+    return results
+
+
+def measure_batch_evaluation(sequences: list[list[int]], boards: int = 100_000) -> dict:
+    """
+    Vérifie l'évaluation par lots (NumPy) contre l'évaluation complète, puis mesure son débit.
+
+    Args:
+        sequences (list[list[int]]): Les coups de chaque partie.
+        boards (int): Le nombre de plateaux du lot mesuré. Par défaut, 100 000.
+
+    Returns:
+        dict: Le nombre de plateaux vérifiés, les débits de décodage et d'évaluation (plateaux par seconde).
+
+    Raises:
+        AssertionError: Si l'évaluation par lots diverge de l'évaluation complète.
+    """
+    # NumPy n'est nécessaire que pour cette mesure.
+    import numpy as np
+
+    from pente_engine.batch import decode_board_states, evaluate_batch
+
+    positions = []
+    for moves in sequences:
+        board = Board()
+        for index in moves:
+            board.play(index)
+            if board.is_game_over:
+                break
+            positions.append(board.copy())
+
+    board_states = [board.to_board_state() for board in positions]
+    scores = evaluate_batch(
+        decode_board_states(board_states),
+        np.array([board.captures for board in positions]),
+        np.array([board.to_move for board in positions]),
+    )
+    for board, score in zip(positions, scores):
+        assert score == evaluate(board), f"Évaluation par lots différente ({board.move_count} coups)."
+
+    repeated_states = (board_states * (boards // len(board_states) + 1))[:boards]
+    start = time.perf_counter()
+    batch = decode_board_states(repeated_states)
+    decode_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    evaluate_batch(batch)
+    evaluate_seconds = time.perf_counter() - start
+
+    return {
+        "verified_boards": len(positions),
+        "boards": boards,
+        "decode_boards_per_second": boards / decode_seconds if decode_seconds else float("inf"),
+        "evaluate_boards_per_second": boards / evaluate_seconds if evaluate_seconds else float("inf"),
+    }
+
+
+def measure_opening_book(sequences: list[list[int]], max_moves: int = 16, lookups: int = 100_000) -> dict:
+    """
+    Construit un livre d'ouvertures à partir des parties, puis mesure le débit des recherches (la justesse du
+    livre est vérifiée par `tests/test_book.py`).
+
+    Args:
+        sequences (list[list[int]]): Les coups de chaque partie.
+        max_moves (int): Le nombre de coups retenus au début de chaque partie. Par défaut, 16.
+        lookups (int): Le nombre de recherches mesurées. Par défaut, 100 000.
+
+    Returns:
+        dict: Le nombre de positions et d'entrées, la taille du fichier (en octets) et le débit des recherches (par
+              seconde).
+    """
+    keys = set()
+    for moves in sequences:
+        board = Board()
+        for index in moves[:max_moves]:
+            if board.is_game_over:
+                break
+            keys.add(canonical_form(board)[0])
+            board.play(index)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "book.bin")
+        entries = build_book(sequences, path, max_moves)
+
+        with OpeningBook(path) as book:
+            measured_keys = list(keys)
+            measured_keys = (measured_keys * (lookups // len(measured_keys) + 1))[:lookups]
+            start = time.perf_counter()
+            for key in measured_keys:
+                book.lookup(key)
+            seconds = time.perf_counter() - start
+
+        size = os.path.getsize(path)
+
+    return {
+        "positions": len(keys),
+        "entries": entries,
+        "file_bytes": size,
+        "lookups_per_second": lookups / seconds if seconds else float("inf"),
+    }
+
+
+def measure_symmetry(sequences: list[list[int]], positions: int = 2000) -> dict:
+    """
+    Mesure le calcul de la forme canonique sur les positions des parties (la justesse des symétries est vérifiée
+    par `tests/test_symmetry.py`).
+
+    Args:
+        sequences (list[list[int]]): Les coups de chaque partie.
+        positions (int): Le nombre maximal de positions mesurées. Par défaut, 2 000.
+
+    Returns:
+        dict: Le nombre de positions mesurées et de positions canoniques distinctes, et la durée moyenne du calcul
+              de la forme canonique (en microsecondes).
+    """
+    boards = []
+    for moves in sequences:
+        board = Board()
+        for index in moves:
+            if len(boards) >= positions:
+                break
+            boards.append(board.copy())
+            board.play(index)
+            if board.is_game_over:
+                break
+
+    start = time.perf_counter()
+    canonical_keys = {canonical_form(board)[0] for board in boards}
+    seconds = time.perf_counter() - start
+
+    return {
+        "positions": len(boards),
+        "distinct_positions": len({board.hash for board in boards}),
+        "distinct_canonical_positions": len(canonical_keys),
+        "canonical_microseconds": 1e6 * seconds / len(boards) if boards else 0.0,
+    }
+
+
+def measure_pondering(sequences: list[list[int]], positions: int = 8, opening_moves: int = 12,
+                      seconds: float = 1.0) -> dict:
+    """
+    Mesure la réflexion anticipée : une position de milieu de partie est envoyée pendant le tour de l'adversaire,
+    qui répond après `seconds` (adversaire simulé par une recherche de profondeur 2), puis la position obtenue est
+    analysée et le délai avant le premier résultat est mesuré.
+
+    Args:
+        sequences (list[list[int]]): Les coups de chaque partie.
+        positions (int): Le nombre maximal de positions mesurées. Par défaut, 8.
+        opening_moves (int): Le nombre de coups joués avant chaque position. Par défaut, 12.
+        seconds (float): La durée de réflexion de l'adversaire simulé (en secondes). Par défaut, 1 seconde.
+
+    Returns:
+        dict: Le nombre de coups prédits et manqués, le taux de réussite et le délai moyen avant le premier
+              résultat (en millisecondes) selon que le coup a été prédit ou non.
+    """
+    opponent = AlphaBetaSearch()
+    analyzer = BackgroundAnalyzer(max_depth=4, analysis_seconds=seconds)
+    delays = {True: [], False: []}
+    try:
+        for moves in sequences:
+            if sum(map(len, delays.values())) >= positions:
+                break
+            board = Board()
+            for index in moves[:opening_moves]:
+                board.play(index)
+            if board.is_game_over or len(moves) <= opening_moves:
+                continue
+
+            hits = analyzer.ponder_stats()["hits"]
+            start = time.perf_counter()
+            analyzer.ponder(board)
+            reply = opponent.search(board, seconds, 2).best_move
+            time.sleep(max(0.0, seconds - (time.perf_counter() - start)))
+            board.play(reply)
+            if board.is_game_over:
+                continue
+
+            start = time.perf_counter()
+            analyzer.analyse(board)
+            while analyzer.poll() is None:
+                time.sleep(0.001)
+            delays[analyzer.ponder_stats()["hits"] > hits].append(time.perf_counter() - start)
+    finally:
+        analyzer.shutdown()
+
+    stats = analyzer.ponder_stats()
+    return {
+        **stats,
+        "hit_first_update_ms": 1000 * sum(delays[True]) / len(delays[True]) if delays[True] else None,
+        "miss_first_update_ms": 1000 * sum(delays[False]) / len(delays[False]) if delays[False] else None,
+    }
+
+
+def measure_anytime_search(sequences: list[list[int]], positions: int = 10, opening_moves: int = 12,
+                           seed: int = DEFAULT_SEED) -> dict:
+    """
+    Mesure la recherche interruptible sur des positions de milieu de partie : délai de `start` pendant une recherche
+    en cours, délai entre `cancel` et l'arrêt effectif de la recherche, résultats progressifs et variantes
+    principales (vérifications : `tests/test_anytime.py`).
+
+    Args:
+        sequences (list[list[int]]): Les coups de chaque partie.
+        positions (int): Le nombre maximal de positions mesurées. Par défaut, 10.
+        opening_moves (int): Le nombre de coups joués avant chaque position. Par défaut, 12.
+        seed (int): La graine du moment de l'interruption.
+
+    Returns:
+        dict: Le nombre de positions, le nombre moyen de résultats progressifs, la longueur moyenne des variantes
+              principales, le délai maximal de `start` et les délais d'arrêt moyen et maximal (en millisecondes).
+    """
+    generator = random.Random(seed)
+    updates = []
+    search = AnytimeSearch(on_progress=updates.append)
+    delays, start_delays, progress_counts, variation_lengths = [], [], [], []
+    for moves in sequences:
+        if len(delays) >= positions:
+            break
+        board = Board()
+        for index in moves[:opening_moves]:
+            board.play(index)
+        if board.is_game_over or len(moves) <= opening_moves:
+            continue
+
+        # Redémarrage pendant une recherche en cours (l'appelant ne doit pas attendre son arrêt).
+        search.start(board, time_budget=60.0, max_depth=AlphaBetaSearch.MAX_DEPTH)
+        time.sleep(generator.uniform(0.05, 0.3))
+        updates.clear()
+        start = time.perf_counter()
+        search.start(board, time_budget=60.0, max_depth=AlphaBetaSearch.MAX_DEPTH)
+        start_delays.append(time.perf_counter() - start)
+
+        # Interruption à un moment aléatoire d'une recherche longue.
+        time.sleep(generator.uniform(0.05, 0.3))
+        start = time.perf_counter()
+        search.cancel()
+        result = search.wait()
+        delays.append(time.perf_counter() - start)
+
+        progress_counts.append(len(updates))
+        if result is not None:
+            variation_lengths.append(len(result.principal_variation))
+
+    return {
+        "positions": len(delays),
+        "progress_updates": sum(progress_counts) / len(progress_counts) if progress_counts else 0.0,
+        "principal_variation_length": sum(variation_lengths) / len(variation_lengths) if variation_lengths else 0.0,
+        "max_start_ms": 1000 * max(start_delays, default=0.0),
+        "cancel_ms": 1000 * sum(delays) / len(delays) if delays else 0.0,
+        "max_cancel_ms": 1000 * max(delays, default=0.0),
+    }
+
+
+def measure_mcts_scaling(workers_list: list[int], seconds: float = 2.0, seed: int = DEFAULT_SEED) -> dict:
+    """
+    Mesure le débit de la recherche MCTS parallèle (simulations par seconde) selon le nombre de processus.
+
+    Args:
+        workers_list (list[int]): Les nombres de processus à mesurer.
+        seconds (float): La durée de chaque mesure. Par défaut, 2 secondes.
+        seed (int): La graine utilisée pour générer la position de départ.
+
+    Returns:
+        dict: Pour chaque nombre de processus, le débit et l'accélération par rapport à la première mesure.
+    """
+    # Position de milieu de partie : les premiers coups d'une partie aléatoire.
+    board = Board()
+    for index in generate_games(1, seed)[0][:12]:
+        board.play(index)
+
+    results = {}
+    baseline = None
+    for workers in workers_list:
+        mcts = ParallelMCTS(workers=workers)
+        try:
+            # Premier lot hors mesure : démarrage des processus.
+            mcts.search(board, mcts.batch_seconds)
+            result = mcts.search(board, seconds)
+        finally:
+            mcts.shutdown()
+
+        baseline = baseline or result.playouts_per_second
+        results[str(workers)] = {
+            "playouts": result.playouts,
+            "playouts_per_second": result.playouts_per_second,
+            "speedup": result.playouts_per_second / baseline if baseline else 0.0,
+        }
+    return results
+
+
+def main() -> None:
+    """
+    Point d'entrée en ligne de commande du microbenchmark du moteur.
+
+    Exemple (depuis le dossier `front_end`) : `python -m pente_engine.benchmark --games 500`
+    """
+    parser = argparse.ArgumentParser(description="Microbenchmark du moteur de règles du Pente.")
+    parser.add_argument("--games", type=int, default=DEFAULT_GAMES, help="Nombre de parties aléatoires.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Graine du générateur aléatoire.")
+    parser.add_argument("--output", type=str, default=None, help="Fichier JSON où écrire les résultats.")
+    parser.add_argument("--threats", action="store_true",
+                        help="Mesure aussi la recherche de menaces sur des positions de milieu de partie.")
+    parser.add_argument("--batch", action="store_true",
+                        help="Mesure aussi l'évaluation par lots (nécessite NumPy).")
+    parser.add_argument("--book", action="store_true",
+                        help="Mesure aussi un livre d'ouvertures construit à partir des parties.")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Mesure aussi le calcul de la forme canonique des positions.")
+    parser.add_argument("--ponder", action="store_true",
+                        help="Mesure aussi la réflexion anticipée (taux de coups prédits et délai de l'indice).")
+    parser.add_argument("--anytime", action="store_true",
+                        help="Mesure aussi la recherche interruptible (délais de démarrage et d'arrêt).")
+    parser.add_argument("--mcts-workers", type=int, nargs="+", default=None, metavar="WORKERS",
+                        help="Mesure aussi le débit MCTS pour ces nombres de processus (ex : 1 2 4 8 16 32).")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.games, args.seed)
+    if args.batch:
+        results["batch_evaluation"] = measure_batch_evaluation(generate_games(args.games, args.seed))
+    if args.threats:
+        results["threat_search"] = measure_threat_search(generate_games(args.games, args.seed))
+    if args.book:
+        results["opening_book"] = measure_opening_book(generate_games(args.games, args.seed))
+    if args.symmetry:
+        results["symmetry"] = measure_symmetry(generate_games(args.games, args.seed))
+    if args.ponder:
+        results["pondering"] = measure_pondering(generate_games(args.games, args.seed))
+    if args.anytime:
+        results["anytime_search"] = measure_anytime_search(generate_games(args.games, args.seed), seed=args.seed)
+    if args.mcts_workers:
+        results["mcts_scaling"] = measure_mcts_scaling(args.mcts_workers, seed=args.seed)
+
+    print(json.dumps(results, indent=4))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(results, output_file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+from typing import NamedTuple
+
+from pente_engine.rules import (
+    BOARD_SIZE, CAPTURE_PATTERNS, CAPTURES_TO_WIN, EMPTY_CHAR, FIRST_PLAYER, FULL_MASK, PLAYER1, PLAYER2,
+    PLAYER_CHARS, WIN_MASKS
+)
+from pente_engine.zobrist import PIECE_KEYS, SIDE_KEY, capture_key, compute_hash
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+
+class MoveResult(NamedTuple):
+    """Résultat d'un coup joué sur le plateau."""
+
+    # Indice de la case jouée
+    index: int
+
+    # Joueur ayant joué le coup (PLAYER1 ou PLAYER2)
+    player: int
+
+    # Indices des pions adverses capturés (par paires)
+    captured: tuple[int, ...]
+
+    # Vrai si le coup a formé un alignement de 5 pions ou plus
+    is_alignment: bool
+
+    # Vrai si le coup termine la partie (alignement ou 5 captures)
+    is_win: bool
+
+
+class Board:
+    """
+    Plateau de Pente représenté par un bitboard par joueur, avec les règles exactes du serveur.
+
+    Le plateau est modifié sur place : `play` empile de quoi annuler le coup et `undo` le défait en temps constant,
+    ce qui évite de copier le plateau à chaque coup examiné par une recherche.
+    """
+
+    __slots__ = ("bitboards", "captures", "to_move", "winner", "move_count", "hash", "_history")
+
+    def __init__(self) -> None:
+        """
+        Initialise un plateau vide, sans capture, avec le joueur 2 (celui qui rejoint la partie) au trait.
+        """
+        self.bitboards: list[int] = [0, 0]
+        self.captures: list[int] = [0, 0]
+        self.to_move: int = FIRST_PLAYER
+        self.winner: int | None = None
+        self.move_count: int = 0
+
+        # Empreinte de Zobrist (pions, captures et trait), mise à jour à chaque coup
+        self.hash: int = compute_hash(self.bitboards, self.captures, self.to_move)
+
+        # Pile d'annulation : résultat de chaque coup et empreinte de la position qui le précédait
+        self._history: list[tuple[MoveResult, int]] = []
+
+    @classmethod
+    def from_board_state(cls, board_state: str, to_move: int | None = None,
+                         captures: tuple[int, int] = (0, 0)) -> "Board":
+        """
+        Construit un plateau à partir du format `board_state` du serveur (361 caractères).
+
+        Args:
+            board_state (str): Le plateau ('x' pour le joueur 1, 'o' pour le joueur 2, '-' pour une case vide).
+            to_move (int | None): Le joueur au trait. Si None, il est déduit du nombre de pions de chaque joueur
+                (exact tant qu'aucune capture n'a eu lieu).
+            captures (tuple[int, int]): Le nombre de captures de chaque joueur. Par défaut, (0, 0).
+
+        Returns:
+            Board: Le plateau correspondant.
+
+        Raises:
+            ValueError: Si le plateau, le joueur au trait ou les captures sont invalides.
+        """
+        if not isinstance(board_state, str) or len(board_state) != BOARD_SIZE:
+            raise ValueError(f"Le plateau doit être une chaîne de {BOARD_SIZE} caractères.")
+
+        if to_move not in (None, PLAYER1, PLAYER2):
+            raise ValueError("Le joueur au trait doit être PLAYER1, PLAYER2 ou None.")
+
+        if len(captures) != 2 or any(not isinstance(count, int) or count < 0 for count in captures):
+            raise ValueError("Les captures doivent être deux entiers positifs.")
+
+        board = cls()
+        for player, player_char in enumerate(PLAYER_CHARS):
+            # Lecture rapide : le bit de poids fort correspond à la dernière case.
+            bits = board_state[::-1].translate({ord(player_char): "1", ord(PLAYER_CHARS[1 - player]): "0",
+                                                ord(EMPTY_CHAR): "0"})
+            if set(bits) - {"0", "1"}:
+                raise ValueError("Le plateau contient des caractères invalides.")
+            board.bitboards[player] = int(bits, 2)
+
+        board.captures = list(captures)
+        board.move_count = board.stone_count(PLAYER1) + board.stone_count(PLAYER2)
+
+        if to_move is None:
+            # Le joueur 2 commence : il est au trait quand les deux joueurs ont autant de pions.
+            to_move = FIRST_PLAYER if board.stone_count(PLAYER1) >= board.stone_count(PLAYER2) else PLAYER1
+        board.to_move = to_move
+
+        for player in (PLAYER1, PLAYER2):
+            if board.captures[player] >= CAPTURES_TO_WIN:
+                board.winner = player
+
+        board.hash = compute_hash(board.bitboards, board.captures, board.to_move)
+        return board
+
+    def to_board_state(self) -> str:
+        """
+        Convertit le plateau au format `board_state` du serveur.
+
+        Returns:
+            str: Le plateau sur 361 caractères.
+        """
+        player1_bits = format(self.bitboards[PLAYER1], f"0{BOARD_SIZE}b")[::-1]
+        player2_bits = format(self.bitboards[PLAYER2], f"0{BOARD_SIZE}b")[::-1]
+        return "".join(
+            PLAYER_CHARS[PLAYER1] if bit1 == "1" else PLAYER_CHARS[PLAYER2] if bit2 == "1" else EMPTY_CHAR
+            for bit1, bit2 in zip(player1_bits, player2_bits)
+        )
+
+    def copy(self) -> "Board":
+        """
+        Crée une copie indépendante du plateau (sans historique : les coups joués avant la copie ne peuvent pas y
+        être annulés).
+
+        Returns:
+            Board: La copie.
+        """
+        board = Board.__new__(Board)
+        board.bitboards = self.bitboards[:]
+        board.captures = self.captures[:]
+        board.to_move = self.to_move
+        board.winner = self.winner
+        board.move_count = self.move_count
+        board.hash = self.hash
+        board._history = []
+        return board
+
+    @property
+    def occupied(self) -> int:
+        """
+        Récupère le masque des cases occupées.
+
+        Returns:
+            int: Le bitboard des cases occupées par l'un ou l'autre joueur.
+        """
+        return self.bitboards[PLAYER1] | self.bitboards[PLAYER2]
+
+    @property
+    def is_game_over(self) -> bool:
+        """
+        Indique si la partie est terminée.
+
+        Returns:
+            bool: True si un joueur a gagné, False sinon.
+        """
+        return self.winner is not None
+
+    def stone_count(self, player: int) -> int:
+        """
+        Compte les pions d'un joueur.
+
+        Args:
+            player (int): Le joueur (PLAYER1 ou PLAYER2).
+
+        Returns:
+            int: Le nombre de pions du joueur sur le plateau.
+        """
+        return self.bitboards[player].bit_count()
+
+    def cell(self, index: int) -> str:
+        """
+        Récupère le contenu d'une case au format `board_state`.
+
+        Args:
+            index (int): L'indice de la case.
+
+        Returns:
+            str: 'x', 'o' ou '-'.
+        """
+        bit = 1 << index
+        if self.bitboards[PLAYER1] & bit:
+            return PLAYER_CHARS[PLAYER1]
+        if self.bitboards[PLAYER2] & bit:
+            return PLAYER_CHARS[PLAYER2]
+        return EMPTY_CHAR
+
+    def is_legal(self, index: int) -> bool:
+        """
+        Vérifie si le joueur au trait peut jouer sur une case (mêmes conditions que le serveur).
+
+        Args:
+            index (int): L'indice de la case.
+
+        Returns:
+            bool: True si la partie est en cours et la case existe et est vide, False sinon.
+        """
+        return (
+            self.winner is None
+            and isinstance(index, int) and 0 <= index < BOARD_SIZE
+            and not self.occupied >> index & 1
+        )
+
+    def legal_moves(self) -> list[int]:
+        """
+        Liste les cases jouables.
+
+        Returns:
+            list[int]: Les indices des cases vides, par ordre croissant (vide si la partie est terminée).
+        """
+        if self.winner is not None:
+            return []
+
+        empty = ~self.occupied & FULL_MASK
+        moves = []
+        while empty:
+            lowest = empty & -empty
+            moves.append(lowest.bit_length() - 1)
+            empty ^= lowest
+        return moves
+
+    def is_alignment(self, index: int, player: int) -> bool:
+        """
+        Vérifie si la case fait partie d'un alignement d'au moins 5 pions du joueur (`check_alignements`).
+
+        Args:
+            index (int): L'indice de la case (normalement le dernier coup).
+            player (int): Le joueur.
+
+        Returns:
+            bool: True si un alignement gagnant passe par la case, False sinon.
+        """
+        stones = self.bitboards[player]
+        for mask in WIN_MASKS[index]:
+            if stones & mask == mask:
+                return True
+        return False
+
+    def find_captures(self, index: int, player: int) -> tuple[int, ...]:
+        """
+        Cherche les paires adverses que le joueur capturerait en jouant sur la case (`check_captures`).
+
+        Args:
+            index (int): L'indice de la case.
+            player (int): Le joueur.
+
+        Returns:
+            tuple[int, ...]: Les indices des pions capturés (deux par capture).
+        """
+        own = self.bitboards[player]
+        opponent = self.bitboards[1 - player]
+        captured = ()
+        for pair_mask, closing_bit, first, second in CAPTURE_PATTERNS[index]:
+            if opponent & pair_mask == pair_mask and own & closing_bit:
+                captured += (first, second)
+        return captured
+
+    def play(self, index: int) -> MoveResult:
+        """
+        Joue un coup pour le joueur au trait, dans l'ordre du serveur : placement, alignement, puis captures.
+
+        Comme sur le serveur, un alignement gagnant termine la partie avant que les captures ne soient appliquées,
+        et un joueur qui atteint 5 captures gagne. Sinon, le trait passe à l'adversaire.
+
+        Args:
+            index (int): L'indice de la case jouée.
+
+        Returns:
+            MoveResult: Le résultat du coup.
+
+        Raises:
+            ValueError: Si la partie est terminée, si la case n'existe pas ou si elle est déjà occupée.
+        """
+        if self.winner is not None:
+            raise ValueError("La partie est terminée.")
+
+        if not isinstance(index, int) or not 0 <= index < BOARD_SIZE:
+            raise ValueError(f"La case {index} est hors du plateau.")
+
+        bit = 1 << index
+        if (self.bitboards[PLAYER1] | self.bitboards[PLAYER2]) & bit:
+            raise ValueError(f"La case {index} est déjà occupée.")
+
+        player = self.to_move
+        previous_hash = self.hash
+        self.bitboards[player] |= bit
+        self.move_count += 1
+        self.hash ^= PIECE_KEYS[player][index]
+
+        if self.is_alignment(index, player):
+            self.winner = player
+            result = MoveResult(index, player, (), True, True)
+            self._history.append((result, previous_hash))
+            return result
+
+        captured = self.find_captures(index, player)
+        if captured:
+            opponent = 1 - player
+            opponent_keys = PIECE_KEYS[opponent]
+            for captured_index in captured:
+                self.bitboards[opponent] &= ~(1 << captured_index)
+                self.hash ^= opponent_keys[captured_index]
+            self.hash ^= capture_key(player, self.captures[player])
+            self.captures[player] += len(captured) // 2
+            self.hash ^= capture_key(player, self.captures[player])
+
+            if self.captures[player] >= CAPTURES_TO_WIN:
+                self.winner = player
+                result = MoveResult(index, player, captured, False, True)
+                self._history.append((result, previous_hash))
+                return result
+
+        self.to_move = 1 - player
+        self.hash ^= SIDE_KEY
+        result = MoveResult(index, player, captured, False, False)
+        self._history.append((result, previous_hash))
+        return result
+
+    def undo(self) -> MoveResult:
+        """
+        Annule le dernier coup joué, en temps constant : le pion posé est retiré, les pions capturés sont remis et
+        les compteurs de captures, le trait, le vainqueur et l'empreinte retrouvent leur valeur d'avant le coup.
+
+        Returns:
+            MoveResult: Le coup annulé.
+
+        Raises:
+            IndexError: Si aucun coup n'a été joué depuis la création (ou la copie) du plateau.
+        """
+        if not self._history:
+            raise IndexError("Aucun coup à annuler.")
+
+        result, self.hash = self._history.pop()
+        player = result.player
+        self.bitboards[player] &= ~(1 << result.index)
+        if result.captured:
+            opponent = 1 - player
+            for captured_index in result.captured:
+                self.bitboards[opponent] |= 1 << captured_index
+            self.captures[player] -= len(result.captured) // 2
+        self.to_move = player
+        self.winner = None
+        self.move_count -= 1
+        return result
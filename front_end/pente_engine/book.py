@@ -0,0 +1,339 @@
+"""
+Livre d'ouvertures : fichier binaire d'entrées `(empreinte, coup, poids)` de taille fixe, triées par empreinte.
+
+Le fichier est construit hors ligne à partir de parties (`build_book`, ou `python -m pente_engine.book`) puis ouvert
+avec `mmap` : il n'y a aucune étape de chargement, et les processus d'une même machine qui ouvrent le même livre
+partagent ses pages en mémoire. Un répertoire placé avant les entrées donne, pour les premiers bits de l'empreinte,
+la plage d'entrées à parcourir : une recherche ne lit qu'une ou deux entrées en moyenne. Les positions et les coups
+sont enregistrés dans leur orientation canonique (voir `pente_engine.symmetry`) : une seule entrée couvre les
+8 orientations symétriques d'une ouverture.
+
+Format (petit-boutiste) :
+
+- en-tête : signature `PENTEBK1`, nombre d'entrées, nombre de bits du répertoire ;
+- répertoire : `2^bits + 1` indices d'entrée (début de la plage de chaque préfixe, puis le nombre d'entrées) ;
+- entrées : empreinte de Zobrist canonique (64 bits), coup canonique (16 bits), poids (16 bits).
+"""
+
+import argparse
+import bisect
+import mmap
+import os
+import random
+import struct
+from collections import Counter
+from collections.abc import Iterable, Sequence
+
+from pente_engine.board import Board
+from pente_engine.symmetry import canonical_form, canonical_symmetries, inverse_move, transform_move
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Signature du fichier
+BOOK_MAGIC: bytes = b"PENTEBK1"
+
+# Structures binaires
+HEADER_STRUCT: struct.Struct = struct.Struct("<8sII")  # Signature, nombre d'entrées, bits du répertoire
+DIRECTORY_STRUCT: struct.Struct = struct.Struct("<I")  # Indice de la première entrée d'un préfixe
+ENTRY_STRUCT: struct.Struct = struct.Struct("<QHH")  # Empreinte, coup, poids
+KEY_STRUCT: struct.Struct = struct.Struct("<Q")  # Empreinte seule (début d'une entrée)
+
+# Poids maximal d'un coup (nombre de parties, borné)
+MAX_WEIGHT: int = 0xFFFF
+
+# Nombre maximal de bits du répertoire (16 Mio de répertoire au plus)
+MAX_DIRECTORY_BITS: int = 22
+
+# Nombre de coups de chaque partie retenus par défaut
+DEFAULT_BOOK_MOVES: int = 16
+
+
+def _directory_bits(entries: int) -> int:
+    """
+    Choisit la taille du répertoire : environ une entrée par préfixe.
+
+    Args:
+        entries (int): Le nombre d'entrées du livre.
+
+    Returns:
+        int: Le nombre de bits du préfixe.
+    """
+    return min(MAX_DIRECTORY_BITS, max(0, (entries - 1).bit_length()))
+
+
+def write_book(weights: dict[tuple[int, int], int], path: str) -> int:
+    """
+    Écrit un livre d'ouvertures. Le fichier est remplacé d'un seul coup : les processus qui ont déjà ouvert
+    l'ancien livre continuent de le lire sans erreur.
+
+    Args:
+        weights (dict[tuple[int, int], int]): Le poids de chaque couple (empreinte, coup).
+        path (str): Le chemin du fichier.
+
+    Returns:
+        int: Le nombre d'entrées écrites.
+
+    Raises:
+        ValueError: Si une empreinte, un coup ou un poids est invalide.
+    """
+    entries = sorted(weights.items())
+    for (key, move), weight in entries:
+        if not 0 <= key < 1 << 64 or not 0 <= move <= 0xFFFF or weight <= 0:
+            raise ValueError(f"Entrée de livre invalide : {(key, move, weight)}.")
+
+    bits = _directory_bits(len(entries))
+    keys = [key for (key, _), _ in entries]
+    shift = 64 - bits
+
+    buffer = bytearray(HEADER_STRUCT.pack(BOOK_MAGIC, len(entries), bits))
+    for prefix in range((1 << bits) + 1):
+        buffer += DIRECTORY_STRUCT.pack(bisect.bisect_left(keys, prefix << shift))
+    for (key, move), weight in entries:
+        buffer += ENTRY_STRUCT.pack(key, move, min(weight, MAX_WEIGHT))
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as book_file:
+        book_file.write(buffer)
+    os.replace(temporary_path, path)
+    return len(entries)
+
+
+def build_book(games: Iterable[Sequence[int]], path: str, max_moves: int = DEFAULT_BOOK_MOVES,
+               min_games: int = 1) -> int:
+    """
+    Construit un livre d'ouvertures à partir de parties : le poids d'un coup est le nombre de parties qui l'ont
+    joué depuis la même position, à une symétrie près.
+
+    Args:
+        games (Iterable[Sequence[int]]): Les coups de chaque partie (indices de case), depuis un plateau vide.
+        path (str): Le chemin du fichier à écrire.
+        max_moves (int): Le nombre de coups retenus au début de chaque partie. Par défaut, 16.
+        min_games (int): Le nombre minimal de parties pour qu'un coup soit retenu. Par défaut, 1.
+
+    Returns:
+        int: Le nombre d'entrées écrites.
+
+    Raises:
+        ValueError: Si un paramètre est invalide ou si une partie contient un coup illégal.
+    """
+    if not isinstance(max_moves, int) or max_moves <= 0:
+        raise ValueError("Le nombre de coups retenus doit être un entier strictement positif.")
+
+    if not isinstance(min_games, int) or min_games <= 0:
+        raise ValueError("Le nombre minimal de parties doit être un entier strictement positif.")
+
+    counts: Counter[tuple[int, int]] = Counter()
+    for moves in games:
+        board = Board()
+        for index in moves[:max_moves]:
+            if board.is_game_over:
+                break
+            key, symmetry = canonical_form(board)
+            counts[key, transform_move(index, symmetry)] += 1
+            board.play(index)
+
+    return write_book({entry: count for entry, count in counts.items() if count >= min_games}, path)
+
+
+def read_numbered_games(path: str) -> list[tuple[int, list[int]]]:
+    """
+    Lit un fichier de parties : une partie par ligne, indices de case séparés par des espaces ou des virgules
+    (les lignes vides et celles qui commencent par `#` sont ignorées).
+
+    Args:
+        path (str): Le chemin du fichier.
+
+    Returns:
+        list[tuple[int, list[int]]]: Le numéro de ligne et les coups de chaque partie.
+
+    Raises:
+        ValueError: Si une ligne contient autre chose que des entiers.
+    """
+    games = []
+    with open(path, encoding="utf-8") as games_file:
+        for line_number, line in enumerate(games_file, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                games.append((line_number, [int(move) for move in line.replace(",", " ").split()]))
+            except ValueError:
+                raise ValueError(f"La ligne {line_number} de {path} doit contenir des indices de case.") from None
+    return games
+
+
+def read_games(path: str) -> list[list[int]]:
+    """
+    Lit un fichier de parties (voir `read_numbered_games`).
+
+    Args:
+        path (str): Le chemin du fichier.
+
+    Returns:
+        list[list[int]]: Les coups de chaque partie.
+
+    Raises:
+        ValueError: Si une ligne contient autre chose que des entiers.
+    """
+    return [moves for _, moves in read_numbered_games(path)]
+
+
+class OpeningBook:
+    """
+    Livre d'ouvertures en lecture seule, projeté en mémoire avec `mmap`.
+
+    L'ouverture ne lit que l'en-tête : les pages du fichier sont chargées à la demande par le système et partagées
+    entre les processus. Un livre transmis à un autre processus (pickle) y est rouvert à partir de son chemin.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Ouvre un livre d'ouvertures.
+
+        Args:
+            path (str): Le chemin du fichier.
+
+        Raises:
+            OSError: Si le fichier ne peut pas être ouvert.
+            ValueError: Si le fichier n'est pas un livre d'ouvertures valide.
+        """
+        self.path = path
+        with open(path, "rb") as book_file:
+            size = os.fstat(book_file.fileno()).st_size
+            if size < HEADER_STRUCT.size:
+                raise ValueError(f"Le fichier {path} n'est pas un livre d'ouvertures valide.")
+            self._map = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self._entries, self._bits = HEADER_STRUCT.unpack_from(self._map)
+        self._directory_offset = HEADER_STRUCT.size
+        self._entries_offset = self._directory_offset + DIRECTORY_STRUCT.size * ((1 << self._bits) + 1)
+        if magic != BOOK_MAGIC or size != self._entries_offset + ENTRY_STRUCT.size * self._entries:
+            self._map.close()
+            raise ValueError(f"Le fichier {path} n'est pas un livre d'ouvertures valide.")
+
+    def __len__(self) -> int:
+        """
+        Récupère le nombre d'entrées du livre.
+
+        Returns:
+            int: Le nombre de couples (position, coup).
+        """
+        return self._entries
+
+    def __reduce__(self) -> tuple:
+        """
+        Transmet le livre à un autre processus par son chemin (le fichier y est projeté à nouveau).
+
+        Returns:
+            tuple: La classe et le chemin du livre.
+        """
+        return OpeningBook, (self.path,)
+
+    def __enter__(self) -> "OpeningBook":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Ferme la projection du fichier.
+        """
+        self._map.close()
+
+    def lookup(self, key: int) -> list[tuple[int, int]]:
+        """
+        Cherche les coups du livre pour une empreinte canonique.
+
+        Args:
+            key (int): L'empreinte canonique de la position (voir `symmetry.canonical_form`).
+
+        Returns:
+            list[tuple[int, int]]: Les couples (coup canonique, poids), du plus joué au moins joué (vide si absent).
+        """
+        book_map, entries_offset, entry_size = self._map, self._entries_offset, ENTRY_STRUCT.size
+        prefix_offset = self._directory_offset + DIRECTORY_STRUCT.size * (key >> (64 - self._bits))
+        low = DIRECTORY_STRUCT.unpack_from(book_map, prefix_offset)[0]
+        high = DIRECTORY_STRUCT.unpack_from(book_map, prefix_offset + DIRECTORY_STRUCT.size)[0]
+
+        # Recherche dichotomique de la première entrée de l'empreinte dans la plage du préfixe
+        while low < high:
+            middle = (low + high) // 2
+            if KEY_STRUCT.unpack_from(book_map, entries_offset + entry_size * middle)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        moves = []
+        for entry in range(low, self._entries):
+            entry_key, move, weight = ENTRY_STRUCT.unpack_from(book_map, entries_offset + entry_size * entry)
+            if entry_key != key:
+                break
+            moves.append((move, weight))
+        moves.sort(key=lambda move_weight: move_weight[1], reverse=True)
+        return moves
+
+    def moves(self, board: Board) -> list[tuple[int, int]]:
+        """
+        Liste les coups du livre pour une position, ramenés dans son orientation (les coups illégaux, dus à une
+        collision d'empreintes, sont écartés). Sert aussi à proposer des indices au joueur.
+
+        Si la position est elle-même symétrique, chaque coup du livre est proposé dans toutes ses orientations
+        équivalentes, avec le même poids.
+
+        Args:
+            board (Board): Le plateau.
+
+        Returns:
+            list[tuple[int, int]]: Les couples (coup, poids), du plus joué au moins joué.
+        """
+        if board.is_game_over:
+            return []
+        key, symmetries = canonical_symmetries(board)
+        moves: dict[int, int] = {}
+        for canonical_move, weight in self.lookup(key):
+            for symmetry in symmetries:
+                move = inverse_move(canonical_move, symmetry)
+                if board.is_legal(move):
+                    moves.setdefault(move, weight)
+        return list(moves.items())
+
+    def choose(self, board: Board, generator: random.Random | None = None) -> int | None:
+        """
+        Tire un coup du livre au hasard, proportionnellement à son poids (les ouvertures varient d'une partie à
+        l'autre).
+
+        Args:
+            board (Board): Le plateau.
+            generator (random.Random | None): Le générateur aléatoire. Par défaut, celui du module `random`.
+
+        Returns:
+            int | None: Le coup choisi, ou None si la position n'est pas dans le livre.
+        """
+        moves = self.moves(board)
+        if not moves:
+            return None
+        generator = generator or random
+        return generator.choices([move for move, _ in moves], [weight for _, weight in moves])[0]
+
+
+def main() -> None:
+    """
+    Point d'entrée en ligne de commande de la construction d'un livre d'ouvertures.
+
+    Exemple (depuis le dossier `front_end`) : `python -m pente_engine.book parties.txt livre.bin --moves 12`
+    """
+    parser = argparse.ArgumentParser(description="Construit un livre d'ouvertures à partir de parties.")
+    parser.add_argument("games", type=str, help="Fichier de parties (une partie par ligne, indices de case).")
+    parser.add_argument("output", type=str, help="Fichier du livre à écrire.")
+    parser.add_argument("--moves", type=int, default=DEFAULT_BOOK_MOVES, help="Coups retenus par partie.")
+    parser.add_argument("--min-games", type=int, default=1, help="Nombre minimal de parties par coup.")
+    args = parser.parse_args()
+
+    entries = build_book(read_games(args.games), args.output, args.moves, args.min_games)
+    print(f"{entries} entrées écrites dans {args.output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+from array import array
+from functools import cache
+
+from pente_engine.board import Board, MoveResult
+from pente_engine.rules import (
+    BOARD_COLS, BOARD_ROWS, BOARD_SIZE, FULL_MASK, LINE_DIRECTIONS, NEIGHBOUR_MASKS, NOT_FIRST_COLUMN,
+    NOT_LAST_COLUMN, WIN_LENGTH, is_on_board, iterate_bits, to_coordinates, to_index
+)
+from pente_engine.transposition import NO_MOVE
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Case jouée sur un plateau vide
+CENTER_INDEX: int = to_index(BOARD_COLS // 2, BOARD_ROWS // 2)
+
+# Distance par défaut des candidats aux pions (distance de Tchebychev)
+DEFAULT_DISTANCE: int = 2
+
+
+@cache
+def neighbourhoods(distance: int) -> tuple[tuple[int, ...], ...]:
+    """
+    Précalcule, pour chaque case, les cases situées à au plus `distance` cases (la case elle-même est exclue).
+
+    Args:
+        distance (int): La distance de Tchebychev.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: Les cases voisines de chaque case.
+    """
+    result = []
+    for index in range(BOARD_SIZE):
+        x, y = to_coordinates(index)
+        result.append(tuple(
+            to_index(x + dx, y + dy)
+            for dy in range(-distance, distance + 1)
+            for dx in range(-distance, distance + 1)
+            if (dx or dy) and is_on_board(x + dx, y + dy)
+        ))
+    return tuple(result)
+
+
+def _build_line_shifts() -> tuple[tuple[int, int, int], ...]:
+    """
+    Précalcule les décalages des directions d'alignement : décaler un bitboard vers les bits de poids faible
+    (masque `ahead_mask`) ou fort (masque `behind_mask`) donne les cases dont la voisine d'un côté ou de l'autre
+    de la direction appartient au bitboard.
+
+    Returns:
+        tuple[tuple[int, int, int], ...]: Pour chaque direction : le décalage, `ahead_mask` et `behind_mask`.
+    """
+    shifts = []
+    for dx, dy in LINE_DIRECTIONS:
+        delta = dy * BOARD_COLS + dx
+        if delta < 0:
+            delta, dx = -delta, -dx
+
+        # Une case de la dernière colonne n'a pas de voisine à droite, une case de la première pas de voisine à gauche.
+        if dx == 1:
+            shifts.append((delta, NOT_LAST_COLUMN, NOT_FIRST_COLUMN))
+        elif dx == -1:
+            shifts.append((delta, NOT_FIRST_COLUMN, NOT_LAST_COLUMN))
+        else:
+            shifts.append((delta, FULL_MASK, FULL_MASK))
+    return tuple(shifts)
+
+
+# Décalages des directions d'alignement
+LINE_SHIFTS: tuple[tuple[int, int, int], ...] = _build_line_shifts()
+
+# Poids des critères de tri des coups (par ordre d'importance, l'heuristique de l'historique venant entre les
+# captures et les lignes)
+CAPTURE_WEIGHT: int = 1 << 25  # Par paire capturée
+BLOCKED_CAPTURE_WEIGHT: int = 1 << 23  # Par paire adverse capturable sur la case
+OWN_LINE_WEIGHT: int = 1 << 6  # Par longueur de ligne prolongée, à partir de 3 pions
+OPPONENT_LINE_WEIGHT: int = 1 << 5
+
+# Longueur de ligne minimale prise en compte dans le tri des coups (les lignes de 2 sont couvertes par les voisins)
+MIN_ORDERED_LINE: int = 3
+
+
+def line_extension_masks(stones: int) -> tuple[int, ...]:
+    """
+    Calcule, pour tout le plateau à la fois, les cases où un pion prolongerait une ligne du joueur : le k-ième
+    masque contient les cases où la plus longue ligne passant par la case atteindrait k + 2 pions.
+
+    Args:
+        stones (int): Le bitboard des pions du joueur.
+
+    Returns:
+        tuple[int, ...]: Les masques des lignes d'au moins 2, 3, 4 et 5 pions.
+    """
+    masks = [0] * (WIN_LENGTH - 1)
+    for delta, ahead_mask, behind_mask in LINE_SHIFTS:
+        # ahead[k] (behind[k]) : cases suivies (précédées) d'au moins k + 1 pions consécutifs du joueur.
+        ahead = [stones >> delta & ahead_mask]
+        behind = [stones << delta & behind_mask]
+        for _ in range(WIN_LENGTH - 2):
+            ahead.append(ahead[0] & (ahead[-1] >> delta & ahead_mask))
+            behind.append(behind[0] & (behind[-1] << delta & behind_mask))
+
+        for length in range(1, WIN_LENGTH):
+            mask = ahead[length - 1] | behind[length - 1]
+            for count in range(1, length):
+                mask |= ahead[count - 1] & behind[length - count - 1]
+            masks[length - 1] |= mask
+    return tuple(masks)
+
+
+def capture_masks(board: Board, player: int) -> tuple[int, ...]:
+    """
+    Calcule, pour tout le plateau à la fois, les cases vides où le joueur capturerait une paire (mêmes conditions
+    que `Board.find_captures`) : un masque par direction de capture.
+
+    Args:
+        board (Board): Le plateau.
+        player (int): Le joueur.
+
+    Returns:
+        tuple[int, ...]: Les masques des 8 directions (une case capture autant de paires que de masques qui la
+                         contiennent).
+    """
+    own = board.bitboards[player]
+    opponent = board.bitboards[1 - player]
+    empty = ~(own | opponent) & FULL_MASK
+    masks = []
+    for delta, ahead_mask, behind_mask in LINE_SHIFTS:
+        # Paire adverse sur les deux cases suivantes, pion du joueur sur la troisième.
+        first = opponent >> delta & ahead_mask
+        second = first & (opponent >> 2 * delta) & (ahead_mask >> delta)
+        closing = own >> 3 * delta & ahead_mask & (ahead_mask >> delta) & (ahead_mask >> 2 * delta)
+        masks.append(second & closing & empty)
+
+        first = opponent << delta & behind_mask
+        second = first & (opponent << 2 * delta) & (behind_mask << delta)
+        closing = own << 3 * delta & behind_mask & (behind_mask << delta) & (behind_mask << 2 * delta)
+        masks.append(second & closing & empty & FULL_MASK)
+    return tuple(masks)
+
+
+def move_bonuses(board: Board) -> list[int]:
+    """
+    Calcule le bonus de tri de chaque case pour le joueur au trait : paires capturées, captures adverses
+    empêchées et lignes prolongées (les siennes et celles de l'adversaire). Les masques calculés sur tout le
+    plateau sont creux : seuls leurs bits sont parcourus, au lieu d'examiner chaque coup.
+
+    Args:
+        board (Board): Le plateau.
+
+    Returns:
+        list[int]: Le bonus de chaque case.
+    """
+    player = board.to_move
+    bonuses = [0] * BOARD_SIZE
+    weighted_masks = (
+        (capture_masks(board, player), CAPTURE_WEIGHT),
+        (capture_masks(board, 1 - player), BLOCKED_CAPTURE_WEIGHT),
+        (line_extension_masks(board.bitboards[player])[MIN_ORDERED_LINE - 2:], OWN_LINE_WEIGHT),
+        (line_extension_masks(board.bitboards[1 - player])[MIN_ORDERED_LINE - 2:], OPPONENT_LINE_WEIGHT),
+    )
+    for masks, weight in weighted_masks:
+        for mask in masks:
+            for index in iterate_bits(mask):
+                bonuses[index] += weight
+    return bonuses
+
+
+def order_moves(board: Board, moves: list[int], preferred_move: int = NO_MOVE,
+                history: list[int] | None = None) -> list[int]:
+    """
+    Trie les coups du plus prometteur au moins prometteur, selon des critères peu coûteux : coup préféré, captures
+    réalisées, captures adverses empêchées, heuristique de l'historique, lignes prolongées (voir `move_bonuses`),
+    puis pions voisins.
+
+    Args:
+        board (Board): Le plateau.
+        moves (list[int]): Les coups à trier.
+        preferred_move (int): Le coup à examiner en premier (ex : meilleur coup de la table). Par défaut, aucun.
+        history (list[int] | None): Le score d'historique de chaque case. Par défaut, aucun.
+
+    Returns:
+        list[int]: Les coups triés.
+    """
+    own = board.bitboards[board.to_move]
+    opponent = board.bitboards[1 - board.to_move]
+    bonuses = move_bonuses(board)
+    if history is not None:
+        bonuses = [bonus + score for bonus, score in zip(bonuses, history)]
+
+    def priority(move: int) -> int:
+        if move == preferred_move:
+            return 1 << 40
+        neighbours = NEIGHBOUR_MASKS[move]
+        return bonuses[move] + ((own & neighbours).bit_count() << 1) + (opponent & neighbours).bit_count()
+
+    return sorted(moves, key=priority, reverse=True)
+
+
+class CandidateSet:
+    """
+    Ensemble des coups candidats (cases vides à au plus `distance` cases d'un pion), tenu à jour coup par coup.
+
+    Pour chaque case, le nombre de pions dans son voisinage est conservé : poser ou retirer un pion ne modifie que
+    ses (2 * distance + 1)² - 1 voisines, quelle que soit la taille du plateau. Les captures et l'annulation sont
+    traitées de la même façon.
+    """
+
+    __slots__ = ("distance", "neighbours", "coverage", "occupied", "cells", "_history")
+
+    def __init__(self, board: Board | None = None, distance: int = DEFAULT_DISTANCE) -> None:
+        """
+        Initialise l'ensemble sur un plateau (vide par défaut).
+
+        Args:
+            board (Board | None): Le plateau de départ. Par défaut, un plateau vide.
+            distance (int): La distance maximale des candidats aux pions. Par défaut, 2.
+
+        Raises:
+            ValueError: Si la distance n'est pas un entier strictement positif.
+        """
+        if not isinstance(distance, int) or distance <= 0:
+            raise ValueError("La distance doit être un entier strictement positif.")
+
+        self.distance = distance
+        self.neighbours = neighbourhoods(distance)
+
+        # Nombre de pions voisins de chaque case, cases occupées et cases candidates
+        self.coverage = array("H", bytes(2 * BOARD_SIZE))
+        self.occupied = bytearray(BOARD_SIZE)
+        self.cells: set[int] = set()
+        self._history: list[MoveResult] = []
+
+        if board is not None:
+            for index in iterate_bits(board.occupied):
+                self.__add_stone(index)
+
+    def __len__(self) -> int:
+        """
+        Récupère le nombre de coups candidats.
+
+        Returns:
+            int: Le nombre de cases candidates (1 sur un plateau vide : le centre).
+        """
+        return len(self.cells) if self.cells or any(self.occupied) else 1
+
+    def __contains__(self, index: int) -> bool:
+        """
+        Vérifie si une case est candidate.
+
+        Args:
+            index (int): L'indice de la case.
+
+        Returns:
+            bool: True si la case est candidate, False sinon.
+        """
+        return index in self.cells
+
+    def __add_stone(self, index: int) -> None:
+        """
+        Pose un pion : la case n'est plus candidate et ses voisines vides le deviennent.
+
+        Args:
+            index (int): L'indice de la case.
+        """
+        coverage, occupied, cells = self.coverage, self.occupied, self.cells
+        occupied[index] = 1
+        cells.discard(index)
+        for neighbour in self.neighbours[index]:
+            coverage[neighbour] += 1
+            if coverage[neighbour] == 1 and not occupied[neighbour]:
+                cells.add(neighbour)
+
+    def __remove_stone(self, index: int) -> None:
+        """
+        Retire un pion (capture ou annulation) : les voisines qui n'ont plus de pion proche ne sont plus candidates.
+
+        Args:
+            index (int): L'indice de la case.
+        """
+        coverage, occupied, cells = self.coverage, self.occupied, self.cells
+        occupied[index] = 0
+        for neighbour in self.neighbours[index]:
+            coverage[neighbour] -= 1
+            if not coverage[neighbour]:
+                cells.discard(neighbour)
+        if coverage[index]:
+            cells.add(index)
+
+    def apply(self, result: MoveResult) -> None:
+        """
+        Applique un coup joué sur le plateau (pion posé et pions capturés).
+
+        Args:
+            result (MoveResult): Le résultat renvoyé par `Board.play`.
+        """
+        self.__add_stone(result.index)
+        for captured_index in result.captured:
+            self.__remove_stone(captured_index)
+        self._history.append(result)
+
+    def undo(self) -> MoveResult:
+        """
+        Annule le dernier coup appliqué.
+
+        Returns:
+            MoveResult: Le coup annulé.
+
+        Raises:
+            IndexError: Si aucun coup n'a été appliqué.
+        """
+        if not self._history:
+            raise IndexError("Aucun coup à annuler.")
+
+        result = self._history.pop()
+        for captured_index in result.captured:
+            self.__add_stone(captured_index)
+        self.__remove_stone(result.index)
+        return result
+
+    def moves(self) -> list[int]:
+        """
+        Liste les coups candidats.
+
+        Returns:
+            list[int]: Les indices des cases candidates, par ordre croissant (le centre sur un plateau vide).
+        """
+        if not self.cells:
+            return [] if any(self.occupied) else [CENTER_INDEX]
+        return sorted(self.cells)
+
+    def ordered_moves(self, board: Board, preferred_move: int = NO_MOVE,
+                      history: list[int] | None = None) -> list[int]:
+        """
+        Liste les coups candidats du plus prometteur au moins prometteur (voir `order_moves`).
+
+        Args:
+            board (Board): Le plateau synchronisé avec l'ensemble.
+            preferred_move (int): Le coup à examiner en premier. Par défaut, aucun.
+            history (list[int] | None): Le score d'historique de chaque case. Par défaut, aucun.
+
+        Returns:
+            list[int]: Les indices des cases candidates triés.
+        """
+        return order_moves(board, self.moves(), preferred_move, history)
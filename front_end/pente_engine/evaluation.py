@@ -0,0 +1,99 @@
+"""
+Évaluation statique d'une position de Pente.
+
+Chaque fenêtre de 5 cases alignées ne contenant les pions que d'un seul joueur lui rapporte un score croissant avec
+le nombre de pions (deux, trois ou quatre pions sur une ligne encore ouverte). S'y ajoutent les captures déjà
+réalisées et les menaces de capture (paire adverse bordée d'un côté par un pion du joueur et de l'autre par une case
+vide).
+"""
+
+from pente_engine.board import Board
+from pente_engine.rules import CAPTURE_PATTERNS, LINE_WINDOWS, PLAYER1, PLAYER2, iterate_bits
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Score d'une fenêtre selon le nombre de pions d'un seul joueur (0 à 4 ; 5 pions est une victoire)
+WINDOW_SCORES: tuple[int, ...] = (0, 1, 8, 64, 1024)
+
+# Score selon le nombre de captures réalisées (croît fortement à l'approche des 5 captures)
+CAPTURE_SCORES: tuple[int, ...] = (0, 64, 160, 400, 1200, 4000)
+
+# Score d'une menace de capture
+CAPTURE_THREAT_SCORE: int = 48
+
+
+def capture_score(count: int) -> int:
+    """
+    Récupère le score d'un nombre de captures.
+
+    Args:
+        count (int): Le nombre de captures du joueur.
+
+    Returns:
+        int: Le score correspondant.
+    """
+    return CAPTURE_SCORES[min(count, len(CAPTURE_SCORES) - 1)]
+
+
+def count_capture_threats(board: Board, player: int) -> int:
+    """
+    Compte les menaces de capture du joueur : paires adverses qu'il capturerait en jouant sur une case vide.
+
+    Args:
+        board (Board): Le plateau.
+        player (int): Le joueur.
+
+    Returns:
+        int: Le nombre de menaces de capture.
+    """
+    own = board.bitboards[player]
+    opponent = board.bitboards[1 - player]
+    empty = ~(own | opponent)
+
+    # Depuis chaque pion du joueur : paire adverse puis case vide (le coup sur la case vide capturerait la paire).
+    threats = 0
+    for index in iterate_bits(own):
+        for pair_mask, closing_bit, _, _ in CAPTURE_PATTERNS[index]:
+            if opponent & pair_mask == pair_mask and empty & closing_bit:
+                threats += 1
+    return threats
+
+
+def evaluate_player(board: Board, player: int) -> int:
+    """
+    Évalue la position du point de vue d'un seul joueur (sans tenir compte de l'adversaire).
+
+    Args:
+        board (Board): Le plateau.
+        player (int): Le joueur.
+
+    Returns:
+        int: Le score du joueur.
+    """
+    own = board.bitboards[player]
+    opponent = board.bitboards[1 - player]
+
+    score = 0
+    for mask in LINE_WINDOWS:
+        stones = own & mask
+        if stones and not opponent & mask:
+            score += WINDOW_SCORES[stones.bit_count()]
+
+    score += capture_score(board.captures[player])
+    score += CAPTURE_THREAT_SCORE * count_capture_threats(board, player)
+    return score
+
+
+def evaluate(board: Board) -> int:
+    """
+    Évalue la position en relisant tout le plateau, du point de vue du joueur au trait.
+
+    Args:
+        board (Board): Le plateau.
+
+    Returns:
+        int: Le score (positif si le joueur au trait est avantagé).
+    """
+    score = evaluate_player(board, PLAYER1) - evaluate_player(board, PLAYER2)
+    return score if board.to_move == PLAYER1 else -score
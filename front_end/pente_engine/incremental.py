@@ -0,0 +1,246 @@
+from array import array
+
+from pente_engine.board import Board, MoveResult
+from pente_engine.evaluation import CAPTURE_THREAT_SCORE, WINDOW_SCORES, capture_score
+from pente_engine.rules import (
+    BOARD_SIZE, CAPTURE_SEGMENTS, LINE_WINDOWS, PLAYER1, PLAYER2, SEGMENTS_BY_CELL, WIN_LENGTH, WINDOWS_BY_CELL,
+    iterate_bits
+)
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Contenu d'une case
+EMPTY_CELL: int = 0
+PLAYER_CELLS: tuple[int, int] = (1, 2)  # Indexé par joueur (PLAYER1, PLAYER2)
+
+# Nombre d'états d'une fenêtre pour un joueur (0 à 5 pions)
+WINDOW_STATES: int = WIN_LENGTH + 1
+
+
+def _build_window_scores() -> tuple[int, ...]:
+    """
+    Précalcule la contribution d'une fenêtre selon son état `pions du joueur 1 * 6 + pions du joueur 2`.
+
+    Returns:
+        tuple[int, ...]: Le score (joueur 1 moins joueur 2) de chaque état.
+    """
+    scores = []
+    for player1_count in range(WINDOW_STATES):
+        for player2_count in range(WINDOW_STATES):
+            if player1_count and not player2_count and player1_count < WIN_LENGTH:
+                scores.append(WINDOW_SCORES[player1_count])
+            elif player2_count and not player1_count and player2_count < WIN_LENGTH:
+                scores.append(-WINDOW_SCORES[player2_count])
+            else:
+                scores.append(0)
+    return tuple(scores)
+
+
+def _build_segment_threats() -> tuple[int, ...]:
+    """
+    Précalcule les menaces de capture d'un segment de 4 cases selon son état `a * 27 + b * 9 + c * 3 + d`.
+
+    Une menace est une paire adverse (b, c) bordée d'un côté par un pion du joueur et de l'autre par une case vide.
+
+    Returns:
+        tuple[int, ...]: Les menaces du joueur 1 moins celles du joueur 2, pour chacun des 81 états.
+    """
+    threats = []
+    for code in range(81):
+        a, b, c, d = code // 27, code // 9 % 3, code // 3 % 3, code % 3
+        threat = 0
+        for player, player_cell in enumerate(PLAYER_CELLS):
+            opponent_cell = PLAYER_CELLS[1 - player]
+            sign = 1 if player == PLAYER1 else -1
+            if b == c == opponent_cell:
+                if a == player_cell and d == EMPTY_CELL:
+                    threat += sign
+                if d == player_cell and a == EMPTY_CELL:
+                    threat += sign
+        threats.append(threat)
+    return tuple(threats)
+
+
+def _build_segment_weights() -> tuple[tuple[tuple[int, int], ...], ...]:
+    """
+    Précalcule, pour chaque case, les segments qui la contiennent et le poids de la case dans leur état
+    (27, 9, 3 ou 1 selon sa position dans le segment).
+
+    Returns:
+        tuple[tuple[tuple[int, int], ...], ...]: Les couples (segment, poids) de chaque case.
+    """
+    return tuple(
+        tuple((segment, 3 ** (3 - CAPTURE_SEGMENTS[segment].index(index))) for segment in SEGMENTS_BY_CELL[index])
+        for index in range(BOARD_SIZE)
+    )
+
+
+# Tables précalculées
+WINDOW_STATE_SCORES: tuple[int, ...] = _build_window_scores()
+SEGMENT_THREATS: tuple[int, ...] = _build_segment_threats()
+SEGMENT_WEIGHTS_BY_CELL: tuple[tuple[tuple[int, int], ...], ...] = _build_segment_weights()
+
+# Seuil de pions d'un seul joueur à partir duquel une fenêtre est une menace (voir `threat_windows`)
+THREAT_WINDOW_STONES: int = 2
+
+# États de fenêtre suivis dans `threat_windows` : au moins 2 pions d'un seul joueur, sans alignement complet
+THREAT_WINDOW_STATES: tuple[bool, ...] = tuple(
+    (player1_count == 0 or player2_count == 0)
+    and THREAT_WINDOW_STONES <= max(player1_count, player2_count) < WIN_LENGTH
+    for player1_count in range(WINDOW_STATES)
+    for player2_count in range(WINDOW_STATES)
+)
+
+# Variation de l'état d'une fenêtre lorsqu'un pion du joueur y est ajouté
+WINDOW_STATE_STEPS: tuple[int, int] = (WINDOW_STATES, 1)  # Indexé par joueur (PLAYER1, PLAYER2)
+
+
+class IncrementalEvaluator:
+    """
+    Évaluateur incrémental : tient à jour l'état de chaque fenêtre de 5 cases (pions du joueur 1 * 6 + pions du
+    joueur 2) et de chaque segment de 4 cases (contenu des cases en base 3), ainsi que les sommes qui en découlent.
+
+    Un coup ne modifie que les fenêtres et segments passant par la case jouée et par les pions capturés (au plus
+    20 fenêtres et 16 segments par case), au lieu de relire tout le plateau. Donne exactement la même valeur que
+    `evaluation.evaluate`, qui sert de référence.
+    """
+
+    __slots__ = ("cells", "window_states", "segment_states", "window_score", "threat_balance", "threat_windows",
+                 "_history")
+
+    def __init__(self, board: Board | None = None) -> None:
+        """
+        Initialise l'évaluateur sur un plateau (vide par défaut).
+
+        Args:
+            board (Board | None): Le plateau de départ. Par défaut, un plateau vide.
+        """
+        self.cells = array("b", bytes(BOARD_SIZE))
+        self.window_states = array("b", bytes(len(LINE_WINDOWS)))
+        self.segment_states = array("b", bytes(len(CAPTURE_SEGMENTS)))
+
+        self.window_score = 0
+        self.threat_balance = 0
+
+        # Fenêtres contenant au moins 2 pions d'un seul joueur, indexées par état (pour la recherche de menaces)
+        self.threat_windows: tuple[set[int], ...] = tuple(set() for _ in THREAT_WINDOW_STATES)
+        self._history: list[MoveResult] = []
+
+        if board is not None:
+            for player in (PLAYER1, PLAYER2):
+                for index in iterate_bits(board.bitboards[player]):
+                    self.__set_cell(index, PLAYER_CELLS[player])
+
+    def windows(self, player: int, stones: int) -> list[int]:
+        """
+        Liste les fenêtres contenant exactement `stones` pions du joueur et aucun pion adverse.
+
+        Args:
+            player (int): Le joueur.
+            stones (int): Le nombre de pions (2 à 4).
+
+        Returns:
+            list[int]: Les indices des fenêtres (dans `LINE_WINDOWS`).
+
+        Raises:
+            ValueError: Si le nombre de pions n'est pas suivi.
+        """
+        if not THREAT_WINDOW_STONES <= stones < WIN_LENGTH:
+            raise ValueError(f"Le nombre de pions doit être compris entre {THREAT_WINDOW_STONES} et {WIN_LENGTH - 1}.")
+
+        return list(self.threat_windows[stones * WINDOW_STATES if player == PLAYER1 else stones])
+
+    def __set_cell(self, index: int, value: int) -> None:
+        """
+        Modifie le contenu d'une case et met à jour les fenêtres et segments qui la contiennent.
+
+        Args:
+            index (int): L'indice de la case.
+            value (int): Le nouveau contenu (EMPTY_CELL ou l'une des PLAYER_CELLS).
+        """
+        cells = self.cells
+        old_value = cells[index]
+        if old_value == value:
+            return
+        cells[index] = value
+
+        # Segments : seul le chiffre de la case modifiée change dans leur état.
+        segment_states = self.segment_states
+        difference = value - old_value
+        threat_delta = 0
+        for segment, weight in SEGMENT_WEIGHTS_BY_CELL[index]:
+            old_state = segment_states[segment]
+            new_state = old_state + difference * weight
+            segment_states[segment] = new_state
+            threat_delta += SEGMENT_THREATS[new_state] - SEGMENT_THREATS[old_state]
+        self.threat_balance += threat_delta
+
+        # Fenêtres : un pion de plus ou de moins pour le joueur concerné.
+        if old_value == EMPTY_CELL:
+            step = WINDOW_STATE_STEPS[value - 1]
+        else:
+            step = -WINDOW_STATE_STEPS[old_value - 1]
+
+        window_states = self.window_states
+        threat_windows = self.threat_windows
+        score_delta = 0
+        for window in WINDOWS_BY_CELL[index]:
+            old_state = window_states[window]
+            new_state = old_state + step
+            window_states[window] = new_state
+            score_delta += WINDOW_STATE_SCORES[new_state] - WINDOW_STATE_SCORES[old_state]
+            if THREAT_WINDOW_STATES[old_state]:
+                threat_windows[old_state].discard(window)
+            if THREAT_WINDOW_STATES[new_state]:
+                threat_windows[new_state].add(window)
+        self.window_score += score_delta
+
+    def apply(self, result: MoveResult) -> None:
+        """
+        Applique un coup joué sur le plateau (pion posé et pions capturés).
+
+        Args:
+            result (MoveResult): Le résultat renvoyé par `Board.play`.
+        """
+        self.__set_cell(result.index, PLAYER_CELLS[result.player])
+        for captured_index in result.captured:
+            self.__set_cell(captured_index, EMPTY_CELL)
+        self._history.append(result)
+
+    def undo(self) -> MoveResult:
+        """
+        Annule le dernier coup appliqué.
+
+        Returns:
+            MoveResult: Le coup annulé.
+
+        Raises:
+            IndexError: Si aucun coup n'a été appliqué.
+        """
+        if not self._history:
+            raise IndexError("Aucun coup à annuler.")
+
+        result = self._history.pop()
+        opponent_cell = PLAYER_CELLS[1 - result.player]
+        for captured_index in result.captured:
+            self.__set_cell(captured_index, opponent_cell)
+        self.__set_cell(result.index, EMPTY_CELL)
+        return result
+
+    def evaluate(self, board: Board) -> int:
+        """
+        Évalue la position, du point de vue du joueur au trait (même valeur que `evaluation.evaluate`).
+
+        Args:
+            board (Board): Le plateau synchronisé avec l'évaluateur (pour les captures et le trait).
+
+        Returns:
+            int: Le score (positif si le joueur au trait est avantagé).
+        """
+        score = (
+            self.window_score
+            + CAPTURE_THREAT_SCORE * self.threat_balance
+            + capture_score(board.captures[PLAYER1]) - capture_score(board.captures[PLAYER2])
+        )
+        return score if board.to_move == PLAYER1 else -score
@@ -0,0 +1,420 @@
+import math
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, NamedTuple
+
+from pente_engine.board import Board
+from pente_engine.rules import BOARD_COLS, BOARD_ROWS, dilate, iterate_bits, to_index
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Nombre maximal de coups d'une simulation (au-delà, la partie est considérée nulle)
+PLAYOUT_MAX_MOVES: int = 80
+
+# Constante d'exploration UCT par défaut
+DEFAULT_EXPLORATION: float = 1.4
+
+# Aucun parent / aucun coup
+NO_NODE: int = -1
+
+
+class NodeStore:
+    """
+    Arbre de recherche stocké dans des tableaux typés (un indice par nœud) au lieu d'un objet Python par nœud.
+
+    Les enfants d'un nœud sont créés en une fois lors de son expansion et occupent des indices consécutifs
+    (`first_child` à `first_child + child_count - 1`). Les positions ne sont pas stockées : elles sont rejouées
+    depuis la racine en suivant les coups.
+    """
+
+    __slots__ = ("parents", "moves", "players", "visits", "wins", "first_child", "child_count")
+
+    def __init__(self) -> None:
+        """
+        Crée un arbre réduit à sa racine.
+        """
+        self.parents = array("i", [NO_NODE])
+        self.moves = array("h", [NO_NODE])
+        self.players = array("b", [NO_NODE])  # Joueur ayant joué le coup menant au nœud
+        self.visits = array("I", [0])
+        self.wins = array("d", [0.0])  # Victoires du point de vue de `players`
+        self.first_child = array("i", [NO_NODE])
+        self.child_count = array("H", [0])
+
+    def __len__(self) -> int:
+        """
+        Récupère le nombre de nœuds.
+
+        Returns:
+            int: Le nombre de nœuds de l'arbre.
+        """
+        return len(self.parents)
+
+    def expand(self, node: int, moves: list[int], player: int) -> None:
+        """
+        Crée les enfants d'un nœud, un par coup candidat.
+
+        Args:
+            node (int): Le nœud à développer.
+            moves (list[int]): Les coups candidats.
+            player (int): Le joueur au trait dans la position du nœud.
+        """
+        count = len(moves)
+        self.first_child[node] = len(self.parents)
+        self.child_count[node] = count
+        self.parents.extend([node] * count)
+        self.moves.extend(moves)
+        self.players.extend([player] * count)
+        self.visits.extend([0] * count)
+        self.wins.extend([0.0] * count)
+        self.first_child.extend([NO_NODE] * count)
+        self.child_count.extend([0] * count)
+
+    def select_child(self, node: int, exploration: float) -> int:
+        """
+        Choisit l'enfant maximisant la formule UCT (les enfants jamais visités sont choisis en premier).
+
+        Args:
+            node (int): Le nœud parent.
+            exploration (float): La constante d'exploration.
+
+        Returns:
+            int: L'indice de l'enfant choisi.
+        """
+        first = self.first_child[node]
+        visits, wins = self.visits, self.wins
+        log_parent = math.log(max(1, visits[node]))
+
+        best_child, best_score = first, -1.0
+        for child in range(first, first + self.child_count[node]):
+            child_visits = visits[child]
+            if not child_visits:
+                return child
+            score = wins[child] / child_visits + exploration * math.sqrt(log_parent / child_visits)
+            if score > best_score:
+                best_child, best_score = child, score
+        return best_child
+
+    def root_statistics(self) -> dict[int, tuple[int, float]]:
+        """
+        Récupère les statistiques des coups de la racine.
+
+        Returns:
+            dict[int, tuple[int, float]]: Les visites et victoires de chaque coup de la racine.
+        """
+        first = self.first_child[0]
+        if first == NO_NODE:
+            return {}
+        return {
+            self.moves[child]: (self.visits[child], self.wins[child])
+            for child in range(first, first + self.child_count[0])
+        }
+
+
+def candidate_moves(board: Board) -> list[int]:
+    """
+    Liste les coups candidats d'une simulation : cases vides voisines des pions (le centre sur un plateau vide).
+
+    Args:
+        board (Board): Le plateau.
+
+    Returns:
+        list[int]: Les indices des cases candidates.
+    """
+    occupied = board.occupied
+    if not occupied:
+        return [to_index(BOARD_COLS // 2, BOARD_ROWS // 2)]
+    return list(iterate_bits(dilate(occupied) & ~occupied))
+
+
+def winning_moves(board: Board, moves: list[int]) -> list[int]:
+    """
+    Filtre les coups qui gagnent immédiatement (alignement de 5 ou cinquième capture).
+
+    Args:
+        board (Board): Le plateau (chaque coup est joué puis défait).
+        moves (list[int]): Les coups candidats.
+
+    Returns:
+        list[int]: Les coups gagnants, dans l'ordre des candidats.
+    """
+    wins = []
+    for move in moves:
+        if board.play(move).is_win:
+            wins.append(move)
+        board.undo()
+    return wins
+
+
+def random_policy(board: Board, generator: random.Random) -> int:
+    """
+    Politique de simulation aléatoire : un coup voisin des pions, au hasard.
+
+    Args:
+        board (Board): Le plateau.
+        generator (random.Random): Le générateur aléatoire.
+
+    Returns:
+        int: Le coup choisi.
+    """
+    return generator.choice(candidate_moves(board))
+
+
+def capture_policy(board: Board, generator: random.Random) -> int:
+    """
+    Politique de simulation guidée par les captures : capture si possible, sinon empêche une capture adverse,
+    sinon joue au hasard près des pions.
+
+    Args:
+        board (Board): Le plateau.
+        generator (random.Random): Le générateur aléatoire.
+
+    Returns:
+        int: Le coup choisi.
+    """
+    moves = candidate_moves(board)
+    player = board.to_move
+    defence = None
+    for move in moves:
+        if board.find_captures(move, player):
+            return move
+        if defence is None and board.find_captures(move, 1 - player):
+            defence = move
+    return defence if defence is not None else generator.choice(moves)
+
+
+# Politiques de simulation disponibles
+PLAYOUT_POLICIES: dict[str, Callable[[Board, random.Random], int]] = {
+    "random": random_policy,
+    "captures": capture_policy,
+}
+
+
+def run_playouts(store: NodeStore, root: Board, deadline: float, policy: Callable[[Board, random.Random], int],
+                 generator: random.Random, exploration: float = DEFAULT_EXPLORATION) -> int:
+    """
+    Effectue des itérations MCTS (sélection, expansion, simulation, rétropropagation) jusqu'à l'échéance.
+
+    Args:
+        store (NodeStore): L'arbre de recherche (enrichi en place).
+        root (Board): La position de la racine.
+        deadline (float): L'échéance (valeur de `time.perf_counter`).
+        policy (Callable): La politique de simulation.
+        generator (random.Random): Le générateur aléatoire.
+        exploration (float): La constante d'exploration UCT.
+
+    Returns:
+        int: Le nombre de simulations effectuées.
+    """
+    playouts = 0
+    while time.perf_counter() < deadline:
+        board = root.copy()
+        node = 0
+        path = [0]
+
+        # Sélection
+        while store.child_count[node] and not board.is_game_over:
+            node = store.select_child(node, exploration)
+            board.play(store.moves[node])
+            path.append(node)
+
+        # Expansion (un nœud déjà visité, ou la racine)
+        if not board.is_game_over and (store.visits[node] or node == 0):
+            # Un coup gagnant décide du nœud : seuls les coups gagnants deviennent ses enfants.
+            moves = candidate_moves(board)
+            store.expand(node, winning_moves(board, moves) or moves, board.to_move)
+            node = store.first_child[node] + generator.randrange(store.child_count[node])
+            board.play(store.moves[node])
+            path.append(node)
+
+        # Simulation
+        moves = 0
+        while not board.is_game_over and moves < PLAYOUT_MAX_MOVES:
+            board.play(policy(board, generator))
+            moves += 1
+        winner = board.winner
+
+        # Rétropropagation (partie nulle : une demi-victoire pour chacun)
+        for visited in path:
+            store.visits[visited] += 1
+            if winner is None:
+                store.wins[visited] += 0.5
+            elif winner == store.players[visited]:
+                store.wins[visited] += 1.0
+
+        playouts += 1
+    return playouts
+
+
+# Arbres propres à chaque processus de calcul, indexés par l'empreinte de la position de la racine
+_worker_trees: dict[int, NodeStore] = {}
+
+
+def _run_batch(root: Board, batch_seconds: float, policy_name: str, seed: int,
+               exploration: float) -> tuple[int, int, dict[int, tuple[int, float]]]:
+    """
+    Poursuit la recherche MCTS du processus de calcul pendant `batch_seconds` (parallélisation à la racine).
+
+    Args:
+        root (Board): La position de la racine.
+        batch_seconds (float): La durée du lot.
+        policy_name (str): Le nom de la politique de simulation.
+        seed (int): La graine du générateur aléatoire.
+        exploration (float): La constante d'exploration UCT.
+
+    Returns:
+        tuple: L'identifiant du processus, le nombre de simulations du lot et les statistiques cumulées de la racine.
+    """
+    # Un seul arbre par processus : celui d'une ancienne position est abandonné.
+    store = _worker_trees.get(root.hash)
+    if store is None:
+        _worker_trees.clear()
+        store = _worker_trees[root.hash] = NodeStore()
+
+    playouts = run_playouts(
+        store, root, time.perf_counter() + batch_seconds, PLAYOUT_POLICIES[policy_name], random.Random(seed),
+        exploration
+    )
+    return os.getpid(), playouts, store.root_statistics()
+
+
+class MCTSResult(NamedTuple):
+    """Résultat d'une recherche MCTS."""
+
+    # Coup le plus visité
+    best_move: int
+
+    # Visites du meilleur coup (tous processus confondus)
+    visits: int
+
+    # Taux de victoire estimé du meilleur coup
+    win_rate: float
+
+    # Nombre total de simulations
+    playouts: int
+
+    # Durée de la recherche (en secondes)
+    seconds: float
+
+    # Débit (simulations par seconde)
+    playouts_per_second: float
+
+    # Nombre de processus de calcul
+    workers: int
+
+
+class ParallelMCTS:
+    """
+    Recherche Monte-Carlo (UCT) parallélisée à la racine : chaque processus d'un `ProcessPoolExecutor` fait
+    grandir son propre arbre par lots, et les statistiques des coups de la racine sont fusionnées après chaque lot.
+    """
+
+    # Durée d'un lot (en secondes) : compromis entre coût de communication et réactivité
+    DEFAULT_BATCH_SECONDS = 0.1
+
+    def __init__(self, workers: int | None = None, policy: str = "captures",
+                 exploration: float = DEFAULT_EXPLORATION, batch_seconds: float = DEFAULT_BATCH_SECONDS) -> None:
+        """
+        Initialise la recherche (les processus de calcul sont démarrés à la première recherche).
+
+        Args:
+            workers (int | None): Le nombre de processus. Par défaut, le nombre de cœurs.
+            policy (str): La politique de simulation (clé de `PLAYOUT_POLICIES`). Par défaut, "captures".
+            exploration (float): La constante d'exploration UCT. Par défaut, 1.4.
+            batch_seconds (float): La durée d'un lot. Par défaut, 0.1 seconde.
+
+        Raises:
+            ValueError: Si un paramètre est invalide.
+        """
+        workers = workers or os.cpu_count() or 1
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Le nombre de processus doit être un entier strictement positif.")
+
+        if policy not in PLAYOUT_POLICIES:
+            raise ValueError(f"La politique de simulation '{policy}' est inconnue.")
+
+        if exploration < 0 or batch_seconds <= 0:
+            raise ValueError("La constante d'exploration et la durée d'un lot doivent être positives.")
+
+        self.workers = workers
+        self.policy = policy
+        self.exploration = exploration
+        self.batch_seconds = batch_seconds
+        self._executor: ProcessPoolExecutor | None = None
+        self._seed = 0
+
+    def search(self, board: Board, time_budget: float = 1.0) -> MCTSResult:
+        """
+        Cherche le meilleur coup pour le joueur au trait pendant le budget de temps.
+
+        Args:
+            board (Board): Le plateau (non modifié).
+            time_budget (float): Le temps de recherche (en secondes). Par défaut, 1 seconde.
+
+        Returns:
+            MCTSResult: Le coup le plus visité et les statistiques de la recherche.
+
+        Raises:
+            ValueError: Si la partie est terminée ou si le budget n'est pas strictement positif.
+        """
+        if board.is_game_over:
+            raise ValueError("La partie est terminée : aucun coup à chercher.")
+
+        if time_budget <= 0:
+            raise ValueError("Le budget de temps doit être strictement positif.")
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        start = time.perf_counter()
+        deadline = start + time_budget
+        latest_statistics: dict[int, dict[int, tuple[int, float]]] = {}
+        playouts = 0
+
+        while True:
+            batch_seconds = min(self.batch_seconds, deadline - time.perf_counter())
+            if batch_seconds <= 0:
+                break
+
+            futures = []
+            for _ in range(self.workers):
+                self._seed += 1
+                futures.append(self._executor.submit(
+                    _run_batch, board, batch_seconds, self.policy, self._seed, self.exploration
+                ))
+
+            # Chaque processus renvoie ses statistiques cumulées : seules les plus récentes sont gardées.
+            for future in futures:
+                pid, batch_playouts, statistics = future.result()
+                playouts += batch_playouts
+                latest_statistics[pid] = statistics
+
+        merged: dict[int, list[float]] = {}
+        for statistics in latest_statistics.values():
+            for move, (visits, wins) in statistics.items():
+                totals = merged.setdefault(move, [0, 0.0])
+                totals[0] += visits
+                totals[1] += wins
+
+        seconds = time.perf_counter() - start
+        if not merged:
+            best_move, visits, wins = candidate_moves(board)[0], 0, 0.0
+        else:
+            best_move, (visits, wins) = max(merged.items(), key=lambda item: item[1][0])
+
+        return MCTSResult(
+            best_move, int(visits), wins / visits if visits else 0.0, playouts, seconds,
+            playouts / seconds if seconds else 0.0, self.workers
+        )
+
+    def shutdown(self) -> None:
+        """
+        Arrête les processus de calcul.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
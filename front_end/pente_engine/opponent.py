@@ -0,0 +1,130 @@
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from pente_engine.board import Board
+from pente_engine.book import OpeningBook
+from pente_engine.search import AlphaBetaSearch, SearchResult
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Recherche propre au processus de calcul (sa table de transposition est conservée d'un coup à l'autre)
+_worker_search: AlphaBetaSearch | None = None
+
+# Livre d'ouvertures propre au processus de calcul (projeté en mémoire une seule fois)
+_worker_book: OpeningBook | None = None
+
+
+def _search_in_worker(board: Board, time_budget: float, book_path: str | None = None) -> SearchResult:
+    """
+    Cherche le meilleur coup dans le processus de calcul (d'abord dans le livre d'ouvertures, s'il y en a un).
+
+    Args:
+        board (Board): Le plateau.
+        time_budget (float): Le temps maximal (en secondes).
+        book_path (str | None): Le chemin du livre d'ouvertures. Par défaut, aucun livre.
+
+    Returns:
+        SearchResult: Le résultat de la recherche (profondeur et nombre de positions nuls pour un coup du livre).
+    """
+    global _worker_search, _worker_book
+
+    if book_path is not None:
+        start = time.perf_counter()
+        if _worker_book is None or _worker_book.path != book_path:
+            _worker_book = OpeningBook(book_path)
+        book_move = _worker_book.choose(board)
+        if book_move is not None:
+            return SearchResult(book_move, 0, 0, 0, time.perf_counter() - start, 0.0)
+
+    if _worker_search is None:
+        _worker_search = AlphaBetaSearch()
+    return _worker_search.search(board, time_budget)
+
+
+class ComputerOpponent:
+    """
+    Adversaire ordinateur : la recherche alpha-bêta tourne dans un processus séparé, pour que la boucle de rendu
+    (et le GIL du processus principal) reste libre. Le résultat est récupéré sans attente avec `poll`.
+    """
+
+    # Budget de temps par coup par défaut (en secondes)
+    DEFAULT_TIME_BUDGET = 1.0
+
+    def __init__(self, time_budget: float = DEFAULT_TIME_BUDGET, book_path: str | None = None) -> None:
+        """
+        Initialise l'adversaire (le processus de calcul est démarré au premier coup).
+
+        Args:
+            time_budget (float): Le temps de réflexion par coup (en secondes). Par défaut, 1 seconde.
+            book_path (str | None): Le chemin d'un livre d'ouvertures (voir `pente_engine.book`), consulté avant
+                toute recherche. Par défaut, aucun livre.
+
+        Raises:
+            ValueError: Si le budget de temps n'est pas strictement positif.
+        """
+        if not isinstance(time_budget, (int, float)) or time_budget <= 0:
+            raise ValueError("Le budget de temps doit être un nombre strictement positif.")
+
+        self.time_budget = float(time_budget)
+        self.book_path = book_path
+        self.last_result: SearchResult | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._future: Future | None = None
+
+    @property
+    def is_thinking(self) -> bool:
+        """
+        Indique si une recherche est en cours.
+
+        Returns:
+            bool: True si un coup est en cours de calcul, False sinon.
+        """
+        return self._future is not None
+
+    def start_thinking(self, board: Board) -> None:
+        """
+        Lance la recherche du prochain coup en arrière-plan.
+
+        Args:
+            board (Board): Le plateau, avec l'ordinateur au trait (copié avant l'envoi au processus de calcul).
+
+        Raises:
+            RuntimeError: Si une recherche est déjà en cours.
+            ValueError: Si la partie est terminée.
+        """
+        if self._future is not None:
+            raise RuntimeError("Une recherche est déjà en cours.")
+
+        if board.is_game_over:
+            raise ValueError("La partie est terminée : aucun coup à chercher.")
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=1)
+        self._future = self._executor.submit(_search_in_worker, board.copy(), self.time_budget, self.book_path)
+
+    def poll(self) -> SearchResult | None:
+        """
+        Récupère le coup calculé s'il est prêt, sans bloquer.
+
+        Returns:
+            SearchResult | None: Le résultat de la recherche si elle est terminée, None sinon.
+
+        Raises:
+            Exception: L'erreur levée par la recherche, le cas échéant.
+        """
+        if self._future is None or not self._future.done():
+            return None
+
+        future, self._future = self._future, None
+        self.last_result = future.result()
+        return self.last_result
+
+    def shutdown(self) -> None:
+        """
+        Arrête le processus de calcul (une recherche en cours est abandonnée).
+        """
+        self._future = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
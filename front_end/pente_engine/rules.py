@@ -0,0 +1,236 @@
+"""
+Constantes et tables précalculées des règles du Pente, identiques à celles du serveur (`back_end/main.c`).
+
+Le plateau est représenté par un entier (bitboard) par couleur : le bit `y * BOARD_COLS + x` vaut 1 si la case
+(x, y) contient un pion de cette couleur.
+"""
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Dimensions du plateau
+BOARD_COLS: int = 19
+BOARD_ROWS: int = 19
+BOARD_SIZE: int = BOARD_COLS * BOARD_ROWS
+
+# Caractères du format `board_state`
+EMPTY_CHAR: str = "-"
+PLAYER1_CHAR: str = "x"  # Hôte de la partie
+PLAYER2_CHAR: str = "o"  # Joueur ayant rejoint la partie (il joue en premier)
+PLAYER_CHARS: tuple[str, str] = (PLAYER1_CHAR, PLAYER2_CHAR)
+
+# Indices des joueurs
+PLAYER1: int = 0
+PLAYER2: int = 1
+FIRST_PLAYER: int = PLAYER2
+
+# Conditions de victoire
+WIN_LENGTH: int = 5
+CAPTURES_TO_WIN: int = 5
+
+# Directions d'alignement (horizontal, vertical, diagonale principale, diagonale secondaire)
+LINE_DIRECTIONS: tuple[tuple[int, int], ...] = ((1, 0), (0, 1), (1, 1), (1, -1))
+
+# Directions de capture (les 8 directions autour d'un pion)
+CAPTURE_DIRECTIONS: tuple[tuple[int, int], ...] = (
+    (1, 0), (0, 1), (1, 1), (1, -1), (-1, 0), (0, -1), (-1, -1), (-1, 1)
+)
+
+# Masque de toutes les cases du plateau
+FULL_MASK: int = (1 << BOARD_SIZE) - 1
+
+
+def to_index(x: int, y: int) -> int:
+    """
+    Convertit des coordonnées en indice de case.
+
+    Args:
+        x (int): La colonne (0 à 18).
+        y (int): La ligne (0 à 18).
+
+    Returns:
+        int: L'indice de la case (0 à 360).
+    """
+    return y * BOARD_COLS + x
+
+
+def to_coordinates(index: int) -> tuple[int, int]:
+    """
+    Convertit un indice de case en coordonnées.
+
+    Args:
+        index (int): L'indice de la case (0 à 360).
+
+    Returns:
+        tuple[int, int]: Les coordonnées (x, y).
+    """
+    return index % BOARD_COLS, index // BOARD_COLS
+
+
+def is_on_board(x: int, y: int) -> bool:
+    """
+    Vérifie si des coordonnées sont dans les limites du plateau.
+
+    Args:
+        x (int): La colonne.
+        y (int): La ligne.
+
+    Returns:
+        bool: True si la case existe, False sinon.
+    """
+    return 0 <= x < BOARD_COLS and 0 <= y < BOARD_ROWS
+
+
+def _build_win_masks() -> tuple[tuple[int, ...], ...]:
+    """
+    Précalcule, pour chaque case, les masques des fenêtres de 5 cases alignées qui la contiennent.
+
+    Un alignement gagnant passant par le dernier coup existe si et seulement si l'une de ces fenêtres est
+    entièrement occupée par le joueur (équivalent à `check_alignements` du serveur).
+
+    Returns:
+        tuple[tuple[int, ...], ...]: Les masques de fenêtres, indexés par case.
+    """
+    win_masks = [[] for _ in range(BOARD_SIZE)]
+    for dx, dy in LINE_DIRECTIONS:
+        for index in range(BOARD_SIZE):
+            x, y = to_coordinates(index)
+            if not is_on_board(x + (WIN_LENGTH - 1) * dx, y + (WIN_LENGTH - 1) * dy):
+                continue
+            cells = [to_index(x + step * dx, y + step * dy) for step in range(WIN_LENGTH)]
+            mask = 0
+            for cell in cells:
+                mask |= 1 << cell
+            for cell in cells:
+                win_masks[cell].append(mask)
+    return tuple(tuple(masks) for masks in win_masks)
+
+
+def _build_capture_patterns() -> tuple[tuple[tuple[int, int, int, int], ...], ...]:
+    """
+    Précalcule, pour chaque case, les motifs de capture dans les 8 directions (équivalent à `check_captures`).
+
+    Returns:
+        tuple[tuple[tuple[int, int, int, int], ...], ...]: Pour chaque case, les motifs
+        (masque de la paire, bit du pion fermant, indice du 1er pion capturé, indice du 2e pion capturé).
+    """
+    capture_patterns = []
+    for index in range(BOARD_SIZE):
+        x, y = to_coordinates(index)
+        patterns = []
+        for dx, dy in CAPTURE_DIRECTIONS:
+            if is_on_board(x + 3 * dx, y + 3 * dy):
+                first = to_index(x + dx, y + dy)
+                second = to_index(x + 2 * dx, y + 2 * dy)
+                closing = to_index(x + 3 * dx, y + 3 * dy)
+                patterns.append(((1 << first) | (1 << second), 1 << closing, first, second))
+        capture_patterns.append(tuple(patterns))
+    return tuple(capture_patterns)
+
+
+# Tables précalculées (construites une seule fois à l'import)
+WIN_MASKS: tuple[tuple[int, ...], ...] = _build_win_masks()
+CAPTURE_PATTERNS: tuple[tuple[tuple[int, int, int, int], ...], ...] = _build_capture_patterns()
+
+
+def _build_column_mask(column: int) -> int:
+    """
+    Précalcule le masque des cases d'une colonne.
+
+    Args:
+        column (int): La colonne.
+
+    Returns:
+        int: Le masque des 19 cases de la colonne.
+    """
+    mask = 0
+    for y in range(BOARD_ROWS):
+        mask |= 1 << to_index(column, y)
+    return mask
+
+
+# Masques des cases hors de la première et de la dernière colonne (évitent les débordements lors des décalages)
+NOT_FIRST_COLUMN: int = FULL_MASK & ~_build_column_mask(0)
+NOT_LAST_COLUMN: int = FULL_MASK & ~_build_column_mask(BOARD_COLS - 1)
+
+
+def dilate(bitboard: int, distance: int = 1) -> int:
+    """
+    Étend un bitboard à toutes les cases situées à au plus `distance` cases (distance de Tchebychev).
+
+    Args:
+        bitboard (int): Le bitboard à étendre.
+        distance (int): La distance d'extension. Par défaut, 1.
+
+    Returns:
+        int: Le bitboard étendu (contient le bitboard d'origine).
+    """
+    for _ in range(distance):
+        horizontal = bitboard | ((bitboard << 1) & NOT_FIRST_COLUMN) | ((bitboard >> 1) & NOT_LAST_COLUMN)
+        bitboard = (horizontal | (horizontal << BOARD_COLS) | (horizontal >> BOARD_COLS)) & FULL_MASK
+    return bitboard
+
+
+def iterate_bits(bitboard: int):
+    """
+    Parcourt les indices des bits à 1 d'un bitboard, par ordre croissant.
+
+    Args:
+        bitboard (int): Le bitboard.
+
+    Yields:
+        int: L'indice de chaque case.
+    """
+    while bitboard:
+        lowest = bitboard & -bitboard
+        yield lowest.bit_length() - 1
+        bitboard ^= lowest
+
+
+# Masques de voisinage immédiat de chaque case (la case elle-même est exclue)
+NEIGHBOUR_MASKS: tuple[int, ...] = tuple(dilate(1 << index) & ~(1 << index) for index in range(BOARD_SIZE))
+
+# Toutes les fenêtres de 5 cases alignées du plateau (chacune une seule fois)
+LINE_WINDOWS: tuple[int, ...] = tuple(sorted({mask for masks in WIN_MASKS for mask in masks}))
+
+
+def _index_by_cell(groups: list[list[int]] | tuple) -> tuple[tuple[int, ...], ...]:
+    """
+    Inverse une liste de groupes de cases : pour chaque case, les indices des groupes qui la contiennent.
+
+    Args:
+        groups (list[list[int]] | tuple): Les cases de chaque groupe.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: Les indices des groupes, indexés par case.
+    """
+    by_cell = [[] for _ in range(BOARD_SIZE)]
+    for group, cells in enumerate(groups):
+        for index in cells:
+            by_cell[index].append(group)
+    return tuple(tuple(groups_of_cell) for groups_of_cell in by_cell)
+
+
+# Fenêtres de 5 cases contenant chaque case (indices dans LINE_WINDOWS)
+WINDOWS_BY_CELL: tuple[tuple[int, ...], ...] = _index_by_cell([list(iterate_bits(mask)) for mask in LINE_WINDOWS])
+
+
+def _build_capture_segments() -> tuple[tuple[int, int, int, int], ...]:
+    """
+    Précalcule tous les segments de 4 cases alignées (support des captures et des menaces de capture).
+
+    Returns:
+        tuple[tuple[int, int, int, int], ...]: Les indices des 4 cases de chaque segment (chaque segment une fois).
+    """
+    segments = []
+    for index in range(BOARD_SIZE):
+        x, y = to_coordinates(index)
+        for dx, dy in LINE_DIRECTIONS:
+            if is_on_board(x + 3 * dx, y + 3 * dy):
+                segments.append(tuple(to_index(x + step * dx, y + step * dy) for step in range(4)))
+    return tuple(segments)
+
+
+# Segments de 4 cases alignées, et segments contenant chaque case (indices dans CAPTURE_SEGMENTS)
+CAPTURE_SEGMENTS: tuple[tuple[int, int, int, int], ...] = _build_capture_segments()
+SEGMENTS_BY_CELL: tuple[tuple[int, ...], ...] = _index_by_cell(CAPTURE_SEGMENTS)
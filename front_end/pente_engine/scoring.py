@@ -0,0 +1,32 @@
+"""
+Formule de score du serveur (`calculate_delta` dans `back_end/main.c`), partagée par le serveur local du jeu hors
+ligne et le classement des tournois.
+"""
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+
+def calculate_delta(*, sg: int, sp: int) -> int:
+    """
+    Calcule la variation de score après une partie, comme le serveur : `round(30 / (1 + 10^((sg - sp) / 400)))`.
+
+    Les noms et l'ordre sont ceux du serveur, dont la documentation attend le score du gagnant (`sg`) puis celui du
+    perdant (`sp`) : la variation vaut 15 à scores égaux, plus quand le gagnant avait le score le plus faible, moins
+    sinon. `forfeit_game` respecte cet ordre, mais `handle_win` passe le score du perdant en `sg` et celui du
+    gagnant en `sp`. Les arguments sont nommés pour que chaque appel indique l'ordre choisi.
+
+    Args:
+        sg (int): Le score passé en premier au serveur (celui du gagnant selon sa documentation).
+        sp (int): Le score passé en second au serveur (celui du perdant selon sa documentation).
+
+    Returns:
+        int: Le nombre de points gagnés par le gagnant et perdus par le perdant.
+
+    Raises:
+        ValueError: Si un score est négatif.
+    """
+    if sg < 0 or sp < 0:
+        raise ValueError("Les scores doivent être positifs.")
+
+    return round(30.0 / (1.0 + 10.0 ** ((sg - sp) / 400.0)))
@@ -0,0 +1,331 @@
+import time
+from typing import Callable, NamedTuple
+
+from pente_engine.board import Board
+from pente_engine.candidates import CandidateSet, order_moves
+from pente_engine.incremental import IncrementalEvaluator
+from pente_engine.rules import BOARD_COLS, BOARD_ROWS, BOARD_SIZE, dilate, iterate_bits, to_index
+from pente_engine.transposition import EXACT, LOWER_BOUND, NO_MOVE, UPPER_BOUND, TranspositionTable
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Score d'une victoire (diminué de la distance en coups, pour préférer les victoires rapides)
+WIN_SCORE: int = 1_000_000
+
+# Borne des scores (au-delà de toute évaluation)
+INFINITY: int = WIN_SCORE + 1
+
+
+class SearchTimeout(Exception):
+    """Levée lorsque le budget de temps de la recherche est épuisé."""
+
+
+class SearchResult(NamedTuple):
+    """Résultat d'une recherche."""
+
+    # Meilleur coup trouvé (indice de case)
+    best_move: int
+
+    # Valeur de la position après le meilleur coup, du point de vue du joueur au trait
+    value: int
+
+    # Profondeur de la dernière itération terminée
+    depth: int
+
+    # Nombre de positions visitées
+    nodes: int
+
+    # Durée de la recherche (en secondes)
+    seconds: float
+
+    # Débit de la recherche (positions visitées par seconde)
+    nodes_per_second: float
+
+    # Variante principale : suite de coups attendue, à partir du meilleur coup (vide si inconnue)
+    principal_variation: tuple[int, ...] = ()
+
+
+class AlphaBetaSearch:
+    """
+    Recherche negamax alpha-bêta avec approfondissement itératif, table de transposition, tri des coups
+    (coup de la table, captures, heuristique de l'historique, lignes prolongées : voir `candidates.order_moves`),
+    évaluation incrémentale et budget de temps strict.
+
+    La recherche est interruptible : `cancel` et `set_deadline` peuvent être appelées depuis un autre fil
+    d'exécution, et l'échéance est vérifiée à chaque position. Voir aussi `pente_engine.anytime.AnytimeSearch`.
+    """
+
+    # Budget de temps par défaut (en secondes)
+    DEFAULT_TIME_BUDGET = 1.0
+
+    # Profondeur maximale de l'approfondissement itératif
+    MAX_DEPTH = 10
+
+    # Distance maximale des coups candidats aux pions déjà posés
+    CANDIDATE_DISTANCE = 2
+
+    # Nombre maximal de coups examinés hors de la racine (les moins prometteurs sont ignorés)
+    MAX_BRANCHING = 16
+
+    def __init__(self, table_size: int = TranspositionTable.DEFAULT_SIZE) -> None:
+        """
+        Initialise la recherche et sa table de transposition (conservée d'un coup à l'autre).
+
+        Args:
+            table_size (int): Le nombre d'entrées de la table de transposition.
+        """
+        self.table = TranspositionTable(table_size)
+        self.history = [0] * BOARD_SIZE
+        self.nodes = 0
+        self.evaluator = IncrementalEvaluator()
+        self.candidates = CandidateSet(distance=AlphaBetaSearch.CANDIDATE_DISTANCE)
+        self._deadline = 0.0
+
+    def candidate_moves(self, board: Board) -> list[int]:
+        """
+        Liste les coups candidats : cases vides proches des pions déjà posés (le centre sur un plateau vide).
+
+        Args:
+            board (Board): Le plateau.
+
+        Returns:
+            list[int]: Les indices des cases candidates.
+        """
+        occupied = board.occupied
+        if not occupied:
+            return [to_index(BOARD_COLS // 2, BOARD_ROWS // 2)]
+
+        return list(iterate_bits(dilate(occupied, AlphaBetaSearch.CANDIDATE_DISTANCE) & ~occupied))
+
+    def cancel(self) -> None:
+        """
+        Interrompt la recherche en cours : elle renvoie le résultat de sa dernière itération terminée. Peut être
+        appelée depuis un autre fil d'exécution.
+        """
+        self._deadline = 0.0
+
+    def set_deadline(self, time_budget: float) -> None:
+        """
+        Remplace l'échéance de la recherche en cours (pour la prolonger ou l'avancer). Peut être appelée depuis un
+        autre fil d'exécution.
+
+        Args:
+            time_budget (float): Le temps restant à partir de maintenant (en secondes).
+        """
+        self._deadline = time.perf_counter() + time_budget
+
+    def principal_variation(self, board: Board, first_move: int, max_length: int = MAX_DEPTH) -> tuple[int, ...]:
+        """
+        Reconstruit la variante principale en suivant les meilleurs coups de la table de transposition.
+
+        Args:
+            board (Board): Le plateau (non modifié).
+            first_move (int): Le premier coup de la variante (le meilleur coup de la recherche).
+            max_length (int): Le nombre maximal de coups. Par défaut, 10.
+
+        Returns:
+            tuple[int, ...]: Les coups de la variante, en s'arrêtant au premier coup inconnu ou illégal.
+        """
+        board = board.copy()
+        line = []
+        move = first_move
+        while len(line) < max_length and not board.is_game_over and board.is_legal(move):
+            line.append(move)
+            board.play(move)
+            entry = self.table.probe(board.hash)
+            if entry is None or entry.best_move == NO_MOVE:
+                break
+            move = entry.best_move
+        return tuple(line)
+
+    def search(self, board: Board, time_budget: float = DEFAULT_TIME_BUDGET, max_depth: int = MAX_DEPTH,
+               on_progress: Callable[[SearchResult], None] | None = None) -> SearchResult:
+        """
+        Cherche le meilleur coup pour le joueur au trait, par approfondissement itératif dans le budget de temps.
+
+        Args:
+            board (Board): Le plateau (non modifié).
+            time_budget (float): Le temps maximal (en secondes). Par défaut, 1 seconde.
+            max_depth (int): La profondeur maximale. Par défaut, 10.
+            on_progress (Callable[[SearchResult], None] | None): Fonction appelée avec le résultat de chaque
+                itération terminée (appelée dans le fil d'exécution de la recherche). Par défaut, aucune.
+
+        Returns:
+            SearchResult: Le meilleur coup de la dernière itération terminée, la profondeur atteinte et le débit.
+
+        Raises:
+            ValueError: Si la partie est terminée ou si les paramètres sont invalides.
+        """
+        if board.is_game_over:
+            raise ValueError("La partie est terminée : aucun coup à chercher.")
+
+        if time_budget <= 0 or max_depth < 1:
+            raise ValueError("Le budget de temps et la profondeur maximale doivent être strictement positifs.")
+
+        start = time.perf_counter()
+        self._deadline = start + time_budget
+        self.nodes = 0
+        self.table.new_search()
+        self.history = [value >> 2 for value in self.history]
+
+        moves = order_moves(board, self.candidate_moves(board), history=self.history)
+        best_move, best_value, depth_reached = moves[0], -INFINITY, 0
+
+        for depth in range(1, max_depth + 1):
+            try:
+                # Coups joués et défaits sur une copie : une itération interrompue la laisse en cours de ligne.
+                value, move = self.__search_root(board.copy(), moves, depth)
+            except SearchTimeout:
+                break
+
+            best_move, best_value, depth_reached = move, value, depth
+            if on_progress is not None:
+                on_progress(self.__result(board, best_move, best_value, depth_reached, start))
+
+            # Le meilleur coup est examiné en premier à l'itération suivante.
+            moves.remove(move)
+            moves.insert(0, move)
+
+            # Une victoire (ou une défaite) forcée ne changera plus avec la profondeur.
+            if abs(value) >= WIN_SCORE - max_depth or len(moves) == 1:
+                break
+
+        return self.__result(board, best_move, best_value, depth_reached, start)
+
+    def __result(self, board: Board, best_move: int, value: int, depth: int, start: float) -> SearchResult:
+        """
+        Construit le résultat de la recherche, avec sa variante principale.
+
+        Args:
+            board (Board): Le plateau de la racine.
+            best_move (int): Le meilleur coup.
+            value (int): La valeur du meilleur coup.
+            depth (int): La profondeur de la dernière itération terminée.
+            start (float): Le début de la recherche (horloge `time.perf_counter`).
+
+        Returns:
+            SearchResult: Le résultat.
+        """
+        seconds = time.perf_counter() - start
+        return SearchResult(
+            best_move, value, depth, self.nodes, seconds, self.nodes / seconds if seconds else 0.0,
+            self.principal_variation(board, best_move, max(depth, 1))
+        )
+
+    def __search_root(self, board: Board, moves: list[int], depth: int) -> tuple[int, int]:
+        """
+        Examine tous les coups de la racine à la profondeur donnée.
+
+        Args:
+            board (Board): Le plateau.
+            moves (list[int]): Les coups candidats triés.
+            depth (int): La profondeur.
+
+        Returns:
+            tuple[int, int]: La valeur et le meilleur coup.
+
+        Raises:
+            SearchTimeout: Si le budget de temps est épuisé.
+        """
+        # Reconstruit les structures incrémentales : une itération interrompue les laisse désynchronisées.
+        self.evaluator = IncrementalEvaluator(board)
+        self.candidates = CandidateSet(board, AlphaBetaSearch.CANDIDATE_DISTANCE)
+
+        alpha, beta = -INFINITY, INFINITY
+        best_move = moves[0]
+        for move in moves:
+            result = board.play(move)
+            if result.is_win:
+                value = WIN_SCORE - 1
+            else:
+                self.evaluator.apply(result)
+                if depth > 1:
+                    self.candidates.apply(result)
+                value = -self.__negamax(board, depth - 1, -beta, -alpha, 1)
+                if depth > 1:
+                    self.candidates.undo()
+                self.evaluator.undo()
+            board.undo()
+            if value > alpha:
+                alpha, best_move = value, move
+
+        self.table.store(board.hash, depth, alpha, EXACT, best_move)
+        return alpha, best_move
+
+    def __negamax(self, board: Board, depth: int, alpha: int, beta: int, ply: int) -> int:
+        """
+        Recherche negamax alpha-bêta.
+
+        Args:
+            board (Board): Le plateau.
+            depth (int): La profondeur restante.
+            alpha (int): La borne inférieure.
+            beta (int): La borne supérieure.
+            ply (int): La distance à la racine (en coups).
+
+        Returns:
+            int: La valeur de la position du point de vue du joueur au trait.
+
+        Raises:
+            SearchTimeout: Si le budget de temps est épuisé.
+        """
+        # Une lecture d'horloge par position (environ 0,1 µs, pour des dizaines de µs par position) : une
+        # interruption prend effet dès la position suivante.
+        self.nodes += 1
+        if time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        original_alpha = alpha
+        preferred_move = NO_MOVE
+        entry = self.table.probe(board.hash)
+        if entry is not None:
+            preferred_move = entry.best_move
+            if entry.depth >= depth:
+                if entry.flag == EXACT:
+                    return entry.value
+                if entry.flag == LOWER_BOUND:
+                    alpha = max(alpha, entry.value)
+                elif entry.flag == UPPER_BOUND:
+                    beta = min(beta, entry.value)
+                if alpha >= beta:
+                    return entry.value
+
+        if depth == 0:
+            return self.evaluator.evaluate(board)
+
+        moves = self.candidates.ordered_moves(board, preferred_move, self.history)
+        if not moves:
+            return 0
+
+        best_value, best_move = -INFINITY, moves[0]
+        for move in moves[:AlphaBetaSearch.MAX_BRANCHING]:
+            result = board.play(move)
+            if result.is_win:
+                value = WIN_SCORE - ply
+            else:
+                self.evaluator.apply(result)
+                if depth > 1:
+                    self.candidates.apply(result)
+                value = -self.__negamax(board, depth - 1, -beta, -alpha, ply + 1)
+                if depth > 1:
+                    self.candidates.undo()
+                self.evaluator.undo()
+            board.undo()
+
+            if value > best_value:
+                best_value, best_move = value, move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                self.history[move] += depth * depth
+                break
+
+        if best_value <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_value >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self.table.store(board.hash, depth, best_value, flag, best_move)
+        return best_value
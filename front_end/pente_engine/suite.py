@@ -0,0 +1,426 @@
+"""
+Suite de benchmarks du moteur sur un jeu fixe de positions (ouvertures, milieux de partie riches en captures, fins
+de partie à un coup de la victoire), avec suivi des régressions.
+
+La justesse est vérifiée par des comptages de type « perft » : nombre de positions, de captures et de victoires
+atteintes à profondeur fixe, comparés à des valeurs de référence. Toute dérive des règles reprises du serveur
+(`check_captures`, `check_alignements`) modifie ces comptages. Les débits (génération des coups, détection des
+captures et des alignements, perft, recherche) sont ajoutés à un historique JSON et comparés aux exécutions
+précédentes.
+
+Exemple (depuis le dossier `front_end`) : `python -m pente_engine.suite --history historique.json --compare`
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, NamedTuple
+
+from pente_engine.board import Board
+from pente_engine.rules import PLAYER1, PLAYER2, to_index
+from pente_engine.search import AlphaBetaSearch
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Positions de la suite : nom -> (catégorie, coups depuis le plateau vide)
+POSITIONS: dict[str, tuple[str, list[int]]] = {
+    "opening_2": ("opening", [100, 142]),
+    "opening_4": ("opening", [161, 163, 178, 176]),
+    "opening_8": ("opening", [155, 161, 104, 179, 219, 83, 216, 178]),
+    "middlegame_captures_1": ("middlegame", [
+        124, 219, 161, 121, 236, 187, 88, 179, 105, 177, 125, 298, 216, 140, 175, 204, 201, 238, 159, 232, 183, 68,
+        142, 139, 241, 144, 205, 197, 224, 163, 157, 196, 158, 200, 332, 100, 285, 143, 240, 79
+    ]),
+    "middlegame_captures_2": ("middlegame", [
+        160, 121, 184, 107, 163, 196, 179, 219, 144, 143, 257, 122, 140, 203, 195, 253, 124, 20, 254, 197, 198, 246,
+        7, 180, 235, 262, 43, 199, 105, 326, 28, 95, 275, 200, 156, 162, 238, 240, 216, 222, 202, 137, 165, 217
+    ]),
+    "middlegame_captures_3": ("middlegame", [
+        180, 182, 273, 141, 181, 155, 240, 255, 204, 139, 200, 216, 217, 196, 122, 3, 115, 125, 158, 199, 161, 236,
+        261, 209, 83, 219, 262, 267, 198, 163, 62, 164, 239, 237, 121, 232, 295, 218, 352, 277
+    ]),
+    "endgame_alignment": ("endgame", [
+        186, 125, 141, 236, 29, 316, 160, 143, 202, 261, 219, 221, 178, 45, 103, 49, 122, 104, 217, 188
+    ]),
+    "endgame_captures": ("endgame", [
+        160, 121, 184, 107, 163, 196, 179, 219, 144, 143, 257, 122, 140, 203, 195, 253, 124, 20, 254, 197, 198, 246,
+        7, 180, 235, 262, 43, 199, 105, 326, 28, 95, 275, 200, 156, 162, 238, 240, 216, 222, 202, 137, 165, 217, 241,
+        196
+    ]),
+    "endgame_open_four": ("endgame", [
+        to_index(0, 0), to_index(5, 9), to_index(18, 0), to_index(6, 9), to_index(0, 18), to_index(7, 9),
+        to_index(18, 18), to_index(8, 9)
+    ]),
+}
+
+# Profondeur des comptages perft
+PERFT_DEPTH: int = 2
+
+# Comptages perft de référence à `PERFT_DEPTH` : nom -> (positions, captures, victoires)
+EXPECTED_PERFT: dict[str, tuple[int, int, int]] = {
+    "opening_2": (128522, 0, 0),
+    "opening_4": (127092, 2, 0),
+    "opening_8": (124256, 2, 0),
+    "middlegame_captures_1": (102417, 1291, 1),
+    "middlegame_captures_2": (101456, 1601, 315),
+    "middlegame_captures_3": (102730, 1293, 0),
+    "endgame_alignment": (115262, 8, 2),
+    "endgame_captures": (101131, 1289, 316),
+    "endgame_open_four": (124256, 0, 704),
+}
+
+# Profondeur de la recherche mesurée (fixe : le nombre de positions visitées ne dépend pas de la machine)
+SEARCH_DEPTH: int = 3
+
+# Baisse de débit tolérée avant de signaler une régression (bruit de mesure)
+DEFAULT_THRESHOLD: float = 0.10
+
+# Nombre d'exécutions précédentes dont la médiane sert de référence
+DEFAULT_WINDOW: int = 5
+
+# Nombre de passages sur les plateaux d'une catégorie par mesure de débit (pour une durée mesurable)
+MEASURE_ROUNDS: int = 20
+
+# Nombre de répétitions de chaque mesure (la meilleure est retenue), et minimum pour comparer à l'historique (une
+# mesure unique varie de plus de 40 % d'une exécution à l'autre)
+DEFAULT_REPEATS: int = 3
+MIN_COMPARE_REPEATS: int = 3
+
+# Paramètre dont dépend chaque débit : seules les exécutions de même valeur sont comparées
+METRIC_DEPTHS: dict[str, str] = {"perft": "perft_depth", "search": "search_depth"}
+
+
+class PerftCounts(NamedTuple):
+    """Comptages d'un perft."""
+
+    # Positions atteintes (feuilles à la profondeur demandée, ou fins de partie avant)
+    nodes: int
+
+    # Coups capturants parmi les coups menant aux feuilles
+    captures: int
+
+    # Coups gagnants parmi les coups menant aux feuilles
+    wins: int
+
+
+def position_board(name: str) -> Board:
+    """
+    Construit le plateau d'une position de la suite.
+
+    Args:
+        name (str): Le nom de la position (clé de `POSITIONS`).
+
+    Returns:
+        Board: Le plateau.
+
+    Raises:
+        KeyError: Si la position n'existe pas.
+    """
+    board = Board()
+    for index in POSITIONS[name][1]:
+        board.play(index)
+    return board
+
+
+def perft(board: Board, depth: int) -> PerftCounts:
+    """
+    Compte les positions atteintes en jouant tous les coups légaux jusqu'à la profondeur donnée (une partie
+    terminée n'est pas prolongée), ainsi que les captures et les victoires des derniers coups.
+
+    Args:
+        board (Board): Le plateau (rendu intact).
+        depth (int): La profondeur (au moins 1).
+
+    Returns:
+        PerftCounts: Les comptages.
+    """
+    nodes = captures = wins = 0
+    for move in board.legal_moves():
+        result = board.play(move)
+        if depth == 1 or result.is_win:
+            nodes += 1
+            captures += bool(result.captured)
+            wins += result.is_win
+        else:
+            child = perft(board, depth - 1)
+            nodes += child.nodes
+            captures += child.captures
+            wins += child.wins
+        board.undo()
+    return PerftCounts(nodes, captures, wins)
+
+
+def _best_rate(operation: Callable[[], int], repeats: int) -> float:
+    """
+    Mesure le débit d'une opération (meilleure de plusieurs répétitions, pour limiter le bruit).
+
+    Args:
+        operation (Callable[[], int]): L'opération, qui renvoie le nombre d'unités traitées.
+        repeats (int): Le nombre de répétitions.
+
+    Returns:
+        float: Le meilleur débit (unités par seconde).
+    """
+    best = 0.0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        count = operation()
+        seconds = time.perf_counter() - start
+        best = max(best, count / seconds if seconds else float("inf"))
+    return best
+
+
+def _generate_moves(boards: list[Board]) -> int:
+    """
+    Génère les coups légaux et les coups candidats de la recherche de chaque plateau.
+
+    Args:
+        boards (list[Board]): Les plateaux.
+
+    Returns:
+        int: Le nombre de générations.
+    """
+    search = AlphaBetaSearch(table_size=1)
+    for board in boards:
+        board.legal_moves()
+        search.candidate_moves(board)
+    return len(boards)
+
+
+def _detect_captures(boards: list[Board]) -> int:
+    """
+    Cherche les captures de chaque joueur sur chaque case vide (`check_captures`).
+
+    Args:
+        boards (list[Board]): Les plateaux.
+
+    Returns:
+        int: Le nombre de cases examinées.
+    """
+    count = 0
+    for board in boards:
+        for index in board.legal_moves():
+            board.find_captures(index, PLAYER1)
+            board.find_captures(index, PLAYER2)
+            count += 2
+    return count
+
+
+def _detect_wins(boards: list[Board]) -> int:
+    """
+    Vérifie, pour chaque case vide, si un pion du joueur au trait y compléterait un alignement
+    (`check_alignements`).
+
+    Args:
+        boards (list[Board]): Les plateaux.
+
+    Returns:
+        int: Le nombre de cases examinées.
+    """
+    count = 0
+    for board in boards:
+        player = board.to_move
+        stones = board.bitboards[player]
+        for index in board.legal_moves():
+            board.bitboards[player] = stones | 1 << index
+            board.is_alignment(index, player)
+            count += 1
+        board.bitboards[player] = stones
+    return count
+
+
+def check_perft(depth: int = PERFT_DEPTH, repeats: int = 1) -> tuple[dict[str, dict], float]:
+    """
+    Calcule les comptages perft de chaque position et les compare aux valeurs de référence (à `PERFT_DEPTH`).
+
+    Args:
+        depth (int): La profondeur. Par défaut, `PERFT_DEPTH`.
+        repeats (int): Le nombre de répétitions (le meilleur débit est retenu). Par défaut, 1.
+
+    Returns:
+        tuple[dict[str, dict], float]: Pour chaque position, les comptages obtenus et attendus (None hors de
+                                       `PERFT_DEPTH`) et leur accord ; et le débit du perft (positions par seconde).
+    """
+    results = {}
+
+    def count_all() -> int:
+        nodes = 0
+        for name in POSITIONS:
+            counts = perft(position_board(name), depth)
+            nodes += counts.nodes
+            expected = EXPECTED_PERFT.get(name) if depth == PERFT_DEPTH else None
+            results[name] = {
+                "counts": list(counts),
+                "expected": list(expected) if expected is not None else None,
+                "ok": expected is None or tuple(counts) == tuple(expected),
+            }
+        return nodes
+
+    rate = _best_rate(count_all, repeats)
+    return results, rate
+
+
+def run_suite(repeats: int = DEFAULT_REPEATS, perft_depth: int = PERFT_DEPTH) -> dict:
+    """
+    Exécute la suite : comptages perft, nombres de positions visitées par la recherche et débits par catégorie
+    de positions.
+
+    Args:
+        repeats (int): Le nombre de répétitions de chaque mesure de débit. Par défaut, 3.
+        perft_depth (int): La profondeur des comptages perft. Par défaut, `PERFT_DEPTH`.
+
+    Returns:
+        dict: L'exécution (date, version de Python, justesse et débits), au format de l'historique.
+    """
+    perft_results, perft_rate = check_perft(perft_depth, repeats)
+
+    categories: dict[str, list[Board]] = {}
+    for name, (category, _) in POSITIONS.items():
+        categories.setdefault(category, []).append(position_board(name))
+
+    throughput = {"perft": perft_rate}
+    for category, boards in categories.items():
+        boards *= MEASURE_ROUNDS
+        throughput[f"{category}.move_generation"] = _best_rate(lambda: _generate_moves(boards), repeats)
+        throughput[f"{category}.capture_detection"] = _best_rate(lambda: _detect_captures(boards), repeats)
+        throughput[f"{category}.win_detection"] = _best_rate(lambda: _detect_wins(boards), repeats)
+
+    # Recherche à profondeur fixe : le nombre de positions visitées est reproductible, le débit est mesuré.
+    search_nodes = {}
+    search_rates = []
+    for name in POSITIONS:
+        board = position_board(name)
+        if board.is_game_over:
+            continue
+        results = [AlphaBetaSearch().search(board, 3600.0, SEARCH_DEPTH) for _ in range(repeats)]
+        search_nodes[name] = results[0].nodes
+        search_rates.append(max(result.nodes_per_second for result in results))
+    throughput["search"] = statistics.fmean(search_rates) if search_rates else 0.0
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "perft_depth": perft_depth,
+        "search_depth": SEARCH_DEPTH,
+        "perft": perft_results,
+        "search_nodes": search_nodes,
+        "throughput": throughput,
+    }
+
+
+def compare_runs(current: dict, history: list[dict], threshold: float = DEFAULT_THRESHOLD,
+                 window: int = DEFAULT_WINDOW) -> list[str]:
+    """
+    Compare une exécution aux précédentes : débits inférieurs à la médiane des `window` dernières exécutions de
+    plus de `threshold`, comptages perft faux et nombres de positions visitées par la recherche modifiés (par
+    rapport à la dernière exécution de même profondeur de recherche).
+
+    Les débits du perft et de la recherche ne sont comparés qu'aux exécutions de même profondeur (perft ou
+    recherche) : une autre profondeur change le coût moyen d'une position.
+
+    Args:
+        current (dict): L'exécution courante (voir `run_suite`).
+        history (list[dict]): Les exécutions précédentes, de la plus ancienne à la plus récente.
+        threshold (float): La baisse de débit tolérée (fraction). Par défaut, 10 %.
+        window (int): Le nombre d'exécutions précédentes prises en compte. Par défaut, 5.
+
+    Returns:
+        list[str]: Les problèmes détectés (vide si aucun).
+    """
+    problems = [f"Perft {name} : {result['counts']} au lieu de {result['expected']}."
+                for name, result in current["perft"].items() if not result["ok"]]
+
+    for metric, value in current["throughput"].items():
+        depth_key = METRIC_DEPTHS.get(metric)
+        previous = [
+            run["throughput"][metric] for run in history
+            if metric in run.get("throughput", {}) and (depth_key is None or run.get(depth_key) == current[depth_key])
+        ][-window:]
+        if not previous:
+            continue
+        baseline = statistics.median(previous)
+        if value < baseline * (1 - threshold):
+            problems.append(f"Débit {metric} : {value:,.0f}/s contre {baseline:,.0f}/s ({value / baseline - 1:+.0%}).")
+
+    # Les nombres de positions visitées ne sont comparables qu'à profondeur de recherche égale.
+    same_depth = [run for run in history if run.get("search_depth") == current["search_depth"]]
+    if same_depth:
+        for name, nodes in current["search_nodes"].items():
+            previous_nodes = same_depth[-1].get("search_nodes", {}).get(name)
+            if previous_nodes is not None and previous_nodes != nodes:
+                problems.append(f"Recherche {name} : {nodes} positions visitées au lieu de {previous_nodes}.")
+
+    return problems
+
+
+def load_history(path: str) -> list[dict]:
+    """
+    Lit l'historique des exécutions (vide si le fichier n'existe pas).
+
+    Args:
+        path (str): Le chemin du fichier JSON.
+
+    Returns:
+        list[dict]: Les exécutions, de la plus ancienne à la plus récente.
+
+    Raises:
+        ValueError: Si le fichier ne contient pas une liste d'exécutions.
+    """
+    try:
+        with open(path, encoding="utf-8") as history_file:
+            history = json.load(history_file)
+    except FileNotFoundError:
+        return []
+
+    if not isinstance(history, list):
+        raise ValueError(f"L'historique {path} doit contenir une liste d'exécutions.")
+    return history
+
+
+def main() -> None:
+    """
+    Point d'entrée en ligne de commande de la suite de benchmarks.
+
+    Le code de sortie vaut 1 si un comptage perft est faux, ou si `--compare` détecte une régression.
+    """
+    parser = argparse.ArgumentParser(description="Suite de benchmarks du moteur de Pente, avec suivi des régressions.")
+    parser.add_argument("--history", type=str, default=None,
+                        help="Fichier JSON de l'historique, auquel l'exécution est ajoutée.")
+    parser.add_argument("--compare", action="store_true",
+                        help="Compare l'exécution à l'historique et signale les régressions.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Baisse de débit tolérée (fraction, 0.10 par défaut).")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW,
+                        help="Nombre d'exécutions précédentes servant de référence.")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help=f"Répétitions de chaque mesure (au moins {MIN_COMPARE_REPEATS} avec --compare).")
+    parser.add_argument("--perft-depth", type=int, default=PERFT_DEPTH,
+                        help="Profondeur des comptages perft (valeurs de référence à 2 uniquement).")
+    args = parser.parse_args()
+
+    if args.repeats < 1:
+        parser.error("--repeats doit être strictement positif.")
+    if args.compare and args.repeats < MIN_COMPARE_REPEATS:
+        parser.error(f"--compare demande au moins {MIN_COMPARE_REPEATS} répétitions (mesures trop bruitées sinon).")
+
+    history = load_history(args.history) if args.history else []
+    current = run_suite(args.repeats, args.perft_depth)
+    print(json.dumps(current, indent=4))
+
+    problems = compare_runs(current, history if args.compare else [], args.threshold, args.window)
+    for problem in problems:
+        print(f"RÉGRESSION : {problem}")
+
+    if args.history:
+        with open(args.history, "w", encoding="utf-8") as history_file:
+            json.dump(history + [current], history_file, indent=4)
+
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Symétries du plateau : les 8 transformations du carré (rotations et réflexions) laissent les règles inchangées.
+
+Chaque transformation est précalculée sous forme de table de permutation des cases, et les clés de Zobrist des
+pions sont permutées de la même façon : les empreintes des 8 orientations d'une position se calculent par simples
+lectures de tables, sans arithmétique de coordonnées. La forme canonique d'une position est l'orientation dont
+l'empreinte est la plus petite ; les caches, livres d'ouvertures et bases de parties n'ont alors besoin que d'une
+entrée par classe de positions symétriques.
+"""
+
+from pente_engine.board import Board
+from pente_engine.rules import BOARD_COLS, BOARD_ROWS, BOARD_SIZE, PLAYER1, PLAYER2, iterate_bits, to_index
+from pente_engine.zobrist import PIECE_KEYS
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Transformations des coordonnées (plateau carré, dernière ligne et dernière colonne : LAST)
+LAST: int = BOARD_COLS - 1
+TRANSFORMATIONS: tuple = (
+    lambda x, y: (x, y),  # Identité
+    lambda x, y: (LAST - y, x),  # Rotation d'un quart de tour
+    lambda x, y: (LAST - x, LAST - y),  # Rotation d'un demi-tour
+    lambda x, y: (y, LAST - x),  # Rotation de trois quarts de tour
+    lambda x, y: (LAST - x, y),  # Réflexion gauche-droite
+    lambda x, y: (x, LAST - y),  # Réflexion haut-bas
+    lambda x, y: (y, x),  # Réflexion selon la diagonale principale
+    lambda x, y: (LAST - y, LAST - x),  # Réflexion selon l'antidiagonale
+)
+
+# Nombre de symétries et symétrie neutre
+SYMMETRIES: int = len(TRANSFORMATIONS)
+IDENTITY: int = 0
+
+assert BOARD_COLS == BOARD_ROWS, "Les symétries supposent un plateau carré."
+
+
+def _build_permutations() -> tuple[tuple[int, ...], ...]:
+    """
+    Précalcule l'image de chaque case par chaque symétrie.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: Les permutations des cases, indexées par symétrie.
+    """
+    return tuple(
+        tuple(to_index(*transformation(index % BOARD_COLS, index // BOARD_COLS)) for index in range(BOARD_SIZE))
+        for transformation in TRANSFORMATIONS
+    )
+
+
+# Permutations des cases et de leurs inverses (INVERSE_PERMUTATIONS[s][PERMUTATIONS[s][i]] == i)
+PERMUTATIONS: tuple[tuple[int, ...], ...] = _build_permutations()
+INVERSE_PERMUTATIONS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(sorted(range(BOARD_SIZE), key=permutation.__getitem__)) for permutation in PERMUTATIONS
+)
+
+# Symétrie inverse de chaque symétrie
+INVERSE_SYMMETRIES: tuple[int, ...] = tuple(PERMUTATIONS.index(inverse) for inverse in INVERSE_PERMUTATIONS)
+
+# Clés de Zobrist des pions après transformation, indexées par symétrie, joueur puis case d'origine
+PERMUTED_PIECE_KEYS: tuple[tuple[tuple[int, ...], ...], ...] = tuple(
+    tuple(tuple(PIECE_KEYS[player][target] for target in permutation) for player in (PLAYER1, PLAYER2))
+    for permutation in PERMUTATIONS
+)
+
+
+def transform_move(index: int, symmetry: int) -> int:
+    """
+    Calcule l'image d'une case par une symétrie.
+
+    Args:
+        index (int): L'indice de la case.
+        symmetry (int): La symétrie (0 à 7).
+
+    Returns:
+        int: L'indice de la case transformée.
+    """
+    return PERMUTATIONS[symmetry][index]
+
+
+def inverse_move(index: int, symmetry: int) -> int:
+    """
+    Calcule l'antécédent d'une case par une symétrie (ramène un coup de l'orientation transformée à l'originale).
+
+    Args:
+        index (int): L'indice de la case transformée.
+        symmetry (int): La symétrie (0 à 7).
+
+    Returns:
+        int: L'indice de la case d'origine.
+    """
+    return INVERSE_PERMUTATIONS[symmetry][index]
+
+
+def transform_board(board: Board, symmetry: int) -> Board:
+    """
+    Crée le plateau transformé par une symétrie (captures, trait et vainqueur inchangés).
+
+    Args:
+        board (Board): Le plateau.
+        symmetry (int): La symétrie (0 à 7).
+
+    Returns:
+        Board: Le plateau transformé, avec son empreinte.
+
+    Raises:
+        ValueError: Si la symétrie n'existe pas.
+    """
+    if not isinstance(symmetry, int) or not 0 <= symmetry < SYMMETRIES:
+        raise ValueError(f"La symétrie doit être un entier compris entre 0 et {SYMMETRIES - 1}.")
+
+    permutation = PERMUTATIONS[symmetry]
+    transformed = board.copy()
+    for player in (PLAYER1, PLAYER2):
+        keys, permuted_keys = PIECE_KEYS[player], PERMUTED_PIECE_KEYS[symmetry][player]
+        bitboard = 0
+        for index in iterate_bits(board.bitboards[player]):
+            bitboard |= 1 << permutation[index]
+            transformed.hash ^= keys[index] ^ permuted_keys[index]
+        transformed.bitboards[player] = bitboard
+    return transformed
+
+
+def symmetric_hashes(board: Board) -> tuple[int, ...]:
+    """
+    Calcule les empreintes de Zobrist des 8 orientations d'une position.
+
+    Args:
+        board (Board): Le plateau.
+
+    Returns:
+        tuple[int, ...]: L'empreinte de chaque orientation, indexée par symétrie (l'identité donne `board.hash`).
+    """
+    stones = [tuple(iterate_bits(board.bitboards[player])) for player in (PLAYER1, PLAYER2)]
+
+    # Part de l'empreinte indépendante de l'orientation : captures et trait
+    base = board.hash
+    for player in (PLAYER1, PLAYER2):
+        keys = PIECE_KEYS[player]
+        for index in stones[player]:
+            base ^= keys[index]
+
+    hashes = []
+    for player_keys in PERMUTED_PIECE_KEYS:
+        key = base
+        for player in (PLAYER1, PLAYER2):
+            keys = player_keys[player]
+            for index in stones[player]:
+                key ^= keys[index]
+        hashes.append(key)
+    return tuple(hashes)
+
+
+def canonical_form(board: Board) -> tuple[int, int]:
+    """
+    Calcule l'empreinte canonique d'une position (la plus petite de ses 8 orientations).
+
+    Args:
+        board (Board): Le plateau.
+
+    Returns:
+        tuple[int, int]: L'empreinte canonique et la symétrie qui transforme la position en sa forme canonique
+                         (les coups s'y ramènent avec `transform_move` et en reviennent avec `inverse_move`).
+    """
+    hashes = symmetric_hashes(board)
+    key = min(hashes)
+    return key, hashes.index(key)
+
+
+def canonical_symmetries(board: Board) -> tuple[int, tuple[int, ...]]:
+    """
+    Calcule l'empreinte canonique d'une position et toutes les symétries qui y mènent (plusieurs si la position est
+    elle-même symétrique, comme le pion central de départ).
+
+    Args:
+        board (Board): Le plateau.
+
+    Returns:
+        tuple[int, tuple[int, ...]]: L'empreinte canonique et les symétries correspondantes.
+    """
+    hashes = symmetric_hashes(board)
+    key = min(hashes)
+    return key, tuple(symmetry for symmetry, symmetric_hash in enumerate(hashes) if symmetric_hash == key)
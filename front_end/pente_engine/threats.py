@@ -0,0 +1,405 @@
+"""
+Recherche dans l'espace des menaces (« threat-space search ») : solveur tactique qui ne développe que les coups
+forçants de l'attaquant pour trouver une victoire forcée, par alignement de 5 pions ou par 5 captures.
+
+Coups forçants de l'attaquant :
+- les « quatre » : coups qui menacent de compléter un alignement au coup suivant ;
+- les menaces de capture, lorsqu'une capture de plus lui suffit pour gagner ;
+- les « trois ouverts » : coups qui créent au moins deux fenêtres de 3 pions de même direction passant par la case
+  jouée, donc la menace d'un quatre impossible à parer.
+
+Le défenseur n'examine que les parades pertinentes : les cases de la menace, ses captures (qui peuvent couper une
+ligne ou le mener à la victoire) et, face à un trois, ses propres quatre (contre-menaces). Comme toute recherche de
+ce type, la preuve suppose qu'aucune autre parade n'existe ; elle est exacte pour les quatre et les captures.
+"""
+
+import time
+from typing import NamedTuple
+
+from pente_engine.board import Board
+from pente_engine.incremental import IncrementalEvaluator
+from pente_engine.rules import CAPTURE_PATTERNS, CAPTURES_TO_WIN, LINE_WINDOWS, NEIGHBOUR_MASKS, iterate_bits
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Résultats de la recherche
+NO_FORCED_WIN: int = 0  # Aucune victoire forcée dans la profondeur donnée
+FORCED_WIN: int = 1  # Victoire forcée trouvée (voir `winning_line`)
+UNKNOWN: int = 2  # Budget épuisé avant la fin de la recherche
+
+
+def _build_window_directions() -> tuple[int, ...]:
+    """
+    Précalcule la direction de chaque fenêtre de 5 cases (écart d'indice entre deux cases consécutives).
+
+    Returns:
+        tuple[int, ...]: L'écart d'indice (1, 19, 20 ou 18) de chaque fenêtre de `LINE_WINDOWS`.
+    """
+    directions = []
+    for mask in LINE_WINDOWS:
+        first = (mask & -mask).bit_length() - 1
+        rest = mask ^ (1 << first)
+        directions.append((rest & -rest).bit_length() - 1 - first)
+    return tuple(directions)
+
+
+# Direction de chaque fenêtre de 5 cases
+WINDOW_DIRECTIONS: tuple[int, ...] = _build_window_directions()
+
+
+class ThreatSearchResult(NamedTuple):
+    """Résultat d'une recherche de menaces."""
+
+    # NO_FORCED_WIN, FORCED_WIN ou UNKNOWN
+    status: int
+
+    # Ligne gagnante (coups de l'attaquant et parades du défenseur, en alternance), vide sans victoire forcée
+    winning_line: tuple[int, ...]
+
+    # Profondeur (en coups de l'attaquant) entièrement explorée
+    depth: int
+
+    # Nombre de positions visitées
+    nodes: int
+
+    # Durée de la recherche (en secondes)
+    seconds: float
+
+
+class _BudgetExhausted(Exception):
+    """Levée lorsque le budget de positions ou de temps de la recherche est épuisé."""
+
+
+def capture_moves(board: Board, player: int) -> dict[int, int]:
+    """
+    Liste les coups qui captureraient au moins une paire adverse.
+
+    Args:
+        board (Board): Le plateau.
+        player (int): Le joueur qui capture.
+
+    Returns:
+        dict[int, int]: Le nombre de paires capturées, indexé par case jouée.
+    """
+    own = board.bitboards[player]
+    opponent = board.bitboards[1 - player]
+    occupied = own | opponent
+
+    # Depuis chaque pion du joueur : paire adverse puis case vide (la case qui fermerait la capture).
+    moves: dict[int, int] = {}
+    for index in iterate_bits(own):
+        for pair_mask, closing_bit, _, _ in CAPTURE_PATTERNS[index]:
+            if opponent & pair_mask == pair_mask and not occupied & closing_bit:
+                move = closing_bit.bit_length() - 1
+                moves[move] = moves.get(move, 0) + 1
+    return moves
+
+
+def capture_threat_moves(board: Board, player: int) -> list[int]:
+    """
+    Liste les coups qui créeraient une menace de capture (paire adverse entre le pion joué et une case vide).
+
+    Args:
+        board (Board): Le plateau.
+        player (int): Le joueur qui menace.
+
+    Returns:
+        list[int]: Les indices des cases, par ordre croissant.
+    """
+    opponent = board.bitboards[1 - player]
+    occupied = board.occupied
+
+    moves = []
+    candidates = 0
+    for index in iterate_bits(opponent):
+        candidates |= NEIGHBOUR_MASKS[index]
+    for index in iterate_bits(candidates & ~occupied):
+        for pair_mask, closing_bit, _, _ in CAPTURE_PATTERNS[index]:
+            if opponent & pair_mask == pair_mask and not occupied & closing_bit:
+                moves.append(index)
+                break
+    return moves
+
+
+class ThreatSpaceSearch:
+    """
+    Solveur de victoires forcées par recherche dans l'espace des menaces (recherche ET/OU limitée aux coups
+    forçants), avec approfondissement itératif (la victoire la plus courte est trouvée en premier) et budget de
+    positions et de temps.
+    """
+
+    # Profondeur maximale par défaut (en coups de l'attaquant)
+    DEFAULT_MAX_DEPTH = 8
+
+    # Nombre maximal de positions visitées par défaut
+    DEFAULT_NODE_LIMIT = 20_000
+
+    # Le temps est vérifié toutes les `TIME_CHECK_INTERVAL` positions (puissance de 2 moins 1)
+    TIME_CHECK_INTERVAL = 63
+
+    def __init__(self, max_depth: int = DEFAULT_MAX_DEPTH, node_limit: int = DEFAULT_NODE_LIMIT,
+                 use_threes: bool = True) -> None:
+        """
+        Initialise le solveur.
+
+        Args:
+            max_depth (int): La profondeur maximale (en coups de l'attaquant). Par défaut, 8.
+            node_limit (int): Le nombre maximal de positions visitées. Par défaut, 20 000.
+            use_threes (bool): Si True, les trois ouverts sont des coups forçants. Sinon, seuls les quatre et les
+                               menaces de capture le sont (recherche plus rapide et preuve exacte).
+
+        Raises:
+            ValueError: Si la profondeur ou le budget de positions n'est pas strictement positif.
+        """
+        if max_depth < 1 or node_limit < 1:
+            raise ValueError("La profondeur et le nombre de positions doivent être strictement positifs.")
+
+        self.max_depth = max_depth
+        self.node_limit = node_limit
+        self.use_threes = use_threes
+        self.nodes = 0
+        self._with_threes = False
+        self._deadline: float | None = None
+        self._evaluator = IncrementalEvaluator()
+
+        # Positions sans victoire forcée, avec la profondeur explorée
+        self._failures: dict[int, int] = {}
+
+    def search(self, board: Board, time_budget: float | None = None) -> ThreatSearchResult:
+        """
+        Cherche une victoire forcée pour le joueur au trait.
+
+        Args:
+            board (Board): Le plateau (non modifié).
+            time_budget (float | None): Le temps maximal (en secondes). Par défaut, seul le budget de positions
+                                        s'applique.
+
+        Returns:
+            ThreatSearchResult: La ligne gagnante, ou l'absence de victoire forcée dans la profondeur maximale,
+                                ou UNKNOWN si le budget est épuisé avant.
+
+        Raises:
+            ValueError: Si la partie est terminée.
+        """
+        if board.is_game_over:
+            raise ValueError("La partie est terminée : aucun coup à chercher.")
+
+        start = time.perf_counter()
+        self._deadline = None if time_budget is None else start + time_budget
+        self.nodes = 0
+
+        # Les coups sont joués et défaits sur une copie : un budget épuisé la laisse en cours de ligne.
+        board = board.copy()
+
+        # Première passe avec les quatre et menaces de capture seuls (peu de coups, preuve exacte), puis les trois.
+        status, line, depth_reached = NO_FORCED_WIN, (), 0
+        for with_threes in (False, True) if self.use_threes else (False,):
+            self._with_threes = with_threes
+            self._failures.clear()
+            for depth in range(1, self.max_depth + 1):
+                self._evaluator = IncrementalEvaluator(board)
+                try:
+                    found = self.__attack(board, depth)
+                except _BudgetExhausted:
+                    status = UNKNOWN
+                    break
+
+                depth_reached = depth
+                if found is not None:
+                    status, line = FORCED_WIN, found
+                    break
+
+            if status != NO_FORCED_WIN:
+                break
+
+        return ThreatSearchResult(status, line, depth_reached, self.nodes, time.perf_counter() - start)
+
+    def win_cells(self, board: Board, player: int) -> set[int]:
+        """
+        Liste les cases où le joueur gagnerait immédiatement (alignement de 5 ou 5e capture).
+
+        Args:
+            board (Board): Le plateau, synchronisé avec l'évaluateur interne.
+            player (int): Le joueur.
+
+        Returns:
+            set[int]: Les indices des cases gagnantes.
+        """
+        occupied = board.occupied
+        cells = set()
+        for window in self._evaluator.windows(player, 4):
+            cells.add((LINE_WINDOWS[window] & ~occupied).bit_length() - 1)
+
+        missing_captures = CAPTURES_TO_WIN - board.captures[player]
+        if missing_captures <= 4:
+            for move, pairs in capture_moves(board, player).items():
+                if pairs >= missing_captures:
+                    cells.add(move)
+        return cells
+
+    def __window_cells(self, windows: list[int], occupied: int) -> set[int]:
+        """
+        Rassemble les cases vides d'un ensemble de fenêtres.
+
+        Args:
+            windows (list[int]): Les indices des fenêtres.
+            occupied (int): Le bitboard des cases occupées.
+
+        Returns:
+            set[int]: Les indices des cases vides.
+        """
+        empty = 0
+        for window in windows:
+            empty |= LINE_WINDOWS[window] & ~occupied
+        return set(iterate_bits(empty))
+
+    def __forcing_moves(self, board: Board) -> list[int]:
+        """
+        Liste les coups forçants du joueur au trait : quatre, menaces de capture gagnante, puis trois.
+
+        Args:
+            board (Board): Le plateau.
+
+        Returns:
+            list[int]: Les coups, sans doublon, des plus forçants aux moins forçants.
+        """
+        player = board.to_move
+        occupied = board.occupied
+        moves = sorted(self.__window_cells(self._evaluator.windows(player, 3), occupied))
+
+        if board.captures[player] >= CAPTURES_TO_WIN - 1:
+            moves += capture_threat_moves(board, player)
+
+        if self._with_threes:
+            # Une case qui appartient à deux fenêtres de 2 pions de même direction crée un trois ouvert.
+            seen: set[tuple[int, int]] = set()
+            doubles: set[int] = set()
+            for window in self._evaluator.windows(player, 2):
+                direction = WINDOW_DIRECTIONS[window]
+                for index in iterate_bits(LINE_WINDOWS[window] & ~occupied):
+                    if (index, direction) in seen:
+                        doubles.add(index)
+                    seen.add((index, direction))
+            moves += sorted(doubles)
+
+        return list(dict.fromkeys(moves))
+
+    def __play(self, board: Board, move: int) -> bool:
+        """
+        Joue un coup sur le plateau et met à jour l'évaluateur interne (le coup est défait par `__undo`).
+
+        Args:
+            board (Board): Le plateau.
+            move (int): La case jouée.
+
+        Returns:
+            bool: True si le coup termine la partie, False sinon.
+
+        Raises:
+            _BudgetExhausted: Si le budget de positions ou de temps est épuisé.
+        """
+        self.nodes += 1
+        if self.nodes >= self.node_limit:
+            raise _BudgetExhausted()
+        if (self._deadline is not None and not self.nodes & ThreatSpaceSearch.TIME_CHECK_INTERVAL
+                and time.perf_counter() > self._deadline):
+            raise _BudgetExhausted()
+
+        result = board.play(move)
+        self._evaluator.apply(result)
+        return result.is_win
+
+    def __undo(self, board: Board) -> None:
+        """
+        Défait le dernier coup joué par `__play` sur le plateau et dans l'évaluateur interne.
+
+        Args:
+            board (Board): Le plateau.
+        """
+        board.undo()
+        self._evaluator.undo()
+
+    def __attack(self, board: Board, depth: int) -> tuple[int, ...] | None:
+        """
+        Nœud OU : l'attaquant (au trait) cherche un coup forçant qui gagne contre toutes les parades.
+
+        Args:
+            board (Board): Le plateau.
+            depth (int): Le nombre de coups restants pour l'attaquant.
+
+        Returns:
+            tuple[int, ...] | None: La ligne gagnante, ou None si aucune victoire forcée n'est trouvée.
+        """
+        attacker = board.to_move
+        wins = self.win_cells(board, attacker)
+        if wins:
+            return (min(wins),)
+
+        if depth <= 1 or self._failures.get(board.hash, 0) >= depth:
+            return None
+
+        # Face à une menace adverse, l'attaquant doit parer, et la parade doit elle-même être forçante.
+        defender_wins = self.win_cells(board, 1 - attacker)
+        if len(defender_wins) > 1:
+            moves = []
+        elif defender_wins:
+            moves = list(defender_wins)
+        else:
+            moves = self.__forcing_moves(board)
+
+        for move in moves:
+            if self.__play(board, move):
+                self.__undo(board)
+                return (move,)
+            line = self.__defend(board, depth, move)
+            self.__undo(board)
+            if line is not None:
+                return (move,) + line
+
+        self._failures[board.hash] = depth
+        return None
+
+    def __defend(self, board: Board, depth: int, last_move: int) -> tuple[int, ...] | None:
+        """
+        Nœud ET : le défenseur (au trait) essaie toutes les parades pertinentes à la menace du dernier coup.
+
+        Args:
+            board (Board): Le plateau.
+            depth (int): Le nombre de coups restants pour l'attaquant (dont le dernier coup joué).
+            last_move (int): Le coup forçant de l'attaquant.
+
+        Returns:
+            tuple[int, ...] | None: La ligne gagnante (parade principale et suite), ou None si une parade tient ou
+                                    si le dernier coup n'était pas forçant.
+        """
+        defender = board.to_move
+        attacker = 1 - defender
+        if self.win_cells(board, defender):
+            return None
+
+        occupied = board.occupied
+        responses = self.win_cells(board, attacker)
+        if not responses:
+            # Trois ouvert : au moins deux fenêtres de 3 pions de même direction passant par le dernier coup.
+            last_bit = 1 << last_move
+            threes = [window for window in self._evaluator.windows(attacker, 3) if LINE_WINDOWS[window] & last_bit]
+            directions = [WINDOW_DIRECTIONS[window] for window in threes]
+            if len(set(directions)) == len(directions):
+                return None
+            responses = self.__window_cells(threes, occupied)
+            responses |= self.__window_cells(self._evaluator.windows(defender, 3), occupied)
+        responses |= capture_moves(board, defender).keys()
+
+        principal = None
+        for response in sorted(responses):
+            if self.__play(board, response):
+                self.__undo(board)
+                return None
+            line = self.__attack(board, depth - 1)
+            self.__undo(board)
+            if line is None:
+                return None
+            if principal is None:
+                principal = (response,) + line
+        return principal
@@ -0,0 +1,433 @@
+"""
+Tournoi entre moteurs : des milliers de parties jouées en parallèle dans un `ProcessPoolExecutor`, avec classement
+selon la formule de score du serveur (`calculate_delta` dans `back_end/main.c`).
+
+Exemple (depuis le dossier `front_end`) :
+`python -m pente_engine.tournament alphabeta:depth=2,time=60 mcts:time=0.1 captures --openings 100`
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import combinations
+from typing import Callable, NamedTuple
+
+from pente_engine.board import Board
+from pente_engine.book import read_numbered_games
+from pente_engine.mcts import PLAYOUT_POLICIES, NodeStore, run_playouts
+from pente_engine.rules import BOARD_COLS, BOARD_ROWS, BOARD_SIZE, FIRST_PLAYER, to_index
+from pente_engine.scoring import calculate_delta
+from pente_engine.search import AlphaBetaSearch
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Score initial de chaque moteur (le serveur part de 0, mais sa formule refuse les scores négatifs)
+INITIAL_RATING: int = 1000
+
+# Nombre de coups aléatoires des ouvertures générées par défaut
+DEFAULT_OPENING_MOVES: int = 4
+
+# Nombre maximal de coups d'une ouverture (au-delà, les ouvertures aléatoires terminent trop souvent la partie)
+MAX_OPENING_MOVES: int = 20
+
+# Nombre d'ouvertures par défaut (chaque ouverture est jouée deux fois par paire de moteurs, couleurs inversées)
+DEFAULT_OPENINGS: int = 50
+
+# Graine par défaut (résultats reproductibles)
+DEFAULT_SEED: int = 1
+
+# Sortes de moteurs et leurs options (valeurs par défaut)
+ENGINE_OPTIONS: dict[str, dict[str, float]] = {
+    "random": {},
+    "captures": {},
+    "alphabeta": {"time": 0.1, "depth": AlphaBetaSearch.MAX_DEPTH},
+    "mcts": {"time": 0.1},
+}
+
+
+class EngineSpec(NamedTuple):
+    """Description d'un moteur du tournoi."""
+
+    # Nom du moteur (sa description en ligne de commande, unique dans le tournoi)
+    name: str
+
+    # Sorte de moteur (clé de `ENGINE_OPTIONS`)
+    kind: str
+
+    # Temps de réflexion par coup (en secondes), pour `alphabeta` et `mcts`
+    time: float = 0.0
+
+    # Profondeur maximale, pour `alphabeta`
+    depth: int = 0
+
+
+class GameResult(NamedTuple):
+    """Résultat d'une partie du tournoi."""
+
+    # Numéro de la partie (ordre de planification)
+    index: int
+
+    # Moteur du premier joueur (au trait au début) et du second
+    first: str
+    second: str
+
+    # Moteur vainqueur (None pour une partie nulle)
+    winner: str | None
+
+    # Coups de la partie (ouverture comprise)
+    moves: list[int]
+
+    # Nombre de coups de l'ouverture
+    opening_moves: int
+
+    # Durée de la partie (en secondes)
+    seconds: float
+
+
+def parse_engine(description: str) -> EngineSpec:
+    """
+    Lit la description d'un moteur : `sorte` ou `sorte:option=valeur,...` (ex : `alphabeta:time=0.5,depth=4`).
+
+    Args:
+        description (str): La description.
+
+    Returns:
+        EngineSpec: Le moteur décrit (options absentes : valeurs par défaut de `ENGINE_OPTIONS`).
+
+    Raises:
+        ValueError: Si la sorte de moteur, une option ou sa valeur est invalide.
+    """
+    kind, _, options_text = description.partition(":")
+    if kind not in ENGINE_OPTIONS:
+        raise ValueError(f"Le moteur doit être l'un de : {', '.join(ENGINE_OPTIONS)}.")
+
+    options = dict(ENGINE_OPTIONS[kind])
+    for option in filter(None, options_text.split(",")):
+        key, _, value = option.partition("=")
+        if key not in options:
+            raise ValueError(f"Option inconnue pour le moteur {kind} : {key}.")
+        try:
+            options[key] = float(value)
+        except ValueError:
+            raise ValueError(f"La valeur de l'option {key} doit être un nombre.") from None
+        if options[key] <= 0:
+            raise ValueError(f"La valeur de l'option {key} doit être strictement positive.")
+
+    return EngineSpec(description, kind, options.get("time", 0.0), int(options.get("depth", 0)))
+
+
+def opening_board(opening: list[int]) -> Board:
+    """
+    Rejoue une ouverture depuis le plateau vide.
+
+    Args:
+        opening (list[int]): Les coups de l'ouverture.
+
+    Returns:
+        Board: Le plateau après l'ouverture.
+
+    Raises:
+        ValueError: Si un coup est illégal ou si l'ouverture termine la partie.
+    """
+    board = Board()
+    for index in opening:
+        board.play(index)
+
+    if board.is_game_over:
+        raise ValueError("L'ouverture termine la partie.")
+    return board
+
+
+def random_opening(generator: random.Random, moves: int = DEFAULT_OPENING_MOVES) -> list[int]:
+    """
+    Tire une ouverture au hasard : des coups proches du centre, sans fin de partie (une ouverture qui termine la
+    partie est tirée à nouveau).
+
+    Args:
+        generator (random.Random): Le générateur aléatoire.
+        moves (int): Le nombre de coups. Par défaut, 4.
+
+    Returns:
+        list[int]: Les coups de l'ouverture.
+
+    Raises:
+        ValueError: Si le nombre de coups n'est pas compris entre 0 et `MAX_OPENING_MOVES`.
+    """
+    if not 0 <= moves <= MAX_OPENING_MOVES:
+        raise ValueError(f"Le nombre de coups d'une ouverture doit être compris entre 0 et {MAX_OPENING_MOVES}.")
+
+    center = BOARD_COLS // 2
+    board = Board()
+    opening = []
+    while len(opening) < moves:
+        x = min(BOARD_COLS - 1, max(0, round(generator.gauss(center, 2))))
+        y = min(BOARD_ROWS - 1, max(0, round(generator.gauss(center, 2))))
+        index = to_index(x, y)
+        if not board.is_legal(index):
+            continue
+
+        board.play(index)
+        opening.append(index)
+        if board.is_game_over:
+            board = Board()
+            opening = []
+    return opening
+
+
+def read_openings(path: str, moves: int, count: int) -> list[list[int]]:
+    """
+    Lit les ouvertures d'un fichier de parties (voir `read_numbered_games`) et les vérifie.
+
+    Args:
+        path (str): Le chemin du fichier.
+        moves (int): Le nombre de coups retenus au début de chaque partie.
+        count (int): Le nombre maximal d'ouvertures.
+
+    Returns:
+        list[list[int]]: Les ouvertures.
+
+    Raises:
+        ValueError: Si une ligne contient autre chose que des indices de case, un coup illégal, ou si
+                    l'ouverture termine la partie.
+    """
+    openings = []
+    for line_number, game in read_numbered_games(path)[:count]:
+        try:
+            opening_board(game[:moves])
+        except ValueError as error:
+            raise ValueError(f"La ligne {line_number} de {path} n'est pas une ouverture valide : {error}") from None
+        openings.append(game[:moves])
+    return openings
+
+
+def _make_player(engine: EngineSpec, generator: random.Random) -> Callable[[Board], int]:
+    """
+    Crée la fonction de choix des coups d'un moteur, pour une partie.
+
+    Args:
+        engine (EngineSpec): Le moteur.
+        generator (random.Random): Le générateur aléatoire de la partie.
+
+    Returns:
+        Callable[[Board], int]: La fonction qui choisit le coup à jouer sur un plateau.
+    """
+    if engine.kind == "alphabeta":
+        # Une recherche par partie : sa table de transposition ne dépend que des coups de la partie.
+        search = AlphaBetaSearch()
+        return lambda board: search.search(board, engine.time, engine.depth).best_move
+
+    if engine.kind == "mcts":
+        policy = PLAYOUT_POLICIES["captures"]
+
+        def play_mcts(board: Board) -> int:
+            store = NodeStore()
+            run_playouts(store, board, time.perf_counter() + engine.time, policy, generator)
+            statistics = store.root_statistics()
+            if not statistics:
+                # Aucune simulation dans le temps imparti : coup de la politique de simulation.
+                return policy(board, generator)
+            return max(statistics, key=lambda move: statistics[move][0])
+
+        return play_mcts
+
+    policy = PLAYOUT_POLICIES[engine.kind]
+    return lambda board: policy(board, generator)
+
+
+def play_game(index: int, first: EngineSpec, second: EngineSpec, opening: list[int], seed: int,
+              max_moves: int = BOARD_SIZE) -> GameResult:
+    """
+    Joue une partie entre deux moteurs, à partir d'une ouverture.
+
+    Args:
+        index (int): Le numéro de la partie.
+        first (EngineSpec): Le moteur du premier joueur.
+        second (EngineSpec): Le moteur du second joueur.
+        opening (list[int]): Les coups de l'ouverture.
+        seed (int): La graine du générateur aléatoire de la partie.
+        max_moves (int): Le nombre maximal de coups (au-delà, la partie est nulle). Par défaut, 361.
+
+    Returns:
+        GameResult: Le résultat de la partie.
+    """
+    start = time.perf_counter()
+    generator = random.Random(seed)
+    engines = {FIRST_PLAYER: first, 1 - FIRST_PLAYER: second}
+    players = {player: _make_player(engine, generator) for player, engine in engines.items()}
+
+    board = opening_board(opening)
+    moves = list(opening)
+
+    while not board.is_game_over and board.move_count < max_moves:
+        move = players[board.to_move](board)
+        board.play(move)
+        moves.append(move)
+
+    winner = engines[board.winner].name if board.winner is not None else None
+    return GameResult(index, first.name, second.name, winner, moves, len(opening), time.perf_counter() - start)
+
+
+def schedule_games(engines: list[EngineSpec], openings: list[list[int]],
+                   seed: int = DEFAULT_SEED) -> list[tuple[int, EngineSpec, EngineSpec, list[int], int]]:
+    """
+    Planifie un tournoi toutes rondes : chaque paire de moteurs joue chaque ouverture deux fois, couleurs inversées.
+
+    Args:
+        engines (list[EngineSpec]): Les moteurs.
+        openings (list[list[int]]): Les ouvertures.
+        seed (int): La graine du tournoi (chaque partie reçoit sa propre graine, dérivée de celle-ci).
+
+    Returns:
+        list[tuple]: Pour chaque partie : son numéro, ses deux moteurs, son ouverture et sa graine.
+    """
+    games = []
+    for first, second in combinations(engines, 2):
+        for opening in openings:
+            for pair in ((first, second), (second, first)):
+                index = len(games)
+                games.append((index, *pair, opening, seed * 1_000_003 + index))
+    return games
+
+
+def compute_ratings(engines: list[EngineSpec], results: list[GameResult]) -> dict[str, dict]:
+    """
+    Calcule le classement : scores (formule du serveur, parties prises dans l'ordre de planification, pour un
+    résultat indépendant de l'ordre de fin des parties ; pas de score négatif), victoires, défaites et parties
+    nulles.
+
+    Args:
+        engines (list[EngineSpec]): Les moteurs.
+        results (list[GameResult]): Les résultats des parties.
+
+    Returns:
+        dict[str, dict]: Les statistiques de chaque moteur, du mieux classé au moins bien classé.
+    """
+    standings = {engine.name: {"rating": INITIAL_RATING, "games": 0, "wins": 0, "losses": 0, "draws": 0}
+                 for engine in engines}
+    for result in sorted(results, key=lambda game: game.index):
+        for name in (result.first, result.second):
+            standings[name]["games"] += 1
+        if result.winner is None:
+            standings[result.first]["draws"] += 1
+            standings[result.second]["draws"] += 1
+            continue
+
+        loser = result.second if result.winner == result.first else result.first
+        winner_stats, loser_stats = standings[result.winner], standings[loser]
+        # Ordre de la documentation du serveur (et de `forfeit_game`) : le score du gagnant, puis celui du perdant.
+        delta = calculate_delta(sg=winner_stats["rating"], sp=loser_stats["rating"])
+        winner_stats["rating"] += delta
+        winner_stats["wins"] += 1
+        loser_stats["rating"] = max(0, loser_stats["rating"] - delta)
+        loser_stats["losses"] += 1
+
+    return dict(sorted(standings.items(), key=lambda item: item[1]["rating"], reverse=True))
+
+
+def run_tournament(engines: list[EngineSpec], openings: list[list[int]], output_path: str | None = None,
+                   workers: int | None = None, seed: int = DEFAULT_SEED, max_moves: int = BOARD_SIZE) -> dict:
+    """
+    Joue le tournoi en parallèle ; chaque résultat est écrit dès la fin de sa partie (une ligne JSON par partie).
+
+    Les résultats sont reproductibles pour une même graine si les moteurs sont limités en profondeur (avec un
+    temps de réflexion largement suffisant) plutôt qu'en temps.
+
+    Args:
+        engines (list[EngineSpec]): Les moteurs (au moins deux, de noms distincts).
+        openings (list[list[int]]): Les ouvertures.
+        output_path (str | None): Le fichier des résultats (JSON Lines). Par défaut, aucun.
+        workers (int | None): Le nombre de processus. Par défaut, le nombre de cœurs.
+        seed (int): La graine du tournoi.
+        max_moves (int): Le nombre maximal de coups par partie. Par défaut, 361.
+
+    Returns:
+        dict: Le classement, le nombre de parties, la durée et le débit (parties par minute).
+
+    Raises:
+        ValueError: Si les moteurs ou les ouvertures sont invalides (coup illégal, ou partie terminée).
+    """
+    if len(engines) < 2 or len({engine.name for engine in engines}) != len(engines):
+        raise ValueError("Le tournoi doit opposer au moins deux moteurs distincts.")
+
+    if not openings:
+        raise ValueError("Le tournoi doit compter au moins une ouverture.")
+
+    # Vérifiées avant de planifier : une ouverture invalide interromprait le tournoi en cours de route.
+    for number, opening in enumerate(openings, 1):
+        try:
+            opening_board(opening)
+        except ValueError as error:
+            raise ValueError(f"L'ouverture {number} n'est pas valide : {error}") from None
+
+    games = schedule_games(engines, openings, seed)
+    workers = workers or os.cpu_count() or 1
+    results = []
+    start = time.perf_counter()
+    output_file = open(output_path, "w", encoding="utf-8") if output_path else None
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(play_game, *game, max_moves) for game in games]
+            for future in as_completed(futures):
+                result = future.result()
+                results.append(result)
+                if output_file is not None:
+                    output_file.write(json.dumps(result._asdict()) + "\n")
+                    output_file.flush()
+    finally:
+        if output_file is not None:
+            output_file.close()
+    seconds = time.perf_counter() - start
+
+    return {
+        "standings": compute_ratings(engines, results),
+        "games": len(results),
+        "workers": workers,
+        "seconds": seconds,
+        "games_per_minute": 60 * len(results) / seconds if seconds else 0.0,
+    }
+
+
+def main() -> None:
+    """
+    Point d'entrée en ligne de commande du tournoi.
+    """
+    parser = argparse.ArgumentParser(description="Tournoi entre moteurs de Pente.")
+    parser.add_argument("engines", nargs="+",
+                        help=f"Moteurs : sorte[:option=valeur,...], sortes : {', '.join(ENGINE_OPTIONS)} "
+                             "(ex : alphabeta:time=0.5,depth=4).")
+    parser.add_argument("--openings", type=int, default=DEFAULT_OPENINGS,
+                        help="Nombre d'ouvertures aléatoires (chacune jouée deux fois par paire de moteurs).")
+    parser.add_argument("--opening-moves", type=int, default=DEFAULT_OPENING_MOVES,
+                        help=f"Nombre de coups de chaque ouverture (de 0 à {MAX_OPENING_MOVES}).")
+    parser.add_argument("--openings-file", type=str, default=None,
+                        help="Fichier d'ouvertures (une partie par ligne, indices de case) au lieu d'ouvertures "
+                             "aléatoires.")
+    parser.add_argument("--max-moves", type=int, default=BOARD_SIZE, help="Nombre maximal de coups par partie.")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (par défaut, les cœurs).")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Graine du tournoi.")
+    parser.add_argument("--output", type=str, default=None, help="Fichier JSON Lines des résultats des parties.")
+    args = parser.parse_args()
+
+    if not 0 <= args.opening_moves <= MAX_OPENING_MOVES:
+        parser.error(f"Le nombre de coups d'une ouverture doit être compris entre 0 et {MAX_OPENING_MOVES}.")
+
+    try:
+        engines = [parse_engine(description) for description in args.engines]
+        if args.openings_file:
+            openings = read_openings(args.openings_file, args.opening_moves, args.openings)
+        else:
+            generator = random.Random(args.seed)
+            openings = [random_opening(generator, args.opening_moves) for _ in range(args.openings)]
+        result = run_tournament(engines, openings, args.output, args.workers, args.seed, args.max_moves)
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(json.dumps(result, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+from array import array
+from typing import NamedTuple
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Types de valeur stockée
+EXACT: int = 0
+LOWER_BOUND: int = 1  # La valeur réelle est au moins égale (coupure bêta)
+UPPER_BOUND: int = 2  # La valeur réelle est au plus égale (aucun coup n'a dépassé alpha)
+
+# Case sans meilleur coup
+NO_MOVE: int = -1
+
+
+class TranspositionEntry(NamedTuple):
+    """Entrée de la table de transposition."""
+
+    # Profondeur de recherche ayant produit la valeur
+    depth: int
+
+    # Valeur de la position (du point de vue du joueur au trait)
+    value: int
+
+    # Type de valeur (EXACT, LOWER_BOUND ou UPPER_BOUND)
+    flag: int
+
+    # Meilleur coup trouvé (NO_MOVE si aucun)
+    best_move: int
+
+
+class TranspositionTable:
+    """
+    Table de transposition de taille fixe, indexée par les empreintes de Zobrist, avec remplacement par profondeur.
+
+    Les entrées sont stockées dans des tableaux typés (`array`) préalloués : l'empreinte mémoire est fixée à la
+    création (17 octets par entrée) et ne grossit jamais. Une entrée n'est remplacée que par une recherche
+    au moins aussi profonde, sauf si elle provient d'une recherche précédente (voir `new_search`).
+    """
+
+    # Taille par défaut (nombre d'entrées, puissance de 2)
+    DEFAULT_SIZE = 1 << 18
+
+    def __init__(self, size: int = DEFAULT_SIZE) -> None:
+        """
+        Alloue la table.
+
+        Args:
+            size (int): Le nombre d'entrées, arrondi à la puissance de 2 inférieure. Par défaut, 262 144.
+
+        Raises:
+            ValueError: Si la taille n'est pas un entier strictement positif.
+        """
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError("La taille de la table de transposition doit être un entier strictement positif.")
+
+        self.size = 1 << (size.bit_length() - 1)
+        self._mask = self.size - 1
+        self.__allocate()
+
+    def __allocate(self) -> None:
+        """
+        Alloue (ou réalloue) les tableaux des entrées et remet les statistiques à zéro.
+        """
+        self._keys = array("Q", bytes(8 * self.size))
+        self._values = array("i", bytes(4 * self.size))
+        self._best_moves = array("h", [NO_MOVE]) * self.size
+        self._depths = array("b", [-1]) * self.size  # -1 : case vide
+        self._flags = array("B", bytes(self.size))
+        self._generations = array("B", bytes(self.size))
+        self._generation = 0
+
+        # Statistiques
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.replacements = 0
+        self.rejections = 0
+
+    def new_search(self) -> None:
+        """
+        Signale le début d'une nouvelle recherche : les entrées des recherches précédentes deviennent remplaçables
+        quelle que soit leur profondeur (elles restent lisibles tant qu'elles ne sont pas remplacées).
+        """
+        self._generation = (self._generation + 1) & 0xFF
+
+    def clear(self) -> None:
+        """
+        Vide la table et remet les statistiques à zéro.
+        """
+        self.__allocate()
+
+    def probe(self, key: int) -> TranspositionEntry | None:
+        """
+        Cherche une position dans la table.
+
+        Args:
+            key (int): L'empreinte de Zobrist de la position.
+
+        Returns:
+            TranspositionEntry | None: L'entrée si la position est présente, None sinon.
+        """
+        slot = key & self._mask
+        if self._depths[slot] >= 0 and self._keys[slot] == key:
+            self.hits += 1
+            return TranspositionEntry(self._depths[slot], self._values[slot], self._flags[slot], self._best_moves[slot])
+
+        self.misses += 1
+        return None
+
+    def store(self, key: int, depth: int, value: int, flag: int, best_move: int = NO_MOVE) -> bool:
+        """
+        Enregistre le résultat de la recherche d'une position, selon la politique de remplacement par profondeur.
+
+        Args:
+            key (int): L'empreinte de Zobrist de la position.
+            depth (int): La profondeur de recherche (0 à 127).
+            value (int): La valeur de la position.
+            flag (int): Le type de valeur (EXACT, LOWER_BOUND ou UPPER_BOUND).
+            best_move (int): Le meilleur coup. Par défaut, NO_MOVE.
+
+        Returns:
+            bool: True si l'entrée a été enregistrée, False si une entrée plus profonde a été conservée.
+        """
+        slot = key & self._mask
+        stored_depth = self._depths[slot]
+
+        if stored_depth >= 0:
+            # Une entrée plus profonde de la recherche en cours est plus précieuse : elle est conservée.
+            if depth < stored_depth and self._generations[slot] == self._generation:
+                self.rejections += 1
+                return False
+            if self._keys[slot] != key:
+                self.replacements += 1
+
+        self._keys[slot] = key
+        self._depths[slot] = min(depth, 127)
+        self._values[slot] = value
+        self._flags[slot] = flag
+        self._best_moves[slot] = best_move
+        self._generations[slot] = self._generation
+        self.stores += 1
+        return True
+
+    def usage(self) -> float:
+        """
+        Calcule le taux de remplissage de la table.
+
+        Returns:
+            float: La proportion d'entrées occupées (entre 0 et 1).
+        """
+        return sum(1 for depth in self._depths if depth >= 0) / self.size
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Récupère les statistiques d'utilisation de la table.
+
+        Returns:
+            dict[str, int | float]: Succès et échecs de lecture, écritures, remplacements, rejets et remplissage.
+        """
+        probes = self.hits + self.misses
+        return {
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "stores": self.stores,
+            "replacements": self.replacements,
+            "rejections": self.rejections,
+            "usage": self.usage(),
+        }
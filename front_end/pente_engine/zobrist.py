@@ -0,0 +1,79 @@
+"""
+Clés de Zobrist du plateau : une clé aléatoire de 64 bits par (joueur, case), par (joueur, nombre de captures) et
+pour le joueur au trait. L'empreinte d'une position est le XOR des clés qui la décrivent, ce qui permet de la mettre
+à jour à chaque pose ou capture en une opération.
+"""
+
+import random
+
+from pente_engine.rules import BOARD_SIZE, CAPTURES_TO_WIN, PLAYER1, PLAYER2
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Graine fixe : les empreintes sont identiques d'une exécution à l'autre (livre d'ouvertures, caches sur disque)
+ZOBRIST_SEED: int = 0x50E7E
+
+# Un coup capture au plus 8 paires : le compteur peut dépasser le seuil de victoire
+MAX_CAPTURE_COUNT: int = CAPTURES_TO_WIN + 8
+
+
+def _build_keys() -> tuple[tuple[tuple[int, ...], ...], tuple[tuple[int, ...], ...], int]:
+    """
+    Tire les clés de Zobrist avec la graine fixe.
+
+    Returns:
+        tuple: Les clés des pions (par joueur puis par case), des captures (par joueur puis par nombre) et du trait.
+    """
+    generator = random.Random(ZOBRIST_SEED)
+    piece_keys = tuple(
+        tuple(generator.getrandbits(64) for _ in range(BOARD_SIZE)) for _ in (PLAYER1, PLAYER2)
+    )
+    # Aucune capture correspond à la clé nulle : un plateau vide a une empreinte nulle (au trait près).
+    capture_keys = tuple(
+        (0,) + tuple(generator.getrandbits(64) for _ in range(MAX_CAPTURE_COUNT)) for _ in (PLAYER1, PLAYER2)
+    )
+    side_key = generator.getrandbits(64)
+    return piece_keys, capture_keys, side_key
+
+
+# Clés précalculées (tirées une seule fois à l'import)
+PIECE_KEYS, CAPTURE_KEYS, SIDE_KEY = _build_keys()
+
+
+def capture_key(player: int, count: int) -> int:
+    """
+    Récupère la clé d'un nombre de captures.
+
+    Args:
+        player (int): Le joueur.
+        count (int): Le nombre de captures du joueur.
+
+    Returns:
+        int: La clé (nulle pour zéro capture).
+    """
+    return CAPTURE_KEYS[player][min(count, MAX_CAPTURE_COUNT)]
+
+
+def compute_hash(bitboards: list[int], captures: list[int], to_move: int) -> int:
+    """
+    Calcule l'empreinte complète d'une position (sert de référence aux mises à jour incrémentales).
+
+    Args:
+        bitboards (list[int]): Les bitboards des deux joueurs.
+        captures (list[int]): Le nombre de captures des deux joueurs.
+        to_move (int): Le joueur au trait.
+
+    Returns:
+        int: L'empreinte de la position sur 64 bits.
+    """
+    key = SIDE_KEY if to_move == PLAYER1 else 0
+    for player in (PLAYER1, PLAYER2):
+        stones = bitboards[player]
+        keys = PIECE_KEYS[player]
+        while stones:
+            lowest = stones & -stones
+            key ^= keys[lowest.bit_length() - 1]
+            stones ^= lowest
+        key ^= capture_key(player, captures[player])
+    return key
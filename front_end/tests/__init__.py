@@ -0,0 +1,3 @@
+"""
+Tests du client et du moteur (depuis le dossier `front_end` : `python -m pytest tests`).
+"""
@@ -0,0 +1,21 @@
+import pytest
+
+from pente_engine.benchmark import generate_games
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Nombre de parties aléatoires et graine des tests (parties reproductibles)
+TEST_GAMES: int = 20
+TEST_SEED: int = 7
+
+
+@pytest.fixture(scope="session")
+def games() -> list[list[int]]:
+    """
+    Parties aléatoires complètes, jouées près du centre (alignements et captures fréquents).
+
+    Returns:
+        list[list[int]]: Les coups de chaque partie.
+    """
+    return generate_games(TEST_GAMES, TEST_SEED)
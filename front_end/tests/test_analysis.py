@@ -0,0 +1,155 @@
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from pente_engine.analysis import PREDICTION_DEPTH, AnalysisUpdate, BackgroundAnalyzer
+from pente_engine.board import Board
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Nombre de coups joués avant la position analysée
+OPENING_MOVES: int = 12
+
+# Délai maximal d'attente d'un résultat du processus d'analyse (en secondes)
+TIMEOUT_SECONDS: float = 10.0
+
+# Délai laissé au processus d'analyse pour terminer la réflexion anticipée (en secondes)
+PONDER_SECONDS: float = 1.0
+
+
+@pytest.fixture
+def analyzer() -> Iterator[BackgroundAnalyzer]:
+    """
+    Analyseur limité à la profondeur de prédiction : la réflexion anticipée se termine en quelques millisecondes.
+
+    Yields:
+        BackgroundAnalyzer: L'analyseur (arrêté à la fin du test).
+    """
+    analyzer = BackgroundAnalyzer(max_depth=PREDICTION_DEPTH, analysis_seconds=TIMEOUT_SECONDS)
+    yield analyzer
+    analyzer.shutdown()
+
+
+@pytest.fixture
+def position(games: list[list[int]]) -> Board:
+    """
+    Position de milieu de partie, partie en cours.
+
+    Returns:
+        Board: Le plateau après les premiers coups de la première partie assez longue.
+    """
+    for moves in games:
+        board = Board()
+        for index in moves[:OPENING_MOVES]:
+            board.play(index)
+        if not board.is_game_over:
+            return board
+    pytest.fail("Aucune partie assez longue.")
+
+
+def wait_update(analyzer: BackgroundAnalyzer, depth: int) -> AnalysisUpdate:
+    """
+    Attend le premier résultat de l'analyse en cours qui atteint la profondeur donnée.
+
+    Args:
+        analyzer (BackgroundAnalyzer): L'analyseur.
+        depth (int): La profondeur attendue.
+
+    Returns:
+        AnalysisUpdate: Le résultat.
+    """
+    deadline = time.perf_counter() + TIMEOUT_SECONDS
+    while time.perf_counter() < deadline:
+        update = analyzer.poll()
+        if update is not None and update.depth >= depth:
+            return update
+        time.sleep(0.005)
+    pytest.fail("Aucun résultat du processus d'analyse.")
+
+
+def ponder(analyzer: BackgroundAnalyzer, board: Board) -> int:
+    """
+    Lance la réflexion anticipée et attend la prédiction de la réponse adverse, puis la fin de l'analyse d'avance.
+
+    Args:
+        analyzer (BackgroundAnalyzer): L'analyseur.
+        board (Board): Le plateau, adversaire au trait.
+
+    Returns:
+        int: La réponse adverse prédite.
+    """
+    analyzer.ponder(board)
+    prediction = wait_update(analyzer, PREDICTION_DEPTH).best_move
+    time.sleep(PONDER_SECONDS)
+    return prediction
+
+
+def test_predicted_reply_is_answered_from_ponder(analyzer: BackgroundAnalyzer, position: Board) -> None:
+    """
+    Si l'adversaire joue la réponse prédite, la position suivante est comptée comme prédite et son premier
+    résultat est celui de l'analyse d'avance, renvoyé aussitôt (durée nulle) à la profondeur déjà atteinte.
+    """
+    prediction = ponder(analyzer, position)
+    assert position.is_legal(prediction)
+
+    position.play(prediction)
+    analyzer.analyse(position)
+    update = wait_update(analyzer, 1)
+
+    assert analyzer.ponder_stats() == {"hits": 1, "misses": 0, "hit_rate": 1.0}
+    assert update.generation == analyzer.generation
+    assert update.seconds == 0.0
+    assert update.depth == PREDICTION_DEPTH
+    assert position.is_legal(update.best_move)
+
+
+def test_other_reply_is_a_miss(analyzer: BackgroundAnalyzer, position: Board) -> None:
+    """
+    Si l'adversaire joue un autre coup, la position suivante est comptée comme mal prédite et analysée depuis
+    le début (le résultat de l'analyse d'avance n'est pas renvoyé).
+    """
+    prediction = ponder(analyzer, position)
+    reply = next(index for index in position.legal_moves() if index != prediction)
+
+    position.play(reply)
+    analyzer.analyse(position)
+    update = wait_update(analyzer, 1)
+
+    assert analyzer.ponder_stats() == {"hits": 0, "misses": 1, "hit_rate": 0.0}
+    assert update.seconds > 0.0
+    assert position.is_legal(update.best_move)
+
+
+def test_prediction_is_scored_by_cancel(analyzer: BackgroundAnalyzer, position: Board) -> None:
+    """
+    Une position atteinte transmise à `cancel` (ni indice ni évaluation demandés) juge la prédiction : la demande
+    de réflexion anticipée suivante, après le coup du joueur, n'est pas comptée comme mal prédite, et le résultat
+    d'avance reste disponible pour une analyse de la position prédite.
+    """
+    prediction = ponder(analyzer, position)
+    position.play(prediction)
+    analyzer.cancel(position)
+
+    analyzer.analyse(position)
+    update = wait_update(analyzer, 1)
+    assert update.seconds == 0.0 and update.depth == PREDICTION_DEPTH
+
+    position.play(update.best_move)
+    ponder(analyzer, position)
+    assert analyzer.ponder_stats() == {"hits": 1, "misses": 0, "hit_rate": 1.0}
+
+
+def test_ponder_cancel_ponder(analyzer: BackgroundAnalyzer, position: Board) -> None:
+    """
+    Réflexion anticipée, réponse prédite jouée puis transmise à `cancel`, coup du joueur et nouvelle réflexion
+    anticipée (déroulement du client sans indice ni évaluation) : la prédiction est comptée comme réussie.
+    """
+    prediction = ponder(analyzer, position)
+    position.play(prediction)
+    analyzer.cancel(position)
+
+    position.play(next(iter(position.legal_moves())))
+    ponder(analyzer, position)
+    assert analyzer.ponder_stats() == {"hits": 1, "misses": 0, "hit_rate": 1.0}
@@ -0,0 +1,143 @@
+import time
+
+import pytest
+
+from pente_engine.anytime import AnytimeSearch
+from pente_engine.board import Board
+from pente_engine.search import SearchResult
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Nombre de coups joués avant les positions cherchées
+OPENING_MOVES: int = 12
+
+# Budget d'une recherche longue, jamais atteint dans les tests (en secondes)
+LONG_BUDGET: float = 60.0
+
+# Délai maximal d'attente de l'arrêt d'une recherche (en secondes)
+STOP_TIMEOUT: float = 1.0
+
+
+@pytest.fixture
+def positions(games: list[list[int]]) -> list[Board]:
+    """
+    Positions de milieu de partie, parties en cours.
+
+    Returns:
+        list[Board]: Les plateaux après les premiers coups de chaque partie assez longue.
+    """
+    boards = []
+    for moves in games:
+        board = Board()
+        for index in moves[:OPENING_MOVES]:
+            board.play(index)
+        if not board.is_game_over:
+            boards.append(board)
+    return boards
+
+
+def assert_legal(board: Board, result: SearchResult) -> None:
+    """
+    Vérifie qu'un résultat est jouable sur le plateau : meilleur coup légal et variante principale légale, qui
+    commence par le meilleur coup.
+
+    Args:
+        board (Board): Le plateau cherché.
+        result (SearchResult): Le résultat.
+    """
+    assert board.is_legal(result.best_move)
+    assert not result.principal_variation or result.principal_variation[0] == result.best_move
+    variation = board.copy()
+    for index in result.principal_variation:
+        assert variation.is_legal(index), f"Variante principale illégale : {result.principal_variation}."
+        variation.play(index)
+
+
+def test_cancel_stops_the_search(positions: list[Board]) -> None:
+    """
+    `cancel` arrête une recherche longue : elle renvoie le résultat de sa dernière itération terminée, et les
+    résultats progressifs sont jouables.
+    """
+    updates = []
+    search = AnytimeSearch(on_progress=updates.append)
+    for board in positions[:3]:
+        updates.clear()
+        search.start(board, LONG_BUDGET)
+        time.sleep(0.1)
+        search.cancel()
+        result = search.wait(STOP_TIMEOUT)
+
+        assert result is not None and not search.is_running
+        assert result.depth >= 1 and result.seconds < LONG_BUDGET
+        for update in updates + [result]:
+            assert_legal(board, update)
+
+
+def test_start_does_not_wait_for_the_previous_search(positions: list[Board]) -> None:
+    """
+    `start` rend la main sans attendre l'arrêt de la recherche en cours, dont les résultats sont ensuite ignorés.
+    """
+    first, second = positions[:2]
+    updates = []
+    search = AnytimeSearch(on_progress=updates.append)
+    search.start(first, LONG_BUDGET)
+    time.sleep(0.1)
+
+    start = time.perf_counter()
+    search.start(second, LONG_BUDGET, max_depth=2)
+    assert time.perf_counter() - start < 0.05
+    updates.clear()
+
+    result = search.wait(5 * STOP_TIMEOUT)
+    assert result is not None and result.depth == 2
+    assert search.poll().depth == 2
+    for update in updates + [result]:
+        assert_legal(second, update)
+
+
+def test_cancel_before_the_search_starts(positions: list[Board]) -> None:
+    """
+    Une recherche interrompue aussitôt demandée s'arrête sans être relancée (aucun résultat n'est exigé).
+    """
+    search = AnytimeSearch()
+    for board in positions[:3]:
+        search.start(board, LONG_BUDGET)
+        search.cancel()
+        search.wait(STOP_TIMEOUT)
+        assert not search.is_running
+
+
+def test_set_deadline_shortens_the_search(positions: list[Board]) -> None:
+    """
+    `set_deadline` avance l'échéance d'une recherche longue, qu'elle soit déjà lancée ou encore en attente.
+    """
+    search = AnytimeSearch()
+    for delay in (0.0, 0.1):
+        search.start(positions[0], LONG_BUDGET)
+        time.sleep(delay)
+        start = time.perf_counter()
+        search.set_deadline(0.1)
+        result = search.wait(STOP_TIMEOUT)
+
+        assert result is not None and not search.is_running
+        assert time.perf_counter() - start < 0.5
+        assert_legal(positions[0], result)
+
+
+def test_invalid_requests_are_rejected(positions: list[Board]) -> None:
+    """
+    Une partie terminée ou des paramètres invalides sont refusés avant le démarrage de la recherche.
+    """
+    board = Board()
+    for index in (0, 95, 1, 96, 2, 97, 3, 98, 4):
+        board.play(index)
+    search = AnytimeSearch()
+
+    with pytest.raises(ValueError):
+        search.start(board)
+    with pytest.raises(ValueError):
+        search.start(positions[0], time_budget=0.0)
+    with pytest.raises(ValueError):
+        search.start(positions[0], max_depth=0)
+    assert not search.is_running and search.generation == 0
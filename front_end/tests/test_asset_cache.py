@@ -0,0 +1,124 @@
+import json
+import os
+import pickle
+from pathlib import Path
+
+import pygame
+import pytest
+
+from classes.AssetCache import AssetCache
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Taille de l'image source et tailles demandées pendant et après la préparation en arrière-plan
+SOURCE_SIZE: tuple[int, int] = (64, 48)
+WARM_UP_SIZE: tuple[int, int] = (32, 24)
+LATER_SIZE: tuple[int, int] = (20, 15)
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> AssetCache:
+    """
+    Cache d'une image source unie, avec un thème et un dossier de cache temporaires.
+
+    Returns:
+        AssetCache: Le cache (vide).
+    """
+    image = pygame.Surface(SOURCE_SIZE, pygame.SRCALPHA)
+    image.fill((200, 120, 40, 255))
+    image_path = tmp_path / "image.png"
+    pygame.image.save(image, str(image_path))
+
+    theme_path = tmp_path / "theme.json"
+    theme_path.write_text("{}")
+    return AssetCache(str(theme_path), {"image": str(image_path)}, str(tmp_path / "cache"))
+
+
+def reopen(cache: AssetCache) -> AssetCache:
+    """
+    Ouvre un nouveau cache sur les mêmes fichiers et charge le cache disque (comme au lancement suivant du client).
+
+    Args:
+        cache (AssetCache): Le cache d'origine.
+
+    Returns:
+        AssetCache: Le nouveau cache.
+    """
+    reopened = AssetCache(cache.theme_path, cache.image_paths, cache.cache_dir)
+    assert reopened.load()
+    return reopened
+
+
+def test_warm_up_is_saved(cache: AssetCache) -> None:
+    """
+    Les images préparées en arrière-plan sont enregistrées à la fin de la préparation.
+    """
+    cache.warm_up_async([("image", WARM_UP_SIZE)])
+    cache.wait()
+
+    assert ("image", *WARM_UP_SIZE) in reopen(cache)._entries
+
+
+def test_later_images_are_saved(cache: AssetCache) -> None:
+    """
+    Les images redimensionnées après la préparation (ex : nouvelle taille de fenêtre) sont enregistrées par `save`,
+    appelée à la fermeture du client, et rechargées telles quelles.
+    """
+    cache.warm_up_async([("image", WARM_UP_SIZE)])
+    cache.wait()
+    image = cache.get_image("image", LATER_SIZE)
+    assert ("image", *LATER_SIZE) not in reopen(cache)._entries
+
+    cache.save()
+    reopened = reopen(cache)
+    assert set(reopened._entries) == {("image", *WARM_UP_SIZE), ("image", *LATER_SIZE)}
+    assert pygame.image.tobytes(reopened.get_image("image", LATER_SIZE), AssetCache.PIXEL_FORMAT) == \
+        pygame.image.tobytes(image, AssetCache.PIXEL_FORMAT)
+
+
+def test_concurrent_rasterization(cache: AssetCache) -> None:
+    """
+    Des images redimensionnées pendant la préparation en arrière-plan (qui libère les images sources à la fin) sont
+    toutes correctes et enregistrées.
+    """
+    sizes = [(width, width) for width in range(8, 40)]
+    cache.warm_up_async([("image", size) for size in sizes[::2]])
+    for size in sizes[1::2]:
+        assert cache.get_image("image", size).get_size() == size
+    cache.wait()
+    cache.save()
+
+    assert set(reopen(cache)._entries) == {("image", *size) for size in sizes}
+
+
+def cache_index(entries: list[list], version: int = AssetCache.CACHE_FORMAT_VERSION) -> bytes:
+    """
+    Construit l'index JSON (première ligne) d'un fichier de cache.
+
+    Args:
+        entries (list[list]): Les entrées de l'index (nom, largeur, hauteur, position).
+        version (int): La version du format.
+
+    Returns:
+        bytes: La ligne d'index.
+    """
+    return json.dumps({"version": version, "format": AssetCache.PIXEL_FORMAT, "entries": entries}).encode() + b"\n"
+
+
+@pytest.mark.parametrize("content", [
+    pickle.dumps({("image", *WARM_UP_SIZE): b"\0" * 4}),
+    cache_index([], AssetCache.CACHE_FORMAT_VERSION - 1),
+    cache_index([["image", *WARM_UP_SIZE, 0]]) + b"\0" * 100,
+    cache_index([["image", *WARM_UP_SIZE, -4]]) + b"\0" * 4000,
+])
+def test_invalid_cache_file_is_ignored(cache: AssetCache, content: bytes) -> None:
+    """
+    Un fichier de cache qui n'est pas au format attendu (ancien cache pickle, autre version, pixels tronqués, position
+    invalide) est ignoré : les images sont alors recalculées.
+    """
+    os.makedirs(cache.cache_dir)
+    Path(cache.cache_path).write_bytes(content)
+
+    assert not cache.load()
+    assert cache.get_image("image", WARM_UP_SIZE).get_size() == WARM_UP_SIZE
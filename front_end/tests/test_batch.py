@@ -0,0 +1,96 @@
+import pytest
+
+from pente_engine.board import Board
+from pente_engine.evaluation import evaluate
+from pente_engine.rules import BOARD_SIZE, EMPTY_CHAR, PLAYER1
+
+# NumPy est facultatif : sans lui, l'évaluation par lots n'est pas testée.
+np = pytest.importorskip("numpy")
+batch = pytest.importorskip("pente_engine.batch")
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+
+def game_positions(games: list[list[int]]) -> list[Board]:
+    """
+    Rassemble les positions en cours des parties (avant chaque victoire), captures et trait compris.
+
+    Args:
+        games (list[list[int]]): Les coups de chaque partie.
+
+    Returns:
+        list[Board]: Les positions.
+    """
+    positions = []
+    for moves in games:
+        board = Board()
+        for index in moves:
+            board.play(index)
+            if board.is_game_over:
+                break
+            positions.append(board.copy())
+    return positions
+
+
+def evaluate_positions(positions: list[Board]) -> list[int]:
+    """
+    Évalue des positions par lots, du point de vue du joueur au trait.
+
+    Args:
+        positions (list[Board]): Les positions.
+
+    Returns:
+        list[int]: Le score de chaque position.
+    """
+    return batch.evaluate_batch(
+        batch.decode_board_states([board.to_board_state() for board in positions]),
+        np.array([board.captures for board in positions]),
+        np.array([board.to_move for board in positions]),
+    ).tolist()
+
+
+def test_batch_matches_evaluate(games: list[list[int]]) -> None:
+    """
+    L'évaluation par lots donne, pour chaque position des parties, le même score que l'évaluation complète.
+    """
+    positions = game_positions(games)
+    assert evaluate_positions(positions) == [evaluate(board) for board in positions]
+
+
+def test_batch_matches_evaluate_across_chunks(games: list[list[int]]) -> None:
+    """
+    Un lot plus grand que `CHUNK_SIZE` (analysé par morceaux) donne les mêmes scores que l'évaluation complète.
+    """
+    positions = game_positions(games)
+    positions = (positions * (batch.CHUNK_SIZE // len(positions) + 2))[:batch.CHUNK_SIZE + 7]
+    assert evaluate_positions(positions) == [evaluate(board) for board in positions]
+
+
+def test_winning_alignment_is_detected(games: list[list[int]]) -> None:
+    """
+    Les parties gagnées par alignement se terminent sur un plateau où l'analyse trouve l'alignement du gagnant.
+    """
+    finals = []
+    for moves in games:
+        board = Board()
+        results = [board.play(index) for index in moves]
+        if results[-1].is_alignment:
+            finals.append(board)
+    assert finals
+
+    analysis = batch.analyse_batch(batch.decode_board_states([board.to_board_state() for board in finals]))
+    for board, five_in_a_row in zip(finals, analysis.five_in_a_row.tolist()):
+        assert five_in_a_row[board.winner]
+
+
+def test_invalid_boards_are_rejected() -> None:
+    """
+    Un plateau de mauvaise longueur, un caractère inconnu ou un trait invalide lèvent une `ValueError`.
+    """
+    with pytest.raises(ValueError):
+        batch.decode_board_states([EMPTY_CHAR * (BOARD_SIZE - 1)])
+    with pytest.raises(ValueError):
+        batch.decode_board_states(["?" * BOARD_SIZE])
+    with pytest.raises(ValueError):
+        batch.evaluate_batch(batch.decode_board_states([EMPTY_CHAR * BOARD_SIZE]), to_move=np.array([PLAYER1 + 2]))
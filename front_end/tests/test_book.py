@@ -0,0 +1,114 @@
+import pickle
+import random
+from collections import Counter
+from collections.abc import Iterator
+
+import pytest
+
+from pente_engine.board import Board
+from pente_engine.book import OpeningBook, build_book
+from pente_engine.symmetry import SYMMETRIES, canonical_form, transform_board, transform_move
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Nombre de coups retenus au début de chaque partie
+BOOK_MOVES: int = 12
+
+
+def count_book_moves(games: list[list[int]]) -> dict[int, Counter]:
+    """
+    Compte directement les coups joués depuis chaque position des ouvertures, en orientation canonique.
+
+    Args:
+        games (list[list[int]]): Les coups de chaque partie.
+
+    Returns:
+        dict[int, Counter]: Pour chaque empreinte canonique, le nombre de parties ayant joué chaque coup canonique.
+    """
+    counts: dict[int, Counter] = {}
+    for moves in games:
+        board = Board()
+        for index in moves[:BOOK_MOVES]:
+            if board.is_game_over:
+                break
+            key, symmetry = canonical_form(board)
+            counts.setdefault(key, Counter())[transform_move(index, symmetry)] += 1
+            board.play(index)
+    return counts
+
+
+@pytest.fixture()
+def book(games: list[list[int]], tmp_path) -> Iterator[OpeningBook]:
+    """
+    Livre construit à partir des parties de test.
+
+    Yields:
+        OpeningBook: Le livre ouvert (fermé à la fin du test).
+    """
+    path = tmp_path / "livre.bin"
+    build_book(games, str(path), BOOK_MOVES)
+    with OpeningBook(str(path)) as opened_book:
+        yield opened_book
+
+
+def test_lookup_matches_direct_counts(book: OpeningBook, games: list[list[int]]) -> None:
+    """
+    Chaque position du livre donne exactement les coups et poids d'un comptage direct, du plus joué au moins joué.
+    """
+    counts = count_book_moves(games)
+
+    assert len(book) == sum(len(counter) for counter in counts.values())
+    for key, counter in counts.items():
+        moves = book.lookup(key)
+        assert dict(moves) == counter
+        assert [weight for _, weight in moves] == sorted(counter.values(), reverse=True)
+
+
+def test_lookup_of_absent_position_is_empty(book: OpeningBook, games: list[list[int]]) -> None:
+    """
+    Une empreinte absente du livre ne donne aucun coup.
+    """
+    counts = count_book_moves(games)
+    generator = random.Random(1)
+    for _ in range(1000):
+        key = generator.getrandbits(64)
+        if key not in counts:
+            assert book.lookup(key) == []
+
+
+def test_pickled_book_is_reopened(book: OpeningBook, games: list[list[int]]) -> None:
+    """
+    Un livre transmis à un autre processus (pickle) y est rouvert depuis son chemin, avec le même contenu.
+    """
+    with pickle.loads(pickle.dumps(book)) as copy:
+        for key in count_book_moves(games):
+            assert copy.lookup(key) == book.lookup(key)
+
+
+def test_moves_follow_the_board_orientation(book: OpeningBook, games: list[list[int]]) -> None:
+    """
+    Les coups proposés pour une position transformée sont les coups transformés de la position d'origine.
+    """
+    board = Board()
+    for index in games[0][:4]:
+        board.play(index)
+    moves = dict(book.moves(board))
+    assert moves
+
+    for symmetry in range(SYMMETRIES):
+        transformed = transform_board(board, symmetry)
+        assert dict(book.moves(transformed)) == {transform_move(move, symmetry): weight
+                                                 for move, weight in moves.items()}
+        assert all(transformed.is_legal(move) for move, _ in book.moves(transformed))
+
+
+def test_invalid_file_is_rejected(tmp_path) -> None:
+    """
+    Un fichier qui n'est pas un livre d'ouvertures est refusé.
+    """
+    path = tmp_path / "invalide.bin"
+    path.write_bytes(b"PENTEBK0" + bytes(64))
+
+    with pytest.raises(ValueError):
+        OpeningBook(str(path))
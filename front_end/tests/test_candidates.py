@@ -0,0 +1,127 @@
+from pente_engine.board import Board
+from pente_engine.candidates import CENTER_INDEX, CandidateSet, capture_masks, line_extension_masks, order_moves
+from pente_engine.rules import (
+    BOARD_SIZE, LINE_DIRECTIONS, PLAYER1, PLAYER2, WIN_LENGTH, dilate, is_on_board, iterate_bits, to_coordinates,
+    to_index
+)
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+
+def reference_candidates(board: Board, distance: int) -> list[int]:
+    """
+    Calcule les coups candidats en relisant tout le plateau.
+
+    Args:
+        board (Board): Le plateau.
+        distance (int): La distance maximale des candidats aux pions.
+
+    Returns:
+        list[int]: Les indices des cases candidates, par ordre croissant (le centre sur un plateau vide).
+    """
+    occupied = board.occupied
+    if not occupied:
+        return [CENTER_INDEX]
+    return list(iterate_bits(dilate(occupied, distance) & ~occupied))
+
+
+def reference_line_length(stones: int, index: int) -> int:
+    """
+    Calcule, case par case, la plus longue ligne que formerait un pion posé sur la case.
+
+    Args:
+        stones (int): Le bitboard des pions du joueur.
+        index (int): L'indice de la case.
+
+    Returns:
+        int: La longueur de la ligne, bornée à 5.
+    """
+    x, y = to_coordinates(index)
+    longest = 1
+    for dx, dy in LINE_DIRECTIONS:
+        length = 1
+        for sign in (1, -1):
+            step = 1
+            while is_on_board(x + sign * step * dx, y + sign * step * dy) \
+                    and stones >> to_index(x + sign * step * dx, y + sign * step * dy) & 1:
+                length += 1
+                step += 1
+        longest = max(longest, length)
+    return min(longest, WIN_LENGTH)
+
+
+def test_candidate_set_matches_full_rescan(games: list[list[int]]) -> None:
+    """
+    Après chaque coup (captures comprises) et chaque annulation, l'ensemble incrémental est égal au calcul
+    complet, pour plusieurs distances.
+    """
+    for distance in (1, 2):
+        for moves in games:
+            board = Board()
+            candidates = CandidateSet(distance=distance)
+            for index in moves:
+                candidates.apply(board.play(index))
+                assert candidates.moves() == reference_candidates(board, distance)
+
+            while board.move_count:
+                board.undo()
+                candidates.undo()
+                assert candidates.moves() == reference_candidates(board, distance)
+
+
+def test_capture_masks_match_find_captures(games: list[list[int]]) -> None:
+    """
+    Les masques de capture contiennent exactement les cases où `find_captures` trouve des paires, autant de fois
+    que de paires capturées.
+    """
+    for moves in games[:5]:
+        board = Board()
+        for move in moves:
+            for player in (PLAYER1, PLAYER2):
+                masks = capture_masks(board, player)
+                for index in range(BOARD_SIZE):
+                    pairs = sum(mask >> index & 1 for mask in masks)
+                    if board.is_legal(index):
+                        assert 2 * pairs == len(board.find_captures(index, player))
+                    else:
+                        assert pairs == 0
+            board.play(move)
+
+
+def test_line_extension_masks_match_reference(games: list[list[int]]) -> None:
+    """
+    Les masques de lignes donnent, pour chaque case, la même longueur de ligne qu'un parcours case par case.
+    """
+    for moves in games[:5]:
+        board = Board()
+        for move in moves:
+            for stones in board.bitboards:
+                masks = line_extension_masks(stones)
+                for index in board.legal_moves():
+                    assert 1 + sum(mask >> index & 1 for mask in masks) == reference_line_length(stones, index)
+            board.play(move)
+
+
+def test_order_moves_priorities() -> None:
+    """
+    Le coup préféré passe en premier, puis la capture, et un coup qui prolonge une ligne passe avant un coup isolé.
+    """
+    board = Board()
+    # 'o' (au trait) : (5, 5) et la ligne (10..12, 10) ; 'x' : la paire (6, 5)-(7, 5), capturable en (8, 5).
+    for x, y in ((5, 5), (6, 5), (10, 10), (7, 5), (11, 10), (15, 15), (12, 10), (16, 16)):
+        board.play(to_index(x, y))
+
+    capture = to_index(8, 5)
+    extension = to_index(13, 10)
+    quiet = to_index(0, 18)
+    candidates = CandidateSet(board)
+    moves = candidates.moves() + [quiet]
+
+    ordered = order_moves(board, moves)
+    assert ordered[0] == capture
+    assert ordered.index(extension) < ordered.index(quiet)
+    assert sorted(ordered) == sorted(moves)
+
+    assert order_moves(board, moves, preferred_move=quiet)[0] == quiet
+    assert candidates.ordered_moves(board)[0] == capture
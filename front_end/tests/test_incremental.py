@@ -0,0 +1,105 @@
+from pente_engine.board import Board
+from pente_engine.evaluation import evaluate
+from pente_engine.incremental import IncrementalEvaluator
+from pente_engine.rules import to_index
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+
+def test_games_cover_captures_and_wins(games: list[list[int]]) -> None:
+    """
+    Les parties de test contiennent des captures et se terminent par des victoires (sinon les tests suivants ne
+    couvriraient pas ces cas).
+    """
+    captures = wins = 0
+    for moves in games:
+        board = Board()
+        for index in moves:
+            result = board.play(index)
+            captures += bool(result.captured)
+            wins += result.is_win
+
+    assert captures > 0
+    assert wins > 0
+
+
+def test_play_matches_full_evaluation(games: list[list[int]]) -> None:
+    """
+    Après chaque coup, l'évaluation incrémentale est égale à l'évaluation complète, et à celle d'un évaluateur
+    construit directement sur le plateau.
+    """
+    for moves in games:
+        board = Board()
+        evaluator = IncrementalEvaluator()
+        for index in moves:
+            evaluator.apply(board.play(index))
+
+            # Une position gagnée n'est jamais évaluée (la recherche s'arrête avant).
+            if not board.is_game_over:
+                assert evaluator.evaluate(board) == evaluate(board)
+                assert IncrementalEvaluator(board).evaluate(board) == evaluate(board)
+
+
+def test_undo_matches_full_evaluation(games: list[list[int]]) -> None:
+    """
+    En défaisant chaque partie jusqu'au plateau vide (victoire et captures comprises), l'évaluation incrémentale
+    reste égale à l'évaluation complète, et l'évaluateur revient à son état initial.
+    """
+    for moves in games:
+        board = Board()
+        evaluator = IncrementalEvaluator()
+        for index in moves:
+            evaluator.apply(board.play(index))
+
+        for _ in moves:
+            assert evaluator.undo() == board.undo()
+            assert evaluator.evaluate(board) == evaluate(board)
+
+        fresh = IncrementalEvaluator()
+        assert evaluator.window_score == evaluator.threat_balance == 0
+        assert evaluator.cells == fresh.cells
+        assert evaluator.window_states == fresh.window_states
+        assert evaluator.segment_states == fresh.segment_states
+
+
+def test_capture_removes_stones_from_evaluation() -> None:
+    """
+    Une capture retire les deux pions de l'évaluation, et son annulation les y remet.
+    """
+    board = Board()
+    evaluator = IncrementalEvaluator()
+    # 'o' (au trait) joue (5, 9) ; 'x' joue (6, 9) et (7, 9) ; 'o' capture en jouant (8, 9).
+    for index in (to_index(5, 9), to_index(6, 9), to_index(0, 0), to_index(7, 9)):
+        evaluator.apply(board.play(index))
+    before = evaluate(board)
+
+    result = board.play(to_index(8, 9))
+    evaluator.apply(result)
+    assert sorted(result.captured) == [to_index(6, 9), to_index(7, 9)]
+    assert evaluator.evaluate(board) == evaluate(board)
+    assert evaluator.cells[to_index(6, 9)] == evaluator.cells[to_index(7, 9)] == 0
+
+    evaluator.undo()
+    board.undo()
+    assert evaluator.evaluate(board) == evaluate(board) == before
+
+
+def test_winning_move_is_undone() -> None:
+    """
+    Un coup gagnant (alignement de 5) appliqué puis annulé laisse l'évaluation inchangée.
+    """
+    board = Board()
+    evaluator = IncrementalEvaluator()
+    for x in range(4):
+        evaluator.apply(board.play(to_index(x, 0)))
+        evaluator.apply(board.play(to_index(x, 18)))
+    before = evaluator.evaluate(board)
+
+    result = board.play(to_index(4, 0))
+    assert result.is_win
+    evaluator.apply(result)
+
+    evaluator.undo()
+    board.undo()
+    assert evaluator.evaluate(board) == evaluate(board) == before
@@ -0,0 +1,132 @@
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from classes.LocalGameServer import LocalGameServer
+from pente_engine import BOARD_COLS, BOARD_SIZE, EMPTY_CHAR, PLAYER_CHARS, Board, calculate_delta, to_index
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Score du joueur au début des parties
+PLAYER_SCORE: int = 100
+
+# Délai maximal d'attente du coup de l'ordinateur (en secondes)
+TIMEOUT_SECONDS: float = 10.0
+
+
+@pytest.fixture
+def server() -> Iterator[LocalGameServer]:
+    """
+    Serveur local d'une partie commencée, avec un joueur déjà classé.
+
+    Yields:
+        LocalGameServer: Le serveur (arrêté à la fin du test).
+    """
+    server = LocalGameServer({"score": PLAYER_SCORE, "wins": 3, "losses": 2, "games_played": 5}, time_budget=0.5)
+    server.send_ready_to_play_message()
+    server.receive_json()
+    yield server
+    server.close_socket()
+
+
+def four_in_a_row(server: LocalGameServer, player: int, y: int) -> None:
+    """
+    Remplace le plateau par une position où un joueur a quatre pions alignés en (0, y) à (3, y), joueur au trait.
+
+    Args:
+        server (LocalGameServer): Le serveur.
+        player (int): Le joueur qui a les quatre pions.
+        y (int): La ligne des quatre pions.
+    """
+    cells = [EMPTY_CHAR] * BOARD_SIZE
+    for x in range(4):
+        cells[to_index(x, y)] = PLAYER_CHARS[player]
+        cells[to_index(BOARD_COLS - 1 - 2 * x, 9)] = PLAYER_CHARS[1 - player]
+    server.board = Board.from_board_state("".join(cells), to_move=server.player)
+
+
+def receive(server: LocalGameServer, message_type: str) -> dict:
+    """
+    Attend un message du serveur local (coup de l'ordinateur compris), en ignorant les autres.
+
+    Args:
+        server (LocalGameServer): Le serveur.
+        message_type (str): Le type du message attendu.
+
+    Returns:
+        dict: Le message.
+    """
+    deadline = time.perf_counter() + TIMEOUT_SECONDS
+    while time.perf_counter() < deadline:
+        if server.is_socket_ready():
+            message = server.receive_json()
+            if message["type"] == message_type:
+                return message
+        else:
+            time.sleep(0.01)
+    pytest.fail(f"Aucun message « {message_type} » du serveur local.")
+
+
+def test_victory_adds_the_server_delta(server: LocalGameServer) -> None:
+    """
+    Une victoire ajoute au score la variation du serveur (score du perdant puis du gagnant, comme `handle_win`).
+    """
+    four_in_a_row(server, server.player, 0)
+    server.send_play_move_json(4, 0)
+    stats = receive(server, "game_over")["player_stats"]
+
+    assert stats["score"] == PLAYER_SCORE + calculate_delta(sg=LocalGameServer.COMPUTER_SCORE, sp=PLAYER_SCORE)
+    assert (stats["wins"], stats["losses"], stats["games_played"]) == (4, 2, 6)
+
+
+def test_defeat_subtracts_the_server_delta(server: LocalGameServer) -> None:
+    """
+    Une défaite retire du score la variation du serveur (score du perdant puis du gagnant, comme `handle_win`).
+    """
+    four_in_a_row(server, 1 - server.player, 18)
+    server.send_play_move_json(10, 0)
+    message = receive(server, "game_over")
+    stats = message["player_stats"]
+
+    assert message["status"] == LocalGameServer.STATUS_DEFEAT
+    assert stats["score"] == PLAYER_SCORE - calculate_delta(sg=PLAYER_SCORE, sp=LocalGameServer.COMPUTER_SCORE)
+    assert (stats["wins"], stats["losses"], stats["games_played"]) == (3, 3, 6)
+
+
+def test_forfeit_subtracts_the_server_delta(server: LocalGameServer) -> None:
+    """
+    Un abandon retire du score la variation du serveur (score du gagnant puis de l'abandon, comme `forfeit_game`).
+    """
+    server.send_quit_game_json()
+    stats = receive(server, "quit_game_response")["player_stats"]
+
+    assert stats["score"] == PLAYER_SCORE - calculate_delta(sg=LocalGameServer.COMPUTER_SCORE, sp=PLAYER_SCORE)
+    assert (stats["losses"], stats["forfeits"], stats["games_played"]) == (3, 1, 6)
+
+
+def test_delta_follows_the_server_arguments() -> None:
+    """
+    La formule attend les arguments du serveur par leur nom (`sg`, `sp`) : un écart de 400 points donne 27 points
+    quand `sg` est le plus faible, 3 sinon.
+    """
+    assert calculate_delta(sg=PLAYER_SCORE, sp=PLAYER_SCORE) == 15
+    assert calculate_delta(sg=PLAYER_SCORE, sp=PLAYER_SCORE + 400) == 27
+    assert calculate_delta(sg=PLAYER_SCORE + 400, sp=PLAYER_SCORE) == 3
+    with pytest.raises(TypeError):
+        calculate_delta(PLAYER_SCORE, PLAYER_SCORE)
+
+
+def test_negative_score_counts_as_zero() -> None:
+    """
+    Un score devenu négatif après des défaites compte comme nul dans la formule, au lieu de la faire échouer.
+    """
+    server = LocalGameServer({"score": -15})
+    try:
+        for expected in (-30, -45):
+            server.send_ready_to_play_message()
+            server.send_quit_game_json()
+            assert receive(server, "quit_game_response")["player_stats"]["score"] == expected
+    finally:
+        server.close_socket()
@@ -0,0 +1,119 @@
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from pente_engine.board import Board
+from pente_engine.mcts import ParallelMCTS, candidate_moves, winning_moves
+from pente_engine.rules import BOARD_SIZE, CAPTURES_TO_WIN, EMPTY_CHAR, PLAYER1, PLAYER2, PLAYER_CHARS, to_index
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Nombre de processus de calcul (plus d'un : les statistiques de la racine sont fusionnées)
+WORKERS: int = 2
+
+# Budget de temps d'une recherche (en secondes)
+TIME_BUDGET: float = 0.3
+
+# Dépassement toléré du budget (démarrage des processus, dernière simulation, communication)
+TIME_TOLERANCE: float = 0.25
+
+# Nombres de coups joués avant les positions de milieu de partie
+OPENING_MOVES: tuple[int, ...] = (6, 12, 24)
+
+# Ligne des positions gagnantes construites à la main
+ROW: int = 9
+
+
+@pytest.fixture(scope="module")
+def mcts() -> Iterator[ParallelMCTS]:
+    """
+    Recherche MCTS à plusieurs processus, partagée par les tests du module.
+
+    Yields:
+        ParallelMCTS: La recherche (processus arrêtés à la fin du module).
+    """
+    mcts = ParallelMCTS(workers=WORKERS)
+    yield mcts
+    mcts.shutdown()
+
+
+def make_board(stones: dict[tuple[int, int], int], captures: tuple[int, int] = (0, 0)) -> Board:
+    """
+    Construit une position avec le joueur 1 au trait.
+
+    Args:
+        stones (dict[tuple[int, int], int]): Le joueur de chaque pion, par coordonnées.
+        captures (tuple[int, int]): Les captures de chaque joueur.
+
+    Returns:
+        Board: Le plateau.
+    """
+    board_state = [EMPTY_CHAR] * BOARD_SIZE
+    for (x, y), player in stones.items():
+        board_state[to_index(x, y)] = PLAYER_CHARS[player]
+    return Board.from_board_state("".join(board_state), PLAYER1, captures)
+
+
+def test_search_returns_a_legal_move(games: list[list[int]], mcts: ParallelMCTS) -> None:
+    """
+    Le coup choisi est jouable dans des positions de milieu de partie, et le plateau n'est pas modifié.
+    """
+    for moves, opening_moves in zip(games, OPENING_MOVES):
+        board = Board()
+        for index in moves[:opening_moves]:
+            board.play(index)
+        before = board.to_board_state()
+
+        result = mcts.search(board, TIME_BUDGET)
+        assert board.is_legal(result.best_move)
+        assert result.playouts > 0 and result.workers == WORKERS
+        assert board.to_board_state() == before
+
+
+@pytest.mark.parametrize("captures", [0, CAPTURES_TO_WIN - 1])
+def test_search_finds_an_immediate_win(mcts: ParallelMCTS, captures: int) -> None:
+    """
+    Un coup qui gagne immédiatement (cinquième pion d'un alignement, ou cinquième capture) est choisi.
+    """
+    if captures:
+        stones = {(9, ROW + 1): PLAYER2, (9, ROW + 2): PLAYER2, (9, ROW + 3): PLAYER1, (8, ROW): PLAYER1}
+    else:
+        stones = {(x, ROW): PLAYER1 for x in (5, 6, 7, 8)}
+        stones[(4, ROW)] = PLAYER2
+    stones.update({(12, 12): PLAYER2, (12, 5): PLAYER2, (2, 14): PLAYER2})
+    board = make_board(stones, (captures, 0))
+    win = to_index(9, ROW)
+
+    assert winning_moves(board, candidate_moves(board)) == [win]
+    assert mcts.search(board, TIME_BUDGET).best_move == win
+
+
+def test_search_respects_the_time_budget(games: list[list[int]]) -> None:
+    """
+    Avec plusieurs processus, une recherche (démarrage des processus compris) se termine peu après son budget.
+    """
+    board = Board()
+    for index in games[0][:OPENING_MOVES[-1]]:
+        board.play(index)
+
+    mcts = ParallelMCTS(workers=WORKERS)
+    try:
+        for time_budget in (TIME_BUDGET / 2, TIME_BUDGET):
+            start = time.perf_counter()
+            result = mcts.search(board, time_budget)
+            elapsed = time.perf_counter() - start
+            assert time_budget <= result.seconds <= elapsed < time_budget + TIME_TOLERANCE
+    finally:
+        mcts.shutdown()
+
+
+def test_invalid_search_is_rejected(mcts: ParallelMCTS) -> None:
+    """
+    Une partie terminée ou un budget nul lèvent une `ValueError`, sans démarrer de recherche.
+    """
+    with pytest.raises(ValueError):
+        mcts.search(make_board({}, (CAPTURES_TO_WIN, 0)))
+    with pytest.raises(ValueError):
+        mcts.search(Board(), 0)
@@ -0,0 +1,118 @@
+import importlib
+import time
+from collections.abc import Iterator
+from types import ModuleType
+
+import pytest
+
+from classes.LocalGameServer import LocalGameServer
+from pente_engine import BOARD_SIZE, EMPTY_CHAR, PLAYER_CHARS, Board, calculate_delta, to_index
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Délai maximal d'attente d'un message du serveur local (coup de l'ordinateur compris, en secondes)
+TIMEOUT_SECONDS: float = 10.0
+
+# Temps de réflexion de l'ordinateur par coup (en secondes)
+COMPUTER_SECONDS: float = 0.2
+
+# Ligne des quatre pions alignés du joueur avant son coup gagnant
+WINNING_ROW: int = 0
+
+
+class FastLocalGameServer(LocalGameServer):
+    """Serveur local dont l'ordinateur réfléchit peu (tests plus rapides)."""
+
+    def __init__(self, player_stats: dict | None = None) -> None:
+        """
+        Initialise le serveur local avec un temps de réflexion réduit.
+
+        Args:
+            player_stats (dict | None): Les statistiques du joueur.
+        """
+        super().__init__(player_stats, time_budget=COMPUTER_SECONDS)
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[ModuleType]:
+    """
+    Client sans affichage (module `main`), sans réflexion anticipée et avec un ordinateur rapide, sur la page de
+    connexion.
+
+    Yields:
+        ModuleType: Le module `main` (analyse et serveur local arrêtés à la fin du test).
+    """
+    monkeypatch.setenv("PENTE_HEADLESS", "1")
+    main = importlib.import_module("main")
+    monkeypatch.setattr(main, "PONDER", False)
+    monkeypatch.setattr(main, "LocalGameServer", FastLocalGameServer)
+    monkeypatch.setattr(main, "request_manager", None)
+    main.reset_game_info()
+    main.update_player_stats({"score": 100, "wins": 3, "losses": 2, "games_played": 5})
+    yield main
+    if isinstance(main.request_manager, LocalGameServer):
+        main.request_manager.close_socket()
+    main.analyzer.shutdown()
+
+
+def handle_next_message(main: ModuleType, page: dict, handler: callable) -> tuple[dict, callable]:
+    """
+    Attend le prochain message du serveur local et le fait traiter par les gestionnaires du client.
+
+    Args:
+        main (ModuleType): Le module `main`.
+        page (dict): Les éléments de la page actuelle.
+        handler (callable): Le gestionnaire d'événements actuel.
+
+    Returns:
+        tuple[dict, callable]: Les éléments de la page et le gestionnaire d'événements suivants.
+    """
+    deadline = time.perf_counter() + TIMEOUT_SECONDS
+    while not main.request_manager.is_socket_ready():
+        if time.perf_counter() > deadline:
+            pytest.fail("Aucun message du serveur local.")
+        time.sleep(0.01)
+
+    is_running, page, handler = main.handle_server_response(page, handler)
+    assert is_running
+    return page, handler
+
+
+def test_offline_game_through_the_client_handlers(client: ModuleType) -> None:
+    """
+    Une partie hors ligne passe par les gestionnaires du client : début de partie sur un plateau vide (comme sur le
+    serveur), coup du joueur, coup de l'ordinateur, puis victoire avec le score du serveur et retour à la page de
+    connexion.
+    """
+    main = client
+    _, page, handler = main.start_offline_game(main.gui_elements_manager.create_gui_elements_login_page())
+
+    page, handler = handle_next_message(main, page, handler)
+    assert main.gui_elements_manager.board == EMPTY_CHAR * BOARD_SIZE
+    assert main.is_my_turn and main.opponent_name == LocalGameServer.COMPUTER_NAME
+
+    main.play_move_optimistically(9, 9, page)
+    page, handler = handle_next_message(main, page, handler)
+    assert not main.is_my_turn and main.pending_move is None
+    assert main.gui_elements_manager.board[to_index(9, 9)] == PLAYER_CHARS[main.request_manager.player]
+
+    page, handler = handle_next_message(main, page, handler)
+    assert main.is_my_turn
+    assert main.gui_elements_manager.board.count(EMPTY_CHAR) == BOARD_SIZE - 2
+
+    # Quatre pions alignés pour le joueur (même plateau pour le serveur local et le client), puis coup gagnant.
+    server = main.request_manager
+    cells = list(main.gui_elements_manager.board)
+    for x in range(4):
+        cells[to_index(x, WINNING_ROW)] = PLAYER_CHARS[server.player]
+    server.board = Board.from_board_state("".join(cells), to_move=server.player)
+    main.gui_elements_manager.board = server.board.to_board_state()
+
+    main.play_move_optimistically(4, WINNING_ROW, page)
+    page, handler = handle_next_message(main, page, handler)
+
+    assert main.request_manager is None and handler is main.handle_events_on_login_page
+    assert (main.wins, main.losses, main.games_played) == (4, 2, 6)
+    assert main.score == 100 + calculate_delta(sg=LocalGameServer.COMPUTER_SCORE, sp=100)
+    assert not main.is_board_visible
@@ -0,0 +1,160 @@
+import contextlib
+import io
+from collections.abc import Iterator
+
+import pygame
+import pygame_gui
+import pytest
+
+from classes.GUIElementsManager import GUIElementsManager
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Taille de la fenêtre (mise à l'échelle de l'interface) et durée d'une image (en secondes)
+WINDOW_SIZE: tuple[int, int] = (1920, 1350)
+FRAME_TIME_DELTA: float = 1 / 60
+
+# Case du pion posé pendant les tests (centre du plateau)
+MOVE_INDEX: int = 180
+
+
+@pytest.fixture
+def gui(monkeypatch: pytest.MonkeyPatch) -> Iterator[tuple[GUIElementsManager, list]]:
+    """
+    Gestionnaire GUI sans affichage sur la page de jeu, plateau vide déjà rendu, avec les mises à jour de l'affichage
+    enregistrées.
+
+    Yields:
+        tuple[GUIElementsManager, list]: Le gestionnaire et les régions de chaque mise à jour (None : toute la
+            fenêtre).
+    """
+    updates = []
+    monkeypatch.setattr(pygame.display, "update", lambda rects=None: updates.append(rects))
+
+    gui = GUIElementsManager(headless=True)
+    gui.resize(WINDOW_SIZE)
+    elements = gui.create_gui_elements_game_page()
+    set_board(gui, GUIElementsManager.EMPTY_CHAR * GUIElementsManager.GRID_COLS ** 2, animate=False)
+    render(gui)
+    render(gui)
+    updates.clear()
+    yield gui, updates
+    gui.clear_page(elements)
+
+
+def set_board(gui: GUIElementsManager, board: str, animate: bool = True) -> None:
+    """
+    Définit le plateau sans afficher les messages de la mise à jour.
+
+    Args:
+        gui (GUIElementsManager): Le gestionnaire GUI.
+        board (str): Le plateau.
+        animate (bool): Si vrai, anime les cases modifiées.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        gui.set_board(board, animate)
+
+
+def render(gui: GUIElementsManager, frames: int = 1) -> None:
+    """
+    Rend des images de la page de jeu (grille et pions visibles).
+
+    Args:
+        gui (GUIElementsManager): Le gestionnaire GUI.
+        frames (int): Le nombre d'images.
+    """
+    for _ in range(frames):
+        gui.render_frame(FRAME_TIME_DELTA, True, True)
+
+
+def test_idle_frames_do_not_update_the_display(gui: tuple[GUIElementsManager, list]) -> None:
+    """
+    Une image identique à la précédente n'est pas envoyée à l'écran.
+    """
+    manager, updates = gui
+    render(manager, 10)
+
+    assert updates == []
+
+
+def test_animation_updates_only_its_cell(gui: tuple[GUIElementsManager, list]) -> None:
+    """
+    Un pion animé ne met à jour que sa case, jusqu'à la fin de l'animation, et l'image finale est identique à un
+    rendu complet.
+    """
+    manager, updates = gui
+    board = list(manager.board)
+    board[MOVE_INDEX] = "x"
+    set_board(manager, "".join(board))
+    render(manager, round(GUIElementsManager.CAPTURE_DISSOLVE_DURATION / FRAME_TIME_DELTA) + 2)
+
+    assert updates and all(update is not None and len(update) == 1 for update in updates)
+    cell_size = manager.manager.output_scale * GUIElementsManager.SCREEN_WIDTH / GUIElementsManager.GRID_COLS
+    for (rect,) in updates:
+        assert rect.width <= cell_size and rect.height <= cell_size
+    assert not manager._animations
+
+    partial = manager.surface.copy()
+    manager.resize(WINDOW_SIZE)
+    render(manager)
+    assert pygame.image.tobytes(partial, "RGB") == pygame.image.tobytes(manager.surface, "RGB")
+
+
+def test_expose_event_redraws_the_window(gui: tuple[GUIElementsManager, list]) -> None:
+    """
+    Une fenêtre de nouveau visible est redessinée entièrement.
+    """
+    manager, updates = gui
+    manager.process_events_manager(pygame.event.Event(pygame.VIDEOEXPOSE))
+    render(manager, 2)
+
+    assert updates == [None]
+
+
+def test_idle_frames_do_not_draw_the_ui(gui: tuple[GUIElementsManager, list], monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    L'interface n'est dessinée que lorsqu'un de ses éléments change (ici, un élément retiré de la page).
+    """
+    manager, _ = gui
+    draws = []
+    monkeypatch.setattr(manager.manager, "draw_ui", draws.append)
+    render(manager, 10)
+    assert draws == []
+
+    manager.manager.ui_group.sprites()[0].kill()
+    render(manager, 10)
+    assert len(draws) == 1
+
+
+def test_grid_and_pieces_are_drawn_over_the_ui(gui: tuple[GUIElementsManager, list]) -> None:
+    """
+    L'interface est dessinée sous la grille et les pions (ordre du rendu : fond, interface, grille, pions) : un
+    panneau qui couvre le plateau ne les cache pas.
+    """
+    manager, _ = gui
+    board = list(manager.board)
+    board[MOVE_INDEX] = "x"
+    set_board(manager, "".join(board), animate=False)
+    pygame_gui.elements.UIPanel(
+        pygame.Rect(0, 0, GUIElementsManager.SCREEN_WIDTH, GUIElementsManager.SCREEN_HEIGHT), manager=manager.manager
+    )
+    render(manager)
+
+    scale, (offset_x, offset_y) = manager.manager.output_scale, manager.manager.output_offset
+    line_x = offset_x + round((GUIElementsManager.MARGIN_X + GUIElementsManager.GRID_COLS // 2
+                               * GUIElementsManager.CELL_SIZE) * scale)
+    cell_y = offset_y + round((GUIElementsManager.MARGIN_Y + GUIElementsManager.CELL_SIZE // 2) * scale)
+    panel_x = offset_x + round((GUIElementsManager.MARGIN_X + GUIElementsManager.CELL_SIZE // 2) * scale)
+    assert manager.surface.get_at((panel_x, cell_y)) != manager.background.get_at((panel_x, cell_y))
+    assert manager.surface.get_at((line_x, cell_y))[:3] == GUIElementsManager.LINE_COLOR
+
+    piece = manager._layers["pieces"]["x"]
+    x, y = max(((x, y) for x in range(piece.get_width()) for y in range(piece.get_height())),
+               key=lambda pixel: piece.get_at(pixel).a)
+    position = (
+        manager._layers["cell_x"][MOVE_INDEX % GUIElementsManager.GRID_COLS] + x,
+        manager._layers["cell_y"][MOVE_INDEX // GUIElementsManager.GRID_COLS] + y
+    )
+    assert all(abs(shown - expected) <= 3 for shown, expected in zip(manager.surface.get_at(position)[:3],
+                                                                     piece.get_at((x, y))[:3]))
@@ -0,0 +1,205 @@
+import pytest
+
+from pente_engine.benchmark import reference_play
+from pente_engine.board import Board, MoveResult
+from pente_engine.rules import (
+    BOARD_COLS, BOARD_ROWS, BOARD_SIZE, CAPTURE_DIRECTIONS, CAPTURES_TO_WIN, EMPTY_CHAR, FIRST_PLAYER, PLAYER1,
+    PLAYER2, PLAYER_CHARS, to_index
+)
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Dernière colonne et dernière ligne du plateau
+LAST_X: int = BOARD_COLS - 1
+LAST_Y: int = BOARD_ROWS - 1
+
+# Ligne des positions construites à la main (loin des bords haut et bas)
+MIDDLE_Y: int = BOARD_ROWS // 2
+
+# Quatre pions alignés du joueur 1 et la case qui complète l'alignement
+FOUR_IN_A_ROW: tuple[tuple[int, int], ...] = ((5, MIDDLE_Y), (6, MIDDLE_Y), (7, MIDDLE_Y), (8, MIDDLE_Y))
+FIFTH_CELL: tuple[int, int] = (9, MIDDLE_Y)
+
+# Paire du joueur 2 capturable depuis la case qui complète l'alignement, et le pion du joueur 1 qui la referme
+PAIR_BELOW: tuple[tuple[int, int], ...] = ((9, MIDDLE_Y + 1), (9, MIDDLE_Y + 2))
+CLOSING_BELOW: tuple[int, int] = (9, MIDDLE_Y + 3)
+
+
+def position(stones: dict[tuple[int, int], int]) -> str:
+    """
+    Construit un plateau au format `board_state`.
+
+    Args:
+        stones (dict[tuple[int, int], int]): Le joueur de chaque pion, par coordonnées.
+
+    Returns:
+        str: Le plateau.
+    """
+    board_state = [EMPTY_CHAR] * BOARD_SIZE
+    for (x, y), player in stones.items():
+        board_state[to_index(x, y)] = PLAYER_CHARS[player]
+    return "".join(board_state)
+
+
+def play_both(board_state: str, move: tuple[int, int], player: int,
+              captures: tuple[int, int] = (0, 0)) -> tuple[Board, MoveResult]:
+    """
+    Joue un coup avec le moteur et avec la traduction directe du serveur, et vérifie qu'ils donnent la même
+    victoire, les mêmes captures et le même plateau.
+
+    Args:
+        board_state (str): Le plateau avant le coup.
+        move (tuple[int, int]): Les coordonnées du coup.
+        player (int): Le joueur au trait.
+        captures (tuple[int, int]): Les captures de chaque joueur avant le coup.
+
+    Returns:
+        tuple[Board, MoveResult]: Le plateau du moteur après le coup, et le résultat du coup.
+    """
+    index = to_index(*move)
+    board = Board.from_board_state(board_state, player, captures)
+    result = board.play(index)
+
+    reference_board, reference_captures = list(board_state), list(captures)
+    is_win, pairs = reference_play(reference_board, reference_captures, index, player)
+
+    assert result.is_win == is_win
+    assert len(result.captured) == 2 * pairs
+    assert board.to_board_state() == "".join(reference_board)
+    assert board.captures == reference_captures
+    return board, result
+
+
+def test_games_match_server_rules(games: list[list[int]]) -> None:
+    """
+    Des parties complètes rejouées coup par coup donnent, avec le moteur et avec la traduction directe du serveur,
+    les mêmes victoires, captures et plateaux, et chaque position se relit à l'identique depuis `board_state`.
+    """
+    for moves in games:
+        board = Board()
+        reference_board = [EMPTY_CHAR] * BOARD_SIZE
+        reference_captures = [0, 0]
+        player = FIRST_PLAYER
+        for index in moves:
+            result = board.play(index)
+            is_win, pairs = reference_play(reference_board, reference_captures, index, player)
+
+            assert result.is_win == is_win
+            assert len(result.captured) == 2 * pairs
+            assert board.to_board_state() == "".join(reference_board)
+            assert board.captures == reference_captures
+
+            reread = Board.from_board_state(board.to_board_state(), board.to_move, tuple(board.captures))
+            assert reread.bitboards == board.bitboards
+            assert (reread.captures, reread.to_move) == (board.captures, board.to_move)
+            # Relu depuis `board_state`, seul un gagnant aux captures est reconnu (pas un alignement).
+            assert reread.winner == (None if result.is_alignment else board.winner)
+            player = 1 - player
+
+
+def test_capture_into_an_alignment_wins_without_capturing() -> None:
+    """
+    Un coup qui complète un alignement et referme une paire adverse gagne par l'alignement : la paire reste sur le
+    plateau et aucune capture n'est comptée.
+    """
+    stones = {cell: PLAYER1 for cell in FOUR_IN_A_ROW + (CLOSING_BELOW,)}
+    stones.update({cell: PLAYER2 for cell in PAIR_BELOW})
+    board, result = play_both(position(stones), FIFTH_CELL, PLAYER1)
+
+    assert result.is_alignment and result.is_win and result.captured == ()
+    assert all(board.cell(to_index(*cell)) == PLAYER_CHARS[PLAYER2] for cell in PAIR_BELOW)
+    assert board.captures == [0, 0] and board.winner == PLAYER1
+
+
+def test_alignment_is_checked_before_captures() -> None:
+    """
+    Avec 4 captures, un coup qui aligne 5 pions et ferait une cinquième capture gagne par l'alignement, avant que
+    la capture ne soit appliquée.
+    """
+    stones = {cell: PLAYER1 for cell in FOUR_IN_A_ROW + (CLOSING_BELOW,)}
+    stones.update({cell: PLAYER2 for cell in PAIR_BELOW})
+    board, result = play_both(position(stones), FIFTH_CELL, PLAYER1, (CAPTURES_TO_WIN - 1, 0))
+
+    assert result.is_alignment and result.captured == ()
+    assert board.captures == [CAPTURES_TO_WIN - 1, 0] and board.winner == PLAYER1
+
+
+@pytest.mark.parametrize("pairs", [1, 2])
+def test_fifth_capture_wins(pairs: int) -> None:
+    """
+    Le joueur qui atteint 5 captures gagne, y compris quand un même coup capture deux paires.
+    """
+    stones = {CLOSING_BELOW: PLAYER1}
+    stones.update({cell: PLAYER2 for cell in PAIR_BELOW})
+    if pairs == 2:
+        stones.update({(FIFTH_CELL[0] - 3, MIDDLE_Y): PLAYER1, FOUR_IN_A_ROW[-1]: PLAYER2, FOUR_IN_A_ROW[-2]: PLAYER2})
+    board, result = play_both(position(stones), FIFTH_CELL, PLAYER1, (CAPTURES_TO_WIN - pairs, 0))
+
+    assert result.is_win and not result.is_alignment and len(result.captured) == 2 * pairs
+    assert board.captures == [CAPTURES_TO_WIN, 0] and board.winner == PLAYER1
+    assert all(board.cell(index) == EMPTY_CHAR for index in result.captured)
+
+
+def test_no_win_below_five_captures() -> None:
+    """
+    Une capture qui laisse le joueur sous 5 captures ne termine pas la partie : le trait passe à l'adversaire.
+    """
+    stones = {CLOSING_BELOW: PLAYER1}
+    stones.update({cell: PLAYER2 for cell in PAIR_BELOW})
+    board, result = play_both(position(stones), FIFTH_CELL, PLAYER1, (CAPTURES_TO_WIN - 2, 0))
+
+    assert not result.is_win and board.winner is None and board.to_move == PLAYER2
+    assert board.captures == [CAPTURES_TO_WIN - 1, 0]
+
+
+@pytest.mark.parametrize("direction", CAPTURE_DIRECTIONS)
+@pytest.mark.parametrize("played_on_edge", [True, False])
+def test_captures_at_the_edges(direction: tuple[int, int], played_on_edge: bool) -> None:
+    """
+    Une paire est capturée dans chacune des 8 directions quand le pion joué, ou celui qui referme la paire, est dans
+    un coin ou sur un bord du plateau.
+    """
+    dx, dy = direction
+    if played_on_edge:
+        start = (0 if dx >= 0 else LAST_X, 0 if dy >= 0 else LAST_Y)
+    else:
+        start = ((LAST_X if dx > 0 else 0) - 3 * dx, (LAST_Y if dy > 0 else 0) - 3 * dy)
+    pair = tuple((start[0] + step * dx, start[1] + step * dy) for step in (1, 2))
+    closing = (start[0] + 3 * dx, start[1] + 3 * dy)
+
+    stones = {closing: PLAYER1}
+    stones.update({cell: PLAYER2 for cell in pair})
+    board, result = play_both(position(stones), start, PLAYER1)
+
+    assert sorted(result.captured) == sorted(to_index(*cell) for cell in pair)
+    assert board.captures == [1, 0]
+
+
+@pytest.mark.parametrize("direction", [direction for direction in CAPTURE_DIRECTIONS if direction[0]])
+def test_captures_do_not_wrap_around_the_edges(direction: tuple[int, int]) -> None:
+    """
+    Une paire dont les indices suivent la case jouée mais qui est de l'autre côté du plateau (ligne suivante ou
+    précédente) n'est pas capturée.
+    """
+    dx, dy = direction
+    start = (LAST_X if dx > 0 else 0, MIDDLE_Y)
+    stride = dy * BOARD_COLS + dx
+    first = to_index(*start) + stride
+    board_state = list(position({}))
+    board_state[first] = board_state[first + stride] = PLAYER_CHARS[PLAYER2]
+    board_state[first + 2 * stride] = PLAYER_CHARS[PLAYER1]
+    board, result = play_both("".join(board_state), start, PLAYER1)
+
+    assert result.captured == () and board.captures == [0, 0]
+
+
+def test_moving_into_a_capture_position_is_safe() -> None:
+    """
+    Un joueur qui complète lui-même une paire entourée de pions adverses n'est pas capturé.
+    """
+    stones = {(8, MIDDLE_Y): PLAYER1, (9, MIDDLE_Y): PLAYER2, (11, MIDDLE_Y): PLAYER1}
+    board, result = play_both(position(stones), (10, MIDDLE_Y), PLAYER2)
+
+    assert result.captured == () and board.captures == [0, 0]
+    assert board.cell(to_index(9, MIDDLE_Y)) == board.cell(to_index(10, MIDDLE_Y)) == PLAYER_CHARS[PLAYER2]
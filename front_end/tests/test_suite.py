@@ -0,0 +1,74 @@
+import pytest
+
+from pente_engine.suite import PERFT_DEPTH, SEARCH_DEPTH, compare_runs, main
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Débit de référence des exécutions précédentes (unités par seconde)
+BASE_RATE: float = 100_000.0
+
+
+def make_run(perft_rate: float = BASE_RATE, search_rate: float = BASE_RATE, perft_depth: int = PERFT_DEPTH,
+             search_depth: int = SEARCH_DEPTH, nodes: int = 1000) -> dict:
+    """
+    Construit une exécution au format de l'historique (comptages perft justes).
+
+    Args:
+        perft_rate (float): Le débit du perft.
+        search_rate (float): Le débit de la recherche (les autres débits valent `BASE_RATE`).
+        perft_depth (int): La profondeur des comptages perft.
+        search_depth (int): La profondeur de la recherche.
+        nodes (int): Le nombre de positions visitées par la recherche.
+
+    Returns:
+        dict: L'exécution.
+    """
+    return {
+        "perft_depth": perft_depth,
+        "search_depth": search_depth,
+        "perft": {},
+        "search_nodes": {"opening_2": nodes},
+        "throughput": {"perft": perft_rate, "search": search_rate, "opening.move_generation": BASE_RATE},
+    }
+
+
+def test_unchanged_run_has_no_problem() -> None:
+    """
+    Une exécution identique aux précédentes ne signale aucun problème.
+    """
+    assert compare_runs(make_run(), [make_run()] * 3) == []
+
+
+def test_perft_rate_is_compared_at_equal_depth() -> None:
+    """
+    Le débit du perft n'est comparé qu'aux exécutions de même profondeur de perft : un débit plus élevé à une autre
+    profondeur ne fait pas passer l'exécution pour une régression, mais une baisse à profondeur égale est signalée.
+    """
+    history = [make_run(perft_rate=10 * BASE_RATE, perft_depth=1)] * 3
+    assert compare_runs(make_run(), history) == []
+
+    problems = compare_runs(make_run(), history + [make_run(perft_rate=2 * BASE_RATE)])
+    assert len(problems) == 1 and problems[0].startswith("Débit perft")
+
+
+def test_search_rate_is_compared_at_equal_depth() -> None:
+    """
+    Le débit et les positions visitées de la recherche ne sont comparés qu'aux exécutions de même profondeur de
+    recherche, même plus anciennes que la dernière exécution.
+    """
+    deeper = make_run(search_rate=BASE_RATE / 10, search_depth=SEARCH_DEPTH + 1, nodes=5000)
+    assert compare_runs(make_run(), [deeper]) == []
+
+    problems = compare_runs(make_run(nodes=1200), [make_run(search_rate=2 * BASE_RATE), deeper])
+    assert [problem.split(" :")[0] for problem in problems] == ["Débit search", "Recherche opening_2"]
+
+
+def test_compare_requires_repeats(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    `--compare` refuse moins de répétitions que le minimum, avant toute mesure.
+    """
+    monkeypatch.setattr("sys.argv", ["suite", "--compare", "--repeats", "1"])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 2
@@ -0,0 +1,103 @@
+import pytest
+
+from pente_engine.board import Board
+from pente_engine.candidates import CENTER_INDEX
+from pente_engine.rules import BOARD_SIZE
+from pente_engine.symmetry import (
+    IDENTITY, INVERSE_SYMMETRIES, PERMUTATIONS, SYMMETRIES, canonical_form, canonical_symmetries, inverse_move,
+    symmetric_hashes, transform_board, transform_move
+)
+from pente_engine.zobrist import compute_hash
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Nombre de parties dont les positions sont vérifiées
+CHECKED_GAMES: int = 5
+
+
+def test_permutations_are_distinct_bijections() -> None:
+    """
+    Les 8 symétries sont des permutations distinctes des cases, l'identité comprise.
+    """
+    assert len(set(PERMUTATIONS)) == SYMMETRIES
+    assert PERMUTATIONS[IDENTITY] == tuple(range(BOARD_SIZE))
+    for permutation in PERMUTATIONS:
+        assert sorted(permutation) == list(range(BOARD_SIZE))
+
+
+@pytest.mark.parametrize("symmetry", range(SYMMETRIES))
+def test_move_round_trip(symmetry: int) -> None:
+    """
+    Une case transformée puis ramenée par la symétrie inverse revient à son origine, et la symétrie inverse est
+    elle-même une des 8 symétries.
+    """
+    for index in range(BOARD_SIZE):
+        assert inverse_move(transform_move(index, symmetry), symmetry) == index
+        assert transform_move(transform_move(index, symmetry), INVERSE_SYMMETRIES[symmetry]) == index
+
+
+def test_board_round_trip(games: list[list[int]]) -> None:
+    """
+    Un plateau transformé puis ramené par la symétrie inverse est identique à l'original (empreinte comprise), et
+    l'empreinte transformée est celle d'un calcul complet.
+    """
+    for moves in games[:CHECKED_GAMES]:
+        board = Board()
+        for index in moves:
+            board.play(index)
+            hashes = symmetric_hashes(board)
+            for symmetry in range(SYMMETRIES):
+                transformed = transform_board(board, symmetry)
+                assert transformed.hash == hashes[symmetry]
+                assert transformed.hash == compute_hash(transformed.bitboards, transformed.captures,
+                                                        transformed.to_move)
+
+                restored = transform_board(transformed, INVERSE_SYMMETRIES[symmetry])
+                assert (restored.bitboards, restored.captures, restored.to_move, restored.hash) == (
+                    board.bitboards, board.captures, board.to_move, board.hash
+                )
+
+
+def test_canonical_form_is_shared_by_all_orientations(games: list[list[int]]) -> None:
+    """
+    Les 8 orientations d'une position ont la même empreinte canonique, et la symétrie renvoyée y mène.
+    """
+    for moves in games[:CHECKED_GAMES]:
+        board = Board()
+        for index in moves:
+            key, symmetry = canonical_form(board)
+            assert transform_board(board, symmetry).hash == key
+            for other in range(SYMMETRIES):
+                assert canonical_form(transform_board(board, other))[0] == key
+            board.play(index)
+
+
+def test_moves_commute_with_symmetries(games: list[list[int]]) -> None:
+    """
+    Jouer un coup puis transformer le plateau revient à transformer le plateau puis jouer le coup transformé
+    (captures et victoires comprises).
+    """
+    for moves in games[:CHECKED_GAMES]:
+        board = Board()
+        for index in moves:
+            next_board = board.copy()
+            next_board.play(index)
+            for symmetry in range(SYMMETRIES):
+                transformed = transform_board(board, symmetry)
+                transformed.play(transform_move(index, symmetry))
+                expected = transform_board(next_board, symmetry)
+                assert (transformed.bitboards, transformed.captures, transformed.winner, transformed.hash) == (
+                    expected.bitboards, expected.captures, expected.winner, expected.hash
+                )
+            board = next_board
+
+
+def test_symmetric_position_has_all_symmetries() -> None:
+    """
+    Le pion central seul est invariant par les 8 symétries.
+    """
+    board = Board()
+    board.play(CENTER_INDEX)
+
+    assert canonical_symmetries(board)[1] == tuple(range(SYMMETRIES))
@@ -0,0 +1,140 @@
+from pente_engine.board import Board
+from pente_engine.rules import BOARD_SIZE, CAPTURES_TO_WIN, EMPTY_CHAR, PLAYER1, PLAYER2, PLAYER_CHARS, to_index
+from pente_engine.threats import FORCED_WIN, NO_FORCED_WIN, ThreatSearchResult, ThreatSpaceSearch
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Ligne des positions de test (loin des bords)
+ROW: int = 9
+
+# Paires du joueur 2 sous et à droite de la case (9, ROW), et la case qui referme la première
+PAIR_BELOW: tuple[tuple[int, int], ...] = ((9, ROW + 1), (9, ROW + 2))
+PAIR_RIGHT: tuple[tuple[int, int], ...] = ((10, ROW), (11, ROW))
+CLOSING_BELOW: tuple[int, int] = (9, ROW + 3)
+
+
+def make_board(stones: dict[tuple[int, int], int], captures: tuple[int, int] = (0, 0)) -> Board:
+    """
+    Construit une position avec le joueur 1 au trait.
+
+    Args:
+        stones (dict[tuple[int, int], int]): Le joueur de chaque pion, par coordonnées.
+        captures (tuple[int, int]): Les captures de chaque joueur.
+
+    Returns:
+        Board: Le plateau.
+    """
+    board_state = [EMPTY_CHAR] * BOARD_SIZE
+    for (x, y), player in stones.items():
+        board_state[to_index(x, y)] = PLAYER_CHARS[player]
+    return Board.from_board_state("".join(board_state), PLAYER1, captures)
+
+
+def search(board: Board, use_threes: bool = False) -> ThreatSearchResult:
+    """
+    Cherche une victoire forcée et vérifie que le plateau n'est pas modifié.
+
+    Args:
+        board (Board): Le plateau.
+        use_threes (bool): Si True, les trois ouverts sont des coups forçants.
+
+    Returns:
+        ThreatSearchResult: Le résultat de la recherche.
+    """
+    before = (board.bitboards[:], board.captures[:], board.hash)
+    result = ThreatSpaceSearch(use_threes=use_threes).search(board)
+    assert (board.bitboards, board.captures, board.hash) == before
+    return result
+
+
+def play_line(board: Board, line: tuple[int, ...]) -> Board:
+    """
+    Rejoue une ligne gagnante sur une copie du plateau.
+
+    Args:
+        board (Board): Le plateau.
+        line (tuple[int, ...]): Les coups de l'attaquant et les parades du défenseur, en alternance.
+
+    Returns:
+        Board: Le plateau à la fin de la ligne.
+    """
+    line_board = board.copy()
+    for index in line:
+        line_board.play(index)
+    return line_board
+
+
+def assert_every_reply_loses(board: Board) -> None:
+    """
+    Vérifie qu'après le premier coup de la ligne, chaque parade du défenseur laisse une victoire immédiate à
+    l'attaquant.
+
+    Args:
+        board (Board): Le plateau après le premier coup de l'attaquant (défenseur au trait).
+    """
+    solver = ThreatSpaceSearch(max_depth=1, use_threes=False)
+    for reply in board.legal_moves():
+        assert not board.play(reply).is_win
+        assert solver.search(board).status == FORCED_WIN, f"La parade {reply} tient."
+        board.undo()
+
+
+def test_open_four_is_a_forced_win() -> None:
+    """
+    Trois pions alignés sans obstacle gagnent en formant un quatre ouvert : chaque parade laisse un bout libre.
+    """
+    board = make_board({(7, ROW): PLAYER1, (8, ROW): PLAYER1, (9, ROW): PLAYER1})
+    result = search(board)
+
+    assert result.status == FORCED_WIN and len(result.winning_line) == 3
+    assert play_line(board, result.winning_line).winner == PLAYER1
+
+    board.play(result.winning_line[0])
+    assert_every_reply_loses(board)
+
+
+def test_four_with_a_capture_threat_is_a_forced_win() -> None:
+    """
+    Avec 4 captures, un quatre fermé qui menace aussi une paire adverse gagne : le défenseur ne peut pas parer les
+    deux menaces. Sans ces captures, le même quatre se pare.
+    """
+    stones = {(4, ROW): PLAYER2, (5, ROW): PLAYER1, (6, ROW): PLAYER1, (7, ROW): PLAYER1}
+    stones.update({(8, ROW + 1): PLAYER2, (8, ROW + 2): PLAYER2})
+    board = make_board(stones, (CAPTURES_TO_WIN - 1, 0))
+    result = search(board)
+
+    assert result.status == FORCED_WIN and len(result.winning_line) == 3
+    assert play_line(board, result.winning_line).winner == PLAYER1
+
+    board.play(result.winning_line[0])
+    assert_every_reply_loses(board)
+
+    assert search(make_board(stones)).status == NO_FORCED_WIN
+
+
+def test_fifth_capture_is_a_forced_win() -> None:
+    """
+    Avec 4 captures, une capture disponible gagne immédiatement, et un coup qui menace deux paires gagne au coup
+    suivant.
+    """
+    stones = {cell: PLAYER2 for cell in PAIR_BELOW + PAIR_RIGHT}
+    board = make_board({**stones, CLOSING_BELOW: PLAYER1}, (CAPTURES_TO_WIN - 1, 0))
+    assert search(board).winning_line == (to_index(9, ROW),)
+
+    board = make_board(stones, (CAPTURES_TO_WIN - 1, 0))
+    result = search(board)
+    assert result.status == FORCED_WIN and result.winning_line[0] == to_index(9, ROW)
+    line_board = play_line(board, result.winning_line)
+    assert line_board.winner == PLAYER1 and line_board.captures[PLAYER1] == CAPTURES_TO_WIN
+
+
+def test_quiet_position_has_no_forced_win() -> None:
+    """
+    Une position calme, sans menace ni capture possible, n'a pas de victoire forcée, même avec les trois ouverts.
+    """
+    board = make_board({(9, ROW): PLAYER1, (10, ROW + 1): PLAYER2, (3, 3): PLAYER1, (15, 15): PLAYER2})
+    result = search(board, use_threes=True)
+
+    assert result.status == NO_FORCED_WIN and result.winning_line == ()
+    assert result.depth == ThreatSpaceSearch.DEFAULT_MAX_DEPTH
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from pente_engine.tournament import (
+    INITIAL_RATING, MAX_OPENING_MOVES, GameResult, compute_ratings, opening_board, parse_engine, random_opening,
+    read_openings, run_tournament
+)
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Ouverture qui termine la partie : cinq 'o' alignés sur la première ligne
+FINISHED_OPENING: list[int] = [0, 40, 1, 41, 2, 42, 3, 43, 4]
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_opening_never_ends_the_game(seed: int) -> None:
+    """
+    Une ouverture aléatoire de longueur maximale est tirée sans fin de partie (et sans boucle infinie).
+    """
+    opening = random_opening(random.Random(seed), MAX_OPENING_MOVES)
+
+    assert len(opening) == MAX_OPENING_MOVES
+    assert not opening_board(opening).is_game_over
+
+
+def test_random_opening_rejects_too_many_moves() -> None:
+    """
+    Une longueur d'ouverture hors bornes est refusée.
+    """
+    with pytest.raises(ValueError):
+        random_opening(random.Random(1), MAX_OPENING_MOVES + 1)
+
+
+def test_read_openings_reports_the_bad_line(tmp_path) -> None:
+    """
+    Une ouverture invalide du fichier est signalée avec son numéro de ligne.
+    """
+    path = tmp_path / "ouvertures.txt"
+    path.write_text("100 142\n# commentaire\n100 100\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="ligne 3"):
+        read_openings(str(path), 4, 10)
+
+
+def test_run_tournament_rejects_finished_opening_before_playing(tmp_path) -> None:
+    """
+    Une ouverture qui termine la partie est refusée avant le début du tournoi : aucun résultat n'est écrit.
+    """
+    engines = [parse_engine("random"), parse_engine("captures")]
+    output_path = tmp_path / "parties.jsonl"
+
+    with pytest.raises(ValueError, match="L'ouverture 2"):
+        run_tournament(engines, [[180, 181], FINISHED_OPENING], str(output_path), workers=1)
+
+    assert not output_path.exists()
+
+
+def test_upset_win_gains_more_points() -> None:
+    """
+    Le classement passe le score du gagnant puis celui du perdant à la formule du serveur : un gagnant moins bien
+    classé que son adversaire gagne plus de 15 points.
+    """
+    engines = [parse_engine("random"), parse_engine("captures")]
+    first, second = engines[0].name, engines[1].name
+    results = [GameResult(0, first, second, first, [], 0, 0.0), GameResult(1, second, first, second, [], 0, 0.0)]
+    ratings = compute_ratings(engines, results)
+
+    assert ratings[second]["rating"] == INITIAL_RATING + 1 and ratings[first]["rating"] == INITIAL_RATING - 1
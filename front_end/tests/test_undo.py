@@ -0,0 +1,87 @@
+from pente_engine.board import Board
+from pente_engine.candidates import CandidateSet
+from pente_engine.rules import FIRST_PLAYER
+from pente_engine.zobrist import compute_hash
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+
+def snapshot(board: Board, candidates: CandidateSet) -> tuple:
+    """
+    Capture tout l'état d'une position : pions, captures, trait, vainqueur, nombre de coups, empreinte et coups
+    candidats.
+
+    Args:
+        board (Board): Le plateau.
+        candidates (CandidateSet): L'ensemble des candidats synchronisé avec le plateau.
+
+    Returns:
+        tuple: L'état de la position.
+    """
+    return (tuple(board.bitboards), tuple(board.captures), board.to_move, board.winner, board.move_count,
+            board.hash, tuple(candidates.moves()), bytes(candidates.coverage))
+
+
+def test_undo_restores_each_position(games: list[list[int]]) -> None:
+    """
+    Chaque coup défait juste après avoir été joué restaure exactement la position, et le rejouer redonne
+    exactement la position suivante.
+    """
+    for moves in games:
+        board = Board()
+        candidates = CandidateSet()
+        for index in moves:
+            before = snapshot(board, candidates)
+            result = board.play(index)
+            candidates.apply(result)
+            after = snapshot(board, candidates)
+
+            assert candidates.undo() == board.undo() == result
+            assert snapshot(board, candidates) == before
+
+            assert board.play(index) == result
+            candidates.apply(result)
+            assert snapshot(board, candidates) == after
+
+
+def test_undo_whole_game_back_to_empty_board(games: list[list[int]]) -> None:
+    """
+    Une partie entière (captures et victoire comprises) défaite coup par coup repasse par toutes ses positions,
+    jusqu'au plateau vide.
+    """
+    for moves in games:
+        board = Board()
+        candidates = CandidateSet()
+        snapshots = []
+        for index in moves:
+            snapshots.append(snapshot(board, candidates))
+            candidates.apply(board.play(index))
+
+        for index, expected in zip(reversed(moves), reversed(snapshots)):
+            assert board.undo().index == index
+            candidates.undo()
+            assert snapshot(board, candidates) == expected
+
+        assert board.bitboards == [0, 0] and board.captures == [0, 0] and board.winner is None
+        assert board.hash == compute_hash([0, 0], [0, 0], FIRST_PLAYER)
+
+
+def test_undo_matches_rebuilt_position(games: list[list[int]]) -> None:
+    """
+    La position obtenue par annulation est identique à celle reconstruite depuis son format `board_state`
+    (empreinte et candidats recalculés de zéro, comparés aux candidats tenus à jour par annulation).
+    """
+    for moves in games:
+        board = Board()
+        candidates = CandidateSet()
+        for index in moves:
+            candidates.apply(board.play(index))
+
+        while board.move_count:
+            board.undo()
+            candidates.undo()
+            rebuilt = Board.from_board_state(board.to_board_state(), board.to_move, tuple(board.captures))
+            assert rebuilt.bitboards == board.bitboards
+            assert rebuilt.hash == board.hash
+            assert CandidateSet(rebuilt).moves() == candidates.moves()
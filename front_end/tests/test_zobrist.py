@@ -0,0 +1,66 @@
+from pente_engine.board import Board
+from pente_engine.rules import FIRST_PLAYER, to_index
+from pente_engine.zobrist import compute_hash
+
+# pdoc: format de la documentation
+__docformat__ = "google"
+
+# Coups d'une ouverture sans capture, et la même position atteinte dans un autre ordre (mêmes pions par joueur)
+OPENING: tuple[int, ...] = (to_index(9, 9), to_index(10, 10), to_index(8, 9), to_index(10, 8))
+TRANSPOSED_OPENING: tuple[int, ...] = (to_index(8, 9), to_index(10, 8), to_index(9, 9), to_index(10, 10))
+
+
+def full_hash(board: Board) -> int:
+    """
+    Calcule l'empreinte du plateau de zéro.
+
+    Args:
+        board (Board): Le plateau.
+
+    Returns:
+        int: L'empreinte complète de la position.
+    """
+    return compute_hash(board.bitboards, board.captures, board.to_move)
+
+
+def test_hash_matches_full_computation_after_each_move(games: list[list[int]]) -> None:
+    """
+    L'empreinte mise à jour à chaque coup (pose, captures, victoire) est égale à son calcul complet.
+    """
+    for moves in games:
+        board = Board()
+        assert board.hash == full_hash(board)
+        for index in moves:
+            board.play(index)
+            assert board.hash == full_hash(board)
+
+
+def test_hash_matches_full_computation_after_each_undo(games: list[list[int]]) -> None:
+    """
+    Après chaque annulation, l'empreinte est égale à son calcul complet et à celle de la position avant le coup.
+    """
+    for moves in games:
+        board = Board()
+        hashes = []
+        for index in moves:
+            hashes.append(board.hash)
+            board.play(index)
+
+        for expected in reversed(hashes):
+            board.undo()
+            assert board.hash == full_hash(board) == expected
+        assert board.hash == compute_hash([0, 0], [0, 0], FIRST_PLAYER)
+
+
+def test_transposed_positions_share_their_hash() -> None:
+    """
+    Une même position atteinte par deux ordres de coups a la même empreinte, qui change avec le joueur au trait.
+    """
+    board = Board()
+    transposed = Board()
+    for index, transposed_index in zip(OPENING, TRANSPOSED_OPENING):
+        board.play(index)
+        transposed.play(transposed_index)
+
+    assert board.bitboards == transposed.bitboards and board.hash == transposed.hash
+    assert Board.from_board_state(board.to_board_state(), 1 - board.to_move).hash != board.hash